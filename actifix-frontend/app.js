@@ -12,12 +12,17 @@ const API_BASE = `${window.location.protocol}//${window.location.hostname}:5001/
 const UI_VERSION = '8.0.60';
 const REFRESH_INTERVAL = 5000;
 const LOG_REFRESH_INTERVAL = 3000;
+const EVENT_TAIL_WAIT_SECONDS = 25;
 const TICKET_REFRESH_INTERVAL = 4000;
 const TICKET_LIMIT = 250;
 
 const ADMIN_PASSWORD_KEY = 'actifix_admin_password';
+const ADMIN_SESSION_KEY = 'actifix_admin_session';
+// Renew the session token this long before it expires
+const ADMIN_SESSION_RENEW_MS = 5 * 60 * 1000;
 const getAdminPassword = () => localStorage.getItem(ADMIN_PASSWORD_KEY) || '';
 const setAdminPasswordInStorage = (value) => {
+  localStorage.removeItem(ADMIN_SESSION_KEY);
   if (!value) {
     localStorage.removeItem(ADMIN_PASSWORD_KEY);
   } else {
@@ -31,10 +36,56 @@ const ONBOARDING_STORAGE_KEY = 'actifix_onboarding_v1';
 const hasCompletedOnboarding = () => localStorage.getItem(ONBOARDING_STORAGE_KEY) === '1';
 const markOnboardingCompleted = () => localStorage.setItem(ONBOARDING_STORAGE_KEY, '1');
 
+// The password is exchanged once for a short-lived session token so the
+// server verifies an HMAC per request instead of re-running PBKDF2.
+const readAdminSession = () => {
+  try {
+    return JSON.parse(localStorage.getItem(ADMIN_SESSION_KEY) || 'null');
+  } catch (err) {
+    return null;
+  }
+};
+
+let adminSessionExchange = null;
+const exchangeAdminSession = () => {
+  const password = getAdminPassword();
+  if (!password || adminSessionExchange) return adminSessionExchange;
+  adminSessionExchange = fetch(`${API_BASE}/auth/admin-session`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ password })
+  })
+    .then((response) => (response.ok ? response.json() : null))
+    .then((data) => {
+      if (!data || !data.token || getAdminPassword() !== password) return null;
+      localStorage.setItem(ADMIN_SESSION_KEY, JSON.stringify({
+        token: data.token,
+        expiresAt: Date.now() + data.expires_in * 1000
+      }));
+      return data.token;
+    })
+    .catch(() => null)
+    .finally(() => {
+      adminSessionExchange = null;
+    });
+  return adminSessionExchange;
+};
+
 const buildAdminHeaders = (initial = {}) => {
   const headers = { ...initial };
   const adminPassword = getAdminPassword();
-  if (adminPassword) {
+  if (!adminPassword) {
+    return headers;
+  }
+  const session = readAdminSession();
+  const remaining = session ? session.expiresAt - Date.now() : 0;
+  if (remaining < ADMIN_SESSION_RENEW_MS) {
+    exchangeAdminSession();
+  }
+  if (remaining > 0) {
+    headers['X-Admin-Session'] = session.token;
+  } else {
+    // Scripts and the first request before the exchange completes
     headers['X-Admin-Password'] = adminPassword;
   }
   return headers;
@@ -164,16 +215,28 @@ const useFetch = (endpoint, interval = REFRESH_INTERVAL) => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [lastUpdated, setLastUpdated] = useState(null);
+  // Validator of the last successful response; the server answers 304
+  // without re-reading or re-serialising when nothing changed.
+  const etagRef = useRef(null);
 
   useEffect(() => {
+    if (!endpoint) return undefined;
+    etagRef.current = null;
     const fetchData = async (retryCount = 0, maxRetries = 3) => {
       try {
         const headers = buildAdminHeaders();
+        if (etagRef.current) headers['If-None-Match'] = etagRef.current;
         const response = await fetch(`${API_BASE}${endpoint}`, { cache: 'no-store', headers });
+        if (response.status === 304) {
+          setError(null);
+          setLastUpdated(new Date());
+          return;
+        }
         if (!response.ok) throw new Error(`HTTP ${response.status}`);
         const text = await response.text();
         try {
           const json = JSON.parse(text);
+          etagRef.current = response.headers.get('ETag');
           setData(json);
           setError(null);
           setLastUpdated(new Date());
@@ -208,6 +271,66 @@ const useFetch = (endpoint, interval = REFRESH_INTERVAL) => {
   return { data, loading, error, lastUpdated };
 };
 
+// Ticket detail responses keyed by id, revalidated with their ETag
+const ticketDetailCache = new Map();
+
+// Long-poll the event log tail: the server holds each request until new
+// events are committed, so an idle dashboard does not re-query the log.
+const useEventTail = (enabled, maxEntries = 300) => {
+  const [entries, setEntries] = useState([]);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState(null);
+  const [lastUpdated, setLastUpdated] = useState(null);
+
+  useEffect(() => {
+    if (!enabled) return undefined;
+    let cancelled = false;
+    let cursor = null;
+    const controller = new AbortController();
+    setEntries([]);
+    setLoading(true);
+
+    const poll = async () => {
+      while (!cancelled) {
+        try {
+          const params = new URLSearchParams({ limit: String(maxEntries) });
+          if (cursor !== null) {
+            params.set('after_id', String(cursor));
+            params.set('wait', String(EVENT_TAIL_WAIT_SECONDS));
+          }
+          const response = await fetch(`${API_BASE}/events/tail?${params}`, {
+            cache: 'no-store',
+            headers: buildAdminHeaders(),
+            signal: controller.signal,
+          });
+          if (!response.ok) throw new Error(`HTTP ${response.status}`);
+          const json = await response.json();
+          cursor = json.cursor;
+          if (json.content && json.content.length) {
+            setEntries((prev) => [...prev, ...json.content].slice(-maxEntries));
+          }
+          setError(null);
+          setLastUpdated(new Date());
+        } catch (err) {
+          if (cancelled) return;
+          setError(err.message);
+          await new Promise((resolve) => setTimeout(resolve, LOG_REFRESH_INTERVAL));
+        } finally {
+          if (!cancelled) setLoading(false);
+        }
+      }
+    };
+
+    poll();
+    return () => {
+      cancelled = true;
+      controller.abort();
+    };
+  }, [enabled, maxEntries]);
+
+  return { data: enabled ? { content: entries } : null, loading, error, lastUpdated };
+};
+
 // Custom hook for authenticated POST requests
 const useAuthenticatedFetch = () => {
   const [loading, setLoading] = useState(false);
@@ -862,9 +985,17 @@ const TicketsView = () => {
     setModalError('');
     try {
       const headers = buildAdminHeaders();
-      const response = await fetch(`${API_BASE}/ticket/${ticketId}`, { headers });
+      const cached = ticketDetailCache.get(ticketId);
+      if (cached) headers['If-None-Match'] = cached.etag;
+      const response = await fetch(`${API_BASE}/ticket/${ticketId}`, { cache: 'no-store', headers });
+      if (response.status === 304 && cached) {
+        setSelectedTicket(cached.data);
+        return;
+      }
       if (!response.ok) throw new Error(`HTTP ${response.status}`);
       const ticketData = await response.json();
+      const etag = response.headers.get('ETag');
+      if (etag) ticketDetailCache.set(ticketId, { etag, data: ticketData });
       setSelectedTicket(ticketData);
     } catch (err) {
       setModalError(err.message);
@@ -1348,7 +1479,11 @@ const LogsView = () => {
   const [severityFilter, setSeverityFilter] = useState('all');
   const logContainerRef = useRef(null);
 
-  const { data, loading, error, lastUpdated } = useFetch(`/logs?type=${logType}&lines=300`, LOG_REFRESH_INTERVAL);
+  // The audit log follows the event tail; file-backed log types still poll
+  const tailing = logType === 'audit';
+  const tail = useEventTail(tailing);
+  const polled = useFetch(tailing ? null : `/logs?type=${logType}&lines=300`, LOG_REFRESH_INTERVAL);
+  const { data, loading, error, lastUpdated } = tailing ? tail : polled;
 
   useEffect(() => {
     if (autoScroll && logContainerRef.current) {
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark API throughput: single-process server vs prefork workers.
+
+Seeds a throwaway project with tickets, then for each worker count starts
+``run_api_server`` in a subprocess and drives it from several client
+processes (keep-alive connections) for a fixed duration. Reports requests
+per second and latency percentiles per endpoint.
+
+Worker count 1 is the existing threaded single-process server; the
+prefork server should scale with the number of cores until the database
+or the clients become the bottleneck.
+
+Usage:
+    python scripts/benchmark_api_server.py
+    python scripts/benchmark_api_server.py --workers 1 2 4 --clients 16 --duration 15
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src to path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+DEFAULT_ENDPOINTS = ("/api/tickets?limit=50", "/api/stats", "/api/health")
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+
+def _project_env(project: Path) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "ACTIFIX_DATA_DIR": str(project / "actifix"),
+        "ACTIFIX_STATE_DIR": str(project / ".actifix"),
+        "ACTIFIX_DB_PATH": str(project / "data" / "actifix.db"),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT / "src"), os.environ.get("PYTHONPATH")])),
+    })
+    return env
+
+
+def _seed(project: Path, count: int) -> None:
+    """Create ``count`` tickets directly through the repository."""
+    os.environ.update(_project_env(project))
+    from actifix.persistence.ticket_repo import get_ticket_repository
+    from actifix.raise_af import ActifixEntry, TicketPriority
+    from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+    init_actifix_files(get_actifix_paths(project_root=project))
+    repo = get_ticket_repository()
+    priorities = list(TicketPriority)
+    for i in range(count):
+        repo.create_ticket(ActifixEntry(
+            message=f"benchmark ticket {i}: " + "x" * 200,
+            source="scripts/benchmark_api_server.py",
+            run_label="api-benchmark",
+            entry_id=f"ACT-APIBENCH-{i:06d}",
+            created_at=datetime.now(timezone.utc),
+            priority=priorities[i % len(priorities)],
+            error_type="BenchError",
+            stack_trace="Traceback (most recent call last):\n" * 5,
+            duplicate_guard=f"apibench-{i}",
+        ))
+
+
+def _free_port() -> int:
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(project: Path, port: int, workers: int) -> subprocess.Popen:
+    code = (
+        "from pathlib import Path\n"
+        "from actifix.api import run_api_server\n"
+        f"run_api_server(port={port}, project_root=Path({str(project)!r}), workers={workers})\n"
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        env=_project_env(project),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    ready = 0
+    # Every worker must be up; probe until a run of successes
+    while time.monotonic() < deadline and ready < workers * 4:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            conn.request("GET", "/api/ping")
+            ready = ready + 1 if conn.getresponse().status == 200 else 0
+            conn.close()
+        except OSError:
+            ready = 0
+            time.sleep(0.2)
+    if ready < workers * 4:
+        process.kill()
+        raise RuntimeError(f"API server with {workers} workers did not start")
+    return process
+
+
+def _client(port: int, path: str, duration: float, results) -> None:
+    latencies = []
+    errors = 0
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+    results.put((latencies, errors))
+
+
+def _drive(port: int, path: str, clients: int, duration: float) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_client, args=(port, path, duration, results)) for _ in range(clients)]
+    for proc in procs:
+        proc.start()
+    latencies, errors = [], 0
+    for _ in procs:
+        chunk, failed = results.get()
+        latencies.extend(chunk)
+        errors += failed
+    for proc in procs:
+        proc.join()
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "rps": len(latencies) / duration,
+        "p50_ms": pct(0.50),
+        "p99_ms": pct(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8, help="Client processes per run")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint")
+    parser.add_argument("--tickets", type=int, default=500, help="Tickets to seed")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Path to request (repeatable)")
+    args = parser.parse_args()
+    endpoints = args.endpoints or list(DEFAULT_ENDPOINTS)
+
+    print(f"CPUs: {os.cpu_count()}  clients: {args.clients}  duration: {args.duration}s  tickets: {args.tickets}")
+    with tempfile.TemporaryDirectory(prefix="actifix-api-bench-") as tmp:
+        project = Path(tmp)
+        _seed(project, args.tickets)
+        baseline = {}
+        for workers in args.workers:
+            port = _free_port()
+            server = _start_server(project, port, workers)
+            try:
+                for path in endpoints:
+                    stats = _drive(port, path, args.clients, args.duration)
+                    baseline.setdefault(path, stats["rps"])
+                    speedup = stats["rps"] / baseline[path] if baseline[path] else 0.0
+                    print(
+                        f"workers={workers:<2} {path:<24} {stats['rps']:>8.1f} req/s  "
+                        f"p50 {stats['p50_ms']:>6.1f} ms  p99 {stats['p99_ms']:>7.1f} ms  "
+                        f"x{speedup:.2f}  errors {stats['errors']}"
+                    )
+            finally:
+                server.send_signal(signal.SIGTERM)
+                try:
+                    server.wait(timeout=60)
+                except subprocess.TimeoutExpired:
+                    server.kill()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
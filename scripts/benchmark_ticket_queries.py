@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the ticket list queries behind /api/tickets and /api/tickets/summary.
+
+Seeds throwaway databases of increasing size and times:
+- get_recent_tickets(20): newest open + completed tickets (index ranges)
+- get_created_bounds("Open"): oldest/newest open ticket (index seeks)
+- get_stats(): counts from the trigger-maintained ticket_counts table
+- legacy: loading every open and completed ticket and sorting in Python
+  (skipped above --legacy-max rows)
+
+The indexed queries should stay flat from 1k to 1M tickets.
+
+Usage:
+    python scripts/benchmark_ticket_queries.py
+    python scripts/benchmark_ticket_queries.py --sizes 1000 100000 --repeat 50
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src to path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from actifix.persistence.database import (  # noqa: E402
+    DatabaseConfig,
+    DatabasePool,
+    serialize_timestamp,
+    timestamp_to_epoch_ms,
+)
+from actifix.persistence.ticket_repo import TicketFilter, TicketRepository  # noqa: E402
+
+PRIORITIES = ("P0", "P1", "P2", "P3", "P4")
+BATCH_SIZE = 50_000
+
+
+def _seed(pool: DatabasePool, count: int) -> None:
+    """Insert ``count`` tickets, about one in five still open."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with pool.connection() as conn:
+        for offset in range(0, count, BATCH_SIZE):
+            rows = []
+            for i in range(offset, min(count, offset + BATCH_SIZE)):
+                created = start + timedelta(seconds=i * 7)
+                rows.append((
+                    f"ACT-BENCH-{i:08d}",
+                    PRIORITIES[i % len(PRIORITIES)],
+                    "BenchError",
+                    f"benchmark ticket {i}",
+                    "benchmark_ticket_queries.py",
+                    serialize_timestamp(created),
+                    timestamp_to_epoch_ms(created),
+                    "Open" if i % 5 == 0 else "Completed",
+                ))
+            conn.executemany(
+                "INSERT INTO tickets (id, priority, error_type, message, source, created_at, "
+                "created_at_ms, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+
+def _time_ms(fn, repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds."""
+    fn()  # Warm the page cache and statement cache
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _legacy_list(repo: TicketRepository, limit: int):
+    tickets = repo.get_tickets(TicketFilter(status="Open")) + repo.get_tickets(
+        TicketFilter(status="Completed")
+    )
+    tickets.sort(key=lambda t: t["created_at"], reverse=True)
+    return tickets[:limit]
+
+
+def run(sizes, repeat: int, legacy_max: int) -> int:
+    print(f"{'tickets':>10} {'recent':>10} {'bounds':>10} {'stats':>10} {'legacy':>12}")
+    with tempfile.TemporaryDirectory(prefix="actifix-bench-") as tmp:
+        for size in sizes:
+            pool = DatabasePool(DatabaseConfig(db_path=Path(tmp) / f"bench_{size}.db"))
+            try:
+                _seed(pool, size)
+                repo = TicketRepository(pool=pool)
+                recent = _time_ms(lambda: repo.get_recent_tickets(20), repeat)
+                bounds = _time_ms(lambda: repo.get_created_bounds("Open"), repeat)
+                stats = _time_ms(repo.get_stats, repeat)
+                legacy = "skipped"
+                if size <= legacy_max:
+                    legacy = f"{_time_ms(lambda: _legacy_list(repo, 20), max(1, repeat // 10)):.2f}"
+                print(f"{size:>10} {recent:>10.2f} {bounds:>10.2f} {stats:>10.2f} {legacy:>12}")
+            finally:
+                pool.close()
+    print("(median milliseconds per call)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--legacy-max", type=int, default=100_000)
+    args = parser.parse_args()
+    return run(args.sizes, args.repeat, args.legacy_max)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ from .raise_af import (
     ActifixEntry,
     TicketPriority,
     generate_entry_id,
+    entry_id_timestamp,
     generate_ticket_id,
     generate_duplicate_guard,
     ensure_scaffold,
@@ -95,6 +96,7 @@ __all__ = [
     "run_health_check",
     "format_health_report",
     "generate_entry_id",
+    "entry_id_timestamp",
     "generate_ticket_id",
     "generate_duplicate_guard",
     "ensure_scaffold",
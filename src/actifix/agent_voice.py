@@ -13,7 +13,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from .raise_af import record_error, TicketPriority
-from .persistence.agent_voice_repo import get_agent_voice_repository
+from .persistence.agent_voice_repo import get_agent_voice_repository, get_agent_voice_writer
 
 
 def record_relay_handoff(
@@ -75,9 +75,25 @@ def record_agent_voice(
     extra: Optional[dict[str, Any]] = None,
     correlation_id: Optional[str] = None,
     max_rows: int = 1_000_000,
-) -> int:
-    """Record a single agent voice row and return its row id."""
+    buffered: bool = False,
+) -> Optional[int]:
+    """
+    Record a single agent voice row and return its row id.
+
+    With buffered=True the row is queued on the global AgentVoiceWriter and
+    written with the next batch; no row id is available, so None is returned.
+    """
     try:
+        if buffered:
+            get_agent_voice_writer(max_rows=max_rows).add(
+                agent_id=agent_id,
+                run_label=run_label,
+                level=level,
+                thought=thought,
+                extra=extra,
+                correlation_id=correlation_id,
+            )
+            return None
         repo = get_agent_voice_repository(max_rows=max_rows)
         return repo.append(
             agent_id=agent_id,
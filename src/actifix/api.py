@@ -4,6 +4,7 @@ Actifix API Server - Flask-based REST API for frontend dashboard.
 Provides endpoints for health, stats, tickets, logs, and system information.
 """
 
+import hashlib
 import importlib
 import json
 import logging
@@ -15,7 +16,7 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict
 
 import yaml
 
@@ -76,11 +77,11 @@ def _ensure_web_dependencies() -> bool:
         return False
 
 from . import __version__
-from .health import get_health, check_sla_breaches
+from .health import check_sla_breaches, get_sla_summary
+from .health_sampler import get_health_snapshot
 from .do_af import (
-    get_open_tickets,
+    _get_ticket_repository,
     get_ticket_stats,
-    get_completed_tickets,
     fix_highest_priority_ticket,
 )
 from .raise_af import (
@@ -97,6 +98,7 @@ from .persistence.event_repo import get_event_repository, EventFilter
 from .persistence.ticket_cleanup import run_automatic_cleanup
 from .persistence.cleanup_config import get_cleanup_config
 from .metrics import export_prometheus_metrics
+from .response_cache import get_response_cache, render_response_cache_metrics
 from .config import get_config, set_config, load_config
 from .security.rate_limiter import RateLimitConfig, RateLimitError, get_rate_limiter
 from .log_utils import log_event
@@ -118,23 +120,49 @@ from .modules.registry import (
 SERVER_START_TIME = time.time()
 SYSTEM_OWNERS = {"runtime", "infra", "core", "persistence", "testing", "tooling"}
 
+# Live event tail (long-poll and SSE)
+MAX_EVENT_TAIL_LIMIT = 500
+MAX_EVENT_TAIL_WAIT_SECONDS = 30.0
+EVENT_STREAM_KEEPALIVE_SECONDS = 15.0
+EVENT_STREAM_MAX_SECONDS = 300.0
+
 # Global SocketIO instance for real-time updates
 _socketio_instance: Optional["SocketIO"] = None
 
+# Relays ticket events to the other API worker processes (prefork mode)
+_event_publisher: Optional[Callable[[str, dict], None]] = None
+
 
 def get_socketio() -> Optional["SocketIO"]:
     """Get the global SocketIO instance."""
     return _socketio_instance
 
 
+def set_event_publisher(publisher: Optional[Callable[[str, dict], None]]) -> None:
+    """Set the cross-process ticket event publisher (None disables)."""
+    global _event_publisher
+    _event_publisher = publisher
+
+
 def emit_ticket_event(event_type: str, ticket_data: dict) -> None:
     """
     Emit a ticket event to all connected WebSocket clients.
 
+    In prefork mode the event is also published to the other API workers,
+    which emit it to their own clients.
+
     Args:
         event_type: Type of event ('ticket_created', 'ticket_updated', 'ticket_completed', 'ticket_deleted')
         ticket_data: Ticket data to broadcast
     """
+    emit_local_ticket_event(event_type, ticket_data)
+    publisher = _event_publisher
+    if publisher is not None:
+        publisher(event_type, ticket_data)
+
+
+def emit_local_ticket_event(event_type: str, ticket_data: dict) -> None:
+    """Emit a ticket event to WebSocket clients of this process only."""
     socketio = get_socketio()
     if socketio is None:
         return
@@ -529,11 +557,11 @@ def _verify_auth_token(token: str) -> bool:
         from actifix.security.auth import get_token_manager, get_user_manager
         token_manager = get_token_manager()
         user_manager = get_user_manager()
+        # Both checks are served from memory for recently seen tokens
         user_id = token_manager.verify_token(token)
         if not user_id:
             return False
-        user = user_manager.get_user(user_id)
-        return user is not None and user.is_active
+        return user_manager.is_active(user_id)
     except Exception as exc:
         record_error(
             message=f"Auth token verification failed: {exc}",
@@ -555,16 +583,44 @@ def _verify_admin_password(password: str) -> bool:
         return False
 
 
+def _verify_admin_session(token: str) -> bool:
+    """Verify an admin session token (one HMAC, no PBKDF2 or database)."""
+    try:
+        from actifix.security.admin_session import get_admin_session_manager
+        from actifix.security.auth import get_user_manager
+        subject = get_admin_session_manager().verify(token)
+        return bool(subject) and get_user_manager().is_active(subject)
+    except Exception:
+        return False
+
+
+def _issue_admin_session(subject: str = "admin") -> dict:
+    from actifix.security.admin_session import get_admin_session_manager
+    session = get_admin_session_manager().issue(subject)
+    return {
+        'token': session.token,
+        'expires_at': datetime.fromtimestamp(session.expires_at, timezone.utc).isoformat(),
+        'expires_in': session.expires_in,
+    }
+
+
 def _auth_credentials_valid(req, allow_local: bool = True) -> bool:
-    """Check if request has valid admin password or token (local option)."""
+    """Check if request has valid admin session, password or token (local option)."""
+    admin_session = req.headers.get("X-Admin-Session", "")
+    if admin_session and _verify_admin_session(admin_session):
+        return True
     admin_password = req.headers.get("X-Admin-Password", "")
     if admin_password and _verify_admin_password(admin_password):
         return True
     if allow_local and _is_local_request(req):
         return True
     token = _extract_bearer_token(req)
-    if token and _verify_auth_token(token):
-        return True
+    if token:
+        from actifix.security.admin_session import is_admin_session_token
+        if is_admin_session_token(token):
+            return _verify_admin_session(token)
+        if _verify_auth_token(token):
+            return True
     return False
 
 
@@ -947,6 +1003,63 @@ def _map_event_type_to_level(event_type: str, message: str) -> str:
     return "INFO"
 
 
+def _event_to_log_line(event: dict) -> dict:
+    """Shape an event_log row the way the frontend log views expect."""
+    event_type = event.get("event_type") or "LOG"
+    message = event.get("message") or ""
+    level = (event.get("level") or "").upper()
+    if not level:
+        level = _map_event_type_to_level(event_type, message)
+    return {
+        "id": event.get("id"),
+        "timestamp": event.get("timestamp") or "",
+        "event": event_type,
+        "ticket": event.get("ticket_id") or "-",
+        "text": message,
+        "extra": event.get("extra_json"),
+        "level": level,
+    }
+
+
+def _parse_log_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 query arg (naive values are UTC); raises ValueError."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _log_events_filter(args, log_type: str, limit: int) -> EventFilter:
+    """
+    Build the /api/logs event filter from query args.
+
+    Supports level (comma-separated), event_prefix, source, start_time and
+    end_time; the "errors" log type restricts levels to ERROR/CRITICAL.
+    """
+    levels = [level.strip() for level in (args.get('level') or '').split(',') if level.strip()]
+    if log_type == "errors":
+        levels = ["ERROR", "CRITICAL"]
+    return EventFilter(
+        levels=levels or None,
+        event_type_prefix=args.get('event_prefix') or None,
+        source=args.get('source') or None,
+        start_time=_parse_log_time(args.get('start_time')),
+        end_time=_parse_log_time(args.get('end_time')),
+        limit=limit,
+    )
+
+
+def _event_tail_filter(args) -> EventFilter:
+    """Build the equality filter for the event tail endpoints from query args."""
+    return EventFilter(
+        event_type=args.get('event_type') or None,
+        ticket_id=args.get('ticket_id') or None,
+        correlation_id=args.get('correlation_id') or None,
+        level=(args.get('level') or '').upper() or None,
+        source=args.get('source') or None,
+    )
+
+
 def _parse_log_line(line: str) -> Optional[dict]:
     """Parse a single AFLog line into structured fields."""
     stripped = line.strip()
@@ -1036,7 +1149,7 @@ def create_app(
         )
     
     # Import here after ensuring dependencies are available
-    from flask import Flask, jsonify, request
+    from flask import Flask, Response, jsonify, request
     from flask_cors import CORS
     
     # Configure Flask to serve static files from actifix-frontend
@@ -1057,7 +1170,11 @@ def create_app(
     socketio = None
     if SOCKETIO_AVAILABLE:
         from flask_socketio import SocketIO
-        socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+        socketio_options = {}
+        if get_config().api_workers > 1:
+            # Long-polling needs sticky sessions, which worker processes lack
+            socketio_options["transports"] = ["websocket"]
+        socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading", **socketio_options)
         _socketio_instance = socketio
         app.extensions["socketio"] = socketio
 
@@ -1387,57 +1504,78 @@ def create_app(
         response.headers['Expires'] = '0'
         return response
     
+    def _ticket_change_token(repo) -> tuple:
+        """Cheap change token for ticket-derived responses (one PK lookup)."""
+        return str(repo.pool.config.db_path), repo.get_write_generation()
+
+    def _conditional_get(endpoint: str, token_fn, build):
+        """
+        Answer a GET with a strong ETag derived from a change token.
+
+        The ETag hashes the endpoint, the token and the query params. When
+        If-None-Match matches, 304 is returned without calling build, so no
+        rows are read and nothing is serialised.
+        """
+        try:
+            token = token_fn()
+        except Exception:
+            return build()
+        etag = hashlib.sha256(
+            repr((endpoint, token, sorted(request.args.items(multi=True)))).encode("utf-8")
+        ).hexdigest()[:32]
+
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.make_response(build())
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        # Let browsers keep the body but revalidate before every use
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    def _serve_cached(endpoint: str, build):
+        """
+        Serve an aggregate read through the response cache.
+
+        Entries are keyed by endpoint, database and query params, and reused
+        until a ticket write bumps the write generation or the entry is
+        older than the max-staleness bound. Error responses are not cached.
+        """
+        paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
+
+        def render():
+            response = app.make_response(build(paths))
+            return response.get_data(), response.status_code, response.headers.get('Content-Type')
+
+        try:
+            db_path, generation = _ticket_change_token(_get_ticket_repository(paths))
+            key = (endpoint, db_path, tuple(sorted(request.args.items(multi=True))))
+        except Exception:
+            # Unknown generation: never serve a possibly stale entry
+            (body, status, content_type), hit = render(), False
+        else:
+            (body, status, content_type), hit = get_response_cache().get_or_compute(
+                key, generation, render, cacheable=lambda value: value[1] < 400,
+            )
+
+        response = app.response_class(body, status=status, content_type=content_type)
+        response.headers['X-Actifix-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
     @app.route('/api/health', methods=['GET'])
     def api_health():
         """Get comprehensive health check data."""
         # Check authentication
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
-        
-        paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
-        
-        # Health summary
-        health = get_health(paths)
-        
-        # Git info
-        git_info = _gather_version_info(app.config['PROJECT_ROOT'])
-        
-        # Disk usage
-        disk_info = None
-        try:
-            import psutil
-            disk = psutil.disk_usage(str(paths.data_dir.parent))
-            disk_gb = lambda b: round(b / (1024**3), 1)
-            disk_info = {
-                'total_gb': disk_gb(disk.total),
-                'used_gb': disk_gb(disk.used),
-                'free_gb': disk_gb(disk.free),
-                'percent': round((disk.used / disk.total) * 100, 1)
-            }
-        except Exception:
-            disk_info = None
-        
-        # Recent events snippet
-        recent_events = []
-        try:
-            repo = get_event_repository()
-            raw_events = repo.get_recent_events(limit=5)
-            recent_events = [{
-                "timestamp": e.get("timestamp", ""),
-                "event": e.get("event_type", "LOG"),
-                "text": (e.get("message", "")[:50] + "...") if len(e.get("message", "")) > 50 else e.get("message", "")
-            } for e in raw_events[-5:][::-1]]
-        except Exception:
-            recent_events = []
-        
-        # Paths summary
-        paths_dict = {
-            "base_dir": str(paths.base_dir),
-            "data_dir": str(paths.data_dir),
-            "logs_dir": str(paths.logs_dir),
-            "state_dir": str(paths.state_dir),
-        }
-        health = get_health(paths)
+        return _serve_cached('health', _build_health)
+
+    def _build_health(paths):
+        # Latest background sample; probes never run the checks themselves
+        snapshot = get_health_snapshot(paths)
+        health = snapshot.health
 
         # Module liveness and key metrics
         module_health = {}
@@ -1461,15 +1599,6 @@ def create_app(
         except Exception:
             module_health = {'error': 'Unable to query module status'}
 
-        # Database pool metrics
-        pool_metrics = {}
-        try:
-            from .persistence.database import get_database_pool
-            pool = get_database_pool()
-            pool_metrics = pool.get_pool_metrics()
-        except Exception:
-            pool_metrics = {'error': 'Unable to query pool metrics'}
-
         return jsonify({
             'healthy': health.healthy,
             'status': health.status,
@@ -1485,11 +1614,15 @@ def create_app(
                 'files_writable': health.files_writable,
             },
             'modules': module_health,
-            'database': pool_metrics,
+            'database': snapshot.pool_metrics,
             'warnings': health.warnings,
             'errors': health.errors,
             'details': health.details,
-    })
+            'sample': {
+                'sampled_at': snapshot.sampled_at.isoformat(),
+                'duration_ms': snapshot.duration_ms,
+            },
+        })
     
     @app.route('/api/version', methods=['GET'])
     def api_version():
@@ -1508,11 +1641,19 @@ def create_app(
         # Check authentication
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
-        
         paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
+        # SLA breach hours grow without writes, so the token also rolls
+        # over every minute.
+        return _conditional_get(
+            'stats',
+            lambda: (*_ticket_change_token(_get_ticket_repository(paths)), int(time.time() // 60)),
+            lambda: _serve_cached('stats', _build_stats),
+        )
+
+    def _build_stats(paths):
         stats = get_ticket_stats(paths)
-        breaches = check_sla_breaches(paths)
-        
+        breaches = check_sla_breaches(paths, incremental=True)
+
         return jsonify({
             'total': stats.get('total', 0),
             'open': stats.get('open', 0),
@@ -1528,7 +1669,13 @@ def create_app(
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
 
-        paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
+        response = _serve_cached('metrics', _build_metrics)
+        if response.status_code == 200:
+            # Cache counters are always current, not part of the cached body
+            response.set_data(response.get_data(as_text=True) + render_response_cache_metrics())
+        return response
+
+    def _build_metrics(paths):
         try:
             payload = export_prometheus_metrics(paths)
         except Exception as exc:
@@ -1553,7 +1700,7 @@ def create_app(
 
         try:
             paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
-            health = get_health(paths)
+            health = get_health_snapshot(paths).health
 
             # Extract stats from health details
             stats = health.details.get("stats", {})
@@ -1585,6 +1732,7 @@ def create_app(
                     "warnings": health.warnings,
                     "errors": health.errors,
                 },
+                "response_cache": get_response_cache().get_stats(),
             }
 
             return jsonify(metrics)
@@ -1608,7 +1756,7 @@ def create_app(
         root = Path(app.config['PROJECT_ROOT'])
         paths = get_actifix_paths(project_root=root)
         try:
-            health = get_health(paths)
+            health = get_health_snapshot(paths).health
             stats = get_ticket_stats(paths)
             modules = _load_modules(root)
             registry = app.extensions.get("actifix_module_registry")
@@ -1648,39 +1796,40 @@ def create_app(
         # Check authentication
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
-        
+
         paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
+        return _conditional_get(
+            'tickets',
+            lambda: _ticket_change_token(_get_ticket_repository(paths)),
+            lambda: _build_tickets(paths),
+        )
+
+    def _build_tickets(paths):
         limit = request.args.get('limit', 20, type=int)
 
-        open_tickets = get_open_tickets(paths)
-        completed_tickets = get_completed_tickets(paths)
+        # Ordering and the limit run in SQL; only `limit` rows are loaded
+        repo = _get_ticket_repository(paths)
+        recent = repo.get_recent_tickets(limit, statuses=("Open", "Completed"))
 
         # Get stats using same method as /health endpoint for consistency
         stats = get_ticket_stats(paths)
 
         # Format tickets for API response
-        def format_ticket(ticket, status='open'):
+        def format_ticket(ticket):
+            message = ticket.get('message') or ''
+            created_at = ticket.get('created_at')
             return {
-                'ticket_id': ticket.ticket_id,
-                'error_type': ticket.error_type,
-                'message': ticket.message[:100] + '...' if len(ticket.message) > 100 else ticket.message,
-                'source': ticket.source,
-                'priority': ticket.priority,
-                'created': ticket.created,
-                'status': status,
+                'ticket_id': ticket['id'],
+                'error_type': ticket.get('error_type'),
+                'message': message[:100] + '...' if len(message) > 100 else message,
+                'source': ticket.get('source'),
+                'priority': ticket.get('priority'),
+                'created': created_at.isoformat() if created_at else '',
+                'status': 'completed' if ticket.get('status') == 'Completed' else 'open',
             }
 
-        all_tickets = [
-            format_ticket(t, 'open') for t in open_tickets
-        ] + [
-            format_ticket(t, 'completed') for t in completed_tickets
-        ]
-
-        # Sort by created date (newest first)
-        all_tickets.sort(key=lambda x: x['created'], reverse=True)
-
         return jsonify({
-            'tickets': all_tickets[:limit],
+            'tickets': [format_ticket(t) for t in recent],
             'total_open': stats.get('open', 0),
             'total_completed': stats.get('completed', 0),
         })
@@ -1692,13 +1841,16 @@ def create_app(
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
         
-        paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
         from .persistence.ticket_repo import get_ticket_repository
         repo = get_ticket_repository()
-        ticket = repo.get_ticket(ticket_id)
-        if not ticket:
-            return jsonify({'error': 'Ticket not found'}), 404
-        return jsonify(ticket)
+
+        def build():
+            ticket = repo.get_ticket(ticket_id)
+            if not ticket:
+                return jsonify({'error': 'Ticket not found'}), 404
+            return jsonify(ticket)
+
+        return _conditional_get(f'ticket:{ticket_id}', lambda: _ticket_change_token(repo), build)
 
     @app.route('/api/raise-ticket', methods=['POST'])
     def api_raise_ticket():
@@ -1858,9 +2010,22 @@ def create_app(
             return jsonify({'error': 'Authorization required'}), 401
 
         log_type = request.args.get('type', 'audit')
+        setup_log = app.config['PROJECT_ROOT'] / 'logs' / 'setup.log'
+
+        def change_token():
+            if log_type == "setup":
+                stat = setup_log.stat() if setup_log.exists() else None
+                return (stat.st_mtime_ns, stat.st_size) if stat else None
+            # Event ids only grow, so the newest id changes on every write;
+            # the generation changes when retention drops events
+            repo = get_event_repository()
+            return str(repo.pool.config.db_path), repo.latest_event_id(), repo.get_write_generation()
+
+        return _conditional_get('logs', change_token, lambda: _build_logs(log_type, setup_log))
+
+    def _build_logs(log_type, setup_log):
         max_lines = request.args.get('lines', 100, type=int)
         if log_type == "setup":
-            setup_log = app.config['PROJECT_ROOT'] / 'logs' / 'setup.log'
             if not setup_log.exists():
                 return jsonify({
                     'content': [],
@@ -1882,43 +2047,25 @@ def create_app(
                     'total_lines': len(file_lines),
                 })
             except Exception as e:
+                # Not 200, so no validator is attached to the error body
                 return jsonify({
                     'content': [],
                     'file': str(setup_log),
                     'error': str(e),
-                })
+                }), 500
+
+        limit = max_lines if max_lines > 0 else 100
+        try:
+            event_filter = _log_events_filter(request.args, log_type, limit)
+        except ValueError as e:
+            return jsonify({'error': f'Invalid time filter: {e}'}), 400
 
         try:
             repo = get_event_repository()
-            limit = max_lines if max_lines > 0 else 100
-            if log_type == "errors":
-                raw_events = repo.get_events(EventFilter(limit=max(limit * 5, 100)))
-                events = [
-                    event for event in raw_events
-                    if (event.get("level") or "").upper() in {"ERROR", "CRITICAL"}
-                ]
-            else:
-                events = repo.get_recent_events(limit=limit)
-
-            events = list(reversed(events))
-            if len(events) > max_lines:
-                events = events[-max_lines:]
-
-            parsed_lines = []
-            for event in events:
-                event_type = event.get("event_type") or "LOG"
-                message = event.get("message") or ""
-                level = (event.get("level") or "").upper()
-                if not level:
-                    level = _map_event_type_to_level(event_type, message)
-                parsed_lines.append({
-                    "timestamp": event.get("timestamp") or "",
-                    "event": event_type,
-                    "ticket": event.get("ticket_id") or "-",
-                    "text": message,
-                    "extra": event.get("extra_json"),
-                    "level": level,
-                })
+            # Filters run in SQL, so exactly `limit` matching rows come back
+            events = list(reversed(repo.get_events(event_filter)))
+
+            parsed_lines = [_event_to_log_line(event) for event in events]
 
             return jsonify({
                 'content': parsed_lines,
@@ -1930,7 +2077,87 @@ def create_app(
                 'content': [],
                 'file': 'data/actifix.db:event_log',
                 'error': str(e),
+            }), 500
+
+    @app.route('/api/events/tail', methods=['GET'])
+    def api_events_tail():
+        """
+        Get events committed after an id cursor (long-poll).
+
+        Query args: after_id (omit to start at the latest events), limit,
+        wait (seconds to block when nothing is new), and equality filters
+        event_type, ticket_id, correlation_id, level, source. Pass the
+        returned cursor as after_id on the next request.
+        """
+        if not _check_auth(request):
+            return jsonify({'error': 'Authorization required'}), 401
+
+        after_id = request.args.get('after_id', None, type=int)
+        limit = max(1, min(request.args.get('limit', 100, type=int), MAX_EVENT_TAIL_LIMIT))
+        wait = max(0.0, min(request.args.get('wait', 0.0, type=float), MAX_EVENT_TAIL_WAIT_SECONDS))
+
+        try:
+            events, cursor = get_event_repository().tail_events(
+                after_id, limit, filter=_event_tail_filter(request.args), wait_seconds=wait,
+            )
+            return jsonify({
+                'content': [_event_to_log_line(event) for event in events],
+                'cursor': cursor,
+                'has_more': len(events) >= limit,
             })
+        except Exception as e:
+            record_error(
+                message=f"Event tail failed: {e}",
+                source="api.py:api_events_tail",
+                priority=TicketPriority.P3,
+            )
+            return jsonify({'error': str(e)}), 500
+
+    @app.route('/api/events/stream', methods=['GET'])
+    def api_events_stream():
+        """
+        Stream committed events as Server-Sent Events.
+
+        Resumes from the Last-Event-ID header (or after_id). Streams end after
+        `duration` seconds (max 300); EventSource clients reconnect and resume.
+        """
+        if not _check_auth(request):
+            return jsonify({'error': 'Authorization required'}), 401
+
+        after_id = request.args.get('after_id', None, type=int)
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        if last_event_id.isdigit():
+            after_id = int(last_event_id)
+        limit = max(1, min(request.args.get('limit', 100, type=int), MAX_EVENT_TAIL_LIMIT))
+        duration = max(0.0, min(
+            request.args.get('duration', EVENT_STREAM_MAX_SECONDS, type=float), EVENT_STREAM_MAX_SECONDS
+        ))
+        event_filter = _event_tail_filter(request.args)
+        repo = get_event_repository()
+
+        def generate():
+            cursor = after_id
+            deadline = time.monotonic() + duration
+            yield "retry: 3000\n\n"
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                events, cursor = repo.tail_events(
+                    cursor, limit, filter=event_filter,
+                    wait_seconds=min(EVENT_STREAM_KEEPALIVE_SECONDS, remaining),
+                )
+                if not events:
+                    yield ": keepalive\n\n"
+                for event in events:
+                    payload = json.dumps(_event_to_log_line(event))
+                    yield f"id: {event['id']}\nevent: log\ndata: {payload}\n\n"
+
+        return Response(
+            generate(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
 
     def _collect_recent_events(limit: int = 5) -> List[Dict[str, str]]:
         """Helper to fetch recent events for dashboard summary sections."""
@@ -2000,7 +2227,7 @@ def create_app(
             "logs_dir": str(paths.logs_dir),
             "state_dir": str(paths.state_dir),
         }
-        health = get_health(paths)
+        health = get_health_snapshot(paths).health
         git_info = _gather_version_info(app.config['PROJECT_ROOT'])
         recent_events = _collect_recent_events(limit=5)
 
@@ -2046,16 +2273,39 @@ def create_app(
         # Check authentication
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
-        
-        modules = _load_modules(app.config['PROJECT_ROOT'])
+
+        root = Path(app.config['PROJECT_ROOT'])
+        paths = get_actifix_paths(project_root=root)
+        status_file = paths.state_dir / "module_statuses.json"
         registry = app.extensions.get("actifix_module_registry")
 
-        # Load module status for annotation
-        paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
-        status_payload = _read_module_status_payload(paths.state_dir / "module_statuses.json")
+        def change_token():
+            # The catalog files and status file, plus in-memory registrations
+            files = []
+            for path in (
+                root / "docs" / "architecture" / "DEPGRAPH.json",
+                root / "docs" / "architecture" / "MAP.yaml",
+                root / "docs" / "architecture" / "MODULES.md",
+                status_file,
+            ):
+                stat = path.stat() if path.exists() else None
+                files.append((stat.st_mtime_ns, stat.st_size) if stat else None)
+            contexts = registry.registered_contexts() if registry else {}
+            metadata = registry.registered_metadata() if registry else {}
+            runtime = sorted(
+                (name, context.host, context.port, str((metadata.get(name) or {}).get("version")))
+                for name, context in contexts.items()
+            )
+            return tuple(files), tuple(runtime)
+
+        def build():
+            modules = _load_modules(root)
+            # Load module status for annotation
+            status_payload = _read_module_status_payload(status_file)
+            _annotate_modules_with_runtime_contexts(modules, registry, status_payload)
+            return jsonify(modules)
 
-        _annotate_modules_with_runtime_contexts(modules, registry, status_payload)
-        return jsonify(modules)
+        return _conditional_get('modules', change_token, build)
 
     @app.route('/api/modules/<module_id>/health', methods=['GET'])
     def api_module_health(module_id):
@@ -2581,6 +2831,32 @@ def create_app(
         else:
             return jsonify({'valid': False, 'error': 'Invalid password'}), 401
 
+    @app.route('/api/auth/admin-session', methods=['POST'])
+    def api_auth_admin_session():
+        """Exchange the admin password (or a live session) for a session token.
+
+        The password is checked once here; later requests send the token in
+        X-Admin-Session (or as a Bearer token) instead of X-Admin-Password.
+        """
+        data = request.get_json(silent=True) or {}
+        password = data.get('password', '')
+        current = request.headers.get("X-Admin-Session", "") or _extract_bearer_token(request) or ""
+        if password:
+            if not _verify_admin_password(password):
+                return jsonify({'error': 'Invalid password'}), 401
+        elif not (current and _verify_admin_session(current)):
+            return jsonify({'error': 'Password or valid admin session required'}), 401
+
+        try:
+            return jsonify(_issue_admin_session())
+        except Exception as e:
+            record_error(
+                message=f"Admin session issue failed: {e}",
+                source="api.py:api_auth_admin_session",
+                priority=TicketPriority.P2,
+            )
+            return jsonify({'error': 'Could not issue admin session'}), 500
+
     @app.route('/api/schema/tickets', methods=['GET'])
     def api_schema_tickets():
         """Export JSON Schema for ticket data structure."""
@@ -2795,7 +3071,6 @@ def create_app(
         """Runtime environment snapshot (redacted)."""
         try:
             from .raise_af import redact_secrets_from_text
-            from .persistence.database import get_database_pool
             import sys
             import platform as plat
 
@@ -2812,10 +3087,9 @@ def create_app(
                 'config': {},
             }
 
-            # Database pool metrics
+            # Database pool metrics (from the background health sample)
             try:
-                pool = get_database_pool()
-                pool_metrics = pool.get_pool_metrics()
+                pool_metrics = get_health_snapshot().pool_metrics
                 diagnostics['database'] = {
                     'connection_healthy': pool_metrics.get('connection_healthy'),
                     'db_size_mb': pool_metrics.get('db_size_mb'),
@@ -2826,7 +3100,7 @@ def create_app(
 
             # Health summary
             try:
-                health = get_health()
+                health = get_health_snapshot().health
                 diagnostics['health'] = {
                     'healthy': health.healthy,
                     'status': health.status,
@@ -3013,29 +3287,27 @@ def create_app(
         # Check authentication
         if not _check_auth(request):
             return jsonify({'error': 'Authorization required'}), 401
+        return _serve_cached('tickets_summary', _build_tickets_summary)
 
+    def _build_tickets_summary(paths):
         try:
-            paths = get_actifix_paths(project_root=app.config['PROJECT_ROOT'])
             stats = get_ticket_stats(paths)
-            breaches = check_sla_breaches(paths)
+            sla = get_sla_summary(paths, incremental=True)
 
-            # Get oldest ticket age
-            from .do_af import get_open_tickets
-            tickets = get_open_tickets(paths)
+            # Oldest open ticket age (MIN(created_at_ms) seek, not a scan)
+            oldest = _get_ticket_repository(paths).get_created_bounds("Open")['oldest']
             oldest_age_hours = 0
-            if tickets:
-                from .health import _get_ticket_age_hours
-                for ticket in tickets:
-                    age = _get_ticket_age_hours(ticket.created)
-                    if age > oldest_age_hours:
-                        oldest_age_hours = age
+            if oldest is not None:
+                oldest_age_hours = max(
+                    0.0, (datetime.now(timezone.utc) - oldest).total_seconds() / 3600
+                )
 
             return jsonify({
                 'total': stats.get('total', 0),
                 'open': stats.get('open', 0),
                 'completed': stats.get('completed', 0),
                 'by_priority': stats.get('by_priority', {}),
-                'sla_breaches': len(breaches),
+                'sla_breaches': sla.total,
                 'oldest_ticket_age_hours': round(oldest_age_hours, 1),
                 'timestamp': datetime.now(timezone.utc).isoformat(),
             })
@@ -3140,19 +3412,47 @@ def run_api_server(
     port: int = 5001,
     project_root: Optional[Path] = None,
     debug: bool = False,
+    workers: Optional[int] = None,
 ) -> None:
     """
     Run the API server.
 
+    With more than one worker (ACTIFIX_API_WORKERS) the API is served by
+    a prefork server of that many processes; debug mode always runs a
+    single process.
+
     Args:
         host: Host to bind to.
         port: Port to bind to.
         project_root: Optional project root path.
         debug: Enable debug mode.
+        workers: Worker processes (defaults to config api_workers).
     """
+    config = get_config()
+    if workers is None:
+        workers = config.api_workers
+    if workers > 1 and not debug:
+        from .api_server import run_prefork_server
+
+        shipper = _start_wal_shipper()
+        try:
+            run_prefork_server(
+                host=host,
+                port=port,
+                project_root=project_root,
+                workers=workers,
+                reuse_port=config.api_reuse_port,
+                graceful_timeout=config.api_graceful_timeout_seconds,
+            )
+        finally:
+            if shipper is not None:
+                shipper.stop()
+        return
+
     app = create_app(project_root, host=host, port=port)
     registry = app.extensions.get("actifix_module_registry")
     socketio = app.extensions.get("socketio")
+    shipper = _start_wal_shipper()
 
     # Register signal handlers for graceful shutdown
     def signal_handler(signum, frame):
@@ -3172,13 +3472,43 @@ def run_api_server(
 
     try:
         if socketio is not None:
-            socketio.run(app, host=host, port=port, debug=debug)
+            # Same threaded Werkzeug server scripts/start.py runs via run_simple
+            socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True)
         else:
             app.run(host=host, port=port, debug=debug, threaded=True)
     finally:
+        if shipper is not None:
+            shipper.stop()
         if isinstance(registry, ModuleRegistry):
             registry.shutdown()
 
 
+def _start_wal_shipper():
+    """Start WAL shipping to the standby directory when ACTIFIX_REPLICA_DIR is set."""
+    try:
+        config = get_config()
+        if not config.replica_dir:
+            return None
+        from .persistence.database import get_database_pool
+        from .persistence.replication import get_wal_shipper
+
+        shipper = get_wal_shipper(
+            get_database_pool().config.db_path,
+            Path(config.replica_dir).expanduser(),
+            interval_seconds=config.replica_ship_interval_seconds,
+        )
+        shipper.start()
+        return shipper
+    except Exception as exc:
+        log_event(
+            "REPLICA_START_FAILED",
+            f"Failed to start WAL shipping: {exc}",
+            extra={"error": str(exc)},
+            source="api.run_api_server",
+            level="WARNING",
+        )
+        return None
+
+
 if __name__ == '__main__':
     run_api_server(debug=True)
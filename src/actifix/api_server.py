@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Multi-process (prefork) serving for the Actifix API.
+
+The single-process server runs every request on one GIL, so JSON
+serialisation, redaction, PBKDF2 and row conversion never use more than
+one core. PreforkServer runs N worker processes instead, each with its
+own Flask app, database pool and caches:
+
+- Listening: the master binds one listening socket and hands it to the
+  workers, which all accept from it. With ``reuse_port`` (Linux,
+  ACTIFIX_API_REUSE_PORT) each worker binds its own SO_REUSEPORT socket
+  instead and the kernel spreads connections evenly; the trade-off is
+  that connections still queued on a stopping worker's socket are reset.
+- Workers are started with the ``spawn`` method so nothing (sqlite
+  connections, locks, singletons) is inherited from the master; each
+  worker opens its own database pool on first use.
+- SIGHUP (or ``reload()``) starts a fresh generation of workers, waits
+  until they are serving, then stops the old ones gracefully: they stop
+  accepting and finish in-flight requests within the graceful timeout.
+  The shared socket stays open throughout, so no connection is refused.
+  Fresh workers re-read configuration and re-import code.
+- Ticket events emitted in one worker are relayed through the master to
+  every other worker, which re-emits them to its own Socket.IO clients.
+  Socket.IO is limited to the websocket transport in this mode, because
+  long-polling needs sticky sessions.
+- Dead workers are replaced.
+
+Rate limits only hold across workers with the shared rate limit backend,
+so the master selects it unless ACTIFIX_RATE_LIMIT_BACKEND is set.
+
+Version: 1.0.0
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import List, Optional
+
+from .log_utils import log_event
+
+READY_TIMEOUT_SECONDS = 60.0
+RESPAWN_BACKOFF_SECONDS = 1.0
+MONITOR_INTERVAL_SECONDS = 0.5
+LISTEN_BACKLOG = 1024
+# Shared-socket workers race for each connection; the losers' accept()
+# gives up after this long so a stop request is never stuck behind it
+ACCEPT_TIMEOUT_SECONDS = 0.1
+
+
+def reuse_port_supported() -> bool:
+    """Whether SO_REUSEPORT load-balances connections on this platform."""
+    return hasattr(socket, "SO_REUSEPORT") and sys.platform.startswith("linux")
+
+
+def _bind_socket(host: str, port: int, reuse_port: bool, listen: bool) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        if listen:
+            sock.listen(LISTEN_BACKLOG)
+    except OSError:
+        sock.close()
+        raise
+    sock.set_inheritable(True)
+    return sock
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+
+class _EventChannel:
+    """Worker end of the event fan-out pipe."""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self._send_lock = threading.Lock()
+
+    def publish(self, event_type: str, data: dict) -> None:
+        payload = json.dumps({"event": event_type, "data": data}, default=str).encode("utf-8")
+        try:
+            with self._send_lock:
+                self.conn.send_bytes(payload)
+        except (OSError, ValueError):
+            # Master gone or channel closed; local clients already have it
+            pass
+
+    def run_receiver(self, deliver) -> threading.Thread:
+        def receive():
+            while True:
+                try:
+                    message = json.loads(self.conn.recv_bytes())
+                except (EOFError, OSError):
+                    return
+                except ValueError:
+                    continue
+                try:
+                    deliver(message["event"], message["data"])
+                except Exception:
+                    continue
+
+        thread = threading.Thread(target=receive, name="actifix-api-fanout", daemon=True)
+        thread.start()
+        return thread
+
+
+def _serve_worker(
+    index: int,
+    host: str,
+    port: int,
+    project_root: Optional[str],
+    listen_socket: Optional[socket.socket],
+    channel: Connection,
+    ready: "multiprocessing.synchronize.Event",
+) -> None:
+    """Worker process entry point (runs in a spawned interpreter)."""
+    from werkzeug.serving import make_server
+
+    from . import api
+
+    # Ctrl-C reaches the whole process group; the master coordinates shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    shared = listen_socket is not None
+    if not shared:
+        listen_socket = _bind_socket(host, port, reuse_port=True, listen=True)
+
+    app = api.create_app(Path(project_root) if project_root else None, host=host, port=port)
+    events = _EventChannel(channel)
+    api.set_event_publisher(events.publish)
+    events.run_receiver(api.emit_local_ticket_event)
+
+    server = make_server(host, port, app, threaded=True, fd=listen_socket.fileno())
+    # server_close() then waits for in-flight requests
+    server.daemon_threads = False
+    if shared:
+        server.socket.settimeout(ACCEPT_TIMEOUT_SECONDS)
+
+    def stop(signum, frame):
+        threading.Thread(target=server.shutdown, name="actifix-api-stop", daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    ready.set()
+    log_event(
+        "API_WORKER_STARTED",
+        f"API worker {index} serving on {host}:{port}",
+        extra={"worker": index, "pid": os.getpid(), "host": host, "port": port},
+        source="api_server._serve_worker",
+    )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        registry = app.extensions.get("actifix_module_registry")
+        if registry is not None:
+            registry.shutdown()
+        channel.close()
+
+
+# ----------------------------------------------------------------------
+# Master side
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _Worker:
+    index: int
+    generation: int
+    process: multiprocessing.Process
+    channel: Connection
+    ready: "multiprocessing.synchronize.Event"
+    started_at: float = field(default_factory=time.monotonic)
+    stopping: bool = False
+
+
+class PreforkServer:
+    """Runs the API in several worker processes behind one address."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 5001,
+        workers: int = 2,
+        project_root: Optional[Path] = None,
+        reuse_port: bool = False,
+        graceful_timeout: float = 30.0,
+    ):
+        """Initialize the server (nothing is bound until ``start()``).
+
+        Args:
+            host: Host to bind to
+            port: Port to bind to (0 picks a free port)
+            workers: Number of worker processes
+            project_root: Project root passed to each worker's create_app()
+            reuse_port: Give each worker its own SO_REUSEPORT socket (Linux)
+            graceful_timeout: Seconds a stopping worker gets to drain
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.project_root = str(project_root) if project_root else None
+        self.reuse_port = reuse_port and reuse_port_supported()
+        self.graceful_timeout = graceful_timeout
+        self._ctx = multiprocessing.get_context("spawn")
+        self._socket: Optional[socket.socket] = None
+        self._workers: List[_Worker] = []
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._reload_requested = threading.Event()
+        self._hub: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Bind the address and start the workers and event hub."""
+        # With SO_REUSEPORT the master's socket only reserves the port (it
+        # never listens, so the kernel never hands it a connection)
+        self._socket = _bind_socket(self.host, self.port, self.reuse_port, listen=not self.reuse_port)
+        self.port = self._socket.getsockname()[1]
+        os.environ.setdefault("ACTIFIX_RATE_LIMIT_BACKEND", "shared")
+        os.environ["ACTIFIX_API_WORKERS"] = str(self.workers)
+
+        self._hub = threading.Thread(target=self._run_hub, name="actifix-api-hub", daemon=True)
+        self._hub.start()
+        with self._lock:
+            for index in range(self.workers):
+                self._workers.append(self._spawn(index))
+        log_event(
+            "API_PREFORK_STARTED",
+            f"API serving on {self.host}:{self.port} with {self.workers} workers",
+            extra={
+                "host": self.host, "port": self.port, "workers": self.workers,
+                "reuse_port": self.reuse_port,
+            },
+            source="api_server.PreforkServer",
+        )
+
+    def _spawn(self, index: int) -> _Worker:
+        master_end, worker_end = self._ctx.Pipe(duplex=True)
+        ready = self._ctx.Event()
+        process = self._ctx.Process(
+            target=_serve_worker,
+            args=(
+                index, self.host, self.port, self.project_root,
+                None if self.reuse_port else self._socket,
+                worker_end, ready,
+            ),
+            name=f"actifix-api-worker-{index}",
+            daemon=False,
+        )
+        process.start()
+        worker_end.close()
+        return _Worker(index, self._generation, process, master_end, ready)
+
+    def wait_until_ready(self, timeout: float = READY_TIMEOUT_SECONDS) -> bool:
+        """Block until every current worker is serving."""
+        with self._lock:
+            workers = [w for w in self._workers if not w.stopping]
+        return self._wait_ready(workers, timeout)
+
+    @staticmethod
+    def _wait_ready(workers: List[_Worker], timeout: float) -> bool:
+        """Wait for ``workers`` to serve; False on timeout or if one exits."""
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            while not worker.ready.wait(MONITOR_INTERVAL_SECONDS / 5):
+                if not worker.process.is_alive() or time.monotonic() >= deadline:
+                    return False
+        return True
+
+    def serve_forever(self) -> None:
+        """Start (if needed) and supervise workers until stopped.
+
+        SIGTERM/SIGINT stop gracefully and SIGHUP reloads, when called
+        from the main thread.
+        """
+        if self._socket is None:
+            self.start()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self._stop.set())
+            signal.signal(signal.SIGINT, lambda signum, frame: self._stop.set())
+            if hasattr(signal, "SIGHUP"):
+                signal.signal(signal.SIGHUP, lambda signum, frame: self._reload_requested.set())
+        try:
+            while not self._stop.wait(MONITOR_INTERVAL_SECONDS):
+                if self._reload_requested.is_set():
+                    self._reload_requested.clear()
+                    self.reload()
+                self._replace_dead_workers()
+        finally:
+            self.stop()
+
+    def reload(self) -> bool:
+        """Replace every worker without dropping the listening address.
+
+        Returns:
+            True if the new generation came up (old workers were stopped);
+            False if it did not, in which case the old workers keep serving
+        """
+        with self._lock:
+            old = [w for w in self._workers if not w.stopping]
+            self._generation += 1
+            fresh = [self._spawn(index) for index in range(self.workers)]
+            self._workers.extend(fresh)
+
+        ok = self._wait_ready(fresh, READY_TIMEOUT_SECONDS)
+        self._stop_workers(fresh if not ok else old)
+        log_event(
+            "API_PREFORK_RELOADED" if ok else "API_PREFORK_RELOAD_FAILED",
+            f"API worker reload {'completed' if ok else 'failed; keeping previous workers'}",
+            extra={"generation": self._generation, "workers": self.workers},
+            source="api_server.PreforkServer",
+            level="INFO" if ok else "WARNING",
+        )
+        return ok
+
+    def _replace_dead_workers(self) -> None:
+        with self._lock:
+            for worker in list(self._workers):
+                if worker.stopping or worker.process.is_alive():
+                    continue
+                # A worker that dies on startup would otherwise respawn in a tight loop
+                if time.monotonic() - worker.started_at < RESPAWN_BACKOFF_SECONDS:
+                    continue
+                self._workers.remove(worker)
+                worker.channel.close()
+                log_event(
+                    "API_WORKER_EXITED",
+                    f"API worker {worker.index} exited with code {worker.process.exitcode}; restarting",
+                    extra={"worker": worker.index, "exitcode": worker.process.exitcode},
+                    source="api_server.PreforkServer",
+                    level="WARNING",
+                )
+                self._workers.append(self._spawn(worker.index))
+
+    def _stop_workers(self, workers: List[_Worker]) -> None:
+        with self._lock:
+            for worker in workers:
+                worker.stopping = True
+                if worker.process.is_alive():
+                    worker.process.terminate()
+        deadline = time.monotonic() + self.graceful_timeout
+        for worker in workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+        with self._lock:
+            for worker in workers:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                worker.channel.close()
+
+    def stop(self) -> None:
+        """Stop all workers gracefully and release the address."""
+        self._stop.set()
+        with self._lock:
+            workers = list(self._workers)
+        self._stop_workers(workers)
+        if self._hub is not None:
+            self._hub.join(timeout=MONITOR_INTERVAL_SECONDS * 4)
+            self._hub = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    @property
+    def worker_pids(self) -> List[int]:
+        with self._lock:
+            return [w.process.pid for w in self._workers if not w.stopping and w.process.pid]
+
+    # ------------------------------------------------------------------
+    # Event fan-out
+    # ------------------------------------------------------------------
+
+    def _run_hub(self) -> None:
+        """Relay each worker's ticket events to every other worker."""
+        while not self._stop.is_set():
+            with self._lock:
+                channels = {w.channel: w for w in self._workers if not w.channel.closed}
+            if not channels:
+                time.sleep(MONITOR_INTERVAL_SECONDS)
+                continue
+            try:
+                ready = wait(list(channels), timeout=MONITOR_INTERVAL_SECONDS)
+            except (OSError, ValueError):
+                # A channel was closed while waiting; rebuild the set
+                continue
+            for conn in ready:
+                try:
+                    payload = conn.recv_bytes()
+                except (EOFError, OSError, ValueError):
+                    # The worker is gone: its end stays readable at EOF, so
+                    # keeping it in the wait set would spin this loop
+                    self._close_channel(conn)
+                    continue
+                for other in channels:
+                    if other is conn or other.closed:
+                        continue
+                    try:
+                        other.send_bytes(payload)
+                    except (OSError, ValueError):
+                        self._close_channel(other)
+
+    def _close_channel(self, conn: Connection) -> None:
+        with self._lock:
+            conn.close()
+
+
+def run_prefork_server(
+    host: str = "127.0.0.1",
+    port: int = 5001,
+    project_root: Optional[Path] = None,
+    workers: int = 2,
+    reuse_port: bool = False,
+    graceful_timeout: float = 30.0,
+) -> None:
+    """Serve the API with ``workers`` processes until SIGTERM/SIGINT."""
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = PreforkServer(
+        host=host,
+        port=port,
+        workers=workers,
+        project_root=project_root,
+        reuse_port=reuse_port,
+        graceful_timeout=graceful_timeout,
+    )
+    server.serve_forever()
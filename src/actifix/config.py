@@ -110,6 +110,7 @@ class ActifixConfig:
     max_p4_tickets_per_day: int = 2
     emergency_ticket_threshold: int = 200
     emergency_window_minutes: int = 1
+    ticket_throttle_reconcile_seconds: float = 30.0
 
     # Testing
     min_coverage_percent: float = 80.0
@@ -121,15 +122,50 @@ class ActifixConfig:
     dispatch_timeout_seconds: float = 600.0
     
     # Health checks
-    health_check_interval_seconds: float = 60.0
+    health_check_interval_seconds: float = 15.0  # Background health sampler cadence
     stale_lock_timeout_seconds: float = 300.0
 
+    # WAL shipping replica (empty replica_dir disables shipping)
+    replica_dir: str = ""
+    replica_ship_interval_seconds: float = 5.0
+
+    # Per-project ticket shards (empty ticket_shard_dir keeps the single database)
+    ticket_shard_dir: str = ""
+    ticket_shard_key: str = ""  # Defaults to the project directory name
+
+    # Event log partitioning ("day" or "week" partitions; retention drops whole partitions)
+    event_partition_period: str = "day"
+
+    # API response cache for aggregate reads (0 disables caching)
+    response_cache_max_staleness_seconds: float = 5.0
+
+    # API token verification cache (0 TTL disables) and last_used flush cadence
+    auth_token_cache_ttl_seconds: float = 30.0
+    auth_token_cache_max_entries: int = 1024
+    auth_usage_flush_seconds: float = 15.0
+
+    # Admin session tokens exchanged for the admin password
+    admin_session_ttl_seconds: float = 3600.0
+    admin_session_rotation_seconds: float = 86400.0
+
     # Module rate limits (per-module)
     module_rate_limit_per_minute: int = 60
     module_rate_limit_per_hour: int = 600
     module_rate_limit_per_day: int = 2000
     module_rate_limit_overrides_json: str = ""
 
+    # Rate limiter counters: "memory" (per process) or "shared" (mmap file
+    # in the state dir, one limit across workers); call record flush cadence
+    rate_limit_backend: str = "memory"
+    rate_limit_flush_seconds: float = 2.0
+
+    # API server worker processes (1 = single threaded process), whether
+    # each worker binds its own SO_REUSEPORT socket, and how long a stopping
+    # or reloaded worker may take to finish in-flight requests
+    api_workers: int = 1
+    api_reuse_port: bool = False
+    api_graceful_timeout_seconds: float = 30.0
+
     # Module config overrides (per-module)
     module_config_overrides_json: str = ""
     
@@ -312,6 +348,9 @@ def load_config(
         emergency_window_minutes=_parse_int(
             _get_env_sanitized("ACTIFIX_EMERGENCY_WINDOW_MINUTES", "", value_type="numeric"), 1
         ),
+        ticket_throttle_reconcile_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_TICKET_THROTTLE_RECONCILE_SECONDS", "", value_type="numeric"), 30.0
+        ),
 
         min_coverage_percent=_parse_float(
             _get_env_sanitized("ACTIFIX_MIN_COVERAGE", "", value_type="numeric"), 80.0
@@ -331,11 +370,36 @@ def load_config(
         ),
 
         health_check_interval_seconds=_parse_float(
-            _get_env_sanitized("ACTIFIX_HEALTH_INTERVAL", "", value_type="numeric"), 60.0
+            _get_env_sanitized("ACTIFIX_HEALTH_INTERVAL", "", value_type="numeric"), 15.0
         ),
         stale_lock_timeout_seconds=_parse_float(
             _get_env_sanitized("ACTIFIX_STALE_LOCK_TIMEOUT", "", value_type="numeric"), 300.0
         ),
+        replica_dir=_get_env_sanitized("ACTIFIX_REPLICA_DIR", "", value_type="path"),
+        replica_ship_interval_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_REPLICA_INTERVAL", "", value_type="numeric"), 5.0
+        ),
+        ticket_shard_dir=_get_env_sanitized("ACTIFIX_SHARD_DIR", "", value_type="path"),
+        ticket_shard_key=_get_env_sanitized("ACTIFIX_SHARD_KEY", ""),
+        event_partition_period=_get_env_sanitized("ACTIFIX_EVENT_PARTITION", "day").lower(),
+        response_cache_max_staleness_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_RESPONSE_CACHE_TTL", "", value_type="numeric"), 5.0
+        ),
+        auth_token_cache_ttl_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_AUTH_TOKEN_CACHE_TTL", "", value_type="numeric"), 30.0
+        ),
+        auth_token_cache_max_entries=_parse_int(
+            _get_env_sanitized("ACTIFIX_AUTH_TOKEN_CACHE_SIZE", "", value_type="numeric"), 1024
+        ),
+        auth_usage_flush_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_AUTH_USAGE_FLUSH_SECONDS", "", value_type="numeric"), 15.0
+        ),
+        admin_session_ttl_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_ADMIN_SESSION_TTL", "", value_type="numeric"), 3600.0
+        ),
+        admin_session_rotation_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_ADMIN_SESSION_ROTATION", "", value_type="numeric"), 86400.0
+        ),
 
         module_rate_limit_per_minute=_parse_int(
             _get_env_sanitized("ACTIFIX_MODULE_RATE_LIMIT_PER_MINUTE", "", value_type="numeric"), 60
@@ -349,6 +413,17 @@ def load_config(
         module_rate_limit_overrides_json=_get_env_sanitized(
             "ACTIFIX_MODULE_RATE_LIMIT_OVERRIDES", "", value_type="string"
         ),
+        rate_limit_backend=_get_env_sanitized("ACTIFIX_RATE_LIMIT_BACKEND", "memory").lower(),
+        rate_limit_flush_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_RATE_LIMIT_FLUSH_SECONDS", "", value_type="numeric"), 2.0
+        ),
+        api_workers=_parse_int(
+            _get_env_sanitized("ACTIFIX_API_WORKERS", "", value_type="numeric"), 1
+        ),
+        api_reuse_port=_parse_bool(_get_env_sanitized("ACTIFIX_API_REUSE_PORT", "0", value_type="boolean")),
+        api_graceful_timeout_seconds=_parse_float(
+            _get_env_sanitized("ACTIFIX_API_GRACEFUL_TIMEOUT", "", value_type="numeric"), 30.0
+        ),
         module_config_overrides_json=_get_env_sanitized(
             "ACTIFIX_MODULE_CONFIG_OVERRIDES", "", value_type="string"
         ),
@@ -474,18 +549,44 @@ def validate_config(config: ActifixConfig) -> list[str]:
         errors.append("Emergency ticket threshold must be positive")
     if config.emergency_window_minutes <= 0:
         errors.append("Emergency window minutes must be positive")
+    if config.ticket_throttle_reconcile_seconds <= 0:
+        errors.append("Ticket throttle reconcile interval must be positive")
     if config.module_rate_limit_per_minute <= 0:
         errors.append("Module rate limit per minute must be positive")
     if config.module_rate_limit_per_hour <= 0:
         errors.append("Module rate limit per hour must be positive")
     if config.module_rate_limit_per_day <= 0:
         errors.append("Module rate limit per day must be positive")
+    if config.rate_limit_backend not in ("memory", "shared"):
+        errors.append("Rate limit backend must be 'memory' or 'shared'")
+    if config.rate_limit_flush_seconds <= 0:
+        errors.append("Rate limit flush interval must be positive")
+    if config.api_workers < 1:
+        errors.append("API workers must be at least 1")
+    if config.api_graceful_timeout_seconds <= 0:
+        errors.append("API graceful timeout must be positive")
+    if config.event_partition_period not in ("day", "week"):
+        errors.append("Event partition period must be 'day' or 'week'")
+    if config.response_cache_max_staleness_seconds < 0:
+        errors.append("Response cache max staleness must not be negative")
+    if config.auth_token_cache_ttl_seconds < 0:
+        errors.append("Auth token cache TTL must not be negative")
+    if config.auth_token_cache_max_entries < 1:
+        errors.append("Auth token cache size must be at least 1")
+    if config.auth_usage_flush_seconds <= 0:
+        errors.append("Auth usage flush interval must be positive")
+    if config.admin_session_ttl_seconds < 1:
+        errors.append("Admin session TTL must be at least 1 second")
+    if config.admin_session_rotation_seconds < config.admin_session_ttl_seconds:
+        errors.append("Admin session key rotation must not be shorter than the session TTL")
 
     # Check timeouts are positive
     if config.test_timeout_seconds <= 0:
         errors.append("Test timeout must be positive")
     if config.dispatch_timeout_seconds <= 0:
         errors.append("Dispatch timeout must be positive")
+    if config.health_check_interval_seconds <= 0:
+        errors.append("Health check interval must be positive")
     
     return errors
 
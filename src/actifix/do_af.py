@@ -81,6 +81,7 @@ def _agent_voice_best_effort(
             level=level,
             extra=extra,
             correlation_id=correlation_id,
+            buffered=True,
         )
     except Exception:
         # record_agent_voice captures failures via Raise_AF; don't block dispatch.
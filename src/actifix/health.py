@@ -7,13 +7,15 @@ Provides health checks, SLA tracking, and system diagnostics.
 import json
 import os
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
 
 from .state_paths import get_actifix_paths, ActifixPaths
-from .do_af import get_open_tickets, get_ticket_stats
+from .do_af import _get_ticket_repository, get_open_tickets, get_ticket_stats
+from .persistence.database import timestamp_to_epoch_ms
 from .raise_af import record_error, TicketPriority
 
 _AGENT_STATUS_FILENAME = "doaf_agent_status.json"
@@ -122,36 +124,192 @@ def _agent_status_stale(agent_status: dict, now: datetime) -> bool:
     return now - parsed > timedelta(minutes=_AGENT_STALE_MINUTES)
 
 
-def check_sla_breaches(paths: Optional[ActifixPaths] = None) -> list[dict]:
+_SLA_PRIORITIES = ("P0", "P1", "P2", "P3", "P4")
+_MS_PER_HOUR = 3_600_000
+
+
+def _sla_thresholds_ms() -> dict:
+    return {p: _get_sla_threshold(p) * _MS_PER_HOUR for p in _SLA_PRIORITIES}
+
+
+def _now_ms(now: datetime) -> int:
+    return int(now.timestamp() * 1000)
+
+
+@dataclass(frozen=True)
+class SlaSummary:
     """
-    Check for SLA breaches in open tickets.
-    
+    SLA state of the open backlog at one instant.
+
+    ``priorities`` maps priority to the breach count, the oldest open
+    ticket and the created time of the oldest ticket still inside its
+    SLA. Ages are derived from the stored epoch-ms values, so a summary
+    can be reported at a later ``now`` as long as no breach instant and
+    no ticket write lies in between.
+    """
+
+    evaluated_at: datetime
+    thresholds_ms: dict
+    priorities: dict
+    next_breach_at: Optional[datetime]
+
+    @property
+    def total(self) -> int:
+        return sum(row["breached"] for row in self.priorities.values())
+
+    @property
+    def oldest_open_ms(self) -> Optional[int]:
+        oldest = [row["oldest_ms"] for row in self.priorities.values() if row["oldest_ms"] is not None]
+        return min(oldest) if oldest else None
+
+    def is_current(self, now_ms: int) -> bool:
+        """Whether no ticket has crossed its SLA since the evaluation."""
+        return self.next_breach_at is None or now_ms < _now_ms(self.next_breach_at)
+
+    def breaches(self, now: Optional[datetime] = None) -> list[dict]:
+        """Oldest breaching ticket per priority (with the count), most urgent first."""
+        now_ms = _now_ms(now or datetime.now(timezone.utc))
+        breaches = []
+        for priority in sorted(self.priorities):
+            row = self.priorities[priority]
+            if not row["breached"]:
+                continue
+            sla_hours = self.thresholds_ms[priority] // _MS_PER_HOUR
+            age_hours = (now_ms - row["oldest_ms"]) / _MS_PER_HOUR
+            breaches.append({
+                "ticket_id": row["oldest_id"],
+                "priority": priority,
+                "count": row["breached"],
+                "age_hours": round(age_hours, 1),
+                "sla_hours": sla_hours,
+                "breach_hours": round(age_hours - sla_hours, 1),
+            })
+        return breaches
+
+
+def _evaluate_sla_in_python(paths: ActifixPaths, thresholds_ms: dict, now_ms: int) -> dict:
+    """Fallback while the epoch-ms backfill has not reached every open ticket."""
+    priorities = {
+        p: {"breached": 0, "oldest_id": None, "oldest_ms": None, "next_ms": None}
+        for p in thresholds_ms
+    }
+    for ticket in get_open_tickets(paths):
+        created = _parse_iso_datetime(ticket.created)
+        row = priorities.get(ticket.priority)
+        if created is None or row is None:
+            continue
+        created_ms = timestamp_to_epoch_ms(created)
+        if row["oldest_ms"] is None or created_ms < row["oldest_ms"]:
+            row["oldest_ms"], row["oldest_id"] = created_ms, ticket.ticket_id
+        if created_ms <= now_ms - thresholds_ms[ticket.priority]:
+            row["breached"] += 1
+        elif row["next_ms"] is None or created_ms < row["next_ms"]:
+            row["next_ms"] = created_ms
+    return priorities
+
+
+def _evaluate_sla(repo, paths: ActifixPaths, thresholds_ms: dict, now: datetime) -> SlaSummary:
+    now_ms = _now_ms(now)
+    priorities = repo.evaluate_sla(thresholds_ms, now_ms)
+    if priorities is None:
+        priorities = _evaluate_sla_in_python(paths, thresholds_ms, now_ms)
+    next_breach = [
+        row["next_ms"] + thresholds_ms[p] for p, row in priorities.items() if row["next_ms"] is not None
+    ]
+    return SlaSummary(
+        evaluated_at=now,
+        thresholds_ms=dict(thresholds_ms),
+        priorities=priorities,
+        next_breach_at=(
+            datetime.fromtimestamp(min(next_breach) / 1000, tz=timezone.utc) if next_breach else None
+        ),
+    )
+
+
+class SlaMonitor:
+    """
+    Incremental SLA evaluation.
+
+    The last summary is reused until the ticket write generation changes
+    (any ticket insert, update or delete) or the wall clock reaches its
+    next-breach instant, so steady-state health checks read one row.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None  # (repo, generation, summary)
+
+    def summary(self, paths: ActifixPaths, now: Optional[datetime] = None) -> SlaSummary:
+        now = now or datetime.now(timezone.utc)
+        repo = _get_ticket_repository(paths)
+        thresholds_ms = _sla_thresholds_ms()
+        # Read before evaluating: a write in between forces the next re-check
+        generation = repo.get_write_generation()
+        with self._lock:
+            state = self._state
+        if state is not None:
+            cached_repo, cached_generation, cached = state
+            if (
+                cached_repo is repo
+                and cached_generation == generation
+                and cached.thresholds_ms == thresholds_ms
+                and cached.is_current(_now_ms(now))
+            ):
+                return cached
+        summary = _evaluate_sla(repo, paths, thresholds_ms, now)
+        with self._lock:
+            self._state = (repo, generation, summary)
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = None
+
+
+_sla_monitor = SlaMonitor()
+
+
+def get_sla_summary(
+    paths: Optional[ActifixPaths] = None,
+    incremental: bool = False,
+) -> SlaSummary:
+    """
+    Evaluate SLA state for open tickets.
+
     Args:
         paths: Optional paths override.
-    
+        incremental: Reuse the previous evaluation while it is provably
+            still correct (see SlaMonitor).
+
     Returns:
-        List of breach info dicts.
+        SlaSummary with per-priority counts and oldest breaching tickets.
     """
     if paths is None:
         paths = get_actifix_paths()
+    if incremental:
+        return _sla_monitor.summary(paths)
+    now = datetime.now(timezone.utc)
+    return _evaluate_sla(_get_ticket_repository(paths), paths, _sla_thresholds_ms(), now)
+
+
+def reset_sla_monitor() -> None:
+    """Forget the incremental SLA state (for testing)."""
+    _sla_monitor.reset()
+
+
+def check_sla_breaches(paths: Optional[ActifixPaths] = None, incremental: bool = False) -> list[dict]:
+    """
+    Check for SLA breaches in open tickets.
     
-    breaches = []
-    tickets = get_open_tickets(paths)
-    
-    for ticket in tickets:
-        age_hours = _get_ticket_age_hours(ticket.created)
-        sla_hours = _get_sla_threshold(ticket.priority)
-        
-        if age_hours > sla_hours:
-            breaches.append({
-                "ticket_id": ticket.ticket_id,
-                "priority": ticket.priority,
-                "age_hours": round(age_hours, 1),
-                "sla_hours": sla_hours,
-                "breach_hours": round(age_hours - sla_hours, 1),
-            })
+    Args:
+        paths: Optional paths override.
+        incremental: Reuse the previous evaluation when still valid.
     
-    return breaches
+    Returns:
+        One breach info dict per breaching priority: its oldest breaching
+        ticket plus the number of breaching tickets ("count").
+    """
+    return get_sla_summary(paths, incremental=incremental).breaches()
 
 
 def get_disk_usage(dir_path: Path) -> Optional[float]:
@@ -207,12 +365,6 @@ def get_health(paths: Optional[ActifixPaths] = None) -> ActifixHealthCheck:
     actifix_disk = get_disk_usage(paths.state_dir)
     data_disk = get_disk_usage(paths.data_dir)
     
-    if actifix_disk:
-        if actifix_disk > disk_threshold_crit:
-            errors.append(f".actifix/ disk usage critical: {actifix_disk:.1f}%")
-        elif actifix_disk > disk_threshold_warn:
-            warnings.append(f".actifix/ disk usage high: {actifix_disk:.1f}%")
-    
     if actifix_disk:
         if actifix_disk > disk_threshold_crit:
             errors.append(f".actifix/ disk usage critical: {actifix_disk:.1f}%")
@@ -251,6 +403,7 @@ def get_health(paths: Optional[ActifixPaths] = None) -> ActifixHealthCheck:
         warnings.append(f"Database size check failed: {e}")
 
     # Check database connection pool health
+    pool_metrics = {}
     try:
         from .persistence.database import get_database_pool
         pool = get_database_pool()
@@ -258,6 +411,7 @@ def get_health(paths: Optional[ActifixPaths] = None) -> ActifixHealthCheck:
         if not pool_metrics.get("connection_healthy"):
             errors.append(f"Database connection unhealthy: {pool_metrics.get('connection_error', 'unknown')}")
     except Exception as e:
+        pool_metrics = {'error': 'Unable to query pool metrics'}
         warnings.append(f"Connection pool check failed: {e}")
 
     # Get ticket stats
@@ -266,23 +420,23 @@ def get_health(paths: Optional[ActifixPaths] = None) -> ActifixHealthCheck:
     completed_tickets = stats.get("completed", 0)
     
     # Check SLA breaches
-    breaches = check_sla_breaches(paths)
-    sla_breaches = len(breaches)
+    sla_summary = get_sla_summary(paths, incremental=True)
+    breaches = sla_summary.breaches(now)
+    sla_breaches = sla_summary.total
     
     if sla_breaches > 0:
         for breach in breaches[:3]:  # Show first 3
+            more = f", {breach['count']} tickets" if breach['count'] > 1 else ""
             warnings.append(
                 f"SLA breach: {breach['ticket_id']} "
-                f"({breach['priority']}, {breach['breach_hours']}h over)"
+                f"({breach['priority']}, {breach['breach_hours']}h over{more})"
             )
     
     # Get oldest ticket age
     oldest_age = 0
-    tickets = get_open_tickets(paths)
-    for ticket in tickets:
-        age = _get_ticket_age_hours(ticket.created)
-        if age > oldest_age:
-            oldest_age = age
+    oldest_ms = sla_summary.oldest_open_ms
+    if oldest_ms is not None:
+        oldest_age = max(0.0, (_now_ms(now) - oldest_ms) / _MS_PER_HOUR)
     
     # Determine overall health
     healthy = True
@@ -335,6 +489,7 @@ def get_health(paths: Optional[ActifixPaths] = None) -> ActifixHealthCheck:
                 "base_dir": str(paths.base_dir),
             },
             "doaf_agent": details_agent,
+            "database_pool": pool_metrics,
         },
         warnings=warnings,
         errors=errors,
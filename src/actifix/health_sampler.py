@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Background health sampler.
+
+get_health() is not free: it writes a probe file, checks disk usage,
+measures database growth and reads pool metrics (which runs a passive WAL
+checkpoint). Running it per request turns every load-balancer probe into
+real I/O. The sampler runs it on a fixed cadence in a daemon thread and
+publishes the result as a HealthSnapshot; HTTP endpoints and the
+Prometheus export read only the latest snapshot.
+
+Usage:
+    from actifix.health_sampler import get_health_snapshot
+
+    snapshot = get_health_snapshot(paths)
+    snapshot.health.status, snapshot.age_seconds
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import get_config
+from .health import ActifixHealthCheck, get_health
+from .log_utils import log_event
+from .state_paths import ActifixPaths, get_actifix_paths
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """
+    One published health sample.
+
+    Snapshots are replaced, never modified: the sampler builds a new one
+    each cycle and swaps the reference, so readers can use the health
+    object and dicts without locking. Readers must not mutate them.
+    """
+
+    health: ActifixHealthCheck
+    pool_metrics: Dict[str, Any]
+    sampled_at: datetime
+    duration_ms: float
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now(timezone.utc) - self.sampled_at).total_seconds()
+
+
+class HealthSampler:
+    """Samples get_health() for one project on a fixed cadence."""
+
+    def __init__(self, paths: ActifixPaths, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS):
+        self.paths = paths
+        self.interval_seconds = interval_seconds
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._sample_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> HealthSnapshot:
+        """Run the health checks now and publish the result."""
+        with self._sample_lock:
+            started = time.perf_counter()
+            health = get_health(self.paths)
+            snapshot = HealthSnapshot(
+                health=health,
+                pool_metrics=dict(health.details.get("database_pool", {})),
+                sampled_at=datetime.now(timezone.utc),
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+    def snapshot(self) -> HealthSnapshot:
+        """
+        Latest published snapshot.
+
+        The first call samples synchronously (there is nothing to serve
+        yet) and starts the background thread.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.sample()
+            self.start()
+        return snapshot
+
+    def start(self) -> None:
+        """Start the sampling thread if it is not running."""
+        with self._sample_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="actifix-health-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sample()
+            except Exception as e:
+                # Keep serving the last good snapshot
+                log_event(
+                    "HEALTH_SAMPLE_FAILED",
+                    f"Background health sample failed: {e}",
+                    extra={"error": str(e), "base_dir": str(self.paths.base_dir)},
+                    source="health_sampler.HealthSampler._run",
+                    level="WARNING",
+                )
+
+
+_samplers: Dict[Path, HealthSampler] = {}
+_samplers_lock = threading.Lock()
+
+
+def get_health_sampler(paths: Optional[ActifixPaths] = None) -> HealthSampler:
+    """Get the sampler for a project (one per .actifix directory)."""
+    if paths is None:
+        paths = get_actifix_paths()
+    key = Path(paths.base_dir)
+    with _samplers_lock:
+        sampler = _samplers.get(key)
+        if sampler is None:
+            interval = getattr(get_config(), "health_check_interval_seconds", DEFAULT_SAMPLE_INTERVAL_SECONDS)
+            sampler = HealthSampler(paths, interval if interval > 0 else DEFAULT_SAMPLE_INTERVAL_SECONDS)
+            _samplers[key] = sampler
+        return sampler
+
+
+def get_health_snapshot(paths: Optional[ActifixPaths] = None) -> HealthSnapshot:
+    """Latest health snapshot for a project."""
+    return get_health_sampler(paths).snapshot()
+
+
+def reset_health_sampler() -> None:
+    """Stop and forget all samplers (for testing)."""
+    with _samplers_lock:
+        samplers = list(_samplers.values())
+        _samplers.clear()
+    for sampler in samplers:
+        sampler.stop()
@@ -14,7 +14,7 @@ from .config import load_config
 from .health import run_health_check
 from .raise_af import record_error, enforce_raise_af_only, TicketPriority
 from .do_af import process_tickets, get_ticket_stats
-from .quarantine import list_quarantine, get_quarantine_count
+from .quarantine import export_quarantine, list_quarantine, get_quarantine_count
 from .testing import TestRunner
 import os
 
@@ -186,8 +186,12 @@ def cmd_quarantine(args: argparse.Namespace) -> int:
                     print(f"  Source: {entry.original_source}")
                     print(f"  Reason: {entry.reason}")
                     print(f"  Date: {entry.quarantined_at.isoformat()}")
+                    print(f"  Occurrences: {entry.occurrences}")
             else:
                 print("No quarantined items")
+        elif args.quarantine_action == "export":
+            exported = export_quarantine()
+            print(f"Exported {len(exported)} quarantine entries")
         
         return 0
 
@@ -629,225 +633,198 @@ def cmd_doctor(args: argparse.Namespace) -> int:
 
 
 def cmd_archive(args: argparse.Namespace) -> int:
-    """Archive old completed tickets with checksum verification."""
+    """Archive old completed tickets to NDJSON with checksum verification."""
     project_root = Path(args.project_root or Path.cwd())
-    output_path = Path(args.output) if args.output else Path("actifix_archive.json")
     min_age_days = args.min_age_days
 
     with ActifixContext(project_root=project_root):
         from .state_paths import get_actifix_paths
-        from .persistence.database import get_database_pool
-        from .raise_af import redact_secrets_from_text
+        from .persistence.database import get_database_pool, serialize_timestamp
+        from .persistence.export_stream import (
+            StreamingExporter,
+            resolve_export_path,
+            ticket_export_table,
+        )
         from datetime import datetime, timezone, timedelta
-        import json
-        import hashlib
 
         paths = get_actifix_paths(project_root=project_root)
         enforce_raise_af_only(paths)
 
+        pool = get_database_pool(db_path=paths.project_root / "data" / "actifix.db")
+        stores = _ticket_stores(pool)
+
+        if args.tier and not args.output:
+            print("=== Actifix Archive ===")
+            print(f"Min age: {min_age_days} days\n")
+            return _archive_to_tier(stores, min_age_days, args.chunk_size)
+
+        output_path = resolve_export_path(
+            Path(args.output) if args.output else Path("actifix_archive.ndjson"),
+            args.compress,
+        )
         print("=== Actifix Archive ===")
         print(f"Output: {output_path}")
         print(f"Min age: {min_age_days} days\n")
 
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=min_age_days)
-        pool = get_database_pool(db_path=paths.project_root / "data" / "actifix.db")
-
-        archive_data = {
-            "archived_at": datetime.now(timezone.utc).isoformat(),
-            "version": "1.0",
-            "min_age_days": min_age_days,
-            "cutoff_date": cutoff_date.isoformat(),
-            "tickets": [],
-        }
-
-        with pool.connection() as conn:
-            # Get old completed tickets
-            print("1. Finding old completed tickets...")
-            cursor = conn.execute(
-                """
-                SELECT id, priority, error_type, message, source, created_at,
-                       updated_at, status, completion_summary, documented,
-                       functioning, tested, completed
-                FROM tickets
-                WHERE status = 'Completed' AND created_at < ?
-                ORDER BY created_at DESC
-                """,
-                (cutoff_date.isoformat(),)
-            )
-
-            tickets = []
-            for row in cursor.fetchall():
-                ticket = {
-                    "id": row[0],
-                    "priority": row[1],
-                    "error_type": row[2],
-                    "message": redact_secrets_from_text(row[3]) if row[3] else None,
-                    "source": row[4],
-                    "created_at": row[5],
-                    "updated_at": row[6],
-                    "status": row[7],
-                    "completion_summary": row[8],
-                    "documented": bool(row[9]),
-                    "functioning": bool(row[10]),
-                    "tested": bool(row[11]),
-                    "completed": bool(row[12]),
-                }
-                tickets.append(ticket)
-
-            archive_data["tickets"] = tickets
-            print(f"   ✓ Found {len(tickets)} tickets to archive")
-
-            if len(tickets) == 0:
-                print("\nNo tickets to archive.")
-                return 0
+        where = "status = 'Completed' AND created_at < ?"
+        params = (serialize_timestamp(cutoff_date),)
+
+        print("1. Streaming old completed tickets...")
+        tables = [ticket_export_table(where, params, pool=store_pool, shard=key) for key, store_pool, _ in stores]
+        exporter = StreamingExporter(
+            output_path,
+            pool,
+            compression=args.compress,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+        result = exporter.export(
+            tables,
+            resume=not args.restart,
+            metadata={"min_age_days": min_age_days, "cutoff_date": cutoff_date.isoformat()},
+        )
+        archived = result.records.get("ticket", 0)
+        if result.resumed:
+            print("   • Resumed from checkpoint")
+        print(f"   ✓ Wrote {archived} tickets to {output_path}")
+        print(f"   ✓ Checksum: {result.sha256[:16]}... ({exporter.checksum_path.name})")
+
+        if archived == 0:
+            print("\nNo tickets to archive.")
+            return 0
 
-            # Calculate checksum
-            print("\n2. Calculating checksum...")
-            tickets_json = json.dumps(tickets, sort_keys=True)
-            checksum = hashlib.sha256(tickets_json.encode()).hexdigest()
-            archive_data["checksum"] = checksum
-            print(f"   ✓ Checksum: {checksum[:16]}...")
-
-            # Write archive file
-            print("\n3. Writing archive...")
-            with open(output_path, 'w') as f:
-                json.dump(archive_data, f, indent=2)
-            print(f"   ✓ Wrote {output_path}")
-
-            # Delete archived tickets if requested
-            if args.delete_after_archive:
-                print("\n4. Deleting archived tickets...")
-                ticket_ids = [t["id"] for t in tickets]
-                placeholders = ','.join('?' * len(ticket_ids))
-                cursor = conn.execute(
-                    f"DELETE FROM tickets WHERE id IN ({placeholders})",
-                    ticket_ids
-                )
-                conn.commit()
-                print(f"   ✓ Deleted {cursor.rowcount} tickets")
+        # Move to the archive tier, or delete, if requested
+        if args.tier:
+            print("\n2. Moving tickets to archive tier...")
+            _archive_to_tier(stores, min_age_days, args.chunk_size)
+        elif args.delete_after_archive:
+            print("\n2. Deleting archived tickets...")
+            deleted = 0
+            for table in tables:
+                last_rowid = result.last_rowids.get(table.checkpoint_key, 0)
+                while True:
+                    with table.pool.transaction(immediate=True) as conn:
+                        cursor = conn.execute(
+                            f"""
+                            DELETE FROM tickets WHERE rowid IN (
+                                SELECT rowid FROM tickets
+                                WHERE rowid <= ? AND {where}
+                                LIMIT ?
+                            )
+                            """,
+                            (last_rowid, *params, args.chunk_size),
+                        )
+                    if cursor.rowcount <= 0:
+                        break
+                    deleted += cursor.rowcount
+            print(f"   ✓ Deleted {deleted} tickets")
 
         print("\n=== Archive Complete ===")
-        print(f"Archived: {len(tickets)} tickets")
+        print(f"Archived: {archived} tickets")
         print(f"File: {output_path}")
-        print(f"Checksum: {checksum}")
+        print(f"Checksum: {result.sha256}")
 
         return 0
 
 
+def _ticket_stores(pool) -> list:
+    """
+    Return (shard key, pool, archive) for every database holding tickets.
+
+    With ticket sharding configured that is each shard; otherwise it is
+    just ``pool`` (shard key "").
+    """
+    from .persistence.ticket_archive import TicketArchive
+    from .persistence.ticket_repo import get_ticket_repository
+
+    repo = get_ticket_repository()
+    if hasattr(repo, "shard_keys"):
+        return [(key, repo.shard(key).pool, repo.shard(key).archive) for key in repo.shard_keys()]
+    return [("", pool, TicketArchive(pool))]
+
+
+def _archive_to_tier(stores: list, min_age_days: int, chunk_size: int) -> int:
+    """Move old completed tickets into each database's attached archive tier."""
+    for key, _, archive in stores:
+        label = f"[{key}] " if key else ""
+        result = archive.archive_completed(min_age_days, chunk_size=chunk_size)
+        print(f"   ✓ {label}Moved {result['moved']} tickets in {result['chunks']} chunks")
+        print(f"   ✓ {label}Archive: {archive.archive_path} ({archive.count()} tickets)")
+    return 0
+
+
 def cmd_export(args: argparse.Namespace) -> int:
-    """Export tickets and events to a file with redaction.
+    """Export tickets and events to an NDJSON file with redaction.
 
-    This command exports data in JSON format for backup/analysis:
+    This command streams data for backup/analysis:
     - Tickets with metadata
     - Event logs
     - Redacts sensitive information (secrets, tokens, etc.)
+
+    Interrupted exports resume from the last written chunk unless
+    --restart is given.
     """
     project_root = Path(args.project_root or Path.cwd())
-    output_path = Path(args.output) if args.output else Path("actifix_export.json")
+    output_path = Path(args.output) if args.output else Path("actifix_export.ndjson")
 
     with ActifixContext(project_root=project_root):
         from .state_paths import get_actifix_paths
-        from .persistence.database import get_database_connection
-        from .raise_af import redact_secrets_from_text
-        from datetime import datetime, timezone
-        import json
+        from .persistence.database import get_database_pool
+        from .persistence.export_stream import (
+            StreamingExporter,
+            event_export_table,
+            resolve_export_path,
+            ticket_export_table,
+        )
 
         paths = get_actifix_paths(project_root=project_root)
         enforce_raise_af_only(paths)
 
+        output_path = resolve_export_path(output_path, args.compress)
         print("=== Actifix Export ===")
         print(f"Output: {output_path}\n")
 
-        export_data = {
-            "exported_at": datetime.now(timezone.utc).isoformat(),
-            "version": "1.0",
-            "tickets": [],
-            "events": [],
-        }
-
-        conn = get_database_connection(paths)
-        try:
-            # Export tickets
-            print("1. Exporting tickets...")
-            cursor = conn.execute(
-                """
-                SELECT id, priority, error_type, message, source, created_at,
-                       updated_at, status, documented, functioning, tested, completed
-                FROM tickets
-                ORDER BY created_at DESC
-                """
-            )
-
-            tickets = []
-            for row in cursor.fetchall():
-                ticket = {
-                    "id": row[0],
-                    "priority": row[1],
-                    "error_type": row[2],
-                    "message": redact_secrets_from_text(row[3]) if row[3] else None,
-                    "source": row[4],
-                    "created_at": row[5],
-                    "updated_at": row[6],
-                    "status": row[7],
-                    "documented": bool(row[8]),
-                    "functioning": bool(row[9]),
-                    "tested": bool(row[10]),
-                    "completed": bool(row[11]),
-                }
-                tickets.append(ticket)
-
-            export_data["tickets"] = tickets
-            print(f"   ✓ Exported {len(tickets)} tickets")
-
-            # Export events (if table exists)
-            print("\n2. Exporting events...")
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT event_type, message, level, source, timestamp
-                    FROM events
-                    ORDER BY timestamp DESC
-                    LIMIT 1000
-                    """
-                )
-
-                events = []
-                for row in cursor.fetchall():
-                    event = {
-                        "event_type": row[0],
-                        "message": redact_secrets_from_text(row[1]) if row[1] else None,
-                        "level": row[2],
-                        "source": row[3],
-                        "timestamp": row[4],
-                    }
-                    events.append(event)
-
-                export_data["events"] = events
-                print(f"   ✓ Exported {len(events)} events (limited to 1000)")
-            except Exception as e:
-                print(f"   • Events table not available: {e}")
-
-            # Write to file
-            print("\n3. Writing export file...")
-            with open(output_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
-
-            print(f"   ✓ Export written to {output_path}")
+        env_db_path = os.environ.get("ACTIFIX_DB_PATH")
+        db_path = Path(env_db_path).expanduser() if env_db_path else paths.project_root / "data" / "actifix.db"
+        pool = get_database_pool(db_path=db_path)
+        exporter = StreamingExporter(
+            output_path,
+            pool,
+            compression=args.compress,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
 
-            # Summary
-            print("\n=== Summary ===")
-            print(f"Tickets exported: {len(export_data['tickets'])}")
-            print(f"Events exported: {len(export_data['events'])}")
-            print(f"File size: {output_path.stat().st_size:,} bytes")
+        def report(record_type: str, count: int) -> None:
+            print(f"   • {record_type}s: {count}", end="\r", flush=True)
+
+        print("1. Streaming tickets and events...")
+        # Tickets from every shard; events always live in the main database
+        tables = [
+            ticket_export_table(pool=store_pool, shard=key)
+            for key, store_pool, _ in _ticket_stores(pool)
+        ]
+        result = exporter.export(
+            tables + [event_export_table()],
+            resume=not args.restart,
+            progress=report,
+        )
+        if result.resumed:
+            print("   • Resumed from checkpoint")
+        print(f"   ✓ Export written to {output_path}")
 
-            return 0
+        print("\n=== Summary ===")
+        print(f"Tickets exported: {result.records.get('ticket', 0)}")
+        print(f"Events exported: {result.records.get('event', 0)}")
+        print(f"File size: {output_path.stat().st_size:,} bytes")
+        print(f"SHA-256: {result.sha256}")
 
-        finally:
-            conn.close()
+        return 0
 
 
 def cmd_maintenance(args: argparse.Namespace) -> int:
-    """Run database maintenance (VACUUM and/or ANALYZE)."""
+    """Run database maintenance (VACUUM, ANALYZE and optional online backup)."""
     from .persistence.database import run_maintenance
     from .state_paths import get_actifix_paths
 
@@ -859,20 +836,55 @@ def cmd_maintenance(args: argparse.Namespace) -> int:
 
     vacuum = not args.no_vacuum
     analyze = not args.no_analyze
+    backup = getattr(args, "backup", False)
 
-    if not vacuum and not analyze:
+    if not vacuum and not analyze and not backup:
         print("Nothing to do (both --no-vacuum and --no-analyze specified)")
         return 0
 
+    backup_path = None
+    backup_ok = True
+    if backup:
+        from .persistence.database import get_database_pool
+        from .persistence.sqlite_robustness import get_robustness_manager
+
+        print("Running online backup...")
+        manager = get_robustness_manager(get_database_pool().config.db_path)
+        last_reported = {"percent": -1}
+
+        def _report_progress(remaining: int, total: int) -> None:
+            percent = 100 if not total else int((total - remaining) * 100 / total)
+            if percent // 10 != last_reported["percent"] // 10 or remaining == 0:
+                last_reported["percent"] = percent
+                print(f"  backup: {percent:3d}% ({total - remaining}/{total} pages)")
+
+        try:
+            backup_path = manager.backup(
+                pages_per_step=args.backup_pages,
+                step_sleep_s=args.backup_sleep_ms / 1000.0,
+                compression=args.backup_compress,
+                progress=_report_progress,
+            )
+            if args.backup_keep:
+                manager.rotate_backups(args.backup_keep)
+        except Exception as e:
+            print(f"  backup failed: {e}")
+            backup_ok = False
+
     if vacuum:
         print("Running VACUUM...")
     if analyze:
         print("Running ANALYZE...")
 
-    results = run_maintenance(vacuum=vacuum, analyze=analyze)
+    results = {"success": True}
+    if vacuum or analyze:
+        results = run_maintenance(vacuum=vacuum, analyze=analyze)
 
     print()
     print("=== Results ===")
+    if backup:
+        status = f"✓ OK ({backup_path})" if backup_ok else "✗ FAILED"
+        print(f"BACKUP: {status}")
     if vacuum:
         status = "✓ OK" if results.get("vacuum") else "✗ FAILED"
         print(f"VACUUM: {status}")
@@ -880,7 +892,7 @@ def cmd_maintenance(args: argparse.Namespace) -> int:
         status = "✓ OK" if results.get("analyze") else "✗ FAILED"
         print(f"ANALYZE: {status}")
 
-    return 0 if results.get("success") else 1
+    return 0 if results.get("success") and backup_ok else 1
 
 
 def cmd_prune(args: argparse.Namespace) -> int:
@@ -914,87 +926,95 @@ def cmd_prune(args: argparse.Namespace) -> int:
 
         # 1. Find old completed tickets
         print("1. Scanning completed tickets...")
-        import sqlite3
-        from .persistence.database import get_database_connection
+        from .persistence.database import get_database_pool
+        from .persistence.quarantine_repo import QuarantineRepository
 
-        conn = get_database_connection(paths)
-        try:
-            cursor = conn.execute(
-                """
-                SELECT id, created_at, updated_at
-                FROM tickets
-                WHERE status = 'Completed'
-                AND completed = 1
-                AND datetime(COALESCE(updated_at, created_at)) < datetime(?)
-                ORDER BY updated_at DESC
-                """,
-                (cutoff_date.isoformat(),)
-            )
-            old_tickets = cursor.fetchall()
-
-            if old_tickets:
-                print(f"   Found {len(old_tickets)} old completed tickets")
-                if args.show_tickets:
-                    for ticket_id, created, updated in old_tickets[:10]:
-                        print(f"   - {ticket_id} (updated: {updated or created})")
-                    if len(old_tickets) > 10:
-                        print(f"   ... and {len(old_tickets) - 10} more")
-
-                if not dry_run:
-                    ticket_ids = [t[0] for t in old_tickets]
+        env_db_path = os.environ.get("ACTIFIX_DB_PATH")
+        db_path = Path(env_db_path).expanduser() if env_db_path else paths.project_root / "data" / "actifix.db"
+        stores = _ticket_stores(get_database_pool(db_path=db_path))
+
+        old_tickets = []
+        for _, store_pool, _ in stores:
+            with store_pool.connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT id, created_at, updated_at
+                    FROM tickets
+                    WHERE status = 'Completed'
+                    AND completed = 1
+                    AND datetime(COALESCE(updated_at, created_at)) < datetime(?)
+                    ORDER BY updated_at DESC
+                    """,
+                    (cutoff_date.isoformat(),)
+                ).fetchall()
+            old_tickets.append((store_pool, [tuple(row) for row in rows]))
+        old_count = sum(len(rows) for _, rows in old_tickets)
+
+        if old_count:
+            print(f"   Found {old_count} old completed tickets")
+            if args.show_tickets:
+                shown = [row for _, rows in old_tickets for row in rows]
+                for ticket_id, created, updated in shown[:10]:
+                    print(f"   - {ticket_id} (updated: {updated or created})")
+                if old_count > 10:
+                    print(f"   ... and {old_count - 10} more")
+
+            if not dry_run:
+                for store_pool, rows in old_tickets:
+                    if not rows:
+                        continue
+                    ticket_ids = [t[0] for t in rows]
                     placeholders = ','.join('?' * len(ticket_ids))
-                    conn.execute(
-                        f"DELETE FROM tickets WHERE id IN ({placeholders})",
-                        ticket_ids
-                    )
-                    conn.commit()
-                    print(f"   ✓ Deleted {len(old_tickets)} old tickets")
-                else:
-                    print(f"   • Would delete {len(old_tickets)} tickets")
-            else:
-                print("   ✓ No old completed tickets found")
-
-            # 2. Prune quarantine
-            print("\n2. Scanning quarantine...")
-            quarantine_dir = paths.base_dir / "quarantine"
-            quarantine_count = 0
-            if quarantine_dir.exists():
-                for item in quarantine_dir.glob("*"):
-                    if item.is_file():
-                        mtime = datetime.fromtimestamp(item.stat().st_mtime, tz=timezone.utc)
-                        if mtime < cutoff_date:
-                            quarantine_count += 1
-                            if not dry_run:
-                                item.unlink()
-
-            if quarantine_count > 0:
-                if not dry_run:
-                    print(f"   ✓ Deleted {quarantine_count} old quarantine entries")
-                else:
-                    print(f"   • Would delete {quarantine_count} quarantine entries")
+                    with store_pool.transaction(immediate=True) as conn:
+                        conn.execute(
+                            f"DELETE FROM tickets WHERE id IN ({placeholders})",
+                            ticket_ids
+                        )
+                print(f"   ✓ Deleted {old_count} old tickets")
             else:
-                print("   ✓ No old quarantine entries found")
-
-            # 3. Summary
-            print("\n=== Summary ===")
-            stats_after = get_ticket_stats()
+                print(f"   • Would delete {old_count} tickets")
+        else:
+            print("   ✓ No old completed tickets found")
+
+        # 2. Prune quarantine
+        print("\n2. Scanning quarantine...")
+        quarantine_dir = paths.base_dir / "quarantine"
+        quarantine_count = 0
+        if quarantine_dir.exists():
+            for item in quarantine_dir.glob("*"):
+                if item.is_file():
+                    mtime = datetime.fromtimestamp(item.stat().st_mtime, tz=timezone.utc)
+                    if mtime < cutoff_date:
+                        quarantine_count += 1
+                        if not dry_run:
+                            item.unlink()
+        quarantine_count += QuarantineRepository().prune(cutoff_date, dry_run=dry_run)
 
-            print(f"Tickets before: {stats_before['total']}")
+        if quarantine_count > 0:
             if not dry_run:
-                print(f"Tickets after: {stats_after['total']}")
-                print(f"Tickets deleted: {stats_before['total'] - stats_after['total']}")
+                print(f"   ✓ Deleted {quarantine_count} old quarantine entries")
             else:
-                print(f"Tickets to delete: {len(old_tickets)}")
+                print(f"   • Would delete {quarantine_count} quarantine entries")
+        else:
+            print("   ✓ No old quarantine entries found")
+
+        # 3. Summary
+        print("\n=== Summary ===")
+        stats_after = get_ticket_stats()
 
-            print(f"\nQuarantine entries: {quarantine_count}")
+        print(f"Tickets before: {stats_before['total']}")
+        if not dry_run:
+            print(f"Tickets after: {stats_after['total']}")
+            print(f"Tickets deleted: {stats_before['total'] - stats_after['total']}")
+        else:
+            print(f"Tickets to delete: {old_count}")
 
-            if dry_run:
-                print("\nRun with --execute to apply changes")
+        print(f"\nQuarantine entries: {quarantine_count}")
 
-            return 0
+        if dry_run:
+            print("\nRun with --execute to apply changes")
 
-        finally:
-            conn.close()
+        return 0
 
 
 def cmd_repair(args: argparse.Namespace) -> int:
@@ -1005,6 +1025,9 @@ def cmd_repair(args: argparse.Namespace) -> int:
     - WAL checkpoint and VACUUM
     - Orphaned record cleanup
     - State file validation
+
+    With --promote-replica the primary database is replaced by the WAL
+    shipping replica instead.
     """
     project_root = Path(args.project_root or Path.cwd())
     dry_run = not args.execute
@@ -1019,6 +1042,9 @@ def cmd_repair(args: argparse.Namespace) -> int:
         print("=== Actifix Repair ===")
         print(f"Mode: {'DRY RUN' if dry_run else 'EXECUTE'}\n")
 
+        if getattr(args, "promote_replica", None):
+            return _promote_replica(Path(args.promote_replica), dry_run)
+
         issues_found = 0
         issues_fixed = 0
 
@@ -1121,6 +1147,58 @@ def cmd_repair(args: argparse.Namespace) -> int:
         return 0 if issues_found == 0 else 1
 
 
+def _promote_replica(standby_dir: Path, dry_run: bool) -> int:
+    """Replace the primary database with the replica in standby_dir."""
+    from .persistence.database import get_database_pool, reset_database_pool
+    from .persistence.replication import ReplicationError, WalShipper
+
+    db_path = get_database_pool().config.db_path
+    shipper = WalShipper(db_path, standby_dir)
+    metrics = shipper.get_metrics()
+
+    print(f"Replica:  {shipper.replica_path}")
+    print(f"Primary:  {db_path}")
+    print(f"Last sync: {metrics['last_sync_at'] or 'never'}")
+
+    if not shipper.replica_path.exists():
+        print("   ✗ Replica database not found")
+        return 1
+    if dry_run:
+        print("   • Would ship verified WAL frames, verify and promote the replica (skipped in dry-run)")
+        print("\nRun with --execute to promote")
+        return 0
+
+    reset_database_pool()
+    try:
+        target = shipper.promote()
+    except ReplicationError as e:
+        print(f"   ✗ Promotion failed: {e}")
+        return 1
+    print(f"   ✓ Replica promoted to {target}")
+    return 0
+
+
+def _add_stream_export_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by the streaming export and archive commands."""
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "lzma"],
+        default=None,
+        help="Compress the NDJSON output",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Redaction worker processes (default: min(4, CPU count))",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start the export over",
+    )
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """
     Main entrypoint for Actifix CLI.
@@ -1184,8 +1262,8 @@ def main(argv: Optional[list[str]] = None) -> int:
     quarantine_parser = subparsers.add_parser("quarantine", help="Manage quarantine")
     quarantine_parser.add_argument(
         "quarantine_action",
-        choices=["list"],
-        help="Quarantine action",
+        choices=["list", "export"],
+        help="Quarantine action (export writes markdown files to the quarantine directory)",
     )
     
     # Diagnostics command
@@ -1295,6 +1373,11 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="Apply repairs (default is dry-run)",
     )
+    repair_parser.add_argument(
+        "--promote-replica",
+        metavar="STANDBY_DIR",
+        help="Replace the primary database with the WAL shipping replica in STANDBY_DIR",
+    )
 
     # Prune command
     prune_parser = subparsers.add_parser("prune", help="Prune old tickets and data")
@@ -1327,13 +1410,42 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="Skip ANALYZE operation",
     )
+    maintenance_parser.add_argument(
+        "--backup",
+        action="store_true",
+        help="Take an online backup via the SQLite backup API",
+    )
+    maintenance_parser.add_argument(
+        "--backup-compress",
+        choices=["gzip", "lzma"],
+        default=None,
+        help="Compress the backup output (default: none)",
+    )
+    maintenance_parser.add_argument(
+        "--backup-pages",
+        type=int,
+        default=1024,
+        help="Pages copied per backup step (default: 1024)",
+    )
+    maintenance_parser.add_argument(
+        "--backup-sleep-ms",
+        type=float,
+        default=10.0,
+        help="Pause between backup steps in milliseconds (default: 10)",
+    )
+    maintenance_parser.add_argument(
+        "--backup-keep",
+        type=int,
+        default=None,
+        help="Rotate backups, keeping only the newest N",
+    )
 
     # Archive command
     archive_parser = subparsers.add_parser("archive", help="Archive old completed tickets with checksum")
     archive_parser.add_argument(
         "--output",
         type=str,
-        help="Output file path (default: actifix_archive.json)",
+        help="Output file path (default: actifix_archive.ndjson)",
     )
     archive_parser.add_argument(
         "--min-age-days",
@@ -1346,15 +1458,35 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="Delete tickets from database after archiving",
     )
+    archive_parser.add_argument(
+        "--tier",
+        action="store_true",
+        help="Move tickets into data/actifix_archive.db instead of deleting them "
+             "(skips the JSON file unless --output is given)",
+    )
+    archive_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="Tickets per chunk when streaming, deleting or tiering (default: 500)",
+    )
+    _add_stream_export_arguments(archive_parser)
 
     # Export command
-    export_parser = subparsers.add_parser("export", help="Export tickets and events to JSON")
+    export_parser = subparsers.add_parser("export", help="Export tickets and events to NDJSON")
     export_parser.add_argument(
         "--output",
         "-o",
         type=str,
-        help="Output file path (default: actifix_export.json)",
+        help="Output file path (default: actifix_export.ndjson)",
+    )
+    export_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Rows per streamed chunk (default: 1000)",
     )
+    _add_stream_export_arguments(export_parser)
 
     args = parser.parse_args(argv)
     
@@ -18,9 +18,10 @@ import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .state_paths import get_actifix_paths, ActifixPaths
-from .do_af import get_ticket_stats
-from .health import get_health
+from .health_sampler import get_health_snapshot
 from .log_utils import log_event
+from .persistence.database import get_contention_metrics
+from .persistence.replication import get_replication_metrics
 
 
 def export_prometheus_metrics(paths: Optional[ActifixPaths] = None) -> str:
@@ -48,9 +49,13 @@ def export_prometheus_metrics(paths: Optional[ActifixPaths] = None) -> str:
         lines.append('actifix_info{version="7.0.12"} 1')
         lines.append("")
 
+        # Everything below comes from the background health sample, so a
+        # scrape never runs the health checks (file probes, checkpoints).
+        health_data = get_health_snapshot(paths).health
+
         # Ticket metrics
         # Get ticket counts by status
-        ticket_stats = get_ticket_stats(paths)
+        ticket_stats = health_data.details.get("stats", {})
 
         lines.append("# HELP actifix_tickets_total Total number of tickets")
         lines.append("# TYPE actifix_tickets_total counter")
@@ -76,8 +81,6 @@ def export_prometheus_metrics(paths: Optional[ActifixPaths] = None) -> str:
         lines.append("")
 
         # Health check metrics
-        health_data = get_health(paths)
-
         lines.append("# HELP actifix_health_status System health status (1=healthy, 0=unhealthy)")
         lines.append("# TYPE actifix_health_status gauge")
         health_status = 1 if health_data.healthy else 0
@@ -98,6 +101,43 @@ def export_prometheus_metrics(paths: Optional[ActifixPaths] = None) -> str:
         lines.append(f"actifix_storage_healthy {storage_healthy}")
         lines.append("")
 
+        # WAL shipping replica (only when a shipper is active)
+        replication = get_replication_metrics()
+        if replication is not None:
+            lines.append("# HELP actifix_replica_lag_seconds Seconds since the replica last caught up")
+            lines.append("# TYPE actifix_replica_lag_seconds gauge")
+            lines.append(f"actifix_replica_lag_seconds {replication['replication_lag_seconds'] or 0}")
+            lines.append("")
+
+            lines.append("# HELP actifix_replica_bytes_shipped_total WAL page bytes shipped to the replica")
+            lines.append("# TYPE actifix_replica_bytes_shipped_total counter")
+            lines.append(f"actifix_replica_bytes_shipped_total {replication['bytes_shipped']}")
+            lines.append("")
+
+            lines.append("# HELP actifix_replica_apply_milliseconds Duration of the last segment apply")
+            lines.append("# TYPE actifix_replica_apply_milliseconds gauge")
+            lines.append(f"actifix_replica_apply_milliseconds {replication['last_apply_ms']}")
+            lines.append("")
+
+        # SQLite write-lock contention per call site
+        contention = get_contention_metrics()
+        if contention:
+            for name, key, kind, help_text in (
+                ("actifix_db_write_transactions_total", "transactions", "counter", "Write transactions by call site"),
+                ("actifix_db_busy_events_total", "busy_events", "counter", "SQLITE_BUSY errors by call site"),
+                ("actifix_db_busy_retries_total", "retries", "counter", "Busy retries by call site"),
+                ("actifix_db_busy_failures_total", "failures", "counter", "Transactions that exhausted busy retries"),
+                ("actifix_db_lock_wait_seconds_total", "lock_wait_seconds", "counter", "Time spent acquiring the write lock"),
+                ("actifix_db_lock_wait_max_seconds", "max_lock_wait_seconds", "gauge", "Longest single write-lock wait"),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for site, stats in sorted(contention.items()):
+                    value = stats[key]
+                    formatted = f"{value:.6f}" if isinstance(value, float) else str(value)
+                    lines.append(f'{name}{{site="{site}"}} {formatted}')
+                lines.append("")
+
         # Metrics generation timestamp
         lines.append("# HELP actifix_metrics_generated_timestamp_seconds Unix timestamp when metrics were generated")
         lines.append("# TYPE actifix_metrics_generated_timestamp_seconds gauge")
@@ -131,8 +171,8 @@ def get_metrics_summary(paths: Optional[ActifixPaths] = None) -> Dict[str, Any]:
         paths = get_actifix_paths()
 
     try:
-        ticket_stats = get_ticket_stats(paths)
-        health_data = get_health(paths)
+        health_data = get_health_snapshot(paths).health
+        ticket_stats = health_data.details.get("stats", {})
 
         return {
             "version": "7.0.12",
@@ -83,6 +83,10 @@ from .database import (
     DatabaseSchemaError,
     get_database_pool,
     reset_database_pool,
+    backfill_epoch_ms_columns,
+    RetryPolicy,
+    get_contention_metrics,
+    reset_contention_metrics,
 )
 
 from .ticket_repo import (
@@ -93,6 +97,15 @@ from .ticket_repo import (
     reset_ticket_repository,
 )
 
+from .ticket_archive import (
+    TicketArchive,
+)
+
+from .ticket_shards import (
+    ShardedTicketRepository,
+    ShardMap,
+)
+
 from .event_repo import (
     EventRepository,
     EventFilter,
@@ -100,14 +113,33 @@ from .event_repo import (
     reset_event_repository,
 )
 
+from .event_partitions import (
+    EventPartitions,
+    get_event_partitions,
+    reset_event_partitions,
+)
+
+from .event_tail import (
+    EventTail,
+    get_event_tail,
+    reset_event_tail,
+)
+
 from .agent_voice_repo import (
     AgentVoiceEntry,
     AgentVoiceRepository,
+    AgentVoiceWriter,
     DEFAULT_MAX_AGENT_VOICE_ROWS,
     get_agent_voice_repository,
+    get_agent_voice_writer,
     reset_agent_voice_repository,
 )
 
+from .quarantine_repo import (
+    QuarantineRecord,
+    QuarantineRepository,
+)
+
 __version__ = "1.0.0"
 
 __all__ = [
@@ -153,6 +185,10 @@ __all__ = [
     "DatabaseSchemaError",
     "get_database_pool",
     "reset_database_pool",
+    "backfill_epoch_ms_columns",
+    "RetryPolicy",
+    "get_contention_metrics",
+    "reset_contention_metrics",
     
     # Ticket Repository
     "TicketRepository",
@@ -160,17 +196,32 @@ __all__ = [
     "TicketLock",
     "get_ticket_repository",
     "reset_ticket_repository",
+    "TicketArchive",
+    "ShardedTicketRepository",
+    "ShardMap",
     
     # Event Repository
     "EventRepository",
     "EventFilter",
     "get_event_repository",
     "reset_event_repository",
+    "EventPartitions",
+    "get_event_partitions",
+    "reset_event_partitions",
+    "EventTail",
+    "get_event_tail",
+    "reset_event_tail",
 
     # AgentVoice Repository
     "AgentVoiceEntry",
     "AgentVoiceRepository",
+    "AgentVoiceWriter",
     "DEFAULT_MAX_AGENT_VOICE_ROWS",
     "get_agent_voice_repository",
+    "get_agent_voice_writer",
     "reset_agent_voice_repository",
+
+    # Quarantine Repository
+    "QuarantineRecord",
+    "QuarantineRepository",
 ]
@@ -4,19 +4,36 @@
 """
 AgentVoice repository.
 
-Stores agent activity/notes in SQLite for review. Enforces a hard cap on total
-rows by pruning the oldest entries after each insert.
+Stores agent activity/notes in SQLite for review. Caps total rows by pruning
+the oldest entries; pruning runs once every `prune_every` appended ids (a rowid
+watermark) rather than after each insert, so the table may briefly hold up to
+max_rows + prune_every rows.
+
+AgentVoiceWriter buffers appends and writes them in batches for chatty callers.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Optional
 
-from .database import get_database_pool
+from ..log_utils import log_event
+from .database import epoch_ms_sql, get_database_pool
 
 DEFAULT_MAX_AGENT_VOICE_ROWS = 1_000_000
+DEFAULT_AGENT_VOICE_PRUNE_EVERY = 1000
+DEFAULT_MAX_PENDING_AGENT_VOICE_ROWS = 10_000
+AGENT_VOICE_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+_INSERT_AGENT_VOICE_SQL = f"""
+    INSERT INTO agent_voice (agent_id, run_label, level, thought, extra_json, correlation_id,
+                             created_at_ms)
+    VALUES (?, ?, ?, ?, ?, ?, {epoch_ms_sql("CURRENT_TIMESTAMP")})
+"""
 
 
 @dataclass(frozen=True)
@@ -34,10 +51,14 @@ class AgentVoiceEntry:
 class AgentVoiceRepository:
     """Repository for writing/reading agent_voice rows."""
 
-    def __init__(self, max_rows: int = DEFAULT_MAX_AGENT_VOICE_ROWS):
+    def __init__(self, max_rows: int = DEFAULT_MAX_AGENT_VOICE_ROWS, prune_every: Optional[int] = None):
         if max_rows <= 0:
             raise ValueError("max_rows must be positive")
         self.max_rows = int(max_rows)
+        self.prune_every = max(1, int(prune_every or min(DEFAULT_AGENT_VOICE_PRUNE_EVERY, self.max_rows)))
+        # Next id at which a retention pass is due, per database file
+        self._prune_watermarks: dict[Path, int] = {}
+        self._lock = threading.Lock()
 
     def append(
         self,
@@ -49,29 +70,42 @@ class AgentVoiceRepository:
         extra: Optional[dict[str, Any]] = None,
         correlation_id: Optional[str] = None,
     ) -> int:
-        """Insert a new agent voice row and prune to max_rows."""
-        if not agent_id:
-            raise ValueError("agent_id is required")
-        if not thought:
-            raise ValueError("thought is required")
-
-        extra_json = None
-        if extra is not None:
-            extra_json = json.dumps(extra, default=str)
+        """Insert a new agent voice row (pruning to max_rows when the watermark is due)."""
+        row = _agent_voice_row(agent_id, thought, run_label, level, extra, correlation_id)
 
         pool = get_database_pool()
         with pool.transaction(immediate=True) as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO agent_voice (agent_id, run_label, level, thought, extra_json, correlation_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (agent_id, run_label, level, thought, extra_json, correlation_id),
-            )
+            cursor = conn.execute(_INSERT_AGENT_VOICE_SQL, row)
             row_id = int(cursor.lastrowid)
-            self._prune_locked(conn)
+            self._prune_if_due(conn, pool.config.db_path, row_id)
             return row_id
 
+    def append_many(self, rows: list[tuple]) -> int:
+        """
+        Insert pre-validated rows (see _agent_voice_row) in one transaction.
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not rows:
+            return 0
+        pool = get_database_pool()
+        with pool.transaction(immediate=True) as conn:
+            conn.executemany(_INSERT_AGENT_VOICE_SQL, rows)
+            last_id = int(conn.execute("SELECT MAX(id) FROM agent_voice").fetchone()[0] or 0)
+            self._prune_if_due(conn, pool.config.db_path, last_id)
+        return len(rows)
+
+    def prune(self) -> int:
+        """Run a retention pass now. Returns the number of rows deleted."""
+        pool = get_database_pool()
+        with pool.transaction(immediate=True) as conn:
+            last_id = int(conn.execute("SELECT MAX(id) FROM agent_voice").fetchone()[0] or 0)
+            deleted = self._prune_locked(conn, last_id)
+            with self._lock:
+                self._prune_watermarks[Path(pool.config.db_path)] = last_id + self.prune_every
+            return deleted
+
     def count(self) -> int:
         pool = get_database_pool()
         with pool.connection() as conn:
@@ -200,21 +234,182 @@ class AgentVoiceRepository:
 
         return entries, next_cursor
 
-    def _prune_locked(self, conn) -> None:
+    def _prune_if_due(self, conn, db_path: Path, last_id: int) -> None:
+        """Prune when last_id has reached this database's watermark."""
+        key = Path(db_path)
+        with self._lock:
+            watermark = self._prune_watermarks.get(key)
+            if watermark is not None and last_id < watermark:
+                return
+            self._prune_watermarks[key] = last_id + self.prune_every
+        self._prune_locked(conn, last_id)
+
+    def _prune_locked(self, conn, last_id: int) -> int:
         """Prune to max_rows using the provided (write-locked) connection."""
-        # Find the minimum id among the newest max_rows entries; delete anything older.
-        # This avoids a large OFFSET scan while still being deterministic by id.
-        cutoff = conn.execute(
-            """
-            SELECT MIN(id) AS cutoff_id
-            FROM (SELECT id FROM agent_voice ORDER BY id DESC LIMIT ?)
-            """,
-            (self.max_rows,),
-        ).fetchone()
-        if cutoff is None or cutoff["cutoff_id"] is None:
+        # Ids are AUTOINCREMENT, so the newest max_rows ids bound the row count;
+        # deleting below that id is a rowid range delete with no index scan.
+        cutoff_id = last_id - self.max_rows
+        if cutoff_id <= 0:
+            return 0
+        return conn.execute("DELETE FROM agent_voice WHERE id <= ?", (cutoff_id,)).rowcount
+
+
+def _agent_voice_row(
+    agent_id: str,
+    thought: str,
+    run_label: Optional[str],
+    level: str,
+    extra: Optional[dict[str, Any]],
+    correlation_id: Optional[str],
+) -> tuple:
+    """Validate an entry and return its insert parameters."""
+    if not agent_id:
+        raise ValueError("agent_id is required")
+    if not thought:
+        raise ValueError("thought is required")
+    extra_json = json.dumps(extra, default=str) if extra is not None else None
+    return (agent_id, run_label, level, thought, extra_json, correlation_id)
+
+
+@dataclass
+class AgentVoiceWriter:
+    """
+    Buffered AgentVoice writer.
+
+    Queues rows and writes them in one transaction when batch_size is
+    reached or on the periodic flush tick. Rows are validated when queued
+    so one bad row cannot fail a batch.
+
+    A failed write is reported (log event, plus an error ticket at the
+    start of each failure streak) and its rows are put back in the queue
+    for the next tick. The queue is capped at max_pending rows; the oldest
+    rows beyond that are dropped and counted in dropped_rows.
+    """
+
+    repo: AgentVoiceRepository
+    batch_size: int = 100
+    flush_interval_seconds: float = 2.0
+    max_pending: int = DEFAULT_MAX_PENDING_AGENT_VOICE_ROWS
+    dropped_rows: int = 0
+    failed_flushes: int = 0
+    _failing: bool = False
+    _batch: list = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _flush_thread: Optional[threading.Thread] = None
+    _stop_event: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self):
+        def flush_loop():
+            while not self._stop_event.wait(self.flush_interval_seconds):
+                self.flush()
+
+        self._flush_thread = threading.Thread(target=flush_loop, daemon=True, name="agent-voice-writer")
+        self._flush_thread.start()
+
+    def add(
+        self,
+        *,
+        agent_id: str,
+        thought: str,
+        run_label: Optional[str] = None,
+        level: str = "INFO",
+        extra: Optional[dict[str, Any]] = None,
+        correlation_id: Optional[str] = None,
+    ) -> None:
+        """Queue a row (non-blocking unless this fills the batch)."""
+        level = (level or "INFO").upper()
+        if level not in AGENT_VOICE_LEVELS:
+            raise ValueError(f"Invalid agent voice level: {level}")
+        row = _agent_voice_row(agent_id, thought, run_label, level, extra, correlation_id)
+
+        with self._lock:
+            self._batch.append(row)
+            self._drop_overflow()
+            # While writes fail, leave retries to the flush tick
+            should_flush = len(self._batch) >= self.batch_size and not self._failing
+        if should_flush:
+            self.flush()
+
+    def _drop_overflow(self) -> None:
+        """Trim the queue to max_pending, oldest first (lock held)."""
+        overflow = len(self._batch) - self.max_pending
+        if overflow > 0:
+            del self._batch[:overflow]
+            self.dropped_rows += overflow
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._batch)
+
+    def flush(self) -> int:
+        """Write all queued rows. Returns the number written."""
+        with self._lock:
+            rows, self._batch = self._batch, []
+        if not rows:
+            return 0
+        try:
+            written = self.repo.append_many(rows)
+        except Exception as exc:
+            # Never raise from the flush tick; keep the rows for the next one
+            with self._lock:
+                self._batch[:0] = rows
+                dropped_before = self.dropped_rows
+                self._drop_overflow()
+                dropped = self.dropped_rows - dropped_before
+                self.failed_flushes += 1
+                first_failure = not self._failing
+                self._failing = True
+            self._report_failure(exc, len(rows), dropped, first_failure)
+            return 0
+        self._failing = False
+        return written
+
+    def _report_failure(self, exc: Exception, rows: int, dropped: int, first_failure: bool) -> None:
+        log_event(
+            "AGENT_VOICE_FLUSH_FAILED",
+            f"Failed to write {rows} buffered agent voice rows: {exc}",
+            extra={
+                "rows": rows,
+                "pending": self.pending(),
+                "dropped_rows": self.dropped_rows,
+                "dropped_now": dropped,
+                "failed_flushes": self.failed_flushes,
+            },
+            source="persistence.agent_voice_repo.AgentVoiceWriter.flush",
+            level="ERROR",
+        )
+        if not first_failure:
             return
-        cutoff_id = int(cutoff["cutoff_id"])
-        conn.execute("DELETE FROM agent_voice WHERE id < ?", (cutoff_id,))
+        try:
+            from ..raise_af import TicketPriority, record_error
+
+            record_error(
+                message=f"Failed to record buffered agent voice: {exc}",
+                source="actifix/persistence/agent_voice_repo.py:AgentVoiceWriter.flush",
+                run_label="agent-voice",
+                error_type=type(exc).__name__,
+                priority=TicketPriority.P2,
+            )
+        except Exception:
+            pass
+
+    def shutdown(self) -> None:
+        """Stop the flush thread and write remaining rows."""
+        self._stop_event.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=2)
+        self.flush()
+        with self._lock:
+            lost, self._batch = len(self._batch), []
+            self.dropped_rows += lost
+        if lost:
+            log_event(
+                "AGENT_VOICE_ROWS_DROPPED",
+                f"Dropped {lost} unwritten agent voice rows at shutdown",
+                extra={"dropped_rows": self.dropped_rows},
+                source="persistence.agent_voice_repo.AgentVoiceWriter.shutdown",
+                level="ERROR",
+            )
 
 
 _global_agent_voice_repo: Optional[AgentVoiceRepository] = None
@@ -231,3 +426,32 @@ def get_agent_voice_repository(max_rows: int = DEFAULT_MAX_AGENT_VOICE_ROWS) ->
 def reset_agent_voice_repository() -> None:
     global _global_agent_voice_repo
     _global_agent_voice_repo = None
+    reset_agent_voice_writer()
+
+
+_global_agent_voice_writer: Optional[AgentVoiceWriter] = None
+_agent_voice_writer_lock = threading.Lock()
+
+
+def get_agent_voice_writer(max_rows: int = DEFAULT_MAX_AGENT_VOICE_ROWS) -> AgentVoiceWriter:
+    """Return the process-global buffered AgentVoice writer (flushed at exit)."""
+    global _global_agent_voice_writer
+    with _agent_voice_writer_lock:
+        repo = get_agent_voice_repository(max_rows=max_rows)
+        if _global_agent_voice_writer is None or _global_agent_voice_writer.repo is not repo:
+            if _global_agent_voice_writer is not None:
+                _global_agent_voice_writer.shutdown()
+            _global_agent_voice_writer = AgentVoiceWriter(repo=repo)
+        return _global_agent_voice_writer
+
+
+def reset_agent_voice_writer() -> None:
+    """Flush and drop the global writer (also runs at interpreter exit)."""
+    global _global_agent_voice_writer
+    with _agent_voice_writer_lock:
+        writer, _global_agent_voice_writer = _global_agent_voice_writer, None
+    if writer is not None:
+        writer.shutdown()
+
+
+atexit.register(reset_agent_voice_writer)
@@ -15,19 +15,21 @@ import base64
 import contextlib
 import os
 import json
+import random
 import sqlite3
 import sys
 import threading
+import time
 import zlib
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Iterator, Union
+from typing import Optional, List, Dict, Any, Callable, Iterator, TypeVar, Union
 
 from ..log_utils import log_event
 
 # Schema version for migrations
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 14
 
 
 class DatabaseSecurityError(Exception):
@@ -135,7 +137,7 @@ CREATE TABLE IF NOT EXISTS schema_version (
 
 -- Tickets table with comprehensive indexing
 CREATE TABLE IF NOT EXISTS tickets (
-    id TEXT PRIMARY KEY,              -- ACT-YYYYMMDD-XXXXX
+    id TEXT PRIMARY KEY,              -- ACT-YYYYMMDD-TTTTTTSSSPPPPP (legacy: ACT-YYYYMMDD-XXXXX)
     priority TEXT NOT NULL,           -- P0-P4
     error_type TEXT NOT NULL,
     message TEXT NOT NULL,
@@ -178,6 +180,11 @@ CREATE TABLE IF NOT EXISTS tickets (
     deleted BOOLEAN DEFAULT 0,
     deleted_at TIMESTAMP,
 
+    -- Integer epoch-millisecond shadows for range predicates and sorting
+    created_at_ms INTEGER,
+    locked_at_ms INTEGER,
+    lease_expires_ms INTEGER,
+
     CHECK (priority IN ('P0', 'P1', 'P2', 'P3', 'P4')),
     CHECK (status IN ('Open', 'In Progress', 'Completed'))
 );
@@ -193,6 +200,7 @@ CREATE TABLE IF NOT EXISTS event_log (
     extra_json TEXT,                     -- JSON serialized extra data
     source TEXT,                         -- Source file/function
     level TEXT DEFAULT 'INFO',           -- DEBUG, INFO, WARNING, ERROR, CRITICAL
+    timestamp_ms INTEGER,                -- Epoch milliseconds shadow of timestamp
     
     FOREIGN KEY (ticket_id) REFERENCES tickets(id) ON DELETE SET NULL
 );
@@ -223,7 +231,9 @@ CREATE TABLE IF NOT EXISTS quarantine (
     quarantined_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     recovered_at TIMESTAMP,             -- NULL if not recovered
     recovery_notes TEXT,
-    status TEXT DEFAULT 'quarantined'   -- quarantined, recovered, deleted
+    status TEXT DEFAULT 'quarantined',  -- quarantined, recovered, deleted
+    occurrences INTEGER NOT NULL DEFAULT 1,  -- Times the same content was quarantined
+    last_seen_at TIMESTAMP              -- Most recent occurrence
 );
 
 -- Database audit log (tracks all ticket changes)
@@ -316,6 +326,7 @@ CREATE TABLE IF NOT EXISTS agent_voice (
     thought TEXT NOT NULL,
     extra_json TEXT,
     correlation_id TEXT,
+    created_at_ms INTEGER,               -- Epoch milliseconds shadow of created_at
 
     CHECK (level IN ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
 );
@@ -326,6 +337,288 @@ CREATE INDEX IF NOT EXISTS idx_agent_voice_run_label ON agent_voice(run_label);
 CREATE INDEX IF NOT EXISTS idx_agent_voice_level ON agent_voice(level);
 """
 
+# Text timestamp columns with an INTEGER epoch-millisecond shadow column
+# named ``<column>_ms``. Writers on hot paths fill the shadow directly;
+# triggers keep it in sync for every other writer and legacy rows are
+# filled by backfill_epoch_ms_columns().
+EPOCH_MS_COLUMNS = (
+    ("tickets", "created_at"),
+    ("tickets", "locked_at"),
+    ("tickets", "lease_expires"),
+    ("event_log", "timestamp"),
+    ("agent_voice", "created_at"),
+)
+
+EPOCH_MS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tickets_created_ms ON tickets(created_at_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_lease_ms ON tickets(lease_expires_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_event_log_timestamp_ms ON event_log(timestamp_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_agent_voice_created_ms ON agent_voice(created_at_ms)",
+)
+
+DEFAULT_EPOCH_BACKFILL_CHUNK_SIZE = 2000
+
+# Quarantine dedup (v9): one active row per content hash, with a counter
+QUARANTINE_COLUMNS = (
+    ("occurrences", "INTEGER NOT NULL DEFAULT 1"),
+    ("last_seen_at", "TIMESTAMP"),
+)
+
+QUARANTINE_INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_quarantine_active_hash "
+    "ON quarantine(original_content_hash) WHERE status = 'quarantined'",
+)
+
+# Event log partitioning (v10): events are written to per-period tables
+# (see event_partitions.py). The original event_log table is kept as the
+# legacy partition and event_log_all is the UNION ALL view over all of them.
+EVENT_LOG_COLUMNS = (
+    "id", "timestamp", "event_type", "message", "ticket_id", "correlation_id",
+    "extra_json", "source", "level", "timestamp_ms",
+)
+EVENT_LOG_VIEW = "event_log_all"
+
+EVENT_PARTITION_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS event_log_partitions (
+        name TEXT PRIMARY KEY,
+        period_start_ms INTEGER NOT NULL,
+        period_end_ms INTEGER NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    # Single id sequence shared by all partitions so ids stay globally unique
+    # and increasing (usable as a cursor across partitions).
+    """
+    CREATE TABLE IF NOT EXISTS event_log_sequence (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        seq INTEGER NOT NULL
+    )
+    """,
+    """
+    INSERT OR IGNORE INTO event_log_sequence (id, seq)
+    SELECT 0, MAX(
+        COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'event_log'), 0),
+        COALESCE((SELECT MAX(id) FROM event_log), 0)
+    )
+    """,
+    f"CREATE VIEW IF NOT EXISTS {EVENT_LOG_VIEW} AS SELECT {', '.join(EVENT_LOG_COLUMNS)} FROM event_log",
+)
+
+# Write generations (v11): a counter per scope bumped by triggers on every
+# committed row change, from any process. Readers compare it to decide
+# whether derived data (cached responses, validators) is still current.
+WRITE_GENERATION_TABLES = (("tickets", "tickets"),)
+
+
+def _write_generation_schema_statements() -> List[str]:
+    """Counter table and the triggers that bump it."""
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS write_generation (
+            scope TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+    ]
+    for scope, table in WRITE_GENERATION_TABLES:
+        statements.append(
+            "INSERT OR IGNORE INTO write_generation (scope, generation) "
+            f"VALUES ('{scope}', 0)"
+        )
+        for operation in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_generation_{operation.lower()}
+                AFTER {operation} ON {table}
+                BEGIN
+                    UPDATE write_generation SET generation = generation + 1
+                    WHERE scope = '{scope}';
+                END
+                """
+            )
+    return statements
+
+
+# Ticket list aggregates (v12): newest-N per status and MIN/MAX created_at
+# come from one composite index, and ticket_counts is kept exact by triggers
+# so dashboard counts do not scan the table.
+_TICKET_COUNT_KEY = "status, priority, deleted"
+
+
+def _ticket_count_key(row: str) -> str:
+    return f"COALESCE({row}.status, ''), COALESCE({row}.priority, ''), COALESCE({row}.deleted, 0)"
+
+
+TICKET_AGGREGATE_SCHEMA = (
+    "CREATE INDEX IF NOT EXISTS idx_tickets_status_created_ms ON tickets(deleted, status, created_at_ms)",
+    f"""
+    CREATE TABLE IF NOT EXISTS ticket_counts (
+        status TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        deleted INTEGER NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY ({_TICKET_COUNT_KEY})
+    )
+    """,
+    # Rebuilt from the table so the counters start exact
+    "DELETE FROM ticket_counts",
+    f"""
+    INSERT INTO ticket_counts ({_TICKET_COUNT_KEY}, count)
+    SELECT COALESCE(status, ''), COALESCE(priority, ''), COALESCE(deleted, 0), COUNT(*)
+    FROM tickets GROUP BY 1, 2, 3
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_tickets_counts_insert
+    AFTER INSERT ON tickets
+    BEGIN
+        INSERT INTO ticket_counts ({_TICKET_COUNT_KEY}, count)
+        VALUES ({_ticket_count_key("NEW")}, 1)
+        ON CONFLICT ({_TICKET_COUNT_KEY}) DO UPDATE SET count = count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_tickets_counts_delete
+    AFTER DELETE ON tickets
+    BEGIN
+        UPDATE ticket_counts SET count = count - 1
+        WHERE ({_TICKET_COUNT_KEY}) = ({_ticket_count_key("OLD")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_tickets_counts_update
+    AFTER UPDATE OF {_TICKET_COUNT_KEY} ON tickets
+    WHEN OLD.status IS NOT NEW.status
+        OR OLD.priority IS NOT NEW.priority
+        OR OLD.deleted IS NOT NEW.deleted
+    BEGIN
+        UPDATE ticket_counts SET count = count - 1
+        WHERE ({_TICKET_COUNT_KEY}) = ({_ticket_count_key("OLD")});
+        INSERT INTO ticket_counts ({_TICKET_COUNT_KEY}, count)
+        VALUES ({_ticket_count_key("NEW")}, 1)
+        ON CONFLICT ({_TICKET_COUNT_KEY}) DO UPDATE SET count = count + 1;
+    END
+    """,
+)
+
+
+# SLA evaluation (v13): per-priority breach counts and oldest/next-to-breach
+# tickets are index seeks on (deleted, status, priority, created_at_ms).
+TICKET_SLA_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_tickets_sla_created_ms "
+    "ON tickets(deleted, status, priority, created_at_ms)"
+)
+
+# Ticket throttling (v14): recent creations of one priority are a range
+# seek on (priority, created_at_ms), so each window reads only its own rows.
+TICKET_THROTTLE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_tickets_priority_created_ms "
+    "ON tickets(priority, created_at_ms)"
+)
+
+
+def read_write_generation(conn: sqlite3.Connection, scope: str = "tickets") -> int:
+    """Current write generation for a scope (0 when it was never written)."""
+    row = conn.execute(
+        "SELECT generation FROM write_generation WHERE scope = ?", (scope,)
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def bump_write_generation(conn: sqlite3.Connection, scope: str) -> None:
+    """Bump a scope's write generation for changes no trigger sees."""
+    conn.execute(
+        "INSERT INTO write_generation (scope, generation) VALUES (?, 1) "
+        "ON CONFLICT(scope) DO UPDATE SET generation = generation + 1",
+        (scope,),
+    )
+
+
+def epoch_ms_sql(expression: str) -> str:
+    """
+    Return SQL converting a text timestamp expression to epoch milliseconds.
+
+    Accepts anything julianday() parses (ISO 8601 with optional fraction and
+    offset, or "YYYY-MM-DD HH:MM:SS"); unparseable values yield NULL.
+    """
+    return f"CAST(ROUND((julianday({expression}) - 2440587.5) * 86400000.0) AS INTEGER)"
+
+
+def epoch_ms_range_sql(column: str, op: str) -> str:
+    """
+    Return an indexed range predicate on ``<column>_ms``.
+
+    Rows whose shadow column has not been backfilled yet are compared via the
+    text column, so results stay correct while a backfill is in progress.
+    The predicate takes the same epoch-ms parameter twice.
+    """
+    if op not in ("<", "<=", ">", ">="):
+        raise ValueError(f"Unsupported range operator: {op}")
+    return (
+        f"({column}_ms {op} ? OR ({column}_ms IS NULL AND {epoch_ms_sql(column)} {op} ?))"
+    )
+
+
+def _epoch_ms_schema_statements() -> List[str]:
+    """Triggers and indexes maintaining the epoch-ms shadow columns."""
+    statements = []
+    for table, column in EPOCH_MS_COLUMNS:
+        shadow = f"{column}_ms"
+        statements.append(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{shadow}_insert
+            AFTER INSERT ON {table}
+            WHEN NEW.{shadow} IS NULL AND NEW.{column} IS NOT NULL
+            BEGIN
+                UPDATE {table} SET {shadow} = {epoch_ms_sql(f"NEW.{column}")}
+                WHERE rowid = NEW.rowid;
+            END
+            """
+        )
+        # Skipped when the writer updated the shadow column itself
+        statements.append(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{shadow}_update
+            AFTER UPDATE OF {column} ON {table}
+            WHEN NEW.{shadow} IS OLD.{shadow}
+            BEGIN
+                UPDATE {table} SET {shadow} = {epoch_ms_sql(f"NEW.{column}")}
+                WHERE rowid = NEW.rowid;
+            END
+            """
+        )
+    statements.extend(EPOCH_MS_INDEXES)
+    return statements
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for write transactions that hit SQLITE_BUSY.
+
+    Each attempt lets SQLite's own busy handler wait (for the connection's
+    DatabaseConfig.timeout unless attempt_busy_timeout shortens it);
+    between attempts the caller sleeps for a full-jitter exponential
+    backoff so contending writers spread out instead of waking in lockstep.
+    The default never gives up sooner than a single attempt with the
+    connection timeout would, so writers queued behind a long bulk delete
+    or migration still get through.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.02  # Seconds, first backoff ceiling
+    max_delay: float = 1.0  # Seconds, backoff ceiling cap
+    multiplier: float = 2.0
+    attempt_busy_timeout: Optional[float] = None  # None keeps DatabaseConfig.timeout
+
+    def backoff(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """Return the jittered delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (self.multiplier ** (attempt - 1)))
+        return (rng or random).uniform(0, ceiling)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1, attempt_busy_timeout=None)
+
 
 @dataclass
 class DatabaseConfig:
@@ -336,6 +629,7 @@ class DatabaseConfig:
     timeout: float = 30.0  # Connection timeout in seconds
     check_same_thread: bool = False  # Allow multi-threaded access
     isolation_level: Optional[str] = "DEFERRED"  # Transaction isolation
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)  # BEGIN IMMEDIATE retries
     
 
 class DatabaseError(Exception):
@@ -353,6 +647,71 @@ class DatabaseSchemaError(DatabaseError):
     pass
 
 
+def is_busy_error(error: BaseException) -> bool:
+    """Return True if error is SQLite reporting a locked/busy database."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+# Per-call-site write contention counters, keyed by "<module>.<function>"
+_contention_stats: Dict[str, Dict[str, float]] = {}
+_contention_lock = threading.Lock()
+
+
+def _caller_site(depth: int) -> str:
+    """Label a call site as ``<module>.<function>`` from the stack."""
+    try:
+        code = sys._getframe(depth + 1).f_code
+    except ValueError:
+        return "unknown"
+    return f"{Path(code.co_filename).stem}.{code.co_name}"
+
+
+def _record_contention(site: str, busy_events: int, retries: int, wait_seconds: float, failed: bool) -> None:
+    with _contention_lock:
+        stats = _contention_stats.get(site)
+        if stats is None:
+            stats = _contention_stats[site] = {
+                "transactions": 0,
+                "busy_events": 0,
+                "retries": 0,
+                "failures": 0,
+                "lock_wait_seconds": 0.0,
+                "max_lock_wait_seconds": 0.0,
+            }
+        stats["transactions"] += 1
+        stats["busy_events"] += busy_events
+        stats["retries"] += retries
+        stats["failures"] += 1 if failed else 0
+        stats["lock_wait_seconds"] += wait_seconds
+        if wait_seconds > stats["max_lock_wait_seconds"]:
+            stats["max_lock_wait_seconds"] = wait_seconds
+
+
+def get_contention_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    Snapshot write-lock contention counters per call site.
+
+    Returns:
+        Dict mapping call site to transactions, busy_events, retries,
+        failures (retries exhausted), lock_wait_seconds and
+        max_lock_wait_seconds (time spent acquiring the write lock).
+    """
+    with _contention_lock:
+        return {site: dict(stats) for site, stats in _contention_stats.items()}
+
+
+def reset_contention_metrics() -> None:
+    """Clear contention counters (for tests and load-test runs)."""
+    with _contention_lock:
+        _contention_stats.clear()
+
+
+T = TypeVar("T")
+
+
 class DatabasePool:
     """
     Thread-safe connection pool for SQLite.
@@ -446,6 +805,15 @@ class DatabasePool:
             if not has_version_table:
                 # Fresh database - create schema
                 conn.executescript(SCHEMA_SQL)
+                for statement in (
+                    _epoch_ms_schema_statements()
+                    + list(QUARANTINE_INDEXES)
+                    + list(EVENT_PARTITION_SCHEMA)
+                    + _write_generation_schema_statements()
+                    + list(TICKET_AGGREGATE_SCHEMA)
+                    + [TICKET_SLA_INDEX, TICKET_THROTTLE_INDEX]
+                ):
+                    conn.execute(statement)
                 conn.execute(
                     "INSERT INTO schema_version (version) VALUES (?)",
                     (SCHEMA_VERSION,)
@@ -460,6 +828,8 @@ class DatabasePool:
                 if current_version < SCHEMA_VERSION:
                     # Run migrations
                     self._migrate_schema(conn, current_version, SCHEMA_VERSION)
+                    if current_version < 8:
+                        self._start_epoch_backfill()
         
         except sqlite3.Error as e:
             raise DatabaseSchemaError(f"Schema initialization failed: {e}") from e
@@ -653,6 +1023,144 @@ class DatabasePool:
                     )
                     print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
 
+        # Migration from v7 to v8: Integer epoch-ms shadow columns.
+        # Existing rows are filled by a chunked background backfill.
+        if from_version <= 7 and to_version >= 8:
+            try:
+                for table, column in EPOCH_MS_COLUMNS:
+                    cursor = conn.execute(f"PRAGMA table_info({table})")
+                    column_names = {row[1] for row in cursor.fetchall()}
+                    if f"{column}_ms" not in column_names:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}_ms INTEGER")
+                for statement in _epoch_ms_schema_statements():
+                    conn.execute(statement)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v7->v8: {rollback_error}",
+                        extra={"migration": "v7_to_v8", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v8 to v9: Quarantine occurrence counter and
+        # content-hash dedup index (quarantine moved from files to the table).
+        if from_version <= 8 and to_version >= 9:
+            try:
+                cursor = conn.execute("PRAGMA table_info(quarantine)")
+                column_names = {row[1] for row in cursor.fetchall()}
+                for column, definition in QUARANTINE_COLUMNS:
+                    if column not in column_names:
+                        conn.execute(f"ALTER TABLE quarantine ADD COLUMN {column} {definition}")
+                for statement in QUARANTINE_INDEXES:
+                    conn.execute(statement)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v8->v9: {rollback_error}",
+                        extra={"migration": "v8_to_v9", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v9 to v10: Event log partition registry, shared id
+        # sequence and the cross-partition view.
+        if from_version <= 9 and to_version >= 10:
+            try:
+                for statement in EVENT_PARTITION_SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v9->v10: {rollback_error}",
+                        extra={"migration": "v9_to_v10", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v10 to v11: Write-generation counters for tickets.
+        if from_version <= 10 and to_version >= 11:
+            try:
+                for statement in _write_generation_schema_statements():
+                    conn.execute(statement)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v10->v11: {rollback_error}",
+                        extra={"migration": "v10_to_v11", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v11 to v12: Composite status/created index and the
+        # trigger-maintained ticket counters.
+        if from_version <= 11 and to_version >= 12:
+            try:
+                for statement in TICKET_AGGREGATE_SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v11->v12: {rollback_error}",
+                        extra={"migration": "v11_to_v12", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v12 to v13: Index for SQL-side SLA evaluation.
+        if from_version <= 12 and to_version >= 13:
+            try:
+                conn.execute(TICKET_SLA_INDEX)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v12->v13: {rollback_error}",
+                        extra={"migration": "v12_to_v13", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
+        # Migration from v13 to v14: Index for per-priority throttle windows.
+        if from_version <= 13 and to_version >= 14:
+            try:
+                conn.execute(TICKET_THROTTLE_INDEX)
+                conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    conn.rollback()
+                except Exception as rollback_error:
+                    log_event(
+                        "DATABASE_ROLLBACK_FAILED",
+                        f"Failed to rollback migration v13->v14: {rollback_error}",
+                        extra={"migration": "v13_to_v14", "error": str(rollback_error)},
+                    )
+                    print(f"WARNING: Database migration rollback failed: {rollback_error}", file=sys.stderr)
+                raise
+
         # Update version tracking
         conn.execute(
             "INSERT INTO schema_version (version) VALUES (?)",
@@ -660,6 +1168,24 @@ class DatabasePool:
         )
         conn.commit()
     
+    def _start_epoch_backfill(self) -> None:
+        """Fill epoch-ms shadow columns of pre-v8 rows in a daemon thread."""
+        def run() -> None:
+            try:
+                backfill_epoch_ms_columns(self)
+            except Exception as e:
+                log_event(
+                    "EPOCH_MS_BACKFILL_FAILED",
+                    f"Epoch-ms backfill stopped: {e}",
+                    extra={"error": str(e)},
+                    source="persistence.database.DatabasePool._start_epoch_backfill",
+                    level="WARNING",
+                )
+            finally:
+                self.close()
+
+        threading.Thread(target=run, name="actifix-epoch-ms-backfill", daemon=True).start()
+
     @contextlib.contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
         """
@@ -676,7 +1202,12 @@ class DatabasePool:
             raise DatabaseError(f"Database operation failed: {e}") from e
     
     @contextlib.contextmanager
-    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+    def transaction(
+        self,
+        immediate: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        site: Optional[str] = None,
+    ) -> Iterator[sqlite3.Connection]:
         """
         Context manager for transactions.
 
@@ -685,19 +1216,112 @@ class DatabasePool:
         Args:
             immediate: If True, use BEGIN IMMEDIATE to acquire write locks upfront.
                       Prevents lock upgrade conflicts in concurrent scenarios.
+                      A busy BEGIN IMMEDIATE is retried per the retry policy
+                      (nothing has run yet, so retrying is always safe).
+            retry: Retry policy override (default: DatabaseConfig.retry_policy).
+            site: Call-site label for contention metrics (default: caller).
 
         Yields:
             Database connection.
         """
         conn = self._get_connection()
+        if immediate:
+            self._begin_immediate(conn, retry or self.config.retry_policy, site or _caller_site(2))
+        else:
+            conn.execute("BEGIN")
         try:
-            begin_stmt = "BEGIN IMMEDIATE" if immediate else "BEGIN"
-            conn.execute(begin_stmt)
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
+
+    @contextlib.contextmanager
+    def _attempt_busy_timeout(self, conn: sqlite3.Connection, policy: RetryPolicy) -> Iterator[None]:
+        """Shorten SQLite's busy wait per attempt while a retry policy is active."""
+        custom = policy.attempt_busy_timeout is not None and policy.max_attempts > 1
+        if custom:
+            conn.execute(f"PRAGMA busy_timeout = {int(policy.attempt_busy_timeout * 1000)}")
+        try:
+            yield
+        finally:
+            if custom:
+                conn.execute(f"PRAGMA busy_timeout = {int(self.config.timeout * 1000)}")
+
+    def _begin_immediate(self, conn: sqlite3.Connection, policy: RetryPolicy, site: str) -> None:
+        """Acquire the write lock, retrying busy errors with jittered backoff."""
+        busy_events = 0
+        start = time.monotonic()
+        with self._attempt_busy_timeout(conn, policy):
+            for attempt in range(1, policy.max_attempts + 1):
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    break
+                except sqlite3.OperationalError as e:
+                    if not is_busy_error(e):
+                        raise
+                    busy_events += 1
+                    if attempt >= policy.max_attempts:
+                        _record_contention(site, busy_events, attempt - 1, time.monotonic() - start, True)
+                        raise
+                    time.sleep(policy.backoff(attempt))
+        _record_contention(site, busy_events, busy_events, time.monotonic() - start, False)
+
+    def run_in_transaction(
+        self,
+        work: Callable[[sqlite3.Connection], T],
+        immediate: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        site: Optional[str] = None,
+    ) -> T:
+        """
+        Run work(conn) in a transaction, re-running it if SQLite reports busy.
+
+        Unlike transaction(), a busy error raised by the body or COMMIT is
+        also retried: the transaction is rolled back and work runs again from
+        scratch. work must therefore be idempotent apart from its database
+        writes (no external side effects before it returns).
+
+        Args:
+            work: Callable receiving the connection; its result is returned.
+            immediate: Use BEGIN IMMEDIATE (recommended for writes).
+            retry: Retry policy override (default: DatabaseConfig.retry_policy).
+            site: Call-site label for contention metrics (default: caller).
+
+        Returns:
+            Result of work.
+        """
+        policy = retry or self.config.retry_policy
+        site = site or _caller_site(1)
+        conn = self._get_connection()
+        busy_events = 0
+        waited = 0.0
+
+        with self._attempt_busy_timeout(conn, policy):
+            for attempt in range(1, policy.max_attempts + 1):
+                began = time.monotonic()
+                try:
+                    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+                    waited += time.monotonic() - began
+                    result = work(conn)
+                    conn.commit()
+                except Exception as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    else:
+                        waited += time.monotonic() - began
+                    busy = is_busy_error(e)
+                    busy_events += 1 if busy else 0
+                    if not busy or attempt >= policy.max_attempts:
+                        _record_contention(site, busy_events, attempt - 1, waited, busy)
+                        raise
+                    delay = policy.backoff(attempt)
+                    time.sleep(delay)
+                    waited += delay
+                    continue
+                _record_contention(site, busy_events, attempt - 1, waited, False)
+                return result
+        raise AssertionError("unreachable")  # pragma: no cover
     
     def get_pool_metrics(self) -> Dict[str, Any]:
         """
@@ -813,10 +1437,7 @@ def get_database_pool(db_path: Optional[Path] = None) -> DatabasePool:
         env_db_path = os.environ.get("ACTIFIX_DB_PATH")
         db_path = Path(env_db_path).expanduser() if env_db_path else (_Path.cwd() / "data" / "actifix.db")
 
-    resolved_db_path = db_path.resolve()
-    _validate_database_path_directory(resolved_db_path)
-    _ensure_database_file_secure(resolved_db_path)
-    _validate_database_file_permissions(resolved_db_path)
+    resolved_db_path = _validate_pool_path(db_path)
 
     with _pool_lock:
         if _global_pool is None or _global_pool.config.db_path != resolved_db_path:
@@ -826,6 +1447,33 @@ def get_database_pool(db_path: Optional[Path] = None) -> DatabasePool:
         return _global_pool
 
 
+def _validate_pool_path(db_path: Path) -> Path:
+    resolved_db_path = db_path.resolve()
+    _validate_database_path_directory(resolved_db_path)
+    _ensure_database_file_secure(resolved_db_path)
+    _validate_database_file_permissions(resolved_db_path)
+    return resolved_db_path
+
+
+def open_database_pool(db_path: Path, config: Optional[DatabaseConfig] = None) -> DatabasePool:
+    """
+    Create a standalone (non-global) pool for another database file.
+
+    The path goes through the same security checks as get_database_pool().
+
+    Args:
+        db_path: Database file path.
+        config: Optional config template (db_path is replaced).
+
+    Returns:
+        New database pool.
+    """
+    resolved_db_path = _validate_pool_path(Path(db_path))
+    if config is None:
+        return DatabasePool(DatabaseConfig(db_path=resolved_db_path))
+    return DatabasePool(replace(config, db_path=resolved_db_path))
+
+
 def get_database_connection(paths: Optional[object] = None) -> sqlite3.Connection:
     """
     Backward-compatible helper to get a raw database connection.
@@ -881,6 +1529,9 @@ def deserialize_json_field(json_str: Optional[str]) -> Any:
         return None
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 def serialize_timestamp(dt: Optional[datetime]) -> Optional[str]:
     """Serialize datetime to ISO format string."""
     if dt is None:
@@ -890,6 +1541,31 @@ def serialize_timestamp(dt: Optional[datetime]) -> Optional[str]:
     return dt.isoformat()
 
 
+def timestamp_to_epoch_ms(dt: Optional[datetime]) -> Optional[int]:
+    """
+    Convert a datetime to epoch milliseconds (naive values are treated as UTC).
+
+    Rounds to the nearest millisecond, matching epoch_ms_sql().
+    """
+    if dt is None:
+        return None
+    if isinstance(dt, str):
+        dt = deserialize_timestamp(dt)
+        if dt is None:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    micros = (dt - _EPOCH) // timedelta(microseconds=1)
+    return (micros + 500) // 1000
+
+
+def epoch_ms_to_timestamp(ms: Optional[int]) -> Optional[datetime]:
+    """Convert epoch milliseconds to an aware UTC datetime."""
+    if ms is None:
+        return None
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
 def deserialize_timestamp(ts_str: Optional[str]) -> Optional[datetime]:
     """Deserialize timestamp string to datetime."""
     if ts_str is None:
@@ -1227,17 +1903,25 @@ REQUIRED_INDEXES = {
         ("idx_tickets_created", "CREATE INDEX IF NOT EXISTS idx_tickets_created ON tickets(created_at DESC)"),
         ("idx_tickets_status_priority", "CREATE INDEX IF NOT EXISTS idx_tickets_status_priority ON tickets(status, priority)"),
         ("idx_tickets_duplicate_guard", "CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_duplicate_guard ON tickets(duplicate_guard) WHERE duplicate_guard IS NOT NULL"),
+        ("idx_tickets_created_ms", "CREATE INDEX IF NOT EXISTS idx_tickets_created_ms ON tickets(created_at_ms)"),
+        ("idx_tickets_lease_ms", "CREATE INDEX IF NOT EXISTS idx_tickets_lease_ms ON tickets(lease_expires_ms)"),
     ],
     "event_log": [
         ("idx_event_log_timestamp", "CREATE INDEX IF NOT EXISTS idx_event_log_timestamp ON event_log(timestamp DESC)"),
         ("idx_event_log_type", "CREATE INDEX IF NOT EXISTS idx_event_log_type ON event_log(event_type)"),
         ("idx_event_log_ticket", "CREATE INDEX IF NOT EXISTS idx_event_log_ticket ON event_log(ticket_id) WHERE ticket_id IS NOT NULL"),
         ("idx_event_log_correlation", "CREATE INDEX IF NOT EXISTS idx_event_log_correlation ON event_log(correlation_id) WHERE correlation_id IS NOT NULL"),
+        ("idx_event_log_timestamp_ms", "CREATE INDEX IF NOT EXISTS idx_event_log_timestamp_ms ON event_log(timestamp_ms)"),
     ],
     "agent_voice": [
         ("idx_agent_voice_timestamp", "CREATE INDEX IF NOT EXISTS idx_agent_voice_timestamp ON agent_voice(timestamp DESC)"),
         ("idx_agent_voice_agent", "CREATE INDEX IF NOT EXISTS idx_agent_voice_agent ON agent_voice(agent_id)"),
         ("idx_agent_voice_level", "CREATE INDEX IF NOT EXISTS idx_agent_voice_level ON agent_voice(level)"),
+        ("idx_agent_voice_created_ms", "CREATE INDEX IF NOT EXISTS idx_agent_voice_created_ms ON agent_voice(created_at_ms)"),
+    ],
+    "quarantine": [
+        ("idx_quarantine_status", "CREATE INDEX IF NOT EXISTS idx_quarantine_status ON quarantine(status)"),
+        ("idx_quarantine_active_hash", QUARANTINE_INDEXES[0]),
     ],
 }
 
@@ -1318,6 +2002,67 @@ def verify_and_create_indexes(pool: Optional[DatabasePool] = None) -> dict:
     }
 
 
+def backfill_epoch_ms_columns(
+    pool: Optional[DatabasePool] = None,
+    chunk_size: int = DEFAULT_EPOCH_BACKFILL_CHUNK_SIZE,
+    max_chunks: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Fill NULL epoch-ms shadow columns from their text timestamps.
+
+    Runs in short IMMEDIATE transactions of at most chunk_size rows so
+    writers are only blocked briefly. Rows whose text timestamp cannot be
+    parsed are left NULL and skipped.
+
+    Args:
+        pool: Database pool (uses global pool if None).
+        chunk_size: Rows updated per transaction.
+        max_chunks: Optional cap on transactions per column (None = until done).
+
+    Returns:
+        Dict mapping "<table>.<column>_ms" to rows filled.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if pool is None:
+        pool = get_database_pool()
+
+    filled: Dict[str, int] = {}
+    for table, column in EPOCH_MS_COLUMNS:
+        shadow = f"{column}_ms"
+        total = 0
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            with pool.transaction(immediate=True) as conn:
+                cursor = conn.execute(
+                    f"""
+                    UPDATE {table} SET {shadow} = {epoch_ms_sql(column)}
+                    WHERE rowid IN (
+                        SELECT rowid FROM {table}
+                        WHERE {shadow} IS NULL AND {column} IS NOT NULL
+                          AND julianday({column}) IS NOT NULL
+                        LIMIT ?
+                    )
+                    """,
+                    (chunk_size,),
+                )
+                updated = cursor.rowcount
+            if updated <= 0:
+                break
+            total += updated
+            chunks += 1
+        filled[f"{table}.{shadow}"] = total
+
+    if any(filled.values()):
+        log_event(
+            "EPOCH_MS_BACKFILL_COMPLETED",
+            f"Backfilled {sum(filled.values())} epoch-ms timestamp values",
+            extra=filled,
+            source="persistence.database.backfill_epoch_ms_columns",
+        )
+    return filled
+
+
 def compact_json_encode(data: Union[dict, list, str], compress: bool = True) -> str:
     """
     Compact JSON encoding for large context fields.
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Event Log Partitions - Time-partitioned storage for the event log.
+
+Events are written to one table per period (``event_log_dYYYYMMDD`` for daily
+partitions, ``event_log_wYYYYMMDD`` for weekly partitions starting on Monday),
+keyed by the event timestamp in UTC. Inserts only touch the small current
+partition and its indexes, and retention drops whole partitions instead of
+deleting rows and leaving free pages behind.
+
+The pre-partitioning ``event_log`` table stays readable as the legacy
+partition. ``event_log_all`` is a UNION ALL view over the legacy table and
+every registered partition, rebuilt whenever a partition is added or dropped.
+
+Event ids come from the single ``event_log_sequence`` row, so they stay
+globally unique and increasing across partitions.
+
+Partitions carry no foreign key to ``tickets``: with ticket shards enabled
+the tickets live in other databases, and an event keeps the id of the ticket
+it was logged for even after that ticket is deleted.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..config import get_config
+from .database import (
+    EVENT_LOG_COLUMNS,
+    EVENT_LOG_VIEW,
+    DatabasePool,
+    bump_write_generation,
+    epoch_ms_range_sql,
+    get_database_pool,
+)
+
+PARTITION_PERIODS = ("day", "week")
+LEGACY_EVENT_TABLE = "event_log"
+
+# Columns supplied by writers (the id is assigned from the shared sequence).
+EVENT_INSERT_COLUMNS = EVENT_LOG_COLUMNS[1:]
+
+
+@dataclass(frozen=True)
+class EventPartition:
+    """One registered partition covering [start_ms, end_ms)."""
+
+    name: str
+    start_ms: int
+    end_ms: int
+
+
+def partition_for(timestamp_ms: int, period: str = "day") -> EventPartition:
+    """Return the partition that holds an event timestamp (epoch ms, UTC)."""
+    if period not in PARTITION_PERIODS:
+        raise ValueError(f"Unknown event partition period: {period}")
+    day = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).date()
+    if period == "week":
+        day -= timedelta(days=day.weekday())
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    end = start + timedelta(days=7 if period == "week" else 1)
+    return EventPartition(
+        name=f"event_log_{period[0]}{day:%Y%m%d}",
+        start_ms=int(start.timestamp() * 1000),
+        end_ms=int(end.timestamp() * 1000),
+    )
+
+
+def _partition_schema(name: str) -> Tuple[str, ...]:
+    return (
+        f"""
+        CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY,
+            timestamp TIMESTAMP NOT NULL,
+            event_type TEXT NOT NULL,
+            message TEXT NOT NULL,
+            ticket_id TEXT,
+            correlation_id TEXT,
+            extra_json TEXT,
+            source TEXT,
+            level TEXT DEFAULT 'INFO',
+            timestamp_ms INTEGER NOT NULL
+        )
+        """,
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_timestamp_ms ON {name}(timestamp_ms)",
+        # Filter column first, then time: serves "newest N matching" reads
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_type_time ON {name}(event_type, timestamp_ms)",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_level_time ON {name}(level, timestamp_ms)",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_source_time ON {name}(source, timestamp_ms)",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_ticket ON {name}(ticket_id)",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_correlation ON {name}(correlation_id) "
+        "WHERE correlation_id IS NOT NULL",
+    )
+
+
+class EventPartitions:
+    """
+    Partition manager for one database.
+
+    Keeps an in-memory set of partitions known to exist so the hot insert
+    path does not issue DDL; a partition dropped by another process is
+    recreated on the next insert that needs it.
+    """
+
+    def __init__(self, pool: DatabasePool, period: str = "day"):
+        if period not in PARTITION_PERIODS:
+            raise ValueError(f"Unknown event partition period: {period}")
+        self.pool = pool
+        self.period = period
+        self._known: set = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Registry
+    # ------------------------------------------------------------------
+
+    def list_partitions(self, conn: Optional[sqlite3.Connection] = None) -> List[EventPartition]:
+        """Return registered partitions, newest period first."""
+        query = (
+            "SELECT name, period_start_ms, period_end_ms FROM event_log_partitions "
+            "ORDER BY period_start_ms DESC"
+        )
+        if conn is None:
+            with self.pool.connection() as own:
+                rows = own.execute(query).fetchall()
+        else:
+            rows = conn.execute(query).fetchall()
+        return [EventPartition(row[0], int(row[1]), int(row[2])) for row in rows]
+
+    def sources(
+        self,
+        conn: sqlite3.Connection,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> List[EventPartition]:
+        """Partitions overlapping [start_ms, end_ms), newest first."""
+        return [
+            partition
+            for partition in self.list_partitions(conn)
+            if (start_ms is None or partition.end_ms > start_ms)
+            and (end_ms is None or partition.start_ms < end_ms)
+        ]
+
+    def rebuild_view(self, conn: sqlite3.Connection) -> None:
+        """Recreate event_log_all over the legacy table and all partitions."""
+        columns = ", ".join(EVENT_LOG_COLUMNS)
+        selects = [f"SELECT {columns} FROM {LEGACY_EVENT_TABLE}"]
+        selects.extend(
+            f"SELECT {columns} FROM {partition.name}"
+            for partition in reversed(self.list_partitions(conn))
+        )
+        conn.execute(f"DROP VIEW IF EXISTS {EVENT_LOG_VIEW}")
+        conn.execute(f"CREATE VIEW {EVENT_LOG_VIEW} AS " + " UNION ALL ".join(selects))
+
+    def ensure(self, conn: sqlite3.Connection, partition: EventPartition) -> None:
+        """Create and register a partition if it does not exist yet."""
+        if partition.name in self._known:
+            return
+        for statement in _partition_schema(partition.name):
+            conn.execute(statement)
+        if conn.execute(f"PRAGMA foreign_key_list({partition.name})").fetchone():
+            self._drop_ticket_foreign_key(conn, partition.name)
+        registered = conn.execute(
+            "INSERT OR IGNORE INTO event_log_partitions (name, period_start_ms, period_end_ms) "
+            "VALUES (?, ?, ?)",
+            (partition.name, partition.start_ms, partition.end_ms),
+        ).rowcount
+        if registered:
+            self.rebuild_view(conn)
+        with self._lock:
+            self._known.add(partition.name)
+
+    def _drop_ticket_foreign_key(self, conn: sqlite3.Connection, name: str) -> None:
+        """Rebuild a partition created with the old tickets(id) foreign key."""
+        rebuilt = f"{name}_rebuild"
+        # Renaming a table validates views, so drop event_log_all until rebuilt
+        conn.execute(f"DROP VIEW IF EXISTS {EVENT_LOG_VIEW}")
+        conn.execute(f"DROP TABLE IF EXISTS {rebuilt}")
+        conn.execute(_partition_schema(rebuilt)[0])
+        columns = ", ".join(EVENT_LOG_COLUMNS)
+        conn.execute(f"INSERT INTO {rebuilt} ({columns}) SELECT {columns} FROM {name}")
+        conn.execute(f"DROP TABLE {name}")
+        conn.execute(f"ALTER TABLE {rebuilt} RENAME TO {name}")
+        for statement in _partition_schema(name)[1:]:
+            conn.execute(statement)
+        self.rebuild_view(conn)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def insert(self, conn: sqlite3.Connection, rows: Sequence[Sequence]) -> List[int]:
+        """
+        Insert events into their partitions inside the caller's transaction.
+
+        Args:
+            conn: Connection with an open write transaction.
+            rows: Values in EVENT_INSERT_COLUMNS order (timestamp_ms required).
+
+        Returns:
+            Assigned event ids, in input order.
+        """
+        if not rows:
+            return []
+        conn.execute("UPDATE event_log_sequence SET seq = seq + ? WHERE id = 0", (len(rows),))
+        last_id = int(conn.execute("SELECT seq FROM event_log_sequence WHERE id = 0").fetchone()[0])
+        first_id = last_id - len(rows) + 1
+
+        grouped: Dict[EventPartition, List[Tuple]] = {}
+        ids = []
+        for offset, row in enumerate(rows):
+            event_id = first_id + offset
+            ids.append(event_id)
+            partition = partition_for(int(row[-1]), self.period)
+            grouped.setdefault(partition, []).append((event_id, *row))
+
+        placeholders = ", ".join("?" for _ in EVENT_LOG_COLUMNS)
+        for partition, values in grouped.items():
+            self.ensure(conn, partition)
+            statement = (
+                f"INSERT INTO {partition.name} ({', '.join(EVENT_LOG_COLUMNS)}) "
+                f"VALUES ({placeholders})"
+            )
+            try:
+                conn.executemany(statement, values)
+            except sqlite3.OperationalError as exc:
+                if "no such table" not in str(exc):
+                    raise
+                # Dropped by another process since we cached it
+                with self._lock:
+                    self._known.discard(partition.name)
+                self.ensure(conn, partition)
+                conn.executemany(statement, values)
+        return ids
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def drop_before(self, cutoff_ms: int, dry_run: bool = False) -> int:
+        """
+        Remove events older than cutoff_ms.
+
+        Partitions that end at or before the cutoff are dropped whole; the
+        partition containing the cutoff is kept, so retention is rounded to
+        the partition period. Legacy event_log rows are deleted by timestamp.
+        Removing anything bumps the "events" write generation, since the
+        newest event id alone does not change.
+
+        Returns:
+            Number of events removed (or that would be removed).
+        """
+        with self.pool.transaction(immediate=not dry_run, site="event_partitions.drop") as conn:
+            expired = [p for p in self.list_partitions(conn) if p.end_ms <= cutoff_ms]
+            removed = 0
+            for partition in expired:
+                removed += int(conn.execute(f"SELECT COUNT(*) FROM {partition.name}").fetchone()[0])
+            legacy_where = epoch_ms_range_sql("timestamp", "<")
+            if dry_run:
+                row = conn.execute(
+                    f"SELECT COUNT(*) FROM {LEGACY_EVENT_TABLE} WHERE {legacy_where}",
+                    (cutoff_ms, cutoff_ms),
+                ).fetchone()
+                return removed + int(row[0])
+
+            removed += conn.execute(
+                f"DELETE FROM {LEGACY_EVENT_TABLE} WHERE {legacy_where}",
+                (cutoff_ms, cutoff_ms),
+            ).rowcount
+            for partition in expired:
+                conn.execute(f"DROP TABLE IF EXISTS {partition.name}")
+                conn.execute("DELETE FROM event_log_partitions WHERE name = ?", (partition.name,))
+            if expired:
+                self.rebuild_view(conn)
+            if removed or expired:
+                bump_write_generation(conn, "events")
+
+        with self._lock:
+            self._known.difference_update(p.name for p in expired)
+        return removed
+
+
+_partition_managers: Dict[Path, EventPartitions] = {}
+_partition_managers_lock = threading.Lock()
+
+
+def get_event_partitions(pool: Optional[DatabasePool] = None) -> EventPartitions:
+    """Get the partition manager for a pool's database (global pool by default)."""
+    pool = pool or get_database_pool()
+    key = Path(pool.config.db_path)
+    with _partition_managers_lock:
+        manager = _partition_managers.get(key)
+        if manager is None or manager.pool is not pool:
+            period = getattr(get_config(), "event_partition_period", "day")
+            manager = EventPartitions(pool, period if period in PARTITION_PERIODS else "day")
+            _partition_managers[key] = manager
+        return manager
+
+
+def reset_event_partitions() -> None:
+    """Forget cached partition managers (for testing)."""
+    with _partition_managers_lock:
+        _partition_managers.clear()
+
@@ -7,6 +7,9 @@ EventRepository - Database-backed event logging for Actifix.
 Replaces AFLog.txt file-based logging with structured database storage.
 Provides efficient querying, filtering, and event tracking.
 
+Events are stored in time partitions (see event_partitions.py); reads walk
+the partitions newest first and stop once enough rows are collected.
+
 Version: 2.0.0
 """
 
@@ -14,11 +17,36 @@ import json
 import sqlite3
 import threading
 import time
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+
+from .database import (
+    EVENT_LOG_VIEW,
+    epoch_ms_range_sql,
+    get_database_pool,
+    read_write_generation,
+    serialize_timestamp,
+    timestamp_to_epoch_ms,
+)
+from .event_partitions import LEGACY_EVENT_TABLE, get_event_partitions
+from .event_tail import get_event_tail
+
+
+def _event_sort_key(event: Dict[str, Any]) -> tuple:
+    """Newest-first ordering key for events merged from several partitions."""
+    timestamp_ms = event.get('timestamp_ms')
+    if timestamp_ms is None:
+        try:
+            timestamp_ms = timestamp_to_epoch_ms(event.get('timestamp'))
+        except (TypeError, ValueError):
+            timestamp_ms = None
+    return (timestamp_ms or 0, event.get('id') or 0)
 
-from .database import get_database_pool, serialize_timestamp
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
 
 
 @dataclass
@@ -29,7 +57,11 @@ class EventFilter:
     ticket_id: Optional[str] = None
     correlation_id: Optional[str] = None
     level: Optional[str] = None
+    levels: Optional[Sequence[str]] = None        # Any of these levels (or `level`)
+    event_type_prefix: Optional[str] = None       # e.g. "TICKET_" (index range scan)
     source: Optional[str] = None
+    start_time: Optional[datetime] = None  # Inclusive lower bound
+    end_time: Optional[datetime] = None    # Exclusive upper bound
     limit: int = 100
     offset: int = 0
 
@@ -76,28 +108,17 @@ class EventRepository:
         try:
             ts = timestamp or datetime.now(timezone.utc)
             ts_str = serialize_timestamp(ts)
+            ts_ms = timestamp_to_epoch_ms(ts)
+
+            # Stored upper-case so level filters can use the index
+            level = (level or 'INFO').upper()
+            row = (ts_str, event_type, message, ticket_id, correlation_id, extra_json, source, level, ts_ms)
+            partitions = get_event_partitions(self.pool)
 
             with self.pool.transaction() as conn:
-                try:
-                    cursor = conn.execute(
-                        """
-                        INSERT INTO event_log
-                        (timestamp, event_type, message, ticket_id, correlation_id, extra_json, source, level)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (ts_str, event_type, message, ticket_id, correlation_id, extra_json, source, level)
-                    )
-                    return cursor.lastrowid
-                except sqlite3.IntegrityError:
-                    cursor = conn.execute(
-                        """
-                        INSERT INTO event_log
-                        (timestamp, event_type, message, ticket_id, correlation_id, extra_json, source, level)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (ts_str, event_type, message, None, correlation_id, extra_json, source, level)
-                    )
-                    return cursor.lastrowid
+                event_id = partitions.insert(conn, [row])[0]
+            get_event_tail(self.pool).notify(event_id)
+            return event_id
         except Exception:
             # Silently fail to avoid recursive logging errors
             return None
@@ -114,40 +135,163 @@ class EventRepository:
         """
         if filter is None:
             filter = EventFilter()
-        
-        query = "SELECT * FROM event_log WHERE 1=1"
-        params = []
-        
-        if filter.event_type:
-            query += " AND event_type = ?"
-            params.append(filter.event_type)
-        
-        if filter.ticket_id:
-            query += " AND ticket_id = ?"
-            params.append(filter.ticket_id)
-        
-        if filter.correlation_id:
-            query += " AND correlation_id = ?"
-            params.append(filter.correlation_id)
-        
-        if filter.level:
-            query += " AND level = ?"
-            params.append(filter.level)
-        
-        if filter.source:
-            query += " AND source = ?"
-            params.append(filter.source)
-        
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([filter.limit, filter.offset])
-        
+
+        start_ms = timestamp_to_epoch_ms(filter.start_time) if filter.start_time else None
+        end_ms = timestamp_to_epoch_ms(filter.end_time) if filter.end_time else None
+        # Rows needed from each source before OFFSET is applied (None = all)
+        needed = filter.limit + filter.offset if filter.limit >= 0 else None
+
         try:
             with self.pool.connection() as conn:
-                cursor = conn.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+                events = self._query_partition(
+                    conn, LEGACY_EVENT_TABLE, filter, start_ms, end_ms, needed, legacy=True
+                )
+                collected: List[Dict[str, Any]] = []
+                for partition in get_event_partitions(self.pool).sources(conn, start_ms, end_ms):
+                    # Older partitions only hold older events
+                    if needed is not None and len(collected) >= needed:
+                        break
+                    collected.extend(self._query_partition(
+                        conn, partition.name, filter, start_ms, end_ms,
+                        None if needed is None else needed - len(collected),
+                    ))
         except Exception:
             return []
-    
+
+        events.extend(collected)
+        events.sort(key=_event_sort_key, reverse=True)
+        if needed is None:
+            return events[filter.offset:]
+        return events[filter.offset:needed]
+
+    def latest_event_id(self) -> int:
+        """Highest committed event id; changes whenever an event is logged."""
+        return get_event_tail(self.pool).latest_id()
+
+    def get_write_generation(self) -> int:
+        """
+        Return the event write generation.
+
+        Bumped when retention removes events. Together with
+        latest_event_id it changes on every change to the log.
+        """
+        with self.pool.connection() as conn:
+            return read_write_generation(conn, "events")
+
+    def tail_events(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+        filter: Optional[EventFilter] = None,
+        wait_seconds: float = 0.0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get events committed after an id cursor, oldest first.
+
+        Without a cursor the latest `limit` events are returned. With a
+        cursor and wait_seconds > 0 the call long-polls: it blocks until a
+        matching event is committed or the wait expires.
+
+        Args:
+            after_id: Last event id the caller has seen (None to start at the tail).
+            limit: Maximum number of events to return.
+            filter: Optional filters (time bounds and paging are ignored).
+            wait_seconds: Maximum time to wait for new events.
+
+        Returns:
+            Tuple of (events, cursor). Pass cursor as after_id on the next call.
+        """
+        filter = filter or EventFilter()
+        tail = get_event_tail(self.pool)
+        limit = max(1, limit)
+
+        if after_id is None:
+            cursor = tail.latest_id()
+            recent = self.get_events(replace(filter, start_time=None, end_time=None, limit=limit, offset=0))
+            return list(reversed(recent)), cursor
+
+        conditions, params = self._filter_conditions(filter)
+        query = (
+            f"SELECT * FROM {EVENT_LOG_VIEW} WHERE {' AND '.join(['id > ?'] + conditions)} "
+            "ORDER BY id LIMIT ?"
+        )
+        deadline = time.monotonic() + max(0.0, wait_seconds)
+        cursor = after_id
+        while True:
+            # Every id up to `seen` is committed, so the cursor can skip past
+            # non-matching events without rescanning them.
+            seen = tail.latest_id()
+            with self.pool.connection() as conn:
+                events = [dict(row) for row in conn.execute(query, [cursor, *params, limit]).fetchall()]
+            if events:
+                last_id = events[-1]['id']
+                return events, last_id if len(events) >= limit else max(last_id, seen)
+            cursor = max(cursor, seen)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not tail.wait(cursor, remaining):
+                return [], cursor
+
+    @staticmethod
+    def _filter_conditions(filter: EventFilter, legacy: bool = False) -> Tuple[List[str], List[Any]]:
+        """
+        SQL predicates for the filter's column fields.
+
+        Levels are stored upper-case; legacy rows may not be, so the legacy
+        table compares UPPER(level) instead.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        for column in ('event_type', 'ticket_id', 'correlation_id', 'source'):
+            value = getattr(filter, column)
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        levels = list(dict.fromkeys(
+            level.upper() for level in [*(filter.levels or []), filter.level] if level
+        ))
+        if levels:
+            level_column = "UPPER(level)" if legacy else "level"
+            conditions.append(f"{level_column} IN ({', '.join('?' for _ in levels)})")
+            params.extend(levels)
+
+        if filter.event_type_prefix:
+            # Range instead of LIKE so the (event_type, timestamp_ms) index applies
+            conditions.append("event_type >= ? AND event_type < ?")
+            params.extend([filter.event_type_prefix, _prefix_upper_bound(filter.event_type_prefix)])
+        return conditions, params
+
+    @classmethod
+    def _query_partition(
+        cls,
+        conn: sqlite3.Connection,
+        table: str,
+        filter: EventFilter,
+        start_ms: Optional[int],
+        end_ms: Optional[int],
+        limit: Optional[int],
+        legacy: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Newest events from one partition matching the filter."""
+        where, values = cls._filter_conditions(filter, legacy=legacy)
+        for bound, op in ((start_ms, '>='), (end_ms, '<')):
+            if bound is None:
+                continue
+            if legacy:
+                # Legacy rows may predate the timestamp_ms backfill
+                where.append(epoch_ms_range_sql('timestamp', op))
+                values.extend([bound, bound])
+            else:
+                where.append(f"timestamp_ms {op} ?")
+                values.append(bound)
+
+        order = "timestamp DESC" if legacy else "timestamp_ms DESC, id DESC"
+        query = f"SELECT * FROM {table} WHERE {' AND '.join(where) or '1=1'} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+        return [dict(row) for row in conn.execute(query, values).fetchall()]
+
     def get_events_for_ticket(self, ticket_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get all events associated with a specific ticket.
@@ -206,26 +350,24 @@ class EventRepository:
     def prune_old_events(self, days_to_keep: int = 90) -> int:
         """
         Delete events older than specified days.
-        
+
+        Partitions that end before the cutoff are dropped whole, so events
+        are kept until the end of the partition period they fall in.
+
         Args:
             days_to_keep: Number of days of events to retain.
-        
+
         Returns:
             Number of events deleted.
         """
+        cutoff_ms = timestamp_to_epoch_ms(
+            datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+        )
         try:
-            with self.pool.transaction() as conn:
-                cursor = conn.execute(
-                    """
-                    DELETE FROM event_log
-                    WHERE timestamp < datetime('now', ? || ' days')
-                    """,
-                    (f'-{days_to_keep}',)
-                )
-                return cursor.rowcount
+            return get_event_partitions(self.pool).drop_before(cutoff_ms)
         except Exception:
             return 0
-    
+
     def get_event_count(self) -> int:
         """
         Get total count of events in the log.
@@ -235,7 +377,7 @@ class EventRepository:
         """
         try:
             with self.pool.connection() as conn:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM event_log")
+                cursor = conn.execute(f"SELECT COUNT(*) as count FROM {EVENT_LOG_VIEW}")
                 row = cursor.fetchone()
                 return row['count'] if row else 0
         except Exception:
@@ -251,14 +393,14 @@ class EventRepository:
         try:
             with self.pool.connection() as conn:
                 # Total count
-                cursor = conn.execute("SELECT COUNT(*) as total FROM event_log")
+                cursor = conn.execute(f"SELECT COUNT(*) as total FROM {EVENT_LOG_VIEW}")
                 total = cursor.fetchone()['total']
                 
                 # By event type
                 cursor = conn.execute(
-                    """
+                    f"""
                     SELECT event_type, COUNT(*) as count
-                    FROM event_log
+                    FROM {EVENT_LOG_VIEW}
                     GROUP BY event_type
                     ORDER BY count DESC
                     LIMIT 10
@@ -268,9 +410,9 @@ class EventRepository:
                 
                 # By level
                 cursor = conn.execute(
-                    """
+                    f"""
                     SELECT level, COUNT(*) as count
-                    FROM event_log
+                    FROM {EVENT_LOG_VIEW}
                     GROUP BY level
                     """
                 )
@@ -358,13 +500,14 @@ class BatchedEventWriter:
 
         event = {
             'timestamp': serialize_timestamp(ts),
+            'timestamp_ms': timestamp_to_epoch_ms(ts),
             'event_type': event_type,
             'message': message,
             'ticket_id': ticket_id,
             'correlation_id': correlation_id,
             'extra_json': extra_json,
             'source': source,
-            'level': level,
+            'level': (level or 'INFO').upper(),
         }
 
         with self._lock:
@@ -410,12 +553,8 @@ class BatchedEventWriter:
         try:
             pool = get_database_pool()
             with pool.transaction() as conn:
-                conn.executemany(
-                    """
-                    INSERT INTO event_log
-                    (timestamp, event_type, message, ticket_id, correlation_id, extra_json, source, level)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                ids = get_event_partitions(pool).insert(
+                    conn,
                     [
                         (
                             e['timestamp'],
@@ -426,10 +565,12 @@ class BatchedEventWriter:
                             e['extra_json'],
                             e['source'],
                             e['level'],
+                            e['timestamp_ms'],
                         )
                         for e in batch
-                    ]
+                    ],
                 )
+            get_event_tail(pool).notify(max(ids))
             return len(batch)
         except Exception:
             # Silently fail to avoid recursive logging errors
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Event Tail - Wake long-poll and stream readers when events are committed.
+
+Readers follow the event log with an id cursor (event ids are globally
+increasing, see event_partitions.py). Instead of re-querying on a timer,
+a waiting reader blocks on a condition variable that EventRepository
+signals after each committed write. Writes from other processes are picked
+up by checking ``PRAGMA data_version``, which only changes when another
+connection commits, so an idle wait costs no table reads.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .database import DatabasePool, get_database_pool
+
+# How often a waiter checks PRAGMA data_version for commits made elsewhere
+DEFAULT_TAIL_POLL_INTERVAL = 1.0
+
+
+class EventTail:
+    """Commit notifications for one event log database."""
+
+    def __init__(self, pool: DatabasePool, poll_interval: float = DEFAULT_TAIL_POLL_INTERVAL):
+        self.pool = pool
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._latest_id = 0
+
+    def notify(self, event_id: Optional[int]) -> None:
+        """Record a committed event id and wake all waiters."""
+        if event_id is None:
+            return
+        with self._condition:
+            if event_id > self._latest_id:
+                self._latest_id = event_id
+            self._condition.notify_all()
+
+    @staticmethod
+    def _read_latest_id(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT seq FROM event_log_sequence WHERE id = 0").fetchone()
+        return int(row[0]) if row else 0
+
+    def latest_id(self) -> int:
+        """Highest committed event id (0 when the log is empty)."""
+        with self.pool.connection() as conn:
+            latest = self._read_latest_id(conn)
+        with self._condition:
+            self._latest_id = max(self._latest_id, latest)
+            return self._latest_id
+
+    def wait(self, after_id: int, timeout: float) -> bool:
+        """
+        Block until an event with id > after_id is committed.
+
+        Args:
+            after_id: Highest event id the caller has already seen.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if newer events exist, False on timeout.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self.pool.connection() as conn:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._read_latest_id(conn) > after_id:
+                return True
+            while True:
+                with self._condition:
+                    if self._latest_id > after_id:
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(min(remaining, self.poll_interval))
+                    if self._latest_id > after_id:
+                        return True
+
+                current = conn.execute("PRAGMA data_version").fetchone()[0]
+                if current != data_version:
+                    data_version = current
+                    latest = self._read_latest_id(conn)
+                    if latest > after_id:
+                        self.notify(latest)
+                        return True
+
+
+_event_tails: Dict[Path, EventTail] = {}
+_event_tails_lock = threading.Lock()
+
+
+def get_event_tail(pool: Optional[DatabasePool] = None) -> EventTail:
+    """Get the commit notifier for a pool's database (global pool by default)."""
+    pool = pool or get_database_pool()
+    key = Path(pool.config.db_path)
+    with _event_tails_lock:
+        tail = _event_tails.get(key)
+        if tail is None or tail.pool is not pool:
+            tail = EventTail(pool)
+            _event_tails[key] = tail
+        return tail
+
+
+def reset_event_tail() -> None:
+    """Forget cached notifiers (for testing)."""
+    with _event_tails_lock:
+        _event_tails.clear()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming NDJSON Export - Bounded-memory export of tickets and events
+
+Rows are read with keyset pagination (``rowid > last_rowid``) in fixed-size
+chunks, redacted in a process pool, and written one JSON object per line.
+Memory use depends on the chunk size, not on the number of rows exported.
+
+Output layout:
+- ``<output>``: NDJSON, optionally gzip (``.gz``) or lzma (``.xz``) compressed.
+  The first line is a header record; every other line carries a ``type``
+  field (``ticket``, ``event``).
+- ``<output>.sha256``: SHA-256 of the uncompressed NDJSON stream, written
+  when the export completes (``sha256sum`` format).
+- ``<output>.checkpoint``: resume state (byte offset and last exported rowid
+  per table). Removed when the export completes.
+
+Each chunk is written as a complete gzip member / xz stream and fsynced
+before the checkpoint is updated, so an interrupted export can be resumed
+by truncating the file to the checkpoint offset and continuing after the
+recorded rowid. Concatenated members decompress as one stream.
+"""
+
+import gzip
+import hashlib
+import json
+import lzma
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .atomic import atomic_write
+from .database import EVENT_LOG_VIEW, DatabasePool, get_database_pool
+
+
+EXPORT_FORMAT_VERSION = "2.0"
+DEFAULT_EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_COMPRESSORS = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+
+ExportProgressCallback = Callable[[str, int], None]
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """
+    A table exported as one record type.
+
+    ``pool`` reads the table from another database than the exporter's
+    (a ticket shard); ``shard`` names it in each record and keeps its
+    checkpoint position separate from other shards of the same type.
+    """
+
+    record_type: str
+    table: str
+    columns: Tuple[str, ...]
+    where: str = ""
+    params: Tuple[Any, ...] = ()
+    redact_columns: Tuple[str, ...] = ()
+    bool_columns: Tuple[str, ...] = ()
+    key_column: str = "rowid"
+    pool: Optional[DatabasePool] = None
+    shard: str = ""
+
+    @property
+    def checkpoint_key(self) -> str:
+        """Key of this table's position in checkpoints and ExportResult.last_rowids."""
+        return f"{self.record_type}:{self.shard}" if self.shard else self.record_type
+
+
+TICKET_EXPORT_COLUMNS = (
+    "id", "priority", "error_type", "message", "source", "created_at",
+    "updated_at", "status", "completion_summary", "documented",
+    "functioning", "tested", "completed",
+)
+TICKET_BOOL_COLUMNS = ("documented", "functioning", "tested", "completed")
+
+EVENT_EXPORT_COLUMNS = (
+    "id", "timestamp", "event_type", "message", "ticket_id", "correlation_id",
+    "source", "level",
+)
+
+
+def ticket_export_table(
+    where: str = "",
+    params: Tuple[Any, ...] = (),
+    pool: Optional[DatabasePool] = None,
+    shard: str = "",
+) -> ExportTable:
+    """Build the ticket export definition with an optional filter and shard."""
+    return ExportTable(
+        record_type="ticket",
+        table="tickets",
+        columns=TICKET_EXPORT_COLUMNS,
+        where=where,
+        params=params,
+        redact_columns=("message", "completion_summary"),
+        bool_columns=TICKET_BOOL_COLUMNS,
+        pool=pool,
+        shard=shard,
+    )
+
+
+def event_export_table() -> ExportTable:
+    """Build the event log export definition (all partitions, keyed by event id)."""
+    return ExportTable(
+        record_type="event",
+        table=EVENT_LOG_VIEW,
+        key_column="id",
+        columns=EVENT_EXPORT_COLUMNS,
+        redact_columns=("message",),
+    )
+
+
+@dataclass
+class ExportResult:
+    """Outcome of a streaming export."""
+
+    output_path: Path
+    sha256: str
+    records: Dict[str, int] = field(default_factory=dict)
+    last_rowids: Dict[str, int] = field(default_factory=dict)
+    resumed: bool = False
+    bytes_written: int = 0
+
+
+def _redact(text: Optional[str]) -> Optional[str]:
+    """Redact one value (module-level so worker processes can import it)."""
+    if not text:
+        return text
+    from ..raise_af import redact_secrets_from_text
+    return redact_secrets_from_text(text)
+
+
+class StreamingExporter:
+    """Write tables as NDJSON with bounded memory and resumable checkpoints."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        pool: Optional[DatabasePool] = None,
+        *,
+        compression: Optional[str] = None,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            output_path: NDJSON output file.
+            pool: Optional database pool (uses global pool if None).
+            compression: None, "gzip" or "lzma".
+            chunk_size: Rows read, redacted and written per chunk.
+            workers: Redaction processes (default: min(4, cpu count));
+                1 redacts in-process.
+        """
+        if compression is not None and compression not in EXPORT_COMPRESSORS:
+            raise ValueError(
+                f"Unsupported export compression '{compression}' "
+                f"(expected one of: {', '.join(sorted(EXPORT_COMPRESSORS))})"
+            )
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.output_path = Path(output_path)
+        self.pool = pool or get_database_pool()
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self.workers = workers if workers is not None else min(4, os.cpu_count() or 1)
+        self.checkpoint_path = self.output_path.with_name(self.output_path.name + ".checkpoint")
+        self.checksum_path = self.output_path.with_name(self.output_path.name + ".sha256")
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not self.checkpoint_path.exists() or not self.output_path.exists():
+            return None
+        try:
+            state = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if state.get("compression") != self.compression:
+            return None
+        if self.output_path.stat().st_size < state.get("offset", 0):
+            return None
+        return state
+
+    def _save_checkpoint(self, state: Dict[str, Any]) -> None:
+        atomic_write(self.checkpoint_path, json.dumps(state))
+
+    def _rehash_existing(self, offset: int) -> "hashlib._Hash":
+        """Truncate to the checkpoint offset and rebuild the running checksum."""
+        with open(self.output_path, "r+b") as handle:
+            handle.truncate(offset)
+        digest = hashlib.sha256()
+        with self._open_reader() as reader:
+            for block in iter(lambda: reader.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _open_reader(self):
+        if self.compression:
+            return EXPORT_COMPRESSORS[self.compression][1](self.output_path, "rb")
+        return open(self.output_path, "rb")
+
+    def _write_block(self, payload: bytes) -> int:
+        """Append one self-contained block and fsync; returns the new file size."""
+        if self.compression:
+            opener = EXPORT_COMPRESSORS[self.compression][1]
+            with open(self.output_path, "ab") as raw:
+                with opener(raw, "wb") as compressed:
+                    compressed.write(payload)
+                raw.flush()
+                os.fsync(raw.fileno())
+                return raw.tell()
+        with open(self.output_path, "ab") as raw:
+            raw.write(payload)
+            raw.flush()
+            os.fsync(raw.fileno())
+            return raw.tell()
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _fetch_chunk(self, spec: ExportTable, after_rowid: int) -> List[Tuple[Any, ...]]:
+        key = spec.key_column
+        where = f"{key} > ?{f' AND ({spec.where})' if spec.where else ''}"
+        query = (
+            f"SELECT {key}, {', '.join(spec.columns)} FROM {spec.table} "
+            f"WHERE {where} ORDER BY {key} LIMIT ?"
+        )
+        with (spec.pool or self.pool).connection() as conn:
+            return [tuple(row) for row in conn.execute(query, (after_rowid, *spec.params, self.chunk_size))]
+
+    def _redact_rows(self, spec: ExportTable, rows: List[Tuple[Any, ...]], executor) -> List[Dict[str, Any]]:
+        origin = {"shard": spec.shard} if spec.shard else {}
+        records = [
+            {"type": spec.record_type, **origin, **dict(zip(spec.columns, row[1:]))}
+            for row in rows
+        ]
+        for column in spec.redact_columns:
+            values = [record[column] for record in records]
+            if executor is not None:
+                redacted = list(executor.map(_redact, values, chunksize=max(1, len(values) // (self.workers * 4))))
+            else:
+                redacted = [_redact(value) for value in values]
+            for record, value in zip(records, redacted):
+                record[column] = value
+        for column in spec.bool_columns:
+            for record in records:
+                record[column] = bool(record[column])
+        return records
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def export(
+        self,
+        tables: Sequence[ExportTable],
+        *,
+        resume: bool = True,
+        metadata: Optional[Dict[str, Any]] = None,
+        progress: Optional[ExportProgressCallback] = None,
+    ) -> ExportResult:
+        """
+        Stream tables to the output file.
+
+        Args:
+            tables: Tables to export, in order.
+            resume: Continue from an existing checkpoint if one matches.
+            metadata: Extra fields for the header record.
+            progress: Optional callback(record_type, records_so_far).
+
+        Returns:
+            ExportResult with checksum and per-type counts.
+        """
+        state = self._load_checkpoint() if resume else None
+        resumed = state is not None
+
+        if resumed:
+            digest = self._rehash_existing(state["offset"])
+        else:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in (self.output_path, self.checksum_path):
+                if stale.exists():
+                    stale.unlink()
+            digest = hashlib.sha256()
+            header = {
+                "type": "header",
+                "version": EXPORT_FORMAT_VERSION,
+                "exported_at": datetime.now(timezone.utc).isoformat(),
+                "compression": self.compression,
+                **(metadata or {}),
+            }
+            payload = self._encode(header)
+            digest.update(payload)
+            state = {
+                "compression": self.compression,
+                "offset": self._write_block(payload),
+                "last_rowids": {},
+                "records": {},
+            }
+            self._save_checkpoint(state)
+
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for spec in tables:
+                last_rowid = state["last_rowids"].get(spec.checkpoint_key, 0)
+                count = state["records"].get(spec.record_type, 0)
+                while True:
+                    rows = self._fetch_chunk(spec, last_rowid)
+                    if not rows:
+                        break
+                    records = self._redact_rows(spec, rows, executor)
+                    payload = b"".join(self._encode(record) for record in records)
+                    digest.update(payload)
+
+                    last_rowid = rows[-1][0]
+                    count += len(rows)
+                    state["offset"] = self._write_block(payload)
+                    state["last_rowids"][spec.checkpoint_key] = last_rowid
+                    state["records"][spec.record_type] = count
+                    self._save_checkpoint(state)
+
+                    if progress is not None:
+                        progress(spec.record_type, count)
+                state["records"].setdefault(spec.record_type, count)
+                state["last_rowids"].setdefault(spec.checkpoint_key, last_rowid)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        checksum = digest.hexdigest()
+        atomic_write(self.checksum_path, f"{checksum}  {self.output_path.name}\n")
+        self.checkpoint_path.unlink(missing_ok=True)
+
+        return ExportResult(
+            output_path=self.output_path,
+            sha256=checksum,
+            records=dict(state["records"]),
+            last_rowids=dict(state["last_rowids"]),
+            resumed=resumed,
+            bytes_written=state["offset"],
+        )
+
+
+def resolve_export_path(path: Path, compression: Optional[str]) -> Path:
+    """Append the compression suffix to path if it is missing."""
+    if compression is None:
+        return path
+    suffix = EXPORT_COMPRESSORS[compression][0]
+    return path if path.name.endswith(suffix) else path.with_name(path.name + suffix)
+
+
+def iter_export_records(path: Path, compression: Optional[str] = None):
+    """Yield records from an NDJSON export one at a time."""
+    opener = EXPORT_COMPRESSORS[compression][1] if compression else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
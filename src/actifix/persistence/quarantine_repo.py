@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Quarantine repository.
+
+Stores quarantined content in the ``quarantine`` table. Entries are
+deduplicated by SHA-256 content hash: quarantining content that is already
+quarantined bumps an occurrence counter instead of adding a row, so a
+corruption loop cannot grow the quarantine without bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from .database import (
+    DatabasePool,
+    deserialize_timestamp,
+    get_database_pool,
+    serialize_timestamp,
+)
+
+QUARANTINE_STATUS_ACTIVE = "quarantined"
+QUARANTINE_STATUS_DELETED = "deleted"
+MAX_QUARANTINE_PAGE_SIZE = 1000
+
+
+def content_hash(content: str) -> str:
+    """Return the dedup hash of quarantined content."""
+    return hashlib.sha256(content.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+@dataclass(frozen=True)
+class QuarantineRecord:
+    id: int
+    entry_id: str
+    original_source: str
+    reason: str
+    content: str
+    content_hash: str
+    quarantined_at: datetime
+    last_seen_at: datetime
+    occurrences: int
+    status: str
+
+
+class QuarantineRepository:
+    """Repository for writing/reading quarantine rows."""
+
+    def __init__(self, pool: Optional[DatabasePool] = None):
+        self._pool = pool
+
+    @property
+    def pool(self) -> DatabasePool:
+        return self._pool or get_database_pool()
+
+    def add(
+        self,
+        *,
+        entry_id: str,
+        content: str,
+        source: str,
+        reason: str,
+        quarantined_at: Optional[datetime] = None,
+    ) -> tuple[QuarantineRecord, bool]:
+        """
+        Quarantine content, deduplicating on its content hash.
+
+        Returns:
+            Tuple of (record, created). created is False when the content was
+            already quarantined and only its occurrence counter was bumped
+            (the record then keeps its original entry_id).
+        """
+        digest = content_hash(content)
+        now = serialize_timestamp(quarantined_at or datetime.now(timezone.utc))
+
+        with self.pool.transaction(immediate=True) as conn:
+            cursor = conn.execute(
+                """
+                UPDATE quarantine
+                SET occurrences = occurrences + 1, last_seen_at = ?, reason = ?
+                WHERE original_content_hash = ? AND status = ?
+                """,
+                (now, reason, digest, QUARANTINE_STATUS_ACTIVE),
+            )
+            created = cursor.rowcount == 0
+            if created:
+                conn.execute(
+                    """
+                    INSERT INTO quarantine (
+                        entry_id, original_source, reason, content, original_content_hash,
+                        quarantined_at, last_seen_at, occurrences, status
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+                    """,
+                    (entry_id, source, reason, content, digest, now, now, QUARANTINE_STATUS_ACTIVE),
+                )
+            row = conn.execute(
+                "SELECT * FROM quarantine WHERE original_content_hash = ? AND status = ?",
+                (digest, QUARANTINE_STATUS_ACTIVE),
+            ).fetchone()
+
+        return self._row_to_record(row), created
+
+    def import_entries(self, entries: Iterable[dict]) -> int:
+        """
+        Insert pre-existing entries (legacy markdown files) as they are.
+
+        Entries whose entry_id is already stored (in any status) or whose
+        content is already actively quarantined are skipped, so importing the
+        same files again is a no-op.
+
+        Args:
+            entries: Dicts with entry_id, content, source, reason and
+                quarantined_at (datetime).
+
+        Returns:
+            Number of entries inserted.
+        """
+        rows = []
+        for entry in entries:
+            when = serialize_timestamp(entry["quarantined_at"])
+            rows.append((
+                entry["entry_id"], entry["source"], entry["reason"], entry["content"],
+                content_hash(entry["content"]), when, when, QUARANTINE_STATUS_ACTIVE,
+            ))
+        if not rows:
+            return 0
+        with self.pool.transaction(immediate=True) as conn:
+            return conn.executemany(
+                """
+                INSERT OR IGNORE INTO quarantine (
+                    entry_id, original_source, reason, content, original_content_hash,
+                    quarantined_at, last_seen_at, occurrences, status
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+                """,
+                rows,
+            ).rowcount
+
+    def get(self, entry_id: str) -> Optional[QuarantineRecord]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM quarantine WHERE entry_id = ? AND status = ?",
+                (entry_id, QUARANTINE_STATUS_ACTIVE),
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def count(self) -> int:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM quarantine WHERE status = ?",
+                (QUARANTINE_STATUS_ACTIVE,),
+            ).fetchone()
+        return int(row[0] if row else 0)
+
+    def list_paginated(
+        self,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+    ) -> tuple[list[QuarantineRecord], Optional[int]]:
+        """
+        List active entries newest first with keyset pagination.
+
+        Args:
+            limit: Number of entries to return (max 1000).
+            cursor: ID cursor for pagination (entries with id < cursor).
+
+        Returns:
+            Tuple of (records, next_cursor). next_cursor is None if no more results.
+        """
+        limit = max(1, min(int(limit), MAX_QUARANTINE_PAGE_SIZE))
+        params: list = [QUARANTINE_STATUS_ACTIVE]
+        cursor_clause = ""
+        if cursor is not None:
+            cursor_clause = "AND id < ?"
+            params.append(int(cursor))
+        params.append(limit + 1)
+
+        # Served by idx_quarantine_status (status, rowid)
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT * FROM quarantine
+                WHERE status = ? {cursor_clause}
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+
+        has_more = len(rows) > limit
+        records = [self._row_to_record(r) for r in rows[:limit]]
+        next_cursor = records[-1].id if has_more and records else None
+        return records, next_cursor
+
+    def remove(self, entry_id: str) -> bool:
+        """Mark an active entry deleted (it no longer dedups new content)."""
+        with self.pool.transaction(immediate=True) as conn:
+            cursor = conn.execute(
+                "UPDATE quarantine SET status = ? WHERE entry_id = ? AND status = ?",
+                (QUARANTINE_STATUS_DELETED, entry_id, QUARANTINE_STATUS_ACTIVE),
+            )
+            return cursor.rowcount > 0
+
+    def prune(self, older_than: datetime, dry_run: bool = False) -> int:
+        """Delete entries (any status) last seen before older_than."""
+        cutoff = serialize_timestamp(older_than)
+        where = "COALESCE(last_seen_at, quarantined_at) < ?"
+        if dry_run:
+            with self.pool.connection() as conn:
+                row = conn.execute(f"SELECT COUNT(*) FROM quarantine WHERE {where}", (cutoff,)).fetchone()
+            return int(row[0])
+        with self.pool.transaction(immediate=True) as conn:
+            return conn.execute(f"DELETE FROM quarantine WHERE {where}", (cutoff,)).rowcount
+
+    @staticmethod
+    def _row_to_record(row) -> QuarantineRecord:
+        quarantined_at = deserialize_timestamp(row["quarantined_at"]) or datetime.now(timezone.utc)
+        return QuarantineRecord(
+            id=int(row["id"]),
+            entry_id=str(row["entry_id"]),
+            original_source=str(row["original_source"]),
+            reason=str(row["reason"]),
+            content=str(row["content"]),
+            content_hash=str(row["original_content_hash"] or ""),
+            quarantined_at=quarantined_at,
+            last_seen_at=deserialize_timestamp(row["last_seen_at"]) or quarantined_at,
+            occurrences=int(row["occurrences"] or 1),
+            status=str(row["status"]),
+        )
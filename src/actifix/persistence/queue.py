@@ -9,6 +9,7 @@ Queues can be replayed when storage becomes available again.
 
 Key Features:
 - Atomic queue operations
+- Append-only journal with batched fsync and compaction
 - Deduplication support
 - Automatic replay on recovery
 - Queue size limits
@@ -19,10 +20,14 @@ Version: 1.0.0 (Generic)
 
 import json
 import hashlib
+import itertools
+import os
+import threading
+import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 
 from .atomic import atomic_write, safe_read
 
@@ -73,6 +78,17 @@ class PersistenceQueue:
     Persistence queue for reliability.
     
     When primary storage fails, operations are queued for later replay.
+
+    Storage layout:
+    - ``queue_file``: compacted snapshot (JSON list of entries)
+    - ``queue_file`` + ``.journal``: append-only log of changes since the
+      snapshot, one JSON record per line
+
+    Enqueue/dequeue append a single journal record instead of rewriting
+    the whole queue. Records are flushed immediately and fsynced in
+    batches; once the journal grows past ``compact_threshold`` records it is
+    folded into a new snapshot. On load the snapshot is read and the journal
+    replayed on top of it; a torn trailing record is ignored.
     """
     
     def __init__(
@@ -81,53 +97,178 @@ class PersistenceQueue:
         max_entries: int = 1000,
         max_age_hours: float = 24.0,
         deduplication: bool = True,
+        fsync_batch_size: int = 16,
+        fsync_interval_seconds: float = 0.5,
+        compact_threshold: int = 1000,
     ):
         """
         Initialize persistence queue.
         
         Args:
-            queue_file: Path to queue file (JSON)
+            queue_file: Path to queue snapshot file (JSON)
             max_entries: Maximum entries in queue
             max_age_hours: Maximum age of entries (auto-pruned)
             deduplication: Enable deduplication based on key
+            fsync_batch_size: Journal records written between fsyncs
+            fsync_interval_seconds: Maximum time between fsyncs
+            compact_threshold: Journal records that trigger compaction
         """
         self.queue_file = Path(queue_file)
+        self.journal_file = self.queue_file.with_name(self.queue_file.name + ".journal")
         self.max_entries = max_entries
         self.max_age_hours = max_age_hours
         self.deduplication = deduplication
-        self._entries: List[QueueEntry] = []
+        self.fsync_batch_size = max(1, fsync_batch_size)
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.compact_threshold = max(1, compact_threshold)
+
+        self._lock = threading.RLock()
+        self._by_id: Dict[str, QueueEntry] = {}
+        self._index: Dict[Tuple[str, str], str] = {}
+        self._journal = None
+        self._journal_records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
         self._load()
+
+    @property
+    def _entries(self) -> List[QueueEntry]:
+        """Entries in queue order (oldest first)."""
+        return list(self._by_id.values())
+
+    @_entries.setter
+    def _entries(self, entries: List[QueueEntry]) -> None:
+        self._by_id = {}
+        self._index = {}
+        for entry in entries:
+            self._put(entry)
+
+    def _put(self, entry: QueueEntry) -> None:
+        self._by_id[entry.entry_id] = entry
+        self._index[(entry.operation, entry.key)] = entry.entry_id
+
+    def _remove(self, entry_id: str) -> Optional[QueueEntry]:
+        entry = self._by_id.pop(entry_id, None)
+        if entry is not None and self._index.get((entry.operation, entry.key)) == entry_id:
+            del self._index[(entry.operation, entry.key)]
+        return entry
     
     def _load(self) -> None:
-        """Load queue from disk."""
+        """Load snapshot from disk and replay the journal on top of it."""
         content = safe_read(self.queue_file, default="[]")
         try:
             data = json.loads(content)
             self._entries = [QueueEntry.from_dict(e) for e in data]
-            self._prune_old_entries()
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError):
             # Queue file corrupted, start fresh
             self._entries = []
+
+        self._journal_records = self._replay_journal()
+
+        size_before = len(self._by_id)
+        self._prune_old_entries()
+        if len(self._by_id) != size_before:
+            self._save()
+
+    def _replay_journal(self) -> int:
+        """Apply journal records to the in-memory state. Returns records applied."""
+        applied = 0
+        try:
+            handle = open(self.journal_file, "r", encoding="utf-8")
+        except OSError:
+            return 0
+        with handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                    op = record["op"]
+                    if op == "put":
+                        self._put(QueueEntry.from_dict(record["entry"]))
+                    elif op == "del":
+                        self._remove(record["id"])
+                    elif op == "clear":
+                        self._entries = []
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                    # Torn write at the tail of the journal
+                    break
+                applied += 1
+        return applied
     
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record to the journal, fsyncing in batches."""
+        if self._journal is None:
+            if not self.queue_file.exists():
+                atomic_write(self.queue_file, "[]")
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_file, "a", encoding="utf-8")
+
+        self._journal.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+        self._unsynced += 1
+
+        now = time.monotonic()
+        if (
+            self._unsynced >= self.fsync_batch_size
+            or now - self._last_sync >= self.fsync_interval_seconds
+        ):
+            self.sync()
+
+        if self._journal_records >= max(self.compact_threshold, 2 * len(self._by_id)):
+            self._save()
+
+    def sync(self) -> None:
+        """Force pending journal records to stable storage."""
+        with self._lock:
+            if self._journal is not None and self._unsynced:
+                os.fsync(self._journal.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Fsync and close the journal."""
+        with self._lock:
+            self.sync()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
     def _save(self) -> None:
-        """Save queue to disk atomically."""
-        data = [e.to_dict() for e in self._entries]
-        content = json.dumps(data, indent=2, default=str)
-        atomic_write(self.queue_file, content)
+        """Compact: write a full snapshot atomically and truncate the journal."""
+        with self._lock:
+            data = [e.to_dict() for e in self._by_id.values()]
+            content = json.dumps(data, default=str, separators=(",", ":"))
+            atomic_write(self.queue_file, content)
+
+            # Replaying the old journal over the new snapshot is idempotent, so
+            # a crash before truncation is harmless.
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self.journal_file.exists():
+                with open(self.journal_file, "w", encoding="utf-8") as handle:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            self._journal_records = 0
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
     
     def _prune_old_entries(self) -> None:
         """Remove entries older than max_age_hours."""
         cutoff = datetime.now(timezone.utc) - timedelta(hours=self.max_age_hours)
-        self._entries = [
-            e for e in self._entries
-            if e.created_at > cutoff
-        ]
+        for entry in self._entries:
+            if entry.created_at <= cutoff:
+                self._remove(entry.entry_id)
     
     def _generate_entry_id(self, operation: str, key: str) -> str:
         """Generate unique entry ID."""
         data = f"{operation}:{key}:{datetime.now(timezone.utc).isoformat()}"
         hash_suffix = hashlib.sha256(data.encode()).hexdigest()[:8]
-        return f"QE-{hash_suffix.upper()}"
+        entry_id = f"QE-{hash_suffix.upper()}"
+        while entry_id in self._by_id:
+            hash_suffix = hashlib.sha256((data + entry_id).encode()).hexdigest()[:8]
+            entry_id = f"QE-{hash_suffix.upper()}"
+        return entry_id
     
     def enqueue(
         self,
@@ -153,37 +294,41 @@ class PersistenceQueue:
         """
         if operation not in {"write", "append", "update", "delete"}:
             raise QueueError(f"Invalid operation: {operation}")
-        
-        # Check for duplicates
-        if self.deduplication:
-            for entry in self._entries:
-                if entry.key == key and entry.operation == operation:
+
+        with self._lock:
+            # Check for duplicates
+            if self.deduplication:
+                existing_id = self._index.get((operation, key))
+                if existing_id is not None:
                     # Update existing entry instead of adding duplicate
+                    entry = self._by_id[existing_id]
                     entry.content = content
                     entry.metadata = metadata or {}
                     entry.last_retry = datetime.now(timezone.utc)
-                    self._save()
+                    self._append({"op": "put", "entry": entry.to_dict()})
                     return entry.entry_id
-        
-        # Check queue size limit
-        if len(self._entries) >= self.max_entries:
-            # Remove oldest entry
-            self._entries.pop(0)
-        
-        # Create new entry
-        entry = QueueEntry(
-            entry_id=self._generate_entry_id(operation, key),
-            operation=operation,
-            key=key,
-            content=content,
-            created_at=datetime.now(timezone.utc),
-            metadata=metadata or {},
-        )
-        
-        self._entries.append(entry)
-        self._save()
-        
-        return entry.entry_id
+
+            # Check queue size limit
+            if len(self._by_id) >= self.max_entries:
+                # Remove oldest entry
+                oldest_id = next(iter(self._by_id))
+                self._remove(oldest_id)
+                self._append({"op": "del", "id": oldest_id})
+
+            # Create new entry
+            entry = QueueEntry(
+                entry_id=self._generate_entry_id(operation, key),
+                operation=operation,
+                key=key,
+                content=content,
+                created_at=datetime.now(timezone.utc),
+                metadata=metadata or {},
+            )
+
+            self._put(entry)
+            self._append({"op": "put", "entry": entry.to_dict()})
+
+            return entry.entry_id
     
     def dequeue(self, entry_id: str) -> Optional[QueueEntry]:
         """
@@ -195,12 +340,11 @@ class PersistenceQueue:
         Returns:
             QueueEntry if found, None otherwise
         """
-        for i, entry in enumerate(self._entries):
-            if entry.entry_id == entry_id:
-                self._entries.pop(i)
-                self._save()
-                return entry
-        return None
+        with self._lock:
+            entry = self._remove(entry_id)
+            if entry is not None:
+                self._append({"op": "del", "id": entry_id})
+            return entry
     
     def peek(self, count: int = 1) -> List[QueueEntry]:
         """
@@ -212,7 +356,7 @@ class PersistenceQueue:
         Returns:
             List of entries (oldest first)
         """
-        return self._entries[:count]
+        return list(itertools.islice(self._by_id.values(), count))
     
     def replay(
         self,
@@ -258,8 +402,9 @@ class PersistenceQueue:
                 failed_entries.append(entry)
         
         # Update queue with only failed entries
-        self._entries = failed_entries
-        self._save()
+        with self._lock:
+            self._entries = failed_entries
+            self._save()
         
         return stats
     
@@ -270,18 +415,19 @@ class PersistenceQueue:
         Returns:
             Number of entries cleared
         """
-        count = len(self._entries)
-        self._entries.clear()
-        self._save()
+        with self._lock:
+            count = len(self._by_id)
+            self._entries = []
+            self._save()
         return count
     
     def size(self) -> int:
         """Get number of entries in queue."""
-        return len(self._entries)
+        return len(self._by_id)
     
     def is_empty(self) -> bool:
         """Check if queue is empty."""
-        return len(self._entries) == 0
+        return not self._by_id
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -290,7 +436,8 @@ class PersistenceQueue:
         Returns:
             Dict with queue stats
         """
-        if not self._entries:
+        entries = self._entries
+        if not entries:
             return {
                 "size": 0,
                 "oldest_entry": None,
@@ -302,14 +449,14 @@ class PersistenceQueue:
         # Count operations
         ops = {}
         total_retries = 0
-        for entry in self._entries:
+        for entry in entries:
             ops[entry.operation] = ops.get(entry.operation, 0) + 1
             total_retries += entry.retry_count
         
         return {
-            "size": len(self._entries),
-            "oldest_entry": self._entries[0].created_at.isoformat(),
-            "newest_entry": self._entries[-1].created_at.isoformat(),
+            "size": len(entries),
+            "oldest_entry": entries[0].created_at.isoformat(),
+            "newest_entry": entries[-1].created_at.isoformat(),
             "operations": ops,
-            "avg_retry_count": total_retries / len(self._entries),
+            "avg_retry_count": total_retries / len(entries),
         }
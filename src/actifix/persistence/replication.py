@@ -0,0 +1,767 @@
+"""WAL shipping replica for a local standby directory.
+
+Keeps a warm copy of the primary SQLite database in a standby directory so a
+corrupted ``data/actifix.db`` can be replaced without waiting for the next
+nightly backup.
+
+How it works:
+- Each sync cycle pins a read snapshot on the primary, which stops SQLite
+  from rewinding the WAL while committed frames are being read.
+- Committed WAL frames past the last shipped frame are validated with the
+  WAL checksum chain, written to a durable segment file in the standby
+  directory and then applied page-by-page to the replica database.
+- When continuity cannot be proven (first run, the WAL was deleted or
+  rewound past unshipped frames), the replica is resynchronised with an
+  incremental page diff against the primary file instead of a full copy.
+  A resync done without a valid WAL header is not repeated until one
+  appears, so a missing or truncated WAL costs one diff, not one per cycle.
+- Segments that were written but not applied (crash between the two steps)
+  are replayed on the next cycle.
+
+Everything happens on the local filesystem; no network transport is involved.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sqlite3
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..log_utils import log_event
+
+WAL_MAGIC_LE = 0x377F0682
+WAL_MAGIC_BE = 0x377F0683
+WAL_HEADER_SIZE = 32
+WAL_FRAME_HEADER_SIZE = 24
+
+SEGMENT_MAGIC = b"AFSEG001"
+SEGMENT_SUFFIX = ".seg"
+STATE_FILE_NAME = "replica_state.json"
+
+# Chunk size used when diffing the primary file against the replica
+_DIFF_CHUNK_PAGES = 256
+
+
+class ReplicationError(Exception):
+    """Raised when the replica cannot be synchronised or promoted."""
+    pass
+
+
+@dataclass(frozen=True)
+class WalHeader:
+    """Parsed WAL file header."""
+
+    magic: int
+    page_size: int
+    checkpoint_seq: int
+    salt1: int
+    salt2: int
+    checksum: Tuple[int, int]
+
+    @property
+    def big_endian(self) -> bool:
+        return self.magic == WAL_MAGIC_BE
+
+    @property
+    def generation(self) -> Tuple[int, int]:
+        return (self.salt1, self.salt2)
+
+
+@dataclass
+class WalFrame:
+    """A single validated WAL frame."""
+
+    page_number: int
+    commit_size: int  # Database size in pages for commit frames, else 0
+    data: bytes
+
+
+@dataclass
+class ReplicaState:
+    """Shipping position persisted alongside the replica."""
+
+    page_size: int = 0
+    salt1: Optional[int] = None
+    salt2: Optional[int] = None
+    checkpoint_seq: Optional[int] = None
+    big_endian: bool = False
+    next_frame: int = 0
+    checksum: List[int] = field(default_factory=lambda: [0, 0])
+    shipped_seq: int = 0
+    applied_seq: int = 0
+    last_sync_at: Optional[float] = None
+
+    @property
+    def generation(self) -> Optional[Tuple[int, int]]:
+        if self.salt1 is None or self.salt2 is None:
+            return None
+        return (self.salt1, self.salt2)
+
+
+def wal_checksum(data: bytes, s0: int, s1: int, big_endian: bool) -> Tuple[int, int]:
+    """Continue the SQLite WAL checksum over ``data`` (length multiple of 8)."""
+    words = struct.unpack(f"{'>' if big_endian else '<'}{len(data) // 4}I", data)
+    for index in range(0, len(words), 2):
+        s0 = (s0 + words[index] + s1) & 0xFFFFFFFF
+        s1 = (s1 + words[index + 1] + s0) & 0xFFFFFFFF
+    return s0, s1
+
+
+def parse_wal_header(data: bytes) -> Optional[WalHeader]:
+    """Parse and validate a WAL header, returning None if absent or invalid."""
+    if len(data) < WAL_HEADER_SIZE:
+        return None
+    magic, _version, page_size, checkpoint_seq, salt1, salt2, ck0, ck1 = struct.unpack(
+        ">8I", data[:WAL_HEADER_SIZE]
+    )
+    if magic not in (WAL_MAGIC_LE, WAL_MAGIC_BE):
+        return None
+    if wal_checksum(data[:24], 0, 0, magic == WAL_MAGIC_BE) != (ck0, ck1):
+        return None
+    return WalHeader(
+        magic=magic,
+        page_size=page_size,
+        checkpoint_seq=checkpoint_seq,
+        salt1=salt1,
+        salt2=salt2,
+        checksum=(ck0, ck1),
+    )
+
+
+def _read_db_page_size(db_path: Path) -> int:
+    with open(db_path, "rb") as handle:
+        header = handle.read(100)
+    if len(header) < 100:
+        return 0
+    page_size = struct.unpack(">H", header[16:18])[0]
+    return 65536 if page_size == 1 else page_size
+
+
+class WalShipper:
+    """Ship committed WAL frames from the primary database to a warm replica."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        standby_dir: Path,
+        interval_seconds: float = 5.0,
+        keep_segments: int = 100,
+    ):
+        """Initialize the shipper.
+
+        Args:
+            db_path: Primary database path
+            standby_dir: Directory holding the replica, segments and state
+            interval_seconds: Pause between background sync cycles
+            keep_segments: Applied segment files retained for inspection
+        """
+        self.db_path = Path(db_path)
+        self.wal_path = Path(str(self.db_path) + "-wal")
+        self.standby_dir = Path(standby_dir)
+        self.replica_path = self.standby_dir / self.db_path.name
+        self.segments_dir = self.standby_dir / "segments"
+        self.state_path = self.standby_dir / STATE_FILE_NAME
+        self.interval_seconds = interval_seconds
+        self.keep_segments = max(1, int(keep_segments))
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._state = self._load_state()
+        self._metrics: Dict[str, Any] = {
+            "bytes_shipped": 0,
+            "frames_shipped": 0,
+            "segments_shipped": 0,
+            "resyncs": 0,
+            "sync_errors": 0,
+            "last_apply_ms": 0.0,
+            "last_sync_ms": 0.0,
+            "last_error": None,
+        }
+
+    # ------------------------------------------------------------------
+    # State persistence
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Optional[ReplicaState]:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+            return ReplicaState(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_state(self, state: ReplicaState) -> None:
+        self.standby_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(asdict(state), handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        tmp_path.replace(self.state_path)
+        self._state = state
+
+    # ------------------------------------------------------------------
+    # WAL scanning
+    # ------------------------------------------------------------------
+
+    def _read_wal_header(self) -> Optional[WalHeader]:
+        try:
+            with open(self.wal_path, "rb") as handle:
+                return parse_wal_header(handle.read(WAL_HEADER_SIZE))
+        except OSError:
+            return None
+
+    def _scan_frames(
+        self,
+        salts: Tuple[int, int],
+        page_size: int,
+        big_endian: bool,
+        start_frame: int,
+        checksum: Tuple[int, int],
+    ) -> Tuple[List[WalFrame], int, Tuple[int, int], bool]:
+        """Collect committed frames of one WAL generation.
+
+        Returns:
+            (frames, next_frame, checksum_at_next_frame, stopped_on_data) where
+            frames end at the last commit frame and ``stopped_on_data`` is True
+            when the chain ended on a complete frame that does not belong to
+            this generation (as opposed to end-of-file).
+        """
+        frame_size = WAL_FRAME_HEADER_SIZE + page_size
+        committed: List[WalFrame] = []
+        pending: List[WalFrame] = []
+        index = start_frame
+        commit_index = start_frame
+        commit_checksum = checksum
+        s0, s1 = checksum
+        stopped_on_data = False
+
+        try:
+            handle = open(self.wal_path, "rb")
+        except OSError:
+            return [], start_frame, checksum, False
+
+        with handle:
+            handle.seek(WAL_HEADER_SIZE + start_frame * frame_size)
+            while True:
+                raw = handle.read(frame_size)
+                if len(raw) < frame_size:
+                    break
+                page_no, commit_size, salt1, salt2, ck0, ck1 = struct.unpack(">6I", raw[:24])
+                if (salt1, salt2) != salts:
+                    stopped_on_data = True
+                    break
+                s0, s1 = wal_checksum(raw[:8], s0, s1, big_endian)
+                s0, s1 = wal_checksum(raw[24:], s0, s1, big_endian)
+                if (s0, s1) != (ck0, ck1):
+                    stopped_on_data = True
+                    break
+                pending.append(WalFrame(page_no, commit_size, raw[24:]))
+                index += 1
+                if commit_size:
+                    committed.extend(pending)
+                    pending = []
+                    commit_index = index
+                    commit_checksum = (s0, s1)
+
+        if pending:
+            # Trailing frames without a commit are not durable yet; the chain
+            # has valid data past the commit point.
+            stopped_on_data = True
+        return committed, commit_index, commit_checksum, stopped_on_data
+
+    # ------------------------------------------------------------------
+    # Segments and replica application
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.segments_dir / f"{seq:012d}{SEGMENT_SUFFIX}"
+
+    def _write_segment(self, seq: int, page_size: int, frames: List[WalFrame]) -> int:
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        path = self._segment_path(seq)
+        tmp_path = path.with_suffix(".partial")
+        written = 0
+        with open(tmp_path, "wb") as handle:
+            handle.write(SEGMENT_MAGIC + struct.pack(">II", page_size, len(frames)))
+            for frame in frames:
+                handle.write(struct.pack(">II", frame.page_number, frame.commit_size))
+                handle.write(frame.data)
+                written += len(frame.data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        tmp_path.replace(path)
+        return written
+
+    def _read_segment(self, path: Path) -> Tuple[int, List[WalFrame]]:
+        with open(path, "rb") as handle:
+            header = handle.read(len(SEGMENT_MAGIC) + 8)
+            if header[: len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                raise ReplicationError(f"Invalid segment file: {path}")
+            page_size, count = struct.unpack(">II", header[len(SEGMENT_MAGIC):])
+            frames = []
+            for _ in range(count):
+                page_no, commit_size = struct.unpack(">II", handle.read(8))
+                data = handle.read(page_size)
+                if len(data) != page_size:
+                    raise ReplicationError(f"Truncated segment file: {path}")
+                frames.append(WalFrame(page_no, commit_size, data))
+        return page_size, frames
+
+    def _apply_frames(self, page_size: int, frames: List[WalFrame]) -> None:
+        if not frames:
+            return
+        db_pages = None
+        with open(self.replica_path, "r+b") as handle:
+            for frame in frames:
+                handle.seek((frame.page_number - 1) * page_size)
+                handle.write(frame.data)
+                if frame.commit_size:
+                    db_pages = frame.commit_size
+            if db_pages is not None:
+                handle.truncate(db_pages * page_size)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _replay_pending_segments(self, state: ReplicaState) -> None:
+        """Apply segments that were shipped but not applied before a crash."""
+        for seq in range(state.applied_seq + 1, state.shipped_seq + 1):
+            path = self._segment_path(seq)
+            if not path.exists():
+                raise ReplicationError(f"Missing shipped segment {path}")
+            page_size, frames = self._read_segment(path)
+            self._apply_frames(page_size, frames)
+            state.applied_seq = seq
+        self._save_state(state)
+
+    def _prune_segments(self, applied_seq: int) -> None:
+        cutoff = applied_seq - self.keep_segments
+        if cutoff <= 0 or not self.segments_dir.exists():
+            return
+        for path in self.segments_dir.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                if int(path.stem) <= cutoff:
+                    path.unlink()
+            except (ValueError, OSError):
+                continue
+
+    # ------------------------------------------------------------------
+    # Resynchronisation
+    # ------------------------------------------------------------------
+
+    def _resync(self, header: Optional[WalHeader]) -> Tuple[ReplicaState, int]:
+        """Bring the replica file in line with the primary file by page diff.
+
+        Must be called while a read snapshot is pinned on the primary.
+
+        Returns:
+            (fresh state positioned at the start of the current WAL generation,
+            bytes written to the replica)
+        """
+        page_size = _read_db_page_size(self.db_path)
+        if header is not None:
+            page_size = page_size or header.page_size
+        if page_size <= 0:
+            raise ReplicationError(f"Cannot determine page size of {self.db_path}")
+
+        self.standby_dir.mkdir(parents=True, exist_ok=True)
+        if not self.replica_path.exists():
+            self.replica_path.touch(mode=0o600)
+
+        chunk = page_size * _DIFF_CHUNK_PAGES
+        written = 0
+        with open(self.db_path, "rb") as src, open(self.replica_path, "r+b") as dest:
+            offset = 0
+            while True:
+                primary_chunk = src.read(chunk)
+                if not primary_chunk:
+                    break
+                dest.seek(offset)
+                replica_chunk = dest.read(len(primary_chunk))
+                if primary_chunk != replica_chunk:
+                    for start in range(0, len(primary_chunk), page_size):
+                        page = primary_chunk[start:start + page_size]
+                        if page != replica_chunk[start:start + page_size]:
+                            dest.seek(offset + start)
+                            dest.write(page)
+                            written += len(page)
+                offset += len(primary_chunk)
+            dest.truncate(offset)
+            dest.flush()
+            os.fsync(dest.fileno())
+
+        previous = self._state
+        state = ReplicaState(
+            page_size=page_size,
+            shipped_seq=previous.shipped_seq if previous else 0,
+            applied_seq=previous.shipped_seq if previous else 0,
+        )
+        if header is not None:
+            state.salt1, state.salt2 = header.generation
+            state.checkpoint_seq = header.checkpoint_seq
+            state.big_endian = header.big_endian
+            state.checksum = list(header.checksum)
+
+        self._metrics["resyncs"] += 1
+        log_event(
+            "REPLICA_RESYNC",
+            f"Replica resynchronised by page diff ({written} bytes written)",
+            extra={"replica": str(self.replica_path), "bytes_written": written},
+            source="persistence.replication.WalShipper._resync",
+        )
+        return state, written
+
+    # ------------------------------------------------------------------
+    # Sync cycle
+    # ------------------------------------------------------------------
+
+    def _ship(self, state: ReplicaState, frames: List[WalFrame]) -> int:
+        if not frames:
+            return 0
+        seq = state.shipped_seq + 1
+        shipped = self._write_segment(seq, state.page_size, frames)
+        state.shipped_seq = seq
+        self._save_state(state)
+
+        apply_started = time.monotonic()
+        self._apply_frames(state.page_size, frames)
+        self._metrics["last_apply_ms"] = round((time.monotonic() - apply_started) * 1000, 3)
+        state.applied_seq = seq
+
+        self._metrics["bytes_shipped"] += shipped
+        self._metrics["frames_shipped"] += len(frames)
+        self._metrics["segments_shipped"] += 1
+        return shipped
+
+    def sync_once(self, allow_resync: bool = True) -> Dict[str, Any]:
+        """Run one shipping cycle.
+
+        Args:
+            allow_resync: Fall back to a page diff against the primary file
+                when WAL continuity cannot be proven. Promotion passes False:
+                the primary is then presumed damaged, and diffing it would
+                copy the damage into the replica.
+
+        Returns:
+            Dict with frames/bytes shipped and whether a resync happened
+            (or was skipped)
+        """
+        if not self.db_path.exists():
+            raise ReplicationError(f"Primary database not found: {self.db_path}")
+
+        with self._lock:
+            started = time.monotonic()
+            result = {"frames": 0, "bytes": 0, "resynced": False, "resync_skipped": False}
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+            try:
+                # Pin a snapshot: while it is held the WAL cannot be rewound
+                # over frames we have not shipped yet.
+                conn.execute("BEGIN")
+                conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+                state = self._state
+                if state is not None and state.applied_seq < state.shipped_seq:
+                    self._replay_pending_segments(state)
+
+                header = self._read_wal_header()
+                needs_resync = state is None or not self.replica_path.exists()
+
+                if not needs_resync and header is not None and header.generation == state.generation:
+                    pass
+                elif not needs_resync and header is None and state.generation is None:
+                    # Already resynced without a WAL; wait for a valid header
+                    pass
+                elif not needs_resync:
+                    needs_resync = not self._drain_previous_generation(state, header, result)
+
+                if needs_resync and not allow_resync:
+                    result["resync_skipped"] = True
+                    log_event(
+                        "REPLICA_RESYNC_SKIPPED",
+                        "WAL continuity not provable; replica left as is (resync disabled)",
+                        extra={"replica": str(self.replica_path)},
+                        source="persistence.replication.WalShipper.sync_once",
+                        level="WARNING",
+                    )
+                    return result
+                if needs_resync:
+                    state, written = self._resync(header)
+                    result["resynced"] = True
+                    result["bytes"] += written
+
+                if header is not None and header.generation == state.generation:
+                    frames, next_frame, checksum, _ = self._scan_frames(
+                        header.generation,
+                        state.page_size,
+                        state.big_endian,
+                        state.next_frame,
+                        tuple(state.checksum),
+                    )
+                    result["bytes"] += self._ship(state, frames)
+                    result["frames"] += len(frames)
+                    state.next_frame = next_frame
+                    state.checksum = list(checksum)
+
+                state.last_sync_at = time.time()
+                self._save_state(state)
+            finally:
+                try:
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    pass
+                conn.close()
+
+            self._prune_segments(self._state.applied_seq)
+            self._metrics["last_sync_ms"] = round((time.monotonic() - started) * 1000, 3)
+            return result
+
+    def _drain_previous_generation(
+        self,
+        state: ReplicaState,
+        header: Optional[WalHeader],
+        result: Dict[str, Any],
+    ) -> bool:
+        """Ship what is left of the previous WAL generation after a rewind.
+
+        Returns:
+            True if the replica is provably continuous with the new generation
+        """
+        if header is None or state.generation is None:
+            return False
+
+        frames, stop_frame, _, stopped_on_data = self._scan_frames(
+            state.generation,
+            state.page_size,
+            state.big_endian,
+            state.next_frame,
+            tuple(state.checksum),
+        )
+        result["bytes"] += self._ship(state, frames)
+        result["frames"] += len(frames)
+
+        # The old generation provably ended at stop_frame only if a complete
+        # foreign frame sits there, exactly one rewind happened, and the new
+        # generation has not yet overwritten that position.
+        _, new_length, _, _ = self._scan_frames(
+            header.generation, state.page_size, header.big_endian, 0, header.checksum
+        )
+        continuous = (
+            stopped_on_data
+            and state.checkpoint_seq is not None
+            and header.checkpoint_seq == state.checkpoint_seq + 1
+            and new_length <= stop_frame
+        )
+        if continuous:
+            state.salt1, state.salt2 = header.generation
+            state.checkpoint_seq = header.checkpoint_seq
+            state.big_endian = header.big_endian
+            state.next_frame = 0
+            state.checksum = list(header.checksum)
+        return continuous
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start shipping in a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def ship_loop():
+            while not self._stop_event.is_set():
+                try:
+                    self.sync_once()
+                    self._metrics["last_error"] = None
+                except Exception as exc:
+                    self._metrics["sync_errors"] += 1
+                    self._metrics["last_error"] = str(exc)
+                    log_event(
+                        "REPLICA_SYNC_FAILED",
+                        f"Replica sync failed: {exc}",
+                        extra={"error": str(exc), "replica": str(self.replica_path)},
+                        source="persistence.replication.WalShipper",
+                        level="ERROR",
+                    )
+                self._stop_event.wait(self.interval_seconds)
+
+        self._thread = threading.Thread(target=ship_loop, daemon=True, name="actifix-wal-shipper")
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Metrics and promotion
+    # ------------------------------------------------------------------
+
+    def _unshipped_frames(self, state: ReplicaState) -> Optional[int]:
+        """Committed primary WAL frames past the shipped position.
+
+        Returns:
+            The frame count (0 when the primary's last commit is shipped), or
+            None when the positions cannot be compared: the WAL was rewound,
+            replaced or removed since the last cycle.
+        """
+        header = self._read_wal_header()
+        if header is None or header.generation != state.generation:
+            return None
+        frames, _, _, _ = self._scan_frames(
+            header.generation,
+            state.page_size,
+            state.big_endian,
+            state.next_frame,
+            tuple(state.checksum),
+        )
+        return len(frames)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return replication metrics (lag, bytes shipped, apply time).
+
+        The lag compares the primary's commit position with the shipped one:
+        it is 0 while every committed frame is shipped, and otherwise the
+        time since the last cycle (the oldest unshipped commit is newer).
+        """
+        state = self._state
+        last_sync_at = state.last_sync_at if state else None
+        unshipped = self._unshipped_frames(state) if state else None
+        if not last_sync_at:
+            lag = None
+        elif unshipped == 0:
+            lag = 0.0
+        else:
+            lag = round(time.time() - last_sync_at, 3)
+        return {
+            **self._metrics,
+            "replica_path": str(self.replica_path),
+            "running": self._thread is not None and self._thread.is_alive(),
+            "replication_lag_seconds": lag,
+            "unshipped_frames": unshipped,
+            "applied_seq": state.applied_seq if state else 0,
+            "last_sync_at": (
+                datetime.fromtimestamp(last_sync_at, tz=timezone.utc).isoformat()
+                if last_sync_at else None
+            ),
+        }
+
+    def verify_replica(self) -> bool:
+        """Run an integrity check against the replica without modifying it."""
+        if not self.replica_path.exists():
+            return False
+        uri = f"file:{self.replica_path}?mode=ro&immutable=1"
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+            try:
+                row = conn.execute("PRAGMA integrity_check").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+        return bool(row) and row[0] == "ok"
+
+    def promote(self, target: Optional[Path] = None, sync_first: bool = True) -> Path:
+        """Replace the primary database with the replica.
+
+        The current primary (and its -wal/-shm files) is moved aside so a stale
+        WAL is never replayed onto the promoted file.
+
+        Args:
+            target: Database path to replace (default: the primary)
+            sync_first: Ship any remaining verified WAL frames before
+                promoting (never a page diff from the primary)
+
+        Returns:
+            Path of the promoted database
+        """
+        target = Path(target) if target else self.db_path
+        self.stop()
+
+        if sync_first and self.db_path.exists():
+            try:
+                self.sync_once(allow_resync=False)
+            except Exception as exc:
+                log_event(
+                    "REPLICA_FINAL_SYNC_FAILED",
+                    f"Final sync before promotion failed: {exc}",
+                    extra={"error": str(exc)},
+                    source="persistence.replication.WalShipper.promote",
+                    level="WARNING",
+                )
+
+        if not self.verify_replica():
+            raise ReplicationError(f"Replica failed integrity check: {self.replica_path}")
+
+        with self._lock:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            for suffix in ("", "-wal", "-shm"):
+                current = Path(str(target) + suffix)
+                if current.exists():
+                    current.replace(Path(f"{target}.pre_promote_{timestamp}{suffix}"))
+
+            tmp_path = target.with_name(target.name + ".promoting")
+            shutil.copy2(self.replica_path, tmp_path)
+            try:
+                os.chmod(tmp_path, 0o600)
+            except OSError:
+                pass
+            tmp_path.replace(target)
+
+        log_event(
+            "REPLICA_PROMOTED",
+            f"Replica promoted to {target}",
+            extra={"replica": str(self.replica_path), "target": str(target)},
+            source="persistence.replication.WalShipper.promote",
+            level="WARNING",
+        )
+        return target
+
+
+_active_shipper: Optional[WalShipper] = None
+_shipper_lock = threading.Lock()
+
+
+def get_wal_shipper(
+    db_path: Path,
+    standby_dir: Path,
+    interval_seconds: float = 5.0,
+) -> WalShipper:
+    """Get or create the process-wide shipper for db_path/standby_dir."""
+    global _active_shipper
+    with _shipper_lock:
+        if (
+            _active_shipper is None
+            or _active_shipper.db_path != Path(db_path)
+            or _active_shipper.standby_dir != Path(standby_dir)
+        ):
+            if _active_shipper is not None:
+                _active_shipper.stop()
+            _active_shipper = WalShipper(db_path, standby_dir, interval_seconds=interval_seconds)
+        return _active_shipper
+
+
+def get_replication_metrics() -> Optional[Dict[str, Any]]:
+    """Return metrics of the active shipper, or None if replication is off."""
+    shipper = _active_shipper
+    return shipper.get_metrics() if shipper is not None else None
+
+
+def reset_wal_shipper() -> None:
+    """Stop and forget the active shipper (for testing)."""
+    global _active_shipper
+    with _shipper_lock:
+        if _active_shipper is not None:
+            _active_shipper.stop()
+        _active_shipper = None
@@ -3,7 +3,8 @@
 Consolidates 30 SQLite robustness tickets with:
 - Defensive PRAGMA enforcement (WAL, synchronous modes)
 - Corruption detection and quarantine
-- Backup/restore with checkpointing and verification
+- Online, throttled backups via the SQLite backup API with rotation
+- Backup/restore with verification
 - Lock storm detection and recovery
 - Periodic maintenance (VACUUM, checkpoint)
 
@@ -12,6 +13,9 @@ Single source of truth for safe SQLite operations in Actifix.
 
 from __future__ import annotations
 
+import gzip
+import lzma
+import os
 import sqlite3
 import time
 import logging
@@ -19,7 +23,7 @@ import shutil
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Callable, Optional, Dict, Any, Tuple
 from datetime import datetime
 import threading
 
@@ -29,6 +33,27 @@ from actifix.agent_voice import record_agent_voice
 
 logger = logging.getLogger(__name__)
 
+# Compression codecs supported for backup output (suffix, opener)
+BACKUP_COMPRESSORS: Dict[str, Tuple[str, Callable[..., Any]]] = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+
+# Progress callback: (remaining_pages, total_pages)
+BackupProgressCallback = Callable[[int, int], None]
+
+
+def _record_voice(action: str, detail: str) -> None:
+    """Record a robustness action to agent voice (best effort)."""
+    try:
+        record_agent_voice(
+            detail,
+            agent_id="sqlite_robustness",
+            extra={"action": action},
+        )
+    except Exception:
+        pass
+
 
 class CorruptionSeverity(Enum):
     """Levels of database corruption."""
@@ -66,6 +91,11 @@ class SQLiteRobustness:
                 - checkpoint_interval_s: seconds (default 300)
                 - vacuum_interval_s: seconds (default 3600)
                 - enable_corruption_check: bool (default True)
+                - backup_pages_per_step: pages copied per backup step (default 1024)
+                - backup_step_sleep_s: pause between backup steps (default 0.01)
+                - backup_compression: None (default), 'gzip' or 'lzma'
+                - backup_keep: number of backups retained by rotation
+                  (default None, keep all)
         """
         self.db_path = Path(db_path)
         self.config = config or {}
@@ -78,12 +108,14 @@ class SQLiteRobustness:
         self.checkpoint_interval_s = self.config.get("checkpoint_interval_s", 300)
         self.vacuum_interval_s = self.config.get("vacuum_interval_s", 3600)
         self.enable_corruption_check = self.config.get("enable_corruption_check", True)
+        self.backup_pages_per_step = int(self.config.get("backup_pages_per_step", 1024))
+        self.backup_step_sleep_s = float(self.config.get("backup_step_sleep_s", 0.01))
+        self.backup_compression = self.config.get("backup_compression")
+        self.backup_keep = self.config.get("backup_keep")
 
         self.last_checkpoint = 0.0
         self.last_vacuum = 0.0
 
-        self._ensure_backup_dir()
-
     def _ensure_backup_dir(self) -> None:
         """Ensure backup directory exists."""
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -140,10 +172,9 @@ class SQLiteRobustness:
             conn.close()
 
             log_event("sqlite:pragmas_enforced", extra=pragmas)
-            record_agent_voice(
-                module_key="sqlite_robustness",
-                action="pragmas_enforced",
-                extra=f"Enforced safety PRAGMAs: {', '.join(pragmas.keys())}"
+            _record_voice(
+                "pragmas_enforced",
+                f"Enforced safety PRAGMAs: {', '.join(pragmas.keys())}",
             )
 
             return pragmas
@@ -231,6 +262,7 @@ class SQLiteRobustness:
         quarantine_path = self.backup_dir / f"corrupted_{self.db_path.name}_{timestamp}"
 
         try:
+            self._ensure_backup_dir()
             shutil.copy2(self.db_path, quarantine_path)
 
             log_event("sqlite:db_quarantined", extra={
@@ -238,10 +270,9 @@ class SQLiteRobustness:
                 "quarantine": str(quarantine_path),
             })
 
-            record_agent_voice(
-                module_key="sqlite_robustness",
-                action="db_quarantined",
-                extra=f"Corrupted database moved to: {quarantine_path}"
+            _record_voice(
+                "db_quarantined",
+                f"Corrupted database moved to: {quarantine_path}",
             )
 
             return quarantine_path
@@ -254,56 +285,96 @@ class SQLiteRobustness:
             )
             raise
 
-    def backup(self, backup_name: Optional[str] = None) -> Path:
-        """Create a safe backup of the database.
-
-        This works even on a busy database by:
-        1. Initiating a checkpoint
-        2. Copying the database file
-        3. Verifying the backup
+    def backup(
+        self,
+        backup_name: Optional[str] = None,
+        *,
+        pages_per_step: Optional[int] = None,
+        step_sleep_s: Optional[float] = None,
+        compression: Optional[str] = None,
+        progress: Optional[BackupProgressCallback] = None,
+    ) -> Path:
+        """Create an online backup of the database.
+
+        Uses the SQLite backup API so the copy is transactionally consistent
+        without quiescing writers:
+        1. Pin a read snapshot on the source (WAL readers never block writers)
+        2. Copy ``pages_per_step`` pages at a time, sleeping between steps to
+           bound the I/O impact on live ingestion
+        3. Verify the backup, then optionally stream it through gzip/lzma
+        4. Rotate old backups when ``backup_keep`` is configured
 
         Args:
             backup_name: Optional backup name (default: timestamped)
+            pages_per_step: Pages copied per step (default from config)
+            step_sleep_s: Pause between steps in seconds (default from config)
+            compression: None, 'gzip' or 'lzma' (default from config)
+            progress: Optional callback invoked as ``progress(remaining, total)``
+                after every step
 
         Returns:
             Path to the backup file
         """
-        try:
-            # Checkpoint to flush WAL
-            self._checkpoint()
-            time.sleep(0.1)  # Let checkpoint settle
+        pages = pages_per_step if pages_per_step is not None else self.backup_pages_per_step
+        sleep_s = step_sleep_s if step_sleep_s is not None else self.backup_step_sleep_s
+        codec = compression if compression is not None else self.backup_compression
+        if codec is not None and codec not in BACKUP_COMPRESSORS:
+            raise ValueError(
+                f"Unsupported backup compression: {codec} "
+                f"(expected one of {', '.join(sorted(BACKUP_COMPRESSORS))})"
+            )
 
+        try:
             if not self.db_path.exists():
                 raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+            self._ensure_backup_dir()
+
+            # Passive checkpoint keeps the WAL short without waiting on readers
+            self._checkpoint(mode="PASSIVE")
+
             # Create timestamped backup name
             if not backup_name:
                 timestamp = datetime.utcnow().isoformat().replace(':', '-')
                 backup_name = f"backup_{self.db_path.stem}_{timestamp}.db"
 
             backup_path = self.backup_dir / backup_name
+            partial_path = backup_path.with_name(backup_path.name + ".partial")
+            partial_path.unlink(missing_ok=True)
+
+            started = time.monotonic()
+            total_pages = self._copy_online(partial_path, max(1, pages), max(0.0, sleep_s), progress)
 
-            # Copy database and WAL files
-            shutil.copy2(self.db_path, backup_path)
+            # Verify backup before it replaces anything
+            self._verify_backup(partial_path)
 
-            wal_path = Path(str(self.db_path) + "-wal")
-            if wal_path.exists():
-                wal_backup = backup_path.parent / f"{backup_path.stem}-wal"
-                shutil.copy2(wal_path, wal_backup)
+            if codec:
+                suffix, opener = BACKUP_COMPRESSORS[codec]
+                backup_path = backup_path.with_name(backup_path.name + suffix)
+                self._compress_file(partial_path, backup_path, opener)
+                partial_path.unlink(missing_ok=True)
+            else:
+                partial_path.replace(backup_path)
 
-            # Verify backup
-            self._verify_backup(backup_path)
+            try:
+                # Backups carry the same data as the live DB; keep them private
+                os.chmod(backup_path, 0o600)
+            except OSError:
+                pass
 
+            duration_ms = (time.monotonic() - started) * 1000
             log_event("sqlite:backup_created", extra={
                 "backup": str(backup_path),
                 "size_bytes": backup_path.stat().st_size,
+                "pages": total_pages,
+                "compression": codec,
+                "duration_ms": round(duration_ms, 2),
             })
 
-            record_agent_voice(
-                module_key="sqlite_robustness",
-                action="backup_created",
-                extra=f"Database backed up to: {backup_path}"
-            )
+            _record_voice("backup_created", f"Database backed up to: {backup_path}")
+
+            if self.backup_keep:
+                self.rotate_backups(int(self.backup_keep))
 
             return backup_path
 
@@ -315,6 +386,94 @@ class SQLiteRobustness:
             )
             raise
 
+    def _copy_online(
+        self,
+        dest_path: Path,
+        pages_per_step: int,
+        step_sleep_s: float,
+        progress: Optional[BackupProgressCallback],
+    ) -> int:
+        """Copy the database into dest_path with the SQLite backup API.
+
+        Returns:
+            Total number of pages copied
+        """
+        source = self._connect()
+        dest = sqlite3.connect(str(dest_path))
+        totals = {"pages": 0}
+
+        def _on_step(status: int, remaining: int, total: int) -> None:
+            totals["pages"] = total
+            if progress is not None:
+                progress(remaining, total)
+            if remaining and step_sleep_s:
+                time.sleep(step_sleep_s)
+
+        try:
+            # Holding a read transaction pins one WAL snapshot for the whole copy,
+            # so concurrent commits neither restart the backup nor block on it.
+            mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+            pinned = str(mode).lower() == "wal"
+            if pinned:
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            try:
+                source.backup(dest, pages=pages_per_step, progress=_on_step)
+            finally:
+                if pinned:
+                    source.execute("COMMIT")
+        finally:
+            dest.close()
+            source.close()
+
+        return totals["pages"]
+
+    @staticmethod
+    def _compress_file(src_path: Path, dest_path: Path, opener: Callable[..., Any]) -> None:
+        """Stream src_path through a compressor into dest_path."""
+        tmp_path = dest_path.with_name(dest_path.name + ".partial")
+        with open(src_path, "rb") as src, opener(tmp_path, "wb") as dest:
+            shutil.copyfileobj(src, dest, length=1024 * 1024)
+        tmp_path.replace(dest_path)
+
+    def list_backups(self) -> list:
+        """List backups for this database, newest first."""
+        if not self.backup_dir.exists():
+            return []
+        candidates = [
+            path for path in self.backup_dir.glob(f"backup_{self.db_path.stem}_*")
+            if not path.name.endswith(".partial")
+        ]
+        return sorted(candidates, key=lambda path: path.stat().st_mtime, reverse=True)
+
+    def rotate_backups(self, keep: int) -> list:
+        """Delete timestamped backups beyond the newest ``keep``.
+
+        Args:
+            keep: Number of backups to retain
+
+        Returns:
+            List of removed backup paths
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+
+        removed = []
+        for path in self.list_backups()[keep:]:
+            try:
+                path.unlink()
+                removed.append(path)
+            except OSError as e:
+                logger.warning(f"Failed to remove old backup {path}: {e}")
+
+        if removed:
+            log_event("sqlite:backups_rotated", extra={
+                "kept": keep,
+                "removed": [str(path) for path in removed],
+            })
+
+        return removed
+
     def restore(self, backup_path: Path, verify: bool = True) -> None:
         """Restore database from backup.
 
@@ -345,8 +504,8 @@ class SQLiteRobustness:
                 if self.db_path.exists():
                     shutil.copy2(self.db_path, safety_copy)
 
-                # Swap in backup
-                shutil.copy2(backup_path, self.db_path)
+                # Swap in backup (decompressing if needed)
+                self._materialize_backup(backup_path, self.db_path)
 
                 # Verify if requested
                 if verify:
@@ -361,10 +520,9 @@ class SQLiteRobustness:
                     "safety_copy": str(safety_copy),
                 })
 
-                record_agent_voice(
-                    module_key="sqlite_robustness",
-                    action="restore_completed",
-                    extra=f"Database restored from: {backup_path}"
+                _record_voice(
+                    "restore_completed",
+                    f"Database restored from: {backup_path}",
                 )
 
         except Exception as e:
@@ -375,16 +533,27 @@ class SQLiteRobustness:
             )
             raise
 
-    def _checkpoint(self, timeout_s: float = 10.0) -> None:
+    @staticmethod
+    def _materialize_backup(backup_path: Path, dest_path: Path) -> None:
+        """Copy a (possibly compressed) backup into dest_path."""
+        for suffix, opener in BACKUP_COMPRESSORS.values():
+            if backup_path.name.endswith(suffix):
+                with opener(backup_path, "rb") as src, open(dest_path, "wb") as dest:
+                    shutil.copyfileobj(src, dest, length=1024 * 1024)
+                return
+        shutil.copy2(backup_path, dest_path)
+
+    def _checkpoint(self, timeout_s: float = 10.0, mode: str = "RESTART") -> None:
         """Trigger database checkpoint to flush WAL.
 
         Args:
             timeout_s: Checkpoint timeout
+            mode: Checkpoint mode (PASSIVE, FULL, RESTART or TRUNCATE)
         """
         try:
             conn = self._connect(timeout_s=timeout_s)
             cursor = conn.cursor()
-            cursor.execute("PRAGMA wal_checkpoint(RESTART)")
+            cursor.execute(f"PRAGMA wal_checkpoint({mode})")
             conn.close()
             self.last_checkpoint = time.time()
         except Exception as e:
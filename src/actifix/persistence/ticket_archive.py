@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ticket Archive Tier - Cold storage for completed tickets
+
+Completed tickets older than a retention window are moved out of the hot
+``tickets`` table into ``actifix_archive.db`` (next to ``actifix.db``). The
+archive is ATTACHed to a pool connection on demand under the schema name
+``archive`` so reads can union both tiers without a second connection.
+
+Moves happen in small chunks, each in its own IMMEDIATE transaction, so
+writers are never blocked for long. Rows are copied into the archive before
+being deleted from the hot table; if a crash lands between the two commits
+the ticket exists in both tiers and union reads prefer the hot copy.
+
+The archive keeps an index over ``duplicate_guard`` so duplicate checks can
+consult archived tickets without scanning.
+"""
+
+import re
+import sqlite3
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .database import DatabasePool, DatabaseError, get_database_pool, serialize_timestamp
+from ..log_utils import log_event
+
+
+ARCHIVE_SCHEMA = "archive"
+ARCHIVE_FILENAME = "actifix_archive.db"
+DEFAULT_ARCHIVE_CHUNK_SIZE = 500
+
+ARCHIVE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS archive.idx_archive_duplicate_guard ON tickets(duplicate_guard)",
+    "CREATE INDEX IF NOT EXISTS archive.idx_archive_status_priority ON tickets(status, priority)",
+    "CREATE INDEX IF NOT EXISTS archive.idx_archive_created ON tickets(created_at)",
+)
+
+_CREATE_TABLE_PATTERN = re.compile(r"^\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?\"?tickets\"?", re.IGNORECASE)
+
+
+class TicketArchive:
+    """Cold tier for completed tickets, attached to pool connections on demand."""
+
+    def __init__(self, pool: Optional[DatabasePool] = None, archive_path: Optional[Path] = None):
+        """
+        Initialize ticket archive.
+
+        Args:
+            pool: Optional database pool (uses global pool if None).
+            archive_path: Optional archive path (defaults next to the main DB).
+        """
+        self.pool = pool or get_database_pool()
+        self.archive_path = Path(archive_path) if archive_path else (
+            self.pool.config.db_path.with_name(ARCHIVE_FILENAME)
+        )
+
+    def exists(self) -> bool:
+        """Return True if the archive database has been created."""
+        return self.archive_path.exists()
+
+    def attach(self, conn: sqlite3.Connection, create: bool = False) -> bool:
+        """
+        Attach the archive to a connection if it is not attached already.
+
+        ATTACH cannot run inside a transaction, so callers must attach before
+        BEGIN.
+
+        Args:
+            conn: Pool connection.
+            create: Create the archive database and schema if missing.
+
+        Returns:
+            True if the archive is attached, False if it does not exist.
+        """
+        if self._is_attached(conn):
+            return True
+        if not create and not self.exists():
+            return False
+        if conn.in_transaction:
+            raise DatabaseError("Cannot attach ticket archive inside a transaction")
+
+        if not self.exists():
+            self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+            self.archive_path.touch(mode=0o600, exist_ok=True)
+
+        conn.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (str(self.archive_path),))
+        self._ensure_schema(conn)
+        return True
+
+    def _is_attached(self, conn: sqlite3.Connection) -> bool:
+        rows = conn.execute("PRAGMA database_list").fetchall()
+        return any(row[1] == ARCHIVE_SCHEMA for row in rows)
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the archive table from the live schema and add new columns."""
+        row = conn.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = 'tickets'"
+        ).fetchone()
+        if row is None:
+            raise DatabaseError("Main tickets table not found; cannot create archive")
+
+        create_sql = _CREATE_TABLE_PATTERN.sub(
+            f"CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.tickets", row[0], count=1
+        )
+        conn.execute(f"PRAGMA {ARCHIVE_SCHEMA}.journal_mode = WAL")
+        conn.execute(create_sql)
+
+        # Columns added to the hot table by later migrations
+        archive_cols = {r[1] for r in conn.execute(f"PRAGMA {ARCHIVE_SCHEMA}.table_info(tickets)")}
+        for col in conn.execute("PRAGMA main.table_info(tickets)").fetchall():
+            name, col_type, default = col[1], col[2], col[4]
+            if name in archive_cols:
+                continue
+            default_sql = f" DEFAULT {default}" if default is not None else ""
+            conn.execute(
+                f"ALTER TABLE {ARCHIVE_SCHEMA}.tickets ADD COLUMN {name} {col_type}{default_sql}"
+            )
+        if "archived_at" not in archive_cols:
+            conn.execute(f"ALTER TABLE {ARCHIVE_SCHEMA}.tickets ADD COLUMN archived_at TIMESTAMP")
+
+        for statement in ARCHIVE_INDEXES:
+            conn.execute(statement)
+        conn.commit()
+
+    @staticmethod
+    def _hot_columns(conn: sqlite3.Connection) -> List[str]:
+        return [row[1] for row in conn.execute("PRAGMA main.table_info(tickets)").fetchall()]
+
+    def union_source(self, conn: sqlite3.Connection) -> str:
+        """
+        Return a FROM-clause source that unions hot and archived tickets.
+
+        The archive must already be attached to conn. Hot rows win if a ticket
+        is present in both tiers.
+        """
+        cols = ", ".join(self._hot_columns(conn))
+        return (
+            f"(SELECT {cols} FROM main.tickets "
+            f"UNION ALL "
+            f"SELECT {cols} FROM {ARCHIVE_SCHEMA}.tickets "
+            f"WHERE id NOT IN (SELECT id FROM main.tickets)) AS tickets"
+        )
+
+    def get_ticket_row(self, conn: sqlite3.Connection, ticket_id: str) -> Optional[sqlite3.Row]:
+        """Fetch an archived ticket row by ID."""
+        if not self.attach(conn):
+            return None
+        return conn.execute(
+            f"SELECT * FROM {ARCHIVE_SCHEMA}.tickets WHERE id = ?", (ticket_id,)
+        ).fetchone()
+
+    def find_duplicate_guard(self, conn: sqlite3.Connection, duplicate_guard: str) -> Optional[sqlite3.Row]:
+        """Look up an archived ticket by duplicate guard (indexed)."""
+        if not self.attach(conn):
+            return None
+        return conn.execute(
+            f"SELECT * FROM {ARCHIVE_SCHEMA}.tickets WHERE duplicate_guard = ? LIMIT 1",
+            (duplicate_guard,),
+        ).fetchone()
+
+    def archive_completed(
+        self,
+        min_age_days: int,
+        chunk_size: int = DEFAULT_ARCHIVE_CHUNK_SIZE,
+        max_tickets: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Move completed tickets older than min_age_days into the archive.
+
+        Args:
+            min_age_days: Minimum ticket age (by created_at) to archive.
+            chunk_size: Tickets moved per transaction.
+            max_tickets: Optional cap on tickets moved in this call.
+
+        Returns:
+            Dict with moved count, chunk count and cutoff timestamp.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=min_age_days)
+        cutoff_str = serialize_timestamp(cutoff)
+        moved = 0
+        chunks = 0
+
+        with self.pool.connection() as conn:
+            self.attach(conn, create=True)
+            cols = ", ".join(self._hot_columns(conn))
+
+        while max_tickets is None or moved < max_tickets:
+            limit = chunk_size if max_tickets is None else min(chunk_size, max_tickets - moved)
+            archived_at = serialize_timestamp(datetime.now(timezone.utc))
+            with self.pool.transaction(immediate=True) as conn:
+                rowids = [
+                    row[0]
+                    for row in conn.execute(
+                        """
+                        SELECT rowid FROM main.tickets
+                        WHERE status = 'Completed' AND deleted = 0 AND created_at < ?
+                        ORDER BY rowid
+                        LIMIT ?
+                        """,
+                        (cutoff_str, limit),
+                    ).fetchall()
+                ]
+                if not rowids:
+                    break
+                placeholders = ",".join("?" * len(rowids))
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.tickets ({cols}, archived_at) "
+                    f"SELECT {cols}, ? FROM main.tickets WHERE rowid IN ({placeholders})",
+                    [archived_at, *rowids],
+                )
+                conn.execute(f"DELETE FROM main.tickets WHERE rowid IN ({placeholders})", rowids)
+            moved += len(rowids)
+            chunks += 1
+
+        if moved:
+            log_event(
+                "TICKETS_ARCHIVED",
+                f"Moved {moved} completed tickets to archive tier",
+                extra={
+                    "moved": moved,
+                    "chunks": chunks,
+                    "cutoff": cutoff_str,
+                    "archive_path": str(self.archive_path),
+                },
+                source="persistence.ticket_archive.TicketArchive.archive_completed",
+            )
+
+        return {"moved": moved, "chunks": chunks, "cutoff": cutoff_str}
+
+    def count(self) -> int:
+        """Return the number of archived tickets."""
+        if not self.exists():
+            return 0
+        with self.pool.connection() as conn:
+            self.attach(conn)
+            row = conn.execute(f"SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.tickets").fetchone()
+            return row[0]
@@ -5,12 +5,19 @@
 Ticket Cleanup and Retention Policies
 
 Provides automatic cleanup of old completed tickets and test/automation tickets.
+
+Retention and duplicate policies are evaluated inside SQLite (CASE buckets
+and window functions over the tickets table) and applied with the bulk
+repository APIs, so large cleanups run as a handful of chunked statements
+instead of one transaction and audit write per ticket.
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import logging
 
+from .database import epoch_ms_sql, timestamp_to_epoch_ms
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,7 +100,7 @@ def get_ticket_age_days(ticket: Dict[str, Any]) -> float:
     Returns:
         Age in days.
     """
-    created = ticket.get('created')
+    created = ticket.get('created') or ticket.get('created_at')
     if not created:
         return 0
 
@@ -115,6 +122,65 @@ def get_ticket_age_days(ticket: Dict[str, Any]) -> float:
     return age.total_seconds() / 86400  # Convert to days
 
 
+def _shard_repositories(repo) -> List[Any]:
+    """Return the per-database repositories behind repo (shards, or repo itself)."""
+    if hasattr(repo, 'shard_keys'):
+        return [repo.shard(key) for key in repo.shard_keys()]
+    return [repo]
+
+
+def _created_ms_sql() -> str:
+    """Ticket creation time in epoch ms (text column fallback until backfilled)."""
+    return f"COALESCE(created_at_ms, {epoch_ms_sql('created_at')})"
+
+
+def _test_ticket_sql() -> Tuple[str, List[Any]]:
+    """SQL predicate equivalent to is_test_ticket()."""
+    clauses = ["instr(source, ?) > 0" for _ in TEST_SOURCES]
+    params: List[Any] = sorted(TEST_SOURCES)
+    clauses.append(f"error_type IN ({', '.join('?' * len(TEST_ERROR_TYPES))})")
+    params.extend(sorted(TEST_ERROR_TYPES))
+    clauses.extend([
+        "instr(source, 'test.') > 0",
+        "instr(source, 'test/') > 0",
+        "instr(lower(source), 'pytest') > 0",
+    ])
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def _retention_bucket_sql(
+    retention_days: int,
+    test_ticket_retention_days: int,
+    use_priority_policies: bool,
+) -> Tuple[str, List[Any]]:
+    """
+    CASE expression naming the retention rule that expires a ticket.
+
+    Evaluates to 'test', 'priority' or 'completed' for expired tickets and
+    NULL for tickets that are kept, mirroring the rule order of
+    apply_retention_policy.
+    """
+    now_ms = timestamp_to_epoch_ms(datetime.now(timezone.utc))
+    created_ms = _created_ms_sql()
+    is_test, test_params = _test_ticket_sql()
+
+    def cutoff(days: float) -> int:
+        return now_ms - int(days * 86400000)
+
+    cases = [f"WHEN {is_test} AND {created_ms} < ? THEN 'test'"]
+    params: List[Any] = test_params + [cutoff(test_ticket_retention_days)]
+
+    if use_priority_policies:
+        for priority, days in PRIORITY_RETENTION_DAYS.items():
+            cases.append(f"WHEN priority = ? THEN CASE WHEN {created_ms} < ? THEN 'priority' END")
+            params.extend([priority, cutoff(days)])
+
+    cases.append(f"WHEN NOT {is_test} AND {created_ms} < ? THEN 'completed'")
+    params.extend(test_params + [cutoff(retention_days)])
+
+    return "CASE " + " ".join(cases) + " END", params
+
+
 def apply_retention_policy(
     repo,
     retention_days: int = DEFAULT_RETENTION_DAYS,
@@ -130,6 +196,9 @@ def apply_retention_policy(
     - Regular completed tickets older than retention_days
     - Test/automation tickets older than test_ticket_retention_days
 
+    Expired tickets are counted with one GROUP BY query and soft-deleted
+    with chunked set-based deletes (repo.delete_tickets_where).
+
     Args:
         repo: TicketRepository instance.
         retention_days: Days to keep regular completed tickets (fallback).
@@ -140,8 +209,6 @@ def apply_retention_policy(
     Returns:
         Dict with counts of tickets that would be/were deleted.
     """
-    from .ticket_repo import TicketFilter
-
     stats = {
         'completed_expired': 0,
         'test_tickets_expired': 0,
@@ -149,44 +216,49 @@ def apply_retention_policy(
         'by_priority': {},
     }
 
-    # Get all completed tickets
-    completed_tickets = repo.get_tickets(TicketFilter(status='Completed'))
-
-    tickets_to_delete = []
-
-    for ticket in completed_tickets:
-        age_days = get_ticket_age_days(ticket)
-        is_test = is_test_ticket(ticket)
-        priority = ticket.get('priority', 'P2')
-
-        should_delete = False
-
-        if is_test and age_days > test_ticket_retention_days:
-            stats['test_tickets_expired'] += 1
-            should_delete = True
-        elif use_priority_policies and priority in PRIORITY_RETENTION_DAYS:
-            # Use priority-based retention
-            priority_retention = PRIORITY_RETENTION_DAYS[priority]
-            if age_days > priority_retention:
-                stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
-                should_delete = True
-        elif not is_test and age_days > retention_days:
-            stats['completed_expired'] += 1
-            should_delete = True
-
-        if should_delete:
-            ticket_id = ticket.get('id') or ticket.get('ticket_id')
-            if ticket_id:
-                tickets_to_delete.append(ticket_id)
-
-    stats['total_deleted'] = len(tickets_to_delete)
+    bucket_sql, bucket_params = _retention_bucket_sql(
+        retention_days, test_ticket_retention_days, use_priority_policies
+    )
+    scope = "status = 'Completed'"
+
+    for shard_repo in _shard_repositories(repo):
+        with shard_repo.pool.connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT bucket, priority, COUNT(*) FROM (
+                    SELECT {bucket_sql} AS bucket, priority
+                    FROM tickets
+                    WHERE deleted = 0 AND {scope}
+                )
+                WHERE bucket IS NOT NULL
+                GROUP BY bucket, priority
+                """,
+                bucket_params,
+            ).fetchall()
+
+        expired = 0
+        for bucket, priority, count in rows:
+            expired += count
+            if bucket == 'test':
+                stats['test_tickets_expired'] += count
+            elif bucket == 'priority':
+                stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + count
+            else:
+                stats['completed_expired'] += count
+
+        if dry_run or not expired:
+            stats['total_deleted'] += expired
+            continue
 
-    if not dry_run and tickets_to_delete:
-        for ticket_id in tickets_to_delete:
-            try:
-                repo.delete_ticket(ticket_id, soft_delete=True)
-            except Exception as e:
-                logger.warning(f"Failed to delete ticket {ticket_id}: {e}")
+        try:
+            deleted = shard_repo.delete_tickets_where(
+                f"{scope} AND ({bucket_sql}) IS NOT NULL",
+                bucket_params,
+                soft_delete=True,
+            )
+            stats['total_deleted'] += len(deleted)
+        except Exception as e:
+            logger.warning(f"Failed to apply retention policy: {e}")
 
     return stats
 
@@ -270,6 +342,11 @@ def cleanup_duplicate_tickets(
     The newest ticket in each duplicate group is kept open. Older tickets
     are auto-completed if they exceed min_age_hours.
 
+    Groups are ranked in SQL with ROW_NUMBER() over the duplicate key and
+    the stale duplicates are closed with repo.mark_complete_many. Each
+    closed ticket's notes name its group's kept ticket, built per row in
+    SQL.
+
     Args:
         repo: TicketRepository instance.
         min_age_hours: Minimum age in hours before auto-completing duplicates.
@@ -278,8 +355,6 @@ def cleanup_duplicate_tickets(
     Returns:
         Dict with counts of duplicates found/cleaned/skipped.
     """
-    from .ticket_repo import TicketFilter
-
     stats = {
         'duplicate_groups': 0,
         'duplicates_found': 0,
@@ -288,63 +363,100 @@ def cleanup_duplicate_tickets(
         'duplicates_skipped_recent': 0,
     }
 
-    open_tickets = repo.get_tickets(TicketFilter(status='Open'))
-    groups: Dict[tuple, list] = {}
-
-    for ticket in open_tickets:
-        key = (
-            ticket.get('message') or '',
-            ticket.get('source') or '',
-            ticket.get('error_type') or '',
+    cutoff_ms = timestamp_to_epoch_ms(
+        datetime.now(timezone.utc) - timedelta(hours=min_age_hours)
+    )
+    ranked_sql = f"""
+        WITH open_tickets AS (
+            SELECT
+                rowid AS rid, id, locked_by,
+                {_created_ms_sql()} AS created_ms,
+                COALESCE(message, '') AS msg,
+                COALESCE(source, '') AS src,
+                COALESCE(error_type, '') AS err
+            FROM tickets
+            WHERE status = 'Open' AND deleted = 0
+        ),
+        ranked AS (
+            SELECT
+                id,
+                ROW_NUMBER() OVER (
+                    PARTITION BY msg, src, err ORDER BY created_ms DESC, rid DESC
+                ) AS rn,
+                COUNT(*) OVER (PARTITION BY msg, src, err) AS group_size,
+                FIRST_VALUE(id) OVER (
+                    PARTITION BY msg, src, err ORDER BY created_ms DESC, rid DESC
+                ) AS keeper_id,
+                locked_by,
+                created_ms
+            FROM open_tickets
+        ),
+        actions AS (
+            SELECT
+                id,
+                keeper_id,
+                CASE
+                    WHEN rn = 1 THEN 'keep'
+                    WHEN locked_by IS NOT NULL THEN 'locked'
+                    WHEN created_ms IS NULL OR created_ms > ? THEN 'recent'
+                    ELSE 'close'
+                END AS action
+            FROM ranked
+            WHERE group_size > 1
         )
-        groups.setdefault(key, []).append(ticket)
+    """
+    counters = {
+        'keep': 'duplicate_groups',
+        'locked': 'duplicates_skipped_locked',
+        'recent': 'duplicates_skipped_recent',
+        'close': 'duplicates_closed',
+    }
 
-    now = datetime.now(timezone.utc)
+    for shard_repo in _shard_repositories(repo):
+        with shard_repo.pool.connection() as conn:
+            counts = dict(conn.execute(
+                ranked_sql + "SELECT action, COUNT(*) FROM actions GROUP BY action",
+                (cutoff_ms,),
+            ).fetchall())
+            stale = {}
+            if not dry_run and counts.get('close'):
+                stale = dict(conn.execute(
+                    ranked_sql
+                    + "SELECT id, char(10) || char(10) || 'Duplicate of ' || keeper_id "
+                    "FROM actions WHERE action = 'close'",
+                    (cutoff_ms,),
+                ).fetchall())
+
+        for action, key in counters.items():
+            if action != 'close':
+                stats[key] += counts.get(action, 0)
+        stats['duplicates_found'] += sum(
+            count for action, count in counts.items() if action != 'keep'
+        )
 
-    for tickets in groups.values():
-        if len(tickets) <= 1:
+        if dry_run:
+            stats['duplicates_closed'] += counts.get('close', 0)
             continue
-        stats['duplicate_groups'] += 1
-        tickets_sorted = sorted(
-            tickets,
-            key=lambda t: t.get('created_at') or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
-        )
-        newest = tickets_sorted[0]
-        older = tickets_sorted[1:]
-        stats['duplicates_found'] += len(older)
-
-        for ticket in older:
-            if ticket.get('locked_by'):
-                stats['duplicates_skipped_locked'] += 1
-                continue
-            created_at = ticket.get('created_at')
-            if not isinstance(created_at, datetime):
-                stats['duplicates_skipped_recent'] += 1
-                continue
-            age_hours = (now - created_at).total_seconds() / 3600.0
-            if age_hours < min_age_hours:
-                stats['duplicates_skipped_recent'] += 1
-                continue
-            if dry_run:
-                stats['duplicates_closed'] += 1
-                continue
-            try:
-                repo.mark_complete(
-                    ticket['id'],
-                    completion_notes=(
-                        "Implementation: Auto-completed stale duplicate ticket; "
-                        f"newer ticket remains open (latest id {newest.get('id')}).\n"
-                        "Files:\n"
-                        "- src/actifix/persistence/ticket_cleanup.py"
-                    ),
-                    test_steps="Automated duplicate cleanup policy execution.",
-                    test_results="Ticket auto-completed as duplicate per cleanup policy.",
-                    summary="Auto-cleanup: stale duplicate ticket",
-                )
-                stats['duplicates_closed'] += 1
-            except Exception as exc:
-                logger.warning(f"Failed to auto-complete duplicate ticket {ticket.get('id')}: {exc}")
+        if not stale:
+            continue
+
+        try:
+            closed = shard_repo.mark_complete_many(
+                list(stale),
+                completion_notes=(
+                    "Implementation: Auto-completed stale duplicate ticket; "
+                    "the newest ticket with the same message, source and error type remains open.\n"
+                    "Files:\n"
+                    "- src/actifix/persistence/ticket_cleanup.py"
+                ),
+                test_steps="Automated duplicate cleanup policy execution.",
+                test_results="Ticket auto-completed as duplicate per cleanup policy.",
+                summary="Auto-cleanup: stale duplicate ticket",
+                notes_suffix=stale,
+            )
+            stats['duplicates_closed'] += len(closed)
+        except Exception as exc:
+            logger.warning(f"Failed to auto-complete duplicate tickets: {exc}")
 
     return stats
 
@@ -97,13 +97,14 @@ when exceeded, providing clear error messages with actual vs. maximum values.
 Version: 1.0.0
 """
 
+import json
 import os
 import re
 import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 
 from ..raise_af import ActifixEntry, TicketPriority
 from ..config import ActifixConfig, get_config
@@ -115,12 +116,22 @@ from .database import (
     deserialize_json_field,
     serialize_timestamp,
     deserialize_timestamp,
+    timestamp_to_epoch_ms,
+    epoch_ms_range_sql,
+    epoch_ms_sql,
+    epoch_ms_to_timestamp,
+    is_busy_error,
     log_database_audit,
+    read_write_generation,
 )
+from .ticket_archive import TicketArchive
 
 
 _SECTION_HEADER_PATTERN = re.compile(r"^[A-Za-z0-9 _/.-]{2,60}:\s*$")
 
+# Rows per transaction (and per batched audit record) for bulk operations
+BULK_CHUNK_SIZE = 500
+
 
 def _extract_completion_section(completion_notes: str, header: str) -> str:
     header_pattern = re.compile(rf"^{re.escape(header)}\s*:\s*(.*)$", re.IGNORECASE)
@@ -264,6 +275,55 @@ def _validate_file_context_size(
         )
 
 
+def _validate_completion_evidence(completion_notes: str, test_steps: str, test_results: str) -> None:
+    """Validate completion evidence for mark_complete / mark_complete_many.
+
+    Raises:
+        ValueError: If completion evidence fields are missing or too short.
+    """
+    # QUALITY GATE VALIDATION
+    # These validations are the core quality gate mechanism.
+    # They ensure NO ticket can be marked complete without evidence.
+    if not completion_notes or len(completion_notes.strip()) < 20:
+        raise ValueError(
+            "completion_notes required: must describe what was done (min 20 chars)"
+        )
+
+    if not test_steps or len(test_steps.strip()) < 10:
+        raise ValueError(
+            "test_steps required: must describe how testing was performed (min 10 chars)"
+        )
+
+    if not test_results or len(test_results.strip()) < 10:
+        raise ValueError(
+            "test_results required: must provide test outcomes/evidence (min 10 chars)"
+        )
+
+    implementation_details = _extract_completion_section(completion_notes, "Implementation")
+    if not implementation_details:
+        raise ValueError(
+            "completion_notes required: include Implementation section describing code changes"
+        )
+
+    completion_files = _extract_completion_files(completion_notes)
+    if not completion_files:
+        raise ValueError(
+            "completion_notes required: include Files section with modified paths"
+        )
+
+    for entry in completion_files:
+        normalized = _normalize_completion_file_entry(entry)
+        lowered = normalized.lower()
+        if lowered in {"tbd", "todo", "n/a", "na", "none"}:
+            raise ValueError(
+                "completion_notes required: Files section must list real paths"
+            )
+        if not _looks_like_path(normalized):
+            raise ValueError(
+                "completion_notes required: Files section must list valid file paths"
+            )
+
+
 @dataclass
 class TicketFilter:
     """Filter criteria for querying tickets."""
@@ -277,6 +337,7 @@ class TicketFilter:
     correlation_id: Optional[str] = None
     limit: Optional[int] = None
     offset: int = 0
+    include_archived: bool = False  # Union with the cold archive tier
 
 
 @dataclass
@@ -311,6 +372,7 @@ class TicketRepository:
         """
         self.pool = pool or get_database_pool()
         self.config = config or get_config()
+        self.archive = TicketArchive(self.pool)
     
     def create_ticket(self, entry: ActifixEntry) -> bool:
         """
@@ -342,6 +404,12 @@ class TicketRepository:
                 "file_context"
             )
 
+        # Archived tickets keep their duplicate guard
+        if entry.duplicate_guard and self.archive.exists():
+            with self.pool.connection() as conn:
+                if self.archive.find_duplicate_guard(conn, entry.duplicate_guard) is not None:
+                    return False
+
         success = False
 
         try:
@@ -364,8 +432,8 @@ class TicketRepository:
                         id, priority, error_type, message, source, run_label,
                         created_at, duplicate_guard, status, stack_trace,
                         file_context, system_state, ai_remediation_notes,
-                        correlation_id, format_version
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        correlation_id, format_version, created_at_ms
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
                         entry.entry_id,
@@ -383,6 +451,7 @@ class TicketRepository:
                         entry.ai_remediation_notes,
                         entry.correlation_id,
                         entry.format_version,
+                        timestamp_to_epoch_ms(entry.created_at),
                     )
                 )
             success = True
@@ -411,12 +480,13 @@ class TicketRepository:
 
         return success
     
-    def get_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+    def get_ticket(self, ticket_id: str, include_archived: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get ticket by ID.
         
         Args:
             ticket_id: Ticket ID to fetch.
+            include_archived: Also look in the archive tier.
         
         Returns:
             Ticket data as dict, or None if not found.
@@ -427,6 +497,9 @@ class TicketRepository:
                 (ticket_id,)
             )
             row = cursor.fetchone()
+
+            if row is None and include_archived:
+                row = self.archive.get_ticket_row(conn, ticket_id)
             
             if row is None:
                 return None
@@ -469,12 +542,12 @@ class TicketRepository:
                 conditions.append("locked_by IS NULL")
 
         if filter.created_after:
-            conditions.append("created_at >= ?")
-            params.append(serialize_timestamp(filter.created_after))
+            conditions.append(epoch_ms_range_sql("created_at", ">="))
+            params.extend([timestamp_to_epoch_ms(filter.created_after)] * 2)
 
         if filter.created_before:
-            conditions.append("created_at <= ?")
-            params.append(serialize_timestamp(filter.created_before))
+            conditions.append(epoch_ms_range_sql("created_at", "<="))
+            params.extend([timestamp_to_epoch_ms(filter.created_before)] * 2)
 
         if filter.correlation_id:
             conditions.append("correlation_id = ?")
@@ -482,8 +555,21 @@ class TicketRepository:
 
         where_clause = " AND ".join(conditions)
 
+        with self.pool.connection() as conn:
+            source = "tickets"
+            if filter.include_archived and self.archive.attach(conn):
+                source = self.archive.union_source(conn)
+
+            query = self._build_tickets_query(source, where_clause, filter)
+            cursor = conn.execute(query, params)
+            rows = cursor.fetchall()
+
+            return [self._row_to_dict(row) for row in rows]
+
+    @staticmethod
+    def _build_tickets_query(source: str, where_clause: str, filter: TicketFilter) -> str:
         query = f"""
-            SELECT * FROM tickets
+            SELECT * FROM {source}
             WHERE {where_clause}
             ORDER BY
                 CASE priority
@@ -500,11 +586,7 @@ class TicketRepository:
         if filter.limit:
             query += f" LIMIT {filter.limit} OFFSET {filter.offset}"
 
-        with self.pool.connection() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-
-            return [self._row_to_dict(row) for row in rows]
+        return query
     
     def get_open_tickets(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all open tickets, sorted by priority."""
@@ -516,12 +598,17 @@ class TicketRepository:
         filter = TicketFilter(status="Completed", limit=limit)
         return self.get_tickets(filter)
     
-    def check_duplicate_guard(self, duplicate_guard: str) -> Optional[Dict[str, Any]]:
+    def check_duplicate_guard(
+        self,
+        duplicate_guard: str,
+        include_archived: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """
         Check if a ticket with the same duplicate guard exists.
         
         Args:
             duplicate_guard: Duplicate guard to check.
+            include_archived: Also consult archived guards.
         
         Returns:
             Ticket data if exists, None otherwise.
@@ -532,6 +619,9 @@ class TicketRepository:
                 (duplicate_guard,)
             )
             row = cursor.fetchone()
+
+            if row is None and include_archived:
+                row = self.archive.find_duplicate_guard(conn, duplicate_guard)
             
             if row is None:
                 return None
@@ -677,47 +767,7 @@ class TicketRepository:
         if existing.get('status') == 'Completed' or existing.get('completed'):
             return False
 
-        # QUALITY GATE VALIDATION
-        # These validations are the core quality gate mechanism.
-        # They ensure NO ticket can be marked complete without evidence.
-        if not completion_notes or len(completion_notes.strip()) < 20:
-            raise ValueError(
-                "completion_notes required: must describe what was done (min 20 chars)"
-            )
-
-        if not test_steps or len(test_steps.strip()) < 10:
-            raise ValueError(
-                "test_steps required: must describe how testing was performed (min 10 chars)"
-            )
-
-        if not test_results or len(test_results.strip()) < 10:
-            raise ValueError(
-                "test_results required: must provide test outcomes/evidence (min 10 chars)"
-            )
-
-        implementation_details = _extract_completion_section(completion_notes, "Implementation")
-        if not implementation_details:
-            raise ValueError(
-                "completion_notes required: include Implementation section describing code changes"
-            )
-
-        completion_files = _extract_completion_files(completion_notes)
-        if not completion_files:
-            raise ValueError(
-                "completion_notes required: include Files section with modified paths"
-            )
-
-        for entry in completion_files:
-            normalized = _normalize_completion_file_entry(entry)
-            lowered = normalized.lower()
-            if lowered in {"tbd", "todo", "n/a", "na", "none"}:
-                raise ValueError(
-                    "completion_notes required: Files section must list real paths"
-                )
-            if not _looks_like_path(normalized):
-                raise ValueError(
-                    "completion_notes required: Files section must list valid file paths"
-                )
+        _validate_completion_evidence(completion_notes, test_steps, test_results)
 
         # Build updates with validated fields
         updates = {
@@ -739,7 +789,119 @@ class TicketRepository:
             updates['completion_summary'] = summary
 
         return self.update_ticket(ticket_id, updates)
-    
+
+    def mark_complete_many(
+        self,
+        ticket_ids: List[str],
+        completion_notes: str,
+        test_steps: str,
+        test_results: str,
+        summary: Optional[str] = None,
+        test_documentation_url: Optional[str] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        notes_suffix: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Mark many tickets completed with the same quality documentation.
+
+        Set-based counterpart of mark_complete for cleanup policies: the
+        evidence is validated once, each chunk of IDs is completed with a
+        single UPDATE in its own IMMEDIATE transaction, and each chunk gets
+        one batched audit record listing the completed IDs. Tickets that are
+        missing, soft-deleted or already completed are skipped (idempotent).
+        Per-ticket text in notes_suffix is appended to each row's notes by
+        the same UPDATE.
+
+        Args:
+            ticket_ids: Ticket IDs to complete.
+            completion_notes: Required description of what was done.
+            test_steps: Required description of testing performed.
+            test_results: Required test outcomes/evidence.
+            summary: Optional short summary.
+            test_documentation_url: Optional link to test artifacts.
+            chunk_size: IDs per transaction / audit record.
+            notes_suffix: Optional ticket ID -> text appended to completion_notes.
+
+        Returns:
+            IDs of the tickets that were completed.
+
+        Raises:
+            ValueError: If completion evidence fields are missing or too short.
+        """
+        _validate_completion_evidence(completion_notes, test_steps, test_results)
+
+        updates = {
+            'status': 'Completed',
+            'completion_notes': completion_notes.strip(),
+            'test_steps': test_steps.strip(),
+            'test_results': test_results.strip(),
+            'test_documentation_url': test_documentation_url,
+            'documented': 1,
+            'functioning': 1,
+            'tested': 1,
+            'completed': 1,
+            'locked_by': None,
+            'locked_at': None,
+            'lease_expires': None,
+        }
+        if summary:
+            updates['completion_summary'] = summary
+
+        ids = list(dict.fromkeys(ticket_ids))
+        chunk_size = max(1, chunk_size)
+        completed: List[str] = []
+
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            placeholders = ", ".join("?" * len(chunk))
+            eligible = (
+                f"id IN ({placeholders}) AND deleted = 0 "
+                "AND status != 'Completed' AND completed = 0"
+            )
+            chunk_updates = dict(updates, updated_at=serialize_timestamp(datetime.now(timezone.utc)))
+            assignments: List[str] = []
+            values: List[Any] = []
+            for key, value in chunk_updates.items():
+                if key == 'completion_notes' and notes_suffix:
+                    # Each row looks its own suffix up in this chunk's JSON object
+                    assignments.append(
+                        "completion_notes = ? || COALESCE("
+                        "(SELECT value FROM json_each(?) WHERE key = tickets.id), '')"
+                    )
+                    values.extend([value, json.dumps({
+                        ticket_id: notes_suffix[ticket_id]
+                        for ticket_id in chunk if ticket_id in notes_suffix
+                    })])
+                else:
+                    assignments.append(f"{key} = ?")
+                    values.append(value)
+            set_clause = ", ".join(assignments)
+
+            with self.pool.transaction(immediate=True) as conn:
+                done = [
+                    row[0]
+                    for row in conn.execute(f"SELECT id FROM tickets WHERE {eligible}", chunk)
+                ]
+                if done:
+                    conn.execute(
+                        f"UPDATE tickets SET {set_clause} WHERE {eligible}",
+                        values + chunk,
+                    )
+
+            if done:
+                completed.extend(done)
+                log_database_audit(
+                    pool=self.pool,
+                    table_name="tickets",
+                    operation="UPDATE",
+                    record_id=None,
+                    user_context=_get_user_context(),
+                    new_values={'ticket_ids': done, **chunk_updates},
+                    change_description=f"Bulk completed {len(done)} tickets",
+                )
+
+        return completed
+
     def acquire_lock(
         self,
         ticket_id: str,
@@ -766,20 +928,24 @@ class TicketRepository:
                 # The WHERE clause ensures we only lock if ticket is available or lease expired
                 # This is atomic - no window for another transaction to interfere
                 cursor = conn.execute(
-                    """
+                    f"""
                     UPDATE tickets
-                    SET locked_by = ?, locked_at = ?, lease_expires = ?, status = 'In Progress'
+                    SET locked_by = ?, locked_at = ?, lease_expires = ?, status = 'In Progress',
+                        locked_at_ms = ?, lease_expires_ms = ?
                     WHERE id = ? AND (
                         locked_by IS NULL
-                        OR lease_expires < ?
+                        OR {epoch_ms_range_sql("lease_expires", "<")}
                     )
                     """,
                     (
                         locked_by,
                         serialize_timestamp(now),
                         serialize_timestamp(lease_expires),
+                        timestamp_to_epoch_ms(now),
+                        timestamp_to_epoch_ms(lease_expires),
                         ticket_id,
-                        serialize_timestamp(now)
+                        timestamp_to_epoch_ms(now),
+                        timestamp_to_epoch_ms(now),
                     )
                 )
 
@@ -794,7 +960,7 @@ class TicketRepository:
                     lease_expires=lease_expires,
                 )
         except sqlite3.OperationalError as exc:
-            if "locked" in str(exc).lower():
+            if is_busy_error(exc):
                 return None
             raise
     
@@ -813,7 +979,8 @@ class TicketRepository:
             cursor = conn.execute(
                 """
                 UPDATE tickets 
-                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open'
+                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open',
+                    locked_at_ms = NULL, lease_expires_ms = NULL
                 WHERE id = ? AND locked_by = ?
                 """,
                 (ticket_id, locked_by)
@@ -844,10 +1011,10 @@ class TicketRepository:
             cursor = conn.execute(
                 """
                 UPDATE tickets 
-                SET lease_expires = ?
+                SET lease_expires = ?, lease_expires_ms = ?
                 WHERE id = ? AND locked_by = ?
                 """,
-                (serialize_timestamp(new_expiry), ticket_id, locked_by)
+                (serialize_timestamp(new_expiry), timestamp_to_epoch_ms(new_expiry), ticket_id, locked_by)
             )
             
             if cursor.rowcount == 0:
@@ -865,12 +1032,13 @@ class TicketRepository:
         now = datetime.now(timezone.utc)
         
         with self.pool.connection() as conn:
+            now_ms = timestamp_to_epoch_ms(now)
             cursor = conn.execute(
-                """
+                f"""
                 SELECT * FROM tickets 
-                WHERE locked_by IS NOT NULL AND lease_expires < ?
+                WHERE locked_by IS NOT NULL AND {epoch_ms_range_sql("lease_expires", "<")}
                 """,
-                (serialize_timestamp(now),)
+                (now_ms, now_ms)
             )
             rows = cursor.fetchall()
             
@@ -887,12 +1055,13 @@ class TicketRepository:
         
         with self.pool.transaction() as conn:
             cursor = conn.execute(
-                """
+                f"""
                 UPDATE tickets 
-                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open'
-                WHERE locked_by IS NOT NULL AND lease_expires < ?
+                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open',
+                    locked_at_ms = NULL, lease_expires_ms = NULL
+                WHERE locked_by IS NOT NULL AND {epoch_ms_range_sql("lease_expires", "<")}
                 """,
-                (serialize_timestamp(now),)
+                (timestamp_to_epoch_ms(now), timestamp_to_epoch_ms(now))
             )
             return cursor.rowcount
     
@@ -926,15 +1095,17 @@ class TicketRepository:
         now = datetime.now(timezone.utc)
         lease_expires = now + lease_duration
 
-        with self.pool.transaction(immediate=True) as conn:
+        # Pure database work, so the whole claim is re-run if SQLite reports busy
+        def claim(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
             # First, cleanup any expired locks to make tickets available
             conn.execute(
-                """
+                f"""
                 UPDATE tickets 
-                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open'
-                WHERE locked_by IS NOT NULL AND lease_expires < ?
+                SET locked_by = NULL, locked_at = NULL, lease_expires = NULL, status = 'Open',
+                    locked_at_ms = NULL, lease_expires_ms = NULL
+                WHERE locked_by IS NOT NULL AND {epoch_ms_range_sql("lease_expires", "<")}
                 """,
-                (serialize_timestamp(now),)
+                (timestamp_to_epoch_ms(now), timestamp_to_epoch_ms(now))
             )
             
             # Build query to find next available ticket
@@ -977,13 +1148,16 @@ class TicketRepository:
             conn.execute(
                 """
                 UPDATE tickets 
-                SET locked_by = ?, locked_at = ?, lease_expires = ?, status = 'In Progress'
+                SET locked_by = ?, locked_at = ?, lease_expires = ?, status = 'In Progress',
+                    locked_at_ms = ?, lease_expires_ms = ?
                 WHERE id = ?
                 """,
                 (
                     locked_by,
                     serialize_timestamp(now),
                     serialize_timestamp(lease_expires),
+                    timestamp_to_epoch_ms(now),
+                    timestamp_to_epoch_ms(lease_expires),
                     ticket_id,
                 )
             )
@@ -993,40 +1167,218 @@ class TicketRepository:
             ticket_row = cursor.fetchone()
             
             return self._row_to_dict(ticket_row)
+
+        return self.pool.run_in_transaction(claim)
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_write_generation(self) -> int:
+        """
+        Return the ticket write generation.
+
+        The counter is bumped by triggers on every committed ticket insert,
+        update or delete (from any process), so an unchanged value means
+        ticket-derived data computed earlier is still current.
+        """
+        with self.pool.connection() as conn:
+            return read_write_generation(conn, "tickets")
+
+    def get_recent_tickets(
+        self,
+        limit: int = 20,
+        statuses: Sequence[str] = ("Open", "Completed"),
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest tickets across the given statuses, newest first.
+
+        Each status is read as its own range on idx_tickets_status_created_ms
+        (deleted, status, created_at_ms) that stops after ``limit`` rows, so
+        the cost is O(limit * len(statuses)) regardless of table size. Rows
+        whose created_at_ms has not been backfilled yet are a separate
+        (normally empty) range ordered by the text column.
+        """
+        if limit <= 0 or not statuses:
+            return []
+        indexed = (
+            "SELECT * FROM (SELECT *, created_at_ms AS sort_ms FROM tickets "
+            "WHERE deleted = 0 AND status = ? AND created_at_ms IS NOT NULL "
+            "ORDER BY created_at_ms DESC LIMIT ?)"
+        )
+        pending = (
+            f"SELECT * FROM (SELECT *, {epoch_ms_sql('created_at')} AS sort_ms FROM tickets "
+            "WHERE deleted = 0 AND status = ? AND created_at_ms IS NULL "
+            "ORDER BY sort_ms DESC LIMIT ?)"
+        )
+        branches: List[str] = []
+        params: List[Any] = []
+        for status in statuses:
+            branches.extend([indexed, pending])
+            params.extend([status, limit, status, limit])
+        query = " UNION ALL ".join(branches) + " ORDER BY sort_ms DESC LIMIT ?"
+        params.append(limit)
+        with self.pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return [self._row_to_dict(row) for row in rows]
+
+    def get_created_bounds(self, status: str = "Open") -> Dict[str, Any]:
+        """
+        Oldest and newest created_at of live tickets with ``status``.
+
+        Each bound is its own scalar subquery, so SQLite answers it with a
+        single seek on idx_tickets_status_created_ms.
+
+        Returns:
+            Dict with 'oldest' and 'newest' datetimes (None when empty).
+        """
+        pending = epoch_ms_sql("created_at")
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                f"""
+                SELECT
+                    (SELECT MIN(created_at_ms) FROM tickets WHERE deleted = 0 AND status = ?) AS oldest,
+                    (SELECT MAX(created_at_ms) FROM tickets WHERE deleted = 0 AND status = ?) AS newest,
+                    (SELECT MIN({pending}) FROM tickets
+                     WHERE deleted = 0 AND status = ? AND created_at_ms IS NULL) AS pending_oldest,
+                    (SELECT MAX({pending}) FROM tickets
+                     WHERE deleted = 0 AND status = ? AND created_at_ms IS NULL) AS pending_newest
+                """,
+                (status, status, status, status),
+            ).fetchone()
+        oldest = [ms for ms in (row['oldest'], row['pending_oldest']) if ms is not None]
+        newest = [ms for ms in (row['newest'], row['pending_newest']) if ms is not None]
+        return {
+            'oldest': epoch_ms_to_timestamp(min(oldest)) if oldest else None,
+            'newest': epoch_ms_to_timestamp(max(newest)) if newest else None,
+        }
+
+    def get_creations_since(self, since_ms: Dict[str, int]) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Tickets created per priority since that priority's own cutoff.
+
+        Soft-deleted tickets are included: callers count creations, not
+        live tickets. Each priority is a range seek on
+        idx_tickets_priority_created_ms, so a short window never reads
+        the rows of a long one.
+
+        Args:
+            since_ms: Cutoff (epoch ms, inclusive) per priority
+
+        Returns:
+            Dict of priority -> list of (id, created_at_ms), oldest first.
+        """
+        creations: Dict[str, List[Tuple[str, int]]] = {}
+        with self.pool.connection() as conn:
+            for priority, cutoff_ms in since_ms.items():
+                rows = conn.execute(
+                    "SELECT id, created_at_ms FROM tickets "
+                    "WHERE priority = ? AND created_at_ms >= ? ORDER BY created_at_ms",
+                    (priority, cutoff_ms),
+                ).fetchall()
+                creations[priority] = [(row['id'], row['created_at_ms']) for row in rows]
+        return creations
+
+    def evaluate_sla(
+        self, thresholds_ms: Dict[str, int], now_ms: int
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        SLA state of open tickets, per priority, in one query.
+
+        For each priority the breach count, the oldest open ticket and the
+        oldest ticket still inside its SLA are separate correlated seeks on
+        idx_tickets_sla_created_ms, so the backlog is never scanned. (A
+        GROUP BY would visit every open row.)
+
+        Args:
+            thresholds_ms: SLA per priority, in milliseconds.
+            now_ms: Evaluation instant, epoch milliseconds.
+
+        Returns:
+            {priority: {'breached', 'oldest_id', 'oldest_ms', 'next_ms'}},
+            or None while open tickets still lack created_at_ms (epoch
+            backfill in progress); callers then evaluate in Python.
+        """
+        if not thresholds_ms:
+            return {}
+        live = "t.deleted = 0 AND t.status = 'Open' AND t.priority = sla.priority"
+        values = ", ".join(["(?, ?)"] * len(thresholds_ms))
+        params: List[Any] = []
+        for priority, threshold_ms in thresholds_ms.items():
+            params.extend([priority, now_ms - threshold_ms])
+        query = f"""
+            WITH sla(priority, cutoff_ms) AS (VALUES {values})
+            SELECT
+                sla.priority AS priority,
+                (SELECT COUNT(*) FROM tickets t
+                 WHERE {live} AND t.created_at_ms <= sla.cutoff_ms) AS breached,
+                (SELECT t.id FROM tickets t
+                 WHERE {live} AND t.created_at_ms IS NOT NULL
+                 ORDER BY t.created_at_ms LIMIT 1) AS oldest_id,
+                (SELECT MIN(t.created_at_ms) FROM tickets t WHERE {live}) AS oldest_ms,
+                (SELECT MIN(t.created_at_ms) FROM tickets t
+                 WHERE {live} AND t.created_at_ms > sla.cutoff_ms) AS next_ms
+            FROM sla
+        """
+        with self.pool.connection() as conn:
+            pending = conn.execute(
+                "SELECT 1 FROM tickets WHERE deleted = 0 AND status = 'Open' "
+                "AND created_at_ms IS NULL LIMIT 1"
+            ).fetchone()
+            if pending is not None:
+                return None
+            rows = conn.execute(query, params).fetchall()
+        return {
+            row['priority']: {
+                'breached': row['breached'],
+                'oldest_id': row['oldest_id'],
+                'oldest_ms': row['oldest_ms'],
+                'next_ms': row['next_ms'],
+            }
+            for row in rows
+        }
+
+    def get_stats(self, include_archived: bool = False) -> Dict[str, Any]:
         """
         Get ticket statistics.
 
+        Live counts come from the trigger-maintained ticket_counts table;
+        only the archive union falls back to counting rows.
+
+        Args:
+            include_archived: Count archived tickets as well.
+
         Returns:
             Dict with counts and breakdowns (excluding soft-deleted tickets).
         """
         with self.pool.connection() as conn:
+            tickets = "tickets"
+            if include_archived and self.archive.attach(conn):
+                tickets = self.archive.union_source(conn)
+            if tickets == "tickets":
+                return self._stats_from_counts(conn)
+
             # Total counts (excluding soft-deleted)
-            cursor = conn.execute("SELECT COUNT(*) as total FROM tickets WHERE deleted = 0")
+            cursor = conn.execute(f"SELECT COUNT(*) as total FROM {tickets} WHERE deleted = 0")
             total = cursor.fetchone()['total']
 
             # By status (excluding soft-deleted)
             cursor = conn.execute(
-                "SELECT status, COUNT(*) as count FROM tickets WHERE deleted = 0 GROUP BY status"
+                f"SELECT status, COUNT(*) as count FROM {tickets} WHERE deleted = 0 GROUP BY status"
             )
             by_status = {row['status']: row['count'] for row in cursor.fetchall()}
 
             # By priority (excluding soft-deleted)
             cursor = conn.execute(
-                "SELECT priority, COUNT(*) as count FROM tickets WHERE deleted = 0 GROUP BY priority"
+                f"SELECT priority, COUNT(*) as count FROM {tickets} WHERE deleted = 0 GROUP BY priority"
             )
             by_priority = {row['priority']: row['count'] for row in cursor.fetchall()}
 
             # Locked count (excluding soft-deleted)
             cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tickets WHERE deleted = 0 AND locked_by IS NOT NULL"
+                f"SELECT COUNT(*) as count FROM {tickets} WHERE deleted = 0 AND locked_by IS NOT NULL"
             )
             locked = cursor.fetchone()['count']
 
             # Soft-deleted count
             cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tickets WHERE deleted = 1"
+                f"SELECT COUNT(*) as count FROM {tickets} WHERE deleted = 1"
             )
             deleted = cursor.fetchone()['count']
 
@@ -1046,6 +1398,44 @@ class TicketRepository:
                 'deleted': deleted,
             }
     
+    @staticmethod
+    def _stats_from_counts(conn: sqlite3.Connection) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        by_priority: Dict[str, int] = {}
+        total = deleted = 0
+        for row in conn.execute(
+            "SELECT status, priority, deleted, count FROM ticket_counts WHERE count != 0"
+        ):
+            if row['deleted']:
+                deleted += row['count']
+                continue
+            total += row['count']
+            by_status[row['status']] = by_status.get(row['status'], 0) + row['count']
+            by_priority[row['priority']] = by_priority.get(row['priority'], 0) + row['count']
+
+        # Locked tickets are few, so walk idx_tickets_locked. The planner
+        # does not use an index for IS NOT NULL, hence the text range
+        # (locked_by is TEXT); the unary + keeps it off the deleted index.
+        locked = conn.execute(
+            "SELECT COUNT(*) as count FROM tickets WHERE locked_by >= '' AND +deleted = 0"
+        ).fetchone()['count']
+
+        return {
+            'total': total,
+            'open': by_status.get('Open', 0),
+            'in_progress': by_status.get('In Progress', 0),
+            'completed': by_status.get('Completed', 0),
+            'by_priority': {
+                'P0': by_priority.get('P0', 0),
+                'P1': by_priority.get('P1', 0),
+                'P2': by_priority.get('P2', 0),
+                'P3': by_priority.get('P3', 0),
+                'P4': by_priority.get('P4', 0),
+            },
+            'locked': locked,
+            'deleted': deleted,
+        }
+
     def delete_ticket(self, ticket_id: str, soft_delete: bool = True) -> bool:
         """
         Delete ticket with optional soft-delete for data recovery.
@@ -1091,6 +1481,80 @@ class TicketRepository:
 
         return success
 
+    def delete_tickets_where(
+        self,
+        where_clause: str,
+        params: Optional[List[Any]] = None,
+        soft_delete: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> List[str]:
+        """
+        Delete every ticket matching a SQL predicate, in rowid-range chunks.
+
+        Each chunk covers the next ``chunk_size`` matching rows by rowid
+        (keyset walk, so sparse tables do not produce empty chunks) and is
+        deleted in its own IMMEDIATE transaction with one batched audit
+        record, keeping write locks short while a large cleanup runs.
+        Soft-deleted tickets are never matched.
+
+        Args:
+            where_clause: Trusted SQL predicate over the tickets table.
+            params: Parameters for the predicate placeholders.
+            soft_delete: If True (default), soft-delete; if False, hard-delete.
+            chunk_size: Rows per transaction / audit record.
+
+        Returns:
+            IDs of the deleted tickets.
+        """
+        params = list(params or [])
+        predicate = f"deleted = 0 AND ({where_clause})"
+        chunk_size = max(1, chunk_size)
+        deleted: List[str] = []
+        last_rowid = -1
+
+        while True:
+            with self.pool.transaction(immediate=True) as conn:
+                row = conn.execute(
+                    f"""
+                    SELECT MAX(rowid) FROM (
+                        SELECT rowid FROM tickets
+                        WHERE rowid > ? AND {predicate}
+                        ORDER BY rowid LIMIT ?
+                    )
+                    """,
+                    [last_rowid] + params + [chunk_size],
+                ).fetchone()
+                if row[0] is None:
+                    break
+                chunk_where = f"rowid > ? AND rowid <= ? AND {predicate}"
+                chunk_params = [last_rowid, row[0]] + params
+                last_rowid = row[0]
+
+                ids = [r[0] for r in conn.execute(f"SELECT id FROM tickets WHERE {chunk_where}", chunk_params)]
+                if soft_delete:
+                    now = serialize_timestamp(datetime.now(timezone.utc))
+                    conn.execute(
+                        f"UPDATE tickets SET deleted = 1, deleted_at = ? WHERE {chunk_where}",
+                        [now] + chunk_params,
+                    )
+                else:
+                    conn.execute(f"DELETE FROM tickets WHERE {chunk_where}", chunk_params)
+
+            if ids:
+                deleted.extend(ids)
+                delete_type = "SOFT_DELETE" if soft_delete else "HARD_DELETE"
+                log_database_audit(
+                    pool=self.pool,
+                    table_name="tickets",
+                    operation="UPDATE" if soft_delete else "DELETE",
+                    record_id=None,
+                    user_context=_get_user_context(),
+                    new_values={'ticket_ids': ids},
+                    change_description=f"Bulk deleted {len(ids)} tickets ({delete_type})",
+                )
+
+        return deleted
+
     def recover_ticket(self, ticket_id: str) -> bool:
         """
         Recover a soft-deleted ticket.
@@ -1187,6 +1651,10 @@ def get_ticket_repository(pool: Optional[DatabasePool] = None, config: Optional[
     """
     Get or create global ticket repository.
 
+    When ticket sharding is configured (ACTIFIX_SHARD_DIR) and no pool
+    override is given, this returns a ShardedTicketRepository facade with
+    the same API.
+
     Args:
         pool: Optional database pool override.
         config: Optional configuration override.
@@ -1196,7 +1664,26 @@ def get_ticket_repository(pool: Optional[DatabasePool] = None, config: Optional[
     """
     global _global_repo
 
-    if _global_repo is None or (pool and _global_repo.pool != pool) or (config and _global_repo.config != config):
+    if pool is None:
+        effective_config = config or get_config()
+        if effective_config.ticket_shard_dir:
+            from .ticket_shards import ShardedTicketRepository
+
+            shard_dir = Path(effective_config.ticket_shard_dir)
+            if (
+                not isinstance(_global_repo, ShardedTicketRepository)
+                or _global_repo.shard_map.shard_dir != shard_dir
+                or (config and _global_repo.config != config)
+            ):
+                _global_repo = ShardedTicketRepository(shard_dir, config=effective_config)
+            return _global_repo
+
+    if (
+        _global_repo is None
+        or not isinstance(_global_repo, TicketRepository)
+        or (pool and _global_repo.pool != pool)
+        or (config and _global_repo.config != config)
+    ):
         _global_repo = TicketRepository(pool=pool, config=config)
 
     return _global_repo
@@ -1205,4 +1692,7 @@ def get_ticket_repository(pool: Optional[DatabasePool] = None, config: Optional[
 def reset_ticket_repository() -> None:
     """Reset global repository (for testing)."""
     global _global_repo
+    close = getattr(_global_repo, "close", None)
+    if close is not None:
+        close()
     _global_repo = None
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ticket Shards - Per-project ticket databases behind one repository facade
+
+With ``ACTIFIX_SHARD_DIR`` set, tickets are stored in one SQLite file per
+shard key (normally one per project) instead of the shared ``actifix.db``,
+so a noisy project's ingest only contends on its own WAL.
+
+Layout of the shard directory:
+- ``shard_map.json``: shard key -> database file name.
+- ``<shard key>.db``: a regular Actifix database (same schema and
+  migrations as the main database).
+- ``<shard key>.archive.db``: that shard's archive tier.
+
+ShardedTicketRepository exposes the TicketRepository API:
+- Writes for new tickets go to the current project's shard.
+- Ticket-ID operations are routed to the shard holding the ticket.
+- Listings and stats fan out to every shard and are merged (listings keep
+  the priority / newest-first order of a single repository).
+- Agent claims (get_and_lock_next_ticket) rotate round-robin over shards.
+"""
+
+import hashlib
+import heapq
+import json
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..config import ActifixConfig, get_config
+from ..raise_af import ActifixEntry
+from .atomic import atomic_write
+from .database import DatabasePool, open_database_pool, timestamp_to_epoch_ms
+from .ticket_archive import TicketArchive
+from .ticket_repo import TicketFilter, TicketLock, TicketRepository
+from ..log_utils import log_event
+
+
+SHARD_MAP_FILENAME = "shard_map.json"
+MAX_SHARD_KEY_LENGTH = 64
+TICKET_LOCATION_CACHE_SIZE = 10000
+
+_PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3, "P4": 4}
+_INVALID_KEY_CHARS = re.compile(r"[^a-z0-9_-]+")
+
+T = TypeVar("T")
+
+
+class ShardError(ValueError):
+    """Invalid shard key or shard map."""
+    pass
+
+
+def normalize_shard_key(key: str) -> str:
+    """Normalize a shard key to a safe file stem (lowercase, [a-z0-9_-])."""
+    normalized = _INVALID_KEY_CHARS.sub("-", (key or "").strip().lower()).strip("-")
+    if not normalized:
+        raise ShardError(f"Invalid shard key: {key!r}")
+    return normalized[:MAX_SHARD_KEY_LENGTH]
+
+
+def project_shard_key(project_root: Path) -> str:
+    """Derive a stable shard key from a project path (name plus path hash)."""
+    resolved = str(Path(project_root).resolve())
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:8]
+    name = _INVALID_KEY_CHARS.sub("-", Path(resolved).name.lower()).strip("-") or "project"
+    return normalize_shard_key(f"{name[:MAX_SHARD_KEY_LENGTH - 9]}-{digest}")
+
+
+class ShardMap:
+    """Shard key -> database file mapping persisted in the shard directory."""
+
+    def __init__(self, shard_dir: Path):
+        self.shard_dir = Path(shard_dir)
+        self.map_path = self.shard_dir / SHARD_MAP_FILENAME
+        self._lock = threading.Lock()
+        self._shards: Dict[str, str] = {}
+        self._loaded_mtime: Optional[float] = None
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime = self.map_path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        try:
+            data = json.loads(self.map_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise ShardError(f"Unreadable shard map {self.map_path}: {e}") from e
+        self._shards = {normalize_shard_key(k): str(v) for k, v in data.get("shards", {}).items()}
+        self._loaded_mtime = mtime
+
+    def keys(self) -> List[str]:
+        """Return all known shard keys (picks up shards added by other processes)."""
+        with self._lock:
+            self._reload_if_changed()
+            return sorted(self._shards)
+
+    def path_for(self, key: str, create: bool = False) -> Optional[Path]:
+        """
+        Return the database path for a shard key.
+
+        Args:
+            key: Shard key (normalized).
+            create: Register the shard in the map if it is unknown.
+
+        Returns:
+            Database path, or None if unknown and create is False.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            filename = self._shards.get(key)
+            if filename is None:
+                if not create:
+                    return None
+                filename = f"{key}.db"
+                self._shards[key] = filename
+                self.shard_dir.mkdir(parents=True, exist_ok=True)
+                atomic_write(self.map_path, json.dumps({"version": 1, "shards": self._shards}, indent=2))
+                self._loaded_mtime = self.map_path.stat().st_mtime
+                log_event(
+                    "TICKET_SHARD_CREATED",
+                    f"Registered ticket shard '{key}'",
+                    extra={"shard": key, "db_file": filename},
+                    source="persistence.ticket_shards.ShardMap.path_for",
+                )
+            return self.shard_dir / filename
+
+
+def _ticket_order_key(ticket: Dict[str, Any]):
+    """Sort key matching TicketRepository listings (priority, newest first)."""
+    created_ms = timestamp_to_epoch_ms(ticket.get("created_at")) or 0
+    return (_PRIORITY_RANK.get(ticket.get("priority"), 5), -created_ms)
+
+
+class ShardedTicketRepository:
+    """TicketRepository facade routing tickets to per-project shard databases."""
+
+    def __init__(
+        self,
+        shard_dir: Path,
+        default_shard: Optional[str] = None,
+        config: Optional[ActifixConfig] = None,
+    ):
+        """
+        Initialize sharded repository.
+
+        Args:
+            shard_dir: Directory holding the shard map and shard databases.
+            default_shard: Shard for new tickets (default: config
+                ticket_shard_key, else derived from the project root).
+            config: Optional configuration (uses global config if None).
+        """
+        self.config = config or get_config()
+        self.shard_map = ShardMap(Path(shard_dir))
+        self.default_shard = normalize_shard_key(
+            default_shard
+            or self.config.ticket_shard_key
+            or project_shard_key(self.config.project_root)
+        )
+        self._repos: Dict[str, TicketRepository] = {}
+        self._lock = threading.Lock()
+        self._claim_cursor = 0
+        self._locations: "OrderedDict[str, str]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Shard access
+    # ------------------------------------------------------------------
+
+    def shard(self, key: Optional[str] = None) -> TicketRepository:
+        """Return the repository for a shard, creating the shard if needed."""
+        key = normalize_shard_key(key) if key else self.default_shard
+        with self._lock:
+            repo = self._repos.get(key)
+            if repo is not None:
+                return repo
+        path = self.shard_map.path_for(key, create=True)
+        pool = open_database_pool(path)
+        with self._lock:
+            repo = self._repos.get(key)
+            if repo is None:
+                repo = self._repos[key] = TicketRepository(pool=pool, config=self.config)
+                # Shards share a directory; keep their archive tiers apart
+                repo.archive = TicketArchive(pool, archive_path=path.with_name(f"{key}.archive.db"))
+            return repo
+
+    def shard_keys(self) -> List[str]:
+        """Return all shard keys, including the default shard."""
+        keys = set(self.shard_map.keys())
+        keys.add(self.default_shard)
+        return sorted(keys)
+
+    @property
+    def pool(self) -> DatabasePool:
+        """Pool of the default shard (for callers that need a raw connection)."""
+        return self.shard().pool
+
+    @property
+    def archive(self):
+        """Archive tier of the default shard."""
+        return self.shard().archive
+
+    def _fan_out(self, work: Callable[[TicketRepository], T]) -> Dict[str, T]:
+        """Run work against every shard (in parallel when there are several)."""
+        repos = {key: self.shard(key) for key in self.shard_keys()}
+        if len(repos) == 1:
+            return {key: work(repo) for key, repo in repos.items()}
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="actifix-shard")
+            executor = self._executor
+        futures = {key: executor.submit(work, repo) for key, repo in repos.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+    def _remember(self, ticket_id: str, key: str) -> None:
+        with self._lock:
+            self._locations[ticket_id] = key
+            self._locations.move_to_end(ticket_id)
+            while len(self._locations) > TICKET_LOCATION_CACHE_SIZE:
+                self._locations.popitem(last=False)
+
+    def locate(self, ticket_id: str) -> Optional[str]:
+        """Return the shard key holding a ticket (hot tier, including soft-deleted)."""
+        with self._lock:
+            key = self._locations.get(ticket_id)
+        if key is not None:
+            return key
+
+        def probe(repo: TicketRepository) -> bool:
+            with repo.pool.connection() as conn:
+                return conn.execute("SELECT 1 FROM tickets WHERE id = ?", (ticket_id,)).fetchone() is not None
+
+        for key, found in self._fan_out(probe).items():
+            if found:
+                self._remember(ticket_id, key)
+                return key
+        return None
+
+    def _route(self, ticket_id: str) -> Optional[TicketRepository]:
+        key = self.locate(ticket_id)
+        return self.shard(key) if key is not None else None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def create_ticket(self, entry: ActifixEntry, shard_key: Optional[str] = None) -> bool:
+        """Create a ticket in the given shard (default: this project's shard)."""
+        key = normalize_shard_key(shard_key) if shard_key else self.default_shard
+        created = self.shard(key).create_ticket(entry)
+        if created:
+            self._remember(entry.entry_id, key)
+        return created
+
+    def check_duplicate_guard(
+        self,
+        duplicate_guard: str,
+        include_archived: bool = True,
+        shard_key: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Check a duplicate guard within one shard (duplicates are per project)."""
+        return self.shard(shard_key).check_duplicate_guard(duplicate_guard, include_archived=include_archived)
+
+    def update_ticket(self, ticket_id: str, updates: Dict[str, Any]) -> bool:
+        repo = self._route(ticket_id)
+        return repo.update_ticket(ticket_id, updates) if repo else False
+
+    def mark_complete(self, ticket_id: str, *args, **kwargs) -> bool:
+        repo = self._route(ticket_id)
+        return repo.mark_complete(ticket_id, *args, **kwargs) if repo else False
+
+    def mark_complete_many(self, ticket_ids: List[str], *args, **kwargs) -> List[str]:
+        """Bulk-complete tickets, one mark_complete_many call per owning shard."""
+        by_shard: Dict[str, List[str]] = {}
+        for ticket_id in ticket_ids:
+            key = self.locate(ticket_id)
+            if key is not None:
+                by_shard.setdefault(key, []).append(ticket_id)
+        completed: List[str] = []
+        for key, ids in by_shard.items():
+            completed.extend(self.shard(key).mark_complete_many(ids, *args, **kwargs))
+        return completed
+
+    def acquire_lock(self, ticket_id: str, *args, **kwargs) -> Optional[TicketLock]:
+        repo = self._route(ticket_id)
+        return repo.acquire_lock(ticket_id, *args, **kwargs) if repo else None
+
+    def release_lock(self, ticket_id: str, locked_by: str) -> bool:
+        repo = self._route(ticket_id)
+        return repo.release_lock(ticket_id, locked_by) if repo else False
+
+    def renew_lock(self, ticket_id: str, *args, **kwargs) -> Optional[TicketLock]:
+        repo = self._route(ticket_id)
+        return repo.renew_lock(ticket_id, *args, **kwargs) if repo else None
+
+    def delete_ticket(self, ticket_id: str, soft_delete: bool = True) -> bool:
+        repo = self._route(ticket_id)
+        return repo.delete_ticket(ticket_id, soft_delete=soft_delete) if repo else False
+
+    def delete_tickets_where(self, where_clause: str, *args, **kwargs) -> List[str]:
+        results = self._fan_out(lambda repo: repo.delete_tickets_where(where_clause, *args, **kwargs))
+        return [ticket_id for ids in results.values() for ticket_id in ids]
+
+    def recover_ticket(self, ticket_id: str) -> bool:
+        repo = self._route(ticket_id)
+        return repo.recover_ticket(ticket_id) if repo else False
+
+    def cleanup_expired_locks(self) -> int:
+        return sum(self._fan_out(lambda repo: repo.cleanup_expired_locks()).values())
+
+    def get_and_lock_next_ticket(self, locked_by: str, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Claim the next ticket, rotating the starting shard on every call.
+
+        Priority order holds within a shard; across shards claims are spread
+        round-robin so one busy project cannot starve the others.
+        """
+        keys = self.shard_keys()
+        with self._lock:
+            start = self._claim_cursor % len(keys)
+            self._claim_cursor += 1
+        for key in keys[start:] + keys[:start]:
+            ticket = self.shard(key).get_and_lock_next_ticket(locked_by, *args, **kwargs)
+            if ticket is not None:
+                self._remember(ticket["id"], key)
+                return ticket
+        return None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_ticket(self, ticket_id: str, include_archived: bool = False) -> Optional[Dict[str, Any]]:
+        repo = self._route(ticket_id)
+        if repo is not None:
+            ticket = repo.get_ticket(ticket_id, include_archived=include_archived)
+            if ticket is not None:
+                return ticket
+        if not include_archived:
+            return None
+        for ticket in self._fan_out(lambda r: r.get_ticket(ticket_id, include_archived=True)).values():
+            if ticket is not None:
+                return ticket
+        return None
+
+    def get_tickets(self, filter: Optional[TicketFilter] = None) -> List[Dict[str, Any]]:
+        """Fan out a listing to every shard and merge in repository order."""
+        if filter is None:
+            filter = TicketFilter()
+        per_shard = replace(
+            filter,
+            limit=(filter.limit + filter.offset) if filter.limit else None,
+            offset=0,
+        )
+        results = self._fan_out(lambda repo: repo.get_tickets(per_shard))
+        for key, tickets in results.items():
+            for ticket in tickets:
+                self._remember(ticket["id"], key)
+        merged = heapq.merge(*results.values(), key=_ticket_order_key)
+        tickets = list(merged)
+        if filter.limit:
+            return tickets[filter.offset:filter.offset + filter.limit]
+        return tickets
+
+    def get_open_tickets(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.get_tickets(TicketFilter(status="Open", limit=limit))
+
+    def get_completed_tickets(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.get_tickets(TicketFilter(status="Completed", limit=limit))
+
+    def get_recent_tickets(
+        self,
+        limit: int = 20,
+        statuses: Sequence[str] = ("Open", "Completed"),
+    ) -> List[Dict[str, Any]]:
+        """Newest tickets over all shards; each shard returns at most ``limit``."""
+        results = self._fan_out(lambda repo: repo.get_recent_tickets(limit, statuses))
+        for key, tickets in results.items():
+            for ticket in tickets:
+                self._remember(ticket["id"], key)
+        merged = heapq.merge(
+            *results.values(),
+            key=lambda t: timestamp_to_epoch_ms(t.get("created_at")) or 0,
+            reverse=True,
+        )
+        return list(merged)[:max(limit, 0)]
+
+    def get_created_bounds(self, status: str = "Open") -> Dict[str, Any]:
+        """Oldest and newest created_at for ``status`` over all shards."""
+        results = self._fan_out(lambda repo: repo.get_created_bounds(status))
+        oldest = [b["oldest"] for b in results.values() if b["oldest"] is not None]
+        newest = [b["newest"] for b in results.values() if b["newest"] is not None]
+        return {
+            "oldest": min(oldest) if oldest else None,
+            "newest": max(newest) if newest else None,
+        }
+
+    def get_creations_since(self, since_ms: Dict[str, int]) -> Dict[str, List[Tuple[str, int]]]:
+        """Per-priority ticket creations over all shards, oldest first."""
+        results = self._fan_out(lambda repo: repo.get_creations_since(since_ms))
+        return {
+            priority: list(heapq.merge(
+                *(result.get(priority, []) for result in results.values()),
+                key=lambda row: row[1],
+            ))
+            for priority in since_ms
+        }
+
+    def evaluate_sla(
+        self, thresholds_ms: Dict[str, int], now_ms: int
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Combine per-shard SLA state (None if any shard is still backfilling)."""
+        results = self._fan_out(lambda repo: repo.evaluate_sla(thresholds_ms, now_ms))
+        if any(result is None for result in results.values()):
+            return None
+        merged: Dict[str, Dict[str, Any]] = {}
+        for result in results.values():
+            for priority, row in result.items():
+                current = merged.setdefault(
+                    priority, {"breached": 0, "oldest_id": None, "oldest_ms": None, "next_ms": None}
+                )
+                current["breached"] += row["breached"]
+                if row["oldest_ms"] is not None and (
+                    current["oldest_ms"] is None or row["oldest_ms"] < current["oldest_ms"]
+                ):
+                    current["oldest_ms"] = row["oldest_ms"]
+                    current["oldest_id"] = row["oldest_id"]
+                if row["next_ms"] is not None and (
+                    current["next_ms"] is None or row["next_ms"] < current["next_ms"]
+                ):
+                    current["next_ms"] = row["next_ms"]
+        return merged
+
+    def get_expired_locks(self) -> List[Dict[str, Any]]:
+        results = self._fan_out(lambda repo: repo.get_expired_locks())
+        return [ticket for tickets in results.values() for ticket in tickets]
+
+    def get_deleted_tickets(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        results = self._fan_out(lambda repo: repo.get_deleted_tickets(limit))
+        tickets = sorted(
+            (ticket for shard_tickets in results.values() for ticket in shard_tickets),
+            key=lambda t: timestamp_to_epoch_ms(t.get("deleted_at")) or 0,
+            reverse=True,
+        )
+        return tickets[:limit] if limit else tickets
+
+    def get_stats(self, include_archived: bool = False) -> Dict[str, Any]:
+        """Sum ticket statistics over all shards."""
+        results = self._fan_out(lambda repo: repo.get_stats(include_archived=include_archived))
+        merged: Dict[str, Any] = {}
+        for stats in results.values():
+            for name, value in stats.items():
+                if isinstance(value, dict):
+                    bucket = merged.setdefault(name, {})
+                    for sub, count in value.items():
+                        bucket[sub] = bucket.get(sub, 0) + count
+                else:
+                    merged[name] = merged.get(name, 0) + value
+        return merged
+
+    def get_write_generation(self) -> Tuple[Tuple[str, int], ...]:
+        """Per-shard write generations; equal values mean no shard changed."""
+        results = self._fan_out(lambda repo: repo.get_write_generation())
+        return tuple(sorted(results.items()))
+
+    def get_shard_stats(self, include_archived: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Return ticket statistics per shard key."""
+        return self._fan_out(lambda repo: repo.get_stats(include_archived=include_archived))
+
+    def close(self) -> None:
+        """Stop fan-out workers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
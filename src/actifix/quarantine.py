@@ -3,17 +3,28 @@ Actifix Quarantine - Corruption handling and malformed data isolation.
 
 Provides quarantine system for corrupted or malformed tickets/data.
 Corruption is quarantined, not fatal - allowing system to continue.
+
+Entries live in the database ``quarantine`` table, deduplicated by content
+hash (repeats bump an occurrence counter). The markdown file form is only
+produced on demand by export_quarantine(). ``quarantine_*.md`` files left by
+releases that stored entries as files are imported into the table the first
+time quarantine is used.
 """
 
-import shutil
+import secrets
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from .log_utils import atomic_write, log_event
+from .persistence.quarantine_repo import QuarantineRecord, QuarantineRepository
 from .state_paths import get_actifix_paths, ensure_actifix_dirs, ActifixPaths
 
+_legacy_imported: set = set()
+_legacy_import_lock = threading.Lock()
+
 
 @dataclass
 class QuarantineEntry:
@@ -24,58 +35,115 @@ class QuarantineEntry:
     reason: str
     content: str
     quarantined_at: datetime
-    file_path: Path
+    file_path: Optional[Path] = None  # Set once exported to markdown
+    occurrences: int = 1
+    last_seen_at: Optional[datetime] = None
 
 
 def generate_quarantine_id() -> str:
-    """Generate unique quarantine entry ID."""
+    """Generate unique quarantine entry ID (timestamp plus a random suffix)."""
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-    return f"quarantine_{timestamp}"
+    # entry_id is UNIQUE; microseconds alone collide under concurrent writers
+    return f"quarantine_{timestamp}_{secrets.token_hex(4)}"
 
 
-def quarantine_content(
-    content: str,
-    source: str,
-    reason: str,
-    paths: Optional[ActifixPaths] = None,
-) -> QuarantineEntry:
+def _to_entry(record: QuarantineRecord, file_path: Optional[Path] = None) -> QuarantineEntry:
+    return QuarantineEntry(
+        entry_id=record.entry_id,
+        original_source=record.original_source,
+        reason=record.reason,
+        content=record.content,
+        quarantined_at=record.quarantined_at,
+        file_path=file_path,
+        occurrences=record.occurrences,
+        last_seen_at=record.last_seen_at,
+    )
+
+
+def _parse_legacy_file(file_path: Path) -> dict:
+    """Read a quarantine_*.md file written by the file-based quarantine."""
+    text = file_path.read_text()
+    entry = {
+        "entry_id": file_path.stem,
+        "source": "",
+        "reason": "",
+        "quarantined_at": datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc),
+        "content": "",
+    }
+    for line in text.split("\n"):
+        if line.startswith("- **Entry ID**:"):
+            entry["entry_id"] = line.split(":", 1)[1].strip() or file_path.stem
+        elif line.startswith("- **Source**:"):
+            entry["source"] = line.split(":", 1)[1].strip()
+        elif line.startswith("- **Reason**:"):
+            entry["reason"] = line.split(":", 1)[1].strip()
+        elif line.startswith("- **Quarantined At**:"):
+            try:
+                entry["quarantined_at"] = datetime.fromisoformat(line.split(":", 1)[1].strip())
+            except ValueError:
+                pass
+    if "## Original Content" in text:
+        code_parts = text.split("## Original Content", 1)[1].split("```")
+        if len(code_parts) >= 2:
+            entry["content"] = code_parts[1].strip()
+    return entry
+
+
+def import_legacy_quarantine(paths: Optional[ActifixPaths] = None) -> int:
     """
-    Quarantine malformed or corrupted content.
-    
+    Import quarantine_*.md files into the quarantine table.
+
+    Runs once per process for each database and quarantine directory; the
+    import itself is idempotent (known entry ids are skipped), and the
+    files are left in place.
+
     Args:
-        content: The content to quarantine.
-        source: Original source (e.g., file path, ticket ID).
-        reason: Reason for quarantine.
         paths: Optional paths override.
-    
+
     Returns:
-        QuarantineEntry with details.
+        Number of entries imported.
     """
     if paths is None:
         paths = get_actifix_paths()
-    
-    ensure_actifix_dirs(paths)
-    
-    # Generate entry
-    entry_id = generate_quarantine_id()
-    quarantined_at = datetime.now(timezone.utc)
-    
-    # Create quarantine file
-    filename = f"{entry_id}.md"
-    file_path = paths.quarantine_dir / filename
-    
-    # Format quarantine content
-    quarantine_content = f"""# Quarantined Content
+    repo = QuarantineRepository()
+    key = (str(repo.pool.config.db_path), str(paths.quarantine_dir))
+    with _legacy_import_lock:
+        if key in _legacy_imported:
+            return 0
+        files = sorted(paths.quarantine_dir.glob("quarantine_*.md")) if paths.quarantine_dir.exists() else []
+        entries = []
+        for file_path in files:
+            try:
+                entries.append(_parse_legacy_file(file_path))
+            except (OSError, ValueError):
+                continue
+        entries.sort(key=lambda e: e["quarantined_at"])
+        imported = repo.import_entries(entries)
+        _legacy_imported.add(key)
 
-- **Entry ID**: {entry_id}
-- **Source**: {source}
-- **Reason**: {reason}
-- **Quarantined At**: {quarantined_at.isoformat()}
+    if imported:
+        log_event(
+            "QUARANTINE_LEGACY_IMPORTED",
+            f"Imported {imported} legacy quarantine files",
+            extra={"imported": imported, "files": len(files), "quarantine_dir": str(paths.quarantine_dir)},
+        )
+    return imported
+
+
+def format_quarantine_markdown(entry: QuarantineEntry) -> str:
+    """Render a quarantine entry in the markdown export format."""
+    return f"""# Quarantined Content
+
+- **Entry ID**: {entry.entry_id}
+- **Source**: {entry.original_source}
+- **Reason**: {entry.reason}
+- **Quarantined At**: {entry.quarantined_at.isoformat()}
+- **Occurrences**: {entry.occurrences}
 
 ## Original Content
 
 ```
-{content}
+{entry.content}
 ```
 
 ## Recovery Notes
@@ -84,31 +152,52 @@ To recover this content:
 1. Review the content above
 2. Fix any issues
 3. Manually reintegrate if needed
-4. Delete this file when resolved
+4. Remove the entry when resolved (actifix quarantine remove <entry id>)
 """
+
+
+def quarantine_content(
+    content: str,
+    source: str,
+    reason: str,
+    paths: Optional[ActifixPaths] = None,
+) -> QuarantineEntry:
+    """
+    Quarantine malformed or corrupted content.
+
+    Content that is already quarantined is not stored again; the existing
+    entry's occurrence counter is incremented and returned instead.
     
-    atomic_write(file_path, quarantine_content)
-    
-    # Log the quarantine
-    log_event(
-        "CONTENT_QUARANTINED",
-        f"Quarantined content from {source}: {reason}",
-        extra={
-            "entry_id": entry_id,
-            "source": source,
-            "reason": reason,
-        }
-    )
+    Args:
+        content: The content to quarantine.
+        source: Original source (e.g., file path, ticket ID).
+        reason: Reason for quarantine.
+        paths: Optional paths override (locates legacy files to import).
     
-    return QuarantineEntry(
-        entry_id=entry_id,
-        original_source=source,
-        reason=reason,
+    Returns:
+        QuarantineEntry with details.
+    """
+    import_legacy_quarantine(paths)
+    record, created = QuarantineRepository().add(
+        entry_id=generate_quarantine_id(),
         content=content,
-        quarantined_at=quarantined_at,
-        file_path=file_path,
+        source=source,
+        reason=reason,
     )
 
+    if created:
+        log_event(
+            "CONTENT_QUARANTINED",
+            f"Quarantined content from {source}: {reason}",
+            extra={
+                "entry_id": record.entry_id,
+                "source": source,
+                "reason": reason,
+            }
+        )
+    
+    return _to_entry(record)
+
 
 def quarantine_file(
     file_path: Path,
@@ -130,90 +219,70 @@ def quarantine_file(
         return None
     
     content = file_path.read_text()
-    source = str(file_path)
-    
-    entry = quarantine_content(content, source, reason, paths)
-    
-    # Move original file
-    backup_name = f"{entry.entry_id}_original{file_path.suffix}"
-    if paths is None:
-        paths = get_actifix_paths()
-    
-    backup_path = paths.quarantine_dir / backup_name
-    shutil.copy2(file_path, backup_path)
-    
-    return entry
+    return quarantine_content(content, str(file_path), reason, paths)
 
 
 def list_quarantine(
     paths: Optional[ActifixPaths] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
 ) -> list[QuarantineEntry]:
     """
-    List all quarantined items.
+    List quarantined items (newest first).
     
     Args:
-        paths: Optional paths override.
+        paths: Optional paths override (locates legacy files to import).
+        limit: Optional page size (all entries when None).
+        cursor: Row-id cursor from a previous page (see QuarantineRepository.list_paginated).
     
     Returns:
         List of QuarantineEntry objects.
     """
+    import_legacy_quarantine(paths)
+    repo = QuarantineRepository()
+    if limit is not None:
+        records, _ = repo.list_paginated(limit=limit, cursor=cursor)
+        return [_to_entry(r) for r in records]
+
+    entries = []
+    while True:
+        records, cursor = repo.list_paginated(limit=500, cursor=cursor)
+        entries.extend(_to_entry(r) for r in records)
+        if cursor is None:
+            return entries
+
+
+def export_quarantine(
+    entry_id: Optional[str] = None,
+    paths: Optional[ActifixPaths] = None,
+) -> list[Path]:
+    """
+    Export quarantine entries as markdown files in the quarantine directory.
+
+    Args:
+        entry_id: Export only this entry (all entries when None).
+        paths: Optional paths override.
+
+    Returns:
+        Paths of the written files.
+    """
     if paths is None:
         paths = get_actifix_paths()
-    
-    entries = []
-    
-    if not paths.quarantine_dir.exists():
-        return entries
-    
-    for file_path in paths.quarantine_dir.glob("quarantine_*.md"):
-        content = file_path.read_text()
-        
-        # Parse entry from content
-        entry_id = file_path.stem
-        
-        # Extract metadata
-        source = ""
-        reason = ""
-        quarantined_at = datetime.now(timezone.utc)
-        original_content = ""
-        
-        for line in content.split("\n"):
-            if line.startswith("- **Entry ID**:"):
-                entry_id = line.split(":")[1].strip()
-            elif line.startswith("- **Source**:"):
-                source = line.split(":", 1)[1].strip()
-            elif line.startswith("- **Reason**:"):
-                reason = line.split(":", 1)[1].strip()
-            elif line.startswith("- **Quarantined At**:"):
-                try:
-                    dt_str = line.split(":", 1)[1].strip()
-                    quarantined_at = datetime.fromisoformat(dt_str)
-                except ValueError:
-                    pass
-        
-        # Extract original content
-        if "## Original Content" in content:
-            parts = content.split("## Original Content")
-            if len(parts) > 1:
-                content_section = parts[1]
-                if "```" in content_section:
-                    code_parts = content_section.split("```")
-                    if len(code_parts) >= 2:
-                        original_content = code_parts[1].strip()
-        
-        entries.append(QuarantineEntry(
-            entry_id=entry_id,
-            original_source=source,
-            reason=reason,
-            content=original_content,
-            quarantined_at=quarantined_at,
-            file_path=file_path,
-        ))
-    
-    # Sort by date (newest first)
-    entries.sort(key=lambda e: e.quarantined_at, reverse=True)
-    
-    return entries
+    ensure_actifix_dirs(paths)
+    import_legacy_quarantine(paths)
+
+    if entry_id is not None:
+        record = QuarantineRepository().get(entry_id)
+        entries = [_to_entry(record)] if record else []
+    else:
+        entries = list_quarantine()
+
+    written = []
+    for entry in entries:
+        file_path = paths.quarantine_dir / f"{entry.entry_id}.md"
+        atomic_write(file_path, format_quarantine_markdown(entry))
+        written.append(file_path)
+    return written
 
 
 def remove_quarantine(
@@ -222,6 +291,8 @@ def remove_quarantine(
 ) -> bool:
     """
     Remove an item from quarantine.
+
+    Also deletes exported markdown (and legacy backup) files for the entry.
     
     Args:
         entry_id: Entry ID to remove.
@@ -232,32 +303,24 @@ def remove_quarantine(
     """
     if paths is None:
         paths = get_actifix_paths()
-    
-    # Find and remove the quarantine file
-    file_path = paths.quarantine_dir / f"{entry_id}.md"
-    
-    if file_path.exists():
-        file_path.unlink()
-        
-        # Also remove original file backup if exists
-        for backup in paths.quarantine_dir.glob(f"{entry_id}_original*"):
-            backup.unlink()
-        
+    import_legacy_quarantine(paths)
+
+    removed = QuarantineRepository().remove(entry_id)
+
+    if paths.quarantine_dir.exists():
+        for stale in paths.quarantine_dir.glob(f"{entry_id}*"):
+            if stale.name == f"{entry_id}.md" or stale.name.startswith(f"{entry_id}_original"):
+                stale.unlink()
+
+    if removed:
         log_event(
             "QUARANTINE_REMOVED",
             f"Removed quarantine entry: {entry_id}",
         )
-        return True
-    
-    return False
+    return removed
 
 
 def get_quarantine_count(paths: Optional[ActifixPaths] = None) -> int:
-    """Get count of quarantined items."""
-    if paths is None:
-        paths = get_actifix_paths()
-    
-    if not paths.quarantine_dir.exists():
-        return 0
-    
-    return len(list(paths.quarantine_dir.glob("quarantine_*.md")))
+    """Get count of quarantined items (single indexed COUNT)."""
+    import_legacy_quarantine(paths)
+    return QuarantineRepository().count()
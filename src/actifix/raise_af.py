@@ -27,9 +27,9 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
 import traceback
-import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -352,10 +352,81 @@ def enforce_raise_af_only(
         )
 
 
+_ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford base32, ASCII-ordered
+_ID_MS_DIGITS = 6     # Millisecond of day (< 32**6)
+_ID_SEQ_DIGITS = 3    # Per-millisecond counter (32768 IDs/ms per process)
+_ID_NODE_DIGITS = 5   # Process ID (covers pid_max of 2**22)
+_ID_SEQ_LIMIT = 32 ** _ID_SEQ_DIGITS
+_ID_LOCK = threading.Lock()
+_id_state = {"ms": 0, "seq": 0}
+
+
+def _encode_base32(value: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        value, rem = divmod(value, 32)
+        chars.append(_ID_ALPHABET[rem])
+    return "".join(reversed(chars))
+
+
 def generate_entry_id() -> str:
-    """Generate a short unique ID for Actifix tickets."""
-    now = datetime.now(timezone.utc)
-    return f"ACT-{now.strftime('%Y%m%d')}-{uuid.uuid4().hex[:5].upper()}"
+    """
+    Generate a time-sortable unique ID for Actifix tickets.
+
+    Format: ``ACT-YYYYMMDD-TTTTTTSSSPPPPP`` where T is the UTC millisecond of
+    the day, S a per-millisecond counter and P the process ID, all in
+    Crockford base32. IDs sort lexicographically in creation order, so
+    inserts land at the right edge of the primary key index and IDs can be
+    used as pagination cursors. The counter is guarded by a lock and the
+    process ID keeps concurrent processes apart, so no retry is needed.
+    The clock never moves backwards: if it does, or the counter for a
+    millisecond is exhausted, the next millisecond is borrowed.
+    """
+    now_ms = time.time_ns() // 1_000_000
+    with _ID_LOCK:
+        if now_ms > _id_state["ms"]:
+            _id_state["ms"] = now_ms
+            _id_state["seq"] = 0
+        else:
+            _id_state["seq"] += 1
+            if _id_state["seq"] >= _ID_SEQ_LIMIT:
+                _id_state["ms"] += 1
+                _id_state["seq"] = 0
+        ms, seq = _id_state["ms"], _id_state["seq"]
+
+    day = datetime.fromtimestamp(ms // 1000, tz=timezone.utc)
+    ms_of_day = ms % 86_400_000
+    return (
+        f"ACT-{day.strftime('%Y%m%d')}-"
+        f"{_encode_base32(ms_of_day, _ID_MS_DIGITS)}"
+        f"{_encode_base32(seq, _ID_SEQ_DIGITS)}"
+        f"{_encode_base32(os.getpid() % (32 ** _ID_NODE_DIGITS), _ID_NODE_DIGITS)}"
+    )
+
+
+def entry_id_timestamp(entry_id: str) -> Optional[datetime]:
+    """
+    Return the creation time encoded in a time-sortable entry ID.
+
+    Legacy IDs (``ACT-YYYYMMDD-XXXXX``) only carry the day and return
+    midnight UTC of that day; unparseable IDs return None.
+    """
+    try:
+        prefix, day, suffix = entry_id.split("-", 2)
+        base = datetime.strptime(day, "%Y%m%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if prefix != "ACT":
+        return None
+    if len(suffix) != _ID_MS_DIGITS + _ID_SEQ_DIGITS + _ID_NODE_DIGITS:
+        return base
+    ms_of_day = 0
+    for char in suffix[:_ID_MS_DIGITS]:
+        index = _ID_ALPHABET.find(char)
+        if index < 0:
+            return base
+        ms_of_day = ms_of_day * 32 + index
+    return base + timedelta(milliseconds=ms_of_day)
 
 
 def generate_ticket_id() -> str:
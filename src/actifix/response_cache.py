@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Response cache for aggregate API reads.
+
+Endpoints such as /api/health, /api/stats, /api/tickets/summary and
+/api/metrics rebuild their payload from several queries on every hit.
+Dashboards poll them far more often than tickets change, so the rendered
+response is cached per (endpoint, query params) and reused while:
+
+- the ticket write generation is unchanged (bumped by database triggers on
+  every committed ticket write, from any process), and
+- the entry is younger than the max-staleness bound, which covers inputs
+  the generation does not track (filesystem checks, events, pool metrics).
+
+Usage:
+    from actifix.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    body, hit = cache.get_or_compute(("stats", ()), generation, build)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .config import get_config
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value and the write generation it was computed at."""
+
+    value: Any
+    generation: Hashable
+    created_at: float
+
+
+class ResponseCache:
+    """LRU response cache invalidated by write generation and age."""
+
+    def __init__(self, max_staleness_seconds: float = 5.0, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_staleness_seconds = max_staleness_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_staleness_seconds > 0
+
+    @staticmethod
+    def _endpoint(key: Hashable) -> str:
+        return str(key[0]) if isinstance(key, tuple) and key else str(key)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        generation: Hashable,
+        compute: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return a cached value for key, or compute and store it.
+
+        Args:
+            key: Cache key; the first element names the endpoint for metrics.
+            generation: Current write generation; a mismatch is a miss.
+            compute: Builds the value on a miss.
+            cacheable: Optional predicate; values it rejects are not stored.
+
+        Returns:
+            (value, hit) tuple.
+        """
+        endpoint = self._endpoint(key)
+        if self.enabled:
+            now = time.monotonic()
+            with self._lock:
+                entry = self._entries.get(key)
+                if (
+                    entry is not None
+                    and entry.generation == generation
+                    and now - entry.created_at <= self.max_staleness_seconds
+                ):
+                    self._entries.move_to_end(key)
+                    self._hits[endpoint] = self._hits.get(endpoint, 0) + 1
+                    return entry.value, True
+
+        # Computed outside the lock; concurrent misses may both compute
+        created_at = time.monotonic()
+        value = compute()
+        with self._lock:
+            self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+            if self.enabled and (cacheable is None or cacheable(value)):
+                self._entries[key] = CacheEntry(value, generation, created_at)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value, False
+
+    def clear(self) -> None:
+        """Drop all cached entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per endpoint plus totals."""
+        with self._lock:
+            endpoints = sorted(set(self._hits) | set(self._misses))
+            per_endpoint = {
+                name: {"hits": self._hits.get(name, 0), "misses": self._misses.get(name, 0)}
+                for name in endpoints
+            }
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            entries = len(self._entries)
+        total = hits + misses
+        return {
+            "enabled": self.enabled,
+            "max_staleness_seconds": self.max_staleness_seconds,
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "endpoints": per_endpoint,
+        }
+
+
+def render_response_cache_metrics(cache: Optional["ResponseCache"] = None) -> str:
+    """Hit/miss counters in Prometheus exposition format."""
+    stats = (cache or get_response_cache()).get_stats()
+    lines = []
+    for name, key, help_text in (
+        ("actifix_response_cache_hits_total", "hits", "API responses served from the response cache"),
+        ("actifix_response_cache_misses_total", "misses", "API responses computed on a cache miss"),
+    ):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for endpoint, counts in stats["endpoints"].items():
+            lines.append(f'{name}{{endpoint="{endpoint}"}} {counts[key]}')
+        lines.append("")
+    lines.append("# HELP actifix_response_cache_entries Responses currently cached")
+    lines.append("# TYPE actifix_response_cache_entries gauge")
+    lines.append(f"actifix_response_cache_entries {stats['entries']}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Global cache instance
+_global_cache: Optional[ResponseCache] = None
+_global_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the global response cache."""
+    global _global_cache
+    with _global_cache_lock:
+        if _global_cache is None:
+            config = get_config()
+            _global_cache = ResponseCache(
+                max_staleness_seconds=getattr(config, "response_cache_max_staleness_seconds", 5.0),
+            )
+        return _global_cache
+
+
+def reset_response_cache() -> None:
+    """Reset the global response cache (for testing)."""
+    global _global_cache
+    with _global_cache_lock:
+        _global_cache = None
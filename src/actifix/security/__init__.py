@@ -31,6 +31,7 @@ from .auth import (
     AuthenticationError,
     AuthorizationError,
     TokenManager,
+    VerifiedTokenCache,
     UserManager,
     AuthorizationManager,
     get_token_manager,
@@ -39,6 +40,14 @@ from .auth import (
     reset_auth_managers,
 )
 
+from .admin_session import (
+    AdminSession,
+    AdminSessionError,
+    AdminSessionManager,
+    get_admin_session_manager,
+    reset_admin_session_manager,
+)
+
 from .credentials import (
     CredentialType,
     Credential,
@@ -75,12 +84,18 @@ __all__ = [
     'AuthenticationError',
     'AuthorizationError',
     'TokenManager',
+    'VerifiedTokenCache',
     'UserManager',
     'AuthorizationManager',
     'get_token_manager',
     'get_user_manager',
     'get_authorization_manager',
     'reset_auth_managers',
+    'AdminSession',
+    'AdminSessionError',
+    'AdminSessionManager',
+    'get_admin_session_manager',
+    'reset_admin_session_manager',
     'CredentialType',
     'Credential',
     'CredentialStorageError',
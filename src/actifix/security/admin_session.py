@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Admin session tokens.
+
+Checking X-Admin-Password runs PBKDF2 (100,000 iterations) on every
+request. Clients instead exchange the password once for a short-lived
+session token and send that; verifying it is one HMAC-SHA256 and a
+constant-time compare.
+
+Token format (all fields URL-safe):
+
+    afs1.<key id>.<subject>.<issued at>.<expires at>.<nonce>.<signature>
+
+Signing keys are kept in ``<state_dir>/admin_session_keys.json`` (mode
+0600) so every worker process of the API verifies every other worker's
+tokens. The newest key signs; a key is rotated out after the rotation
+interval and kept for verification until tokens it signed have expired.
+Workers re-read the file at least every KEY_RELOAD_SECONDS, so a
+``rotate_keys(revoke_existing=True)`` reaches every process within that.
+ACTIFIX_ADMIN_SESSION_SECRET pins a single key instead (no rotation).
+
+Version: 1.0.0
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TOKEN_PREFIX = "afs1"
+KEY_FILENAME = "admin_session_keys.json"
+KEY_RELOAD_SECONDS = 60.0
+_SUBJECT_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class AdminSessionError(Exception):
+    """Raised when an admin session cannot be issued."""
+    pass
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """One HMAC signing key."""
+    kid: str
+    secret: bytes
+    created_at: float
+
+
+@dataclass(frozen=True)
+class AdminSession:
+    """An issued session token and its lifetime."""
+    token: str
+    subject: str
+    issued_at: int
+    expires_at: int
+
+    @property
+    def expires_in(self) -> int:
+        return max(0, self.expires_at - int(time.time()))
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class AdminSessionManager:
+    """Issues and verifies HMAC-signed admin session tokens."""
+
+    def __init__(
+        self,
+        key_file: Optional[Path] = None,
+        ttl_seconds: float = 3600.0,
+        rotation_seconds: float = 86400.0,
+        secret: Optional[str] = None,
+    ):
+        """Initialize session manager.
+
+        Args:
+            key_file: Where signing keys are persisted (state dir default)
+            ttl_seconds: Session lifetime
+            rotation_seconds: Age after which a new signing key is minted
+            secret: Fixed signing secret (disables key file and rotation)
+        """
+        self.key_file = Path(key_file) if key_file else self._get_default_key_file()
+        self.ttl_seconds = ttl_seconds
+        self.rotation_seconds = rotation_seconds
+        self.lock = threading.RLock()
+        self._keys: Dict[str, SigningKey] = {}
+        self._loaded_at = float("-inf")
+        self._pinned = bool(secret)
+        if secret:
+            key = SigningKey("env", secret.encode("utf-8"), 0.0)
+            self._keys = {key.kid: key}
+
+    def _get_default_key_file(self) -> Path:
+        from ..state_paths import get_actifix_paths
+        return Path(get_actifix_paths().state_dir) / KEY_FILENAME
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _load_keys(self) -> Dict[str, SigningKey]:
+        self._loaded_at = time.monotonic()
+        try:
+            payload = json.loads(self.key_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        keys = {}
+        for item in payload.get("keys", []):
+            try:
+                key = SigningKey(
+                    str(item["kid"]), base64.urlsafe_b64decode(item["secret"]), float(item["created_at"])
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            keys[key.kid] = key
+        return keys
+
+    def _save_keys(self, keys: Dict[str, SigningKey]) -> None:
+        payload = {
+            "keys": [
+                {"kid": k.kid, "secret": base64.urlsafe_b64encode(k.secret).decode("ascii"),
+                 "created_at": k.created_at}
+                for k in sorted(keys.values(), key=lambda k: k.created_at)
+            ]
+        }
+        self.key_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.key_file.with_name(f".{self.key_file.name}.{os.getpid()}.{secrets.token_hex(4)}")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, self.key_file)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def _signing_key(self, now: float) -> SigningKey:
+        """Current signing key, minting (and pruning) keys when due."""
+        with self.lock:
+            if not self._keys and not self._pinned:
+                self._keys = self._load_keys()
+            newest = max(self._keys.values(), key=lambda k: k.created_at, default=None)
+            if self._pinned or (newest is not None and now - newest.created_at < self.rotation_seconds):
+                return newest
+            # Another worker may already have rotated
+            self._keys = self._load_keys()
+            newest = max(self._keys.values(), key=lambda k: k.created_at, default=None)
+            if newest is not None and now - newest.created_at < self.rotation_seconds:
+                return newest
+            return self._rotate(now)
+
+    def _rotate(self, now: float) -> SigningKey:
+        key = SigningKey(secrets.token_hex(4), secrets.token_bytes(32), now)
+        # Retired keys verify until every token they signed has expired
+        keep_after = now - self.rotation_seconds - self.ttl_seconds
+        keys = {k.kid: k for k in self._keys.values() if k.created_at >= keep_after}
+        keys[key.kid] = key
+        try:
+            self._save_keys(keys)
+        except OSError as e:
+            raise AdminSessionError(f"Cannot persist admin session keys: {e}")
+        self._keys = keys
+        return key
+
+    def rotate_keys(self, revoke_existing: bool = False) -> str:
+        """Mint a new signing key now.
+
+        Args:
+            revoke_existing: Drop all older keys, invalidating every session
+
+        Returns:
+            The new key id
+        """
+        if self._pinned:
+            raise AdminSessionError("Signing key is pinned by ACTIFIX_ADMIN_SESSION_SECRET")
+        with self.lock:
+            self._keys = {} if revoke_existing else self._load_keys()
+            return self._rotate(time.time()).kid
+
+    def _verification_key(self, kid: str) -> Optional[SigningKey]:
+        if self._pinned:
+            return self._keys.get(kid)
+        key = self._keys.get(kid)
+        age = time.monotonic() - self._loaded_at
+        # Unknown kids may have been minted by another worker since our last
+        # load; re-read at most once a second so forged kids stay cheap
+        if (key is None and age >= 1.0) or age >= KEY_RELOAD_SECONDS:
+            with self.lock:
+                self._keys = self._load_keys()
+                key = self._keys.get(kid)
+        return key
+
+    # ------------------------------------------------------------------
+    # Tokens
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _sign(key: SigningKey, message: str) -> str:
+        return _b64(hmac.new(key.secret, message.encode("ascii"), hashlib.sha256).digest())
+
+    def issue(self, subject: str = "admin") -> AdminSession:
+        """Issue a session token for ``subject``."""
+        if not _SUBJECT_RE.match(subject):
+            raise AdminSessionError(f"Invalid session subject: {subject!r}")
+        now = time.time()
+        key = self._signing_key(now)
+        issued_at = int(now)
+        expires_at = issued_at + max(1, int(self.ttl_seconds))
+        message = f"{TOKEN_PREFIX}.{key.kid}.{subject}.{issued_at}.{expires_at}.{secrets.token_hex(8)}"
+        return AdminSession(f"{message}.{self._sign(key, message)}", subject, issued_at, expires_at)
+
+    def verify(self, token: str) -> Optional[str]:
+        """Return the session subject if ``token`` is valid, else None."""
+        parts = token.split(".") if token else []
+        if len(parts) != 7 or parts[0] != TOKEN_PREFIX:
+            return None
+        _, kid, subject, issued_at, expires_at, _nonce, signature = parts
+        try:
+            if int(expires_at) <= time.time() or int(issued_at) > int(expires_at):
+                return None
+        except ValueError:
+            return None
+        key = self._verification_key(kid)
+        if key is None:
+            return None
+        expected = self._sign(key, token.rsplit(".", 1)[0])
+        if not hmac.compare_digest(expected, signature):
+            return None
+        return subject
+
+    def refresh(self, token: str) -> Optional[AdminSession]:
+        """Exchange a valid session token for a fresh one."""
+        subject = self.verify(token)
+        return self.issue(subject) if subject else None
+
+    def known_key_ids(self) -> List[str]:
+        with self.lock:
+            return sorted(self._keys)
+
+
+def is_admin_session_token(token: Optional[str]) -> bool:
+    """Whether a bearer value looks like an admin session token."""
+    return bool(token) and token.startswith(f"{TOKEN_PREFIX}.")
+
+
+# Global instance
+_session_manager: Optional[AdminSessionManager] = None
+_session_manager_lock = threading.Lock()
+
+
+def get_admin_session_manager() -> AdminSessionManager:
+    """Get or create global admin session manager."""
+    global _session_manager
+    with _session_manager_lock:
+        if _session_manager is None:
+            from ..config import get_config
+            config = get_config()
+            _session_manager = AdminSessionManager(
+                ttl_seconds=getattr(config, "admin_session_ttl_seconds", 3600.0),
+                rotation_seconds=getattr(config, "admin_session_rotation_seconds", 86400.0),
+                secret=os.environ.get("ACTIFIX_ADMIN_SESSION_SECRET") or None,
+            )
+        return _session_manager
+
+
+def reset_admin_session_manager() -> None:
+    """Reset global admin session manager (for testing)."""
+    global _session_manager
+    with _session_manager_lock:
+        _session_manager = None
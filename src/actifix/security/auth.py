@@ -22,6 +22,7 @@ import os
 import secrets
 import sqlite3
 import threading
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -71,19 +72,113 @@ class AuthorizationError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class _VerifiedToken:
+    """A verified token hash held by VerifiedTokenCache."""
+    user_id: str
+    expires_at: datetime
+    cached_until: float  # time.monotonic() deadline
+
+
+class VerifiedTokenCache:
+    """Bounded TTL cache of verified token hashes.
+
+    Lookups are plain dict reads (no lock, no database). Entries are
+    never served past the token's own expiry, are dropped as soon as the
+    token is revoked through this process, and revocations made by other
+    processes take effect within ``ttl_seconds``. When full, the entry
+    verified longest ago is evicted.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, _VerifiedToken] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, token_hash: str, now: datetime) -> Optional[str]:
+        """Return the cached user_id for a token hash, or None."""
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.cached_until or now >= entry.expires_at:
+            self._entries.pop(token_hash, None)
+            return None
+        return entry.user_id
+
+    def put(self, token_hash: str, user_id: str, expires_at: datetime) -> None:
+        """Remember a successful verification."""
+        if not self.enabled:
+            return
+        entry = _VerifiedToken(user_id, expires_at, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._entries.pop(token_hash, None)
+            self._entries[token_hash] = entry
+            while len(self._entries) > self.max_entries:
+                try:
+                    self._entries.pop(next(iter(self._entries)), None)
+                except (StopIteration, RuntimeError):
+                    break
+
+    def invalidate(self, token_hash: str) -> None:
+        with self._lock:
+            self._entries.pop(token_hash, None)
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            for token_hash, entry in list(self._entries.items()):
+                if entry.user_id == user_id:
+                    self._entries.pop(token_hash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class TokenManager:
     """Manages authentication tokens and sessions."""
 
-    def __init__(self, secret_key: Optional[str] = None, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        db_path: Optional[str] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        usage_flush_seconds: Optional[float] = None,
+    ):
         """Initialize token manager.
 
         Args:
             secret_key: Secret key for token signing (generated if not provided)
             db_path: Path to SQLite database for token storage
+            cache_ttl_seconds: Verified-token cache TTL (config default; 0 disables)
+            usage_flush_seconds: Interval for writing batched last_used updates
         """
         self.secret_key = secret_key or self._generate_secret_key()
         self.db_path = db_path or self._get_default_db_path()
         self.lock = threading.RLock()
+
+        from ..config import get_config
+        config = get_config()
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = getattr(config, "auth_token_cache_ttl_seconds", 30.0)
+        if usage_flush_seconds is None:
+            usage_flush_seconds = getattr(config, "auth_usage_flush_seconds", 15.0)
+        self.token_cache = VerifiedTokenCache(
+            ttl_seconds=cache_ttl_seconds,
+            max_entries=getattr(config, "auth_token_cache_max_entries", 1024),
+        )
+        self.usage_flush_seconds = usage_flush_seconds
+        self._pending_usage: Dict[str, str] = {}
+        self._usage_lock = threading.Lock()
+        self._usage_stop = threading.Event()
+        self._usage_thread: Optional[threading.Thread] = None
         self._init_database()
 
     def _generate_secret_key(self) -> str:
@@ -199,23 +294,32 @@ class TokenManager:
     def verify_token(self, token_value: str) -> Optional[str]:
         """Verify a token and return user_id if valid.
 
+        Recently verified tokens are answered from the in-memory cache
+        without a lock or a database round trip. last_used is recorded in
+        memory and written by the periodic usage flush.
+
         Args:
             token_value: Token value to verify
 
         Returns:
             User ID if token is valid, None otherwise
         """
-        with self.lock:
-            token_hash = self._hash_token(token_value)
+        token_hash = self._hash_token(token_value)
+        now = datetime.now(timezone.utc)
 
+        user_id = self.token_cache.get(token_hash, now)
+        if user_id is not None:
+            self._record_usage(token_hash, now)
+            return user_id
+
+        # Serialised with revocation so a revoked token is never re-cached
+        with self.lock:
             try:
                 conn = sqlite3.connect(self.db_path, timeout=5)
                 cursor = conn.cursor()
 
-                now = datetime.now(timezone.utc)
-
                 cursor.execute('''
-                    SELECT user_id FROM auth_tokens
+                    SELECT user_id, expires_at FROM auth_tokens
                     WHERE token_hash = ? AND is_revoked = 0 AND expires_at > ?
                 ''', (token_hash, now.isoformat()))
 
@@ -223,10 +327,11 @@ class TokenManager:
                 conn.close()
 
                 if result:
-                    # Update last_used
-                    self._update_token_usage(token_hash)
-                    return result[0]
-            except sqlite3.Error:
+                    user_id, expires_at = result
+                    self.token_cache.put(token_hash, user_id, datetime.fromisoformat(expires_at))
+                    self._record_usage(token_hash, now)
+                    return user_id
+            except (sqlite3.Error, ValueError):
                 pass
 
             return None
@@ -242,6 +347,7 @@ class TokenManager:
         """
         with self.lock:
             token_hash = self._hash_token(token_value)
+            self.token_cache.invalidate(token_hash)
 
             try:
                 conn = sqlite3.connect(self.db_path, timeout=5)
@@ -269,6 +375,7 @@ class TokenManager:
             Number of tokens revoked
         """
         with self.lock:
+            self.token_cache.invalidate_user(user_id)
             try:
                 conn = sqlite3.connect(self.db_path, timeout=5)
                 cursor = conn.cursor()
@@ -289,17 +396,56 @@ class TokenManager:
         """Hash a token value for storage."""
         return hashlib.sha256(token_value.encode()).hexdigest()
 
-    def _update_token_usage(self, token_hash: str) -> None:
-        """Update last_used timestamp for a token."""
+    def _record_usage(self, token_hash: str, now: datetime) -> None:
+        """Queue a last_used update for the next flush (best effort)."""
+        self._pending_usage[token_hash] = now.isoformat()
+        if self._usage_thread is None:
+            self._start_usage_flusher()
+
+    def _start_usage_flusher(self) -> None:
+        with self._usage_lock:
+            if self._usage_thread is not None:
+                return
+            self._usage_stop.clear()
+            self._usage_thread = threading.Thread(
+                target=self._run_usage_flusher, name="actifix-auth-usage", daemon=True
+            )
+            self._usage_thread.start()
+
+    def _run_usage_flusher(self) -> None:
+        while not self._usage_stop.wait(self.usage_flush_seconds):
+            self.flush_usage()
+
+    def flush_usage(self) -> int:
+        """Write queued last_used updates in one transaction.
+
+        Returns:
+            Number of tokens updated
+        """
+        with self._usage_lock:
+            pending, self._pending_usage = self._pending_usage, {}
+        if not pending:
+            return 0
         try:
             conn = sqlite3.connect(self.db_path, timeout=5)
-            cursor = conn.cursor()
-            now = datetime.now(timezone.utc)
-            cursor.execute('UPDATE auth_tokens SET last_used = ? WHERE token_hash = ?', (now.isoformat(), token_hash))
+            conn.executemany(
+                'UPDATE auth_tokens SET last_used = ? WHERE token_hash = ?',
+                [(last_used, token_hash) for token_hash, last_used in pending.items()],
+            )
             conn.commit()
             conn.close()
         except sqlite3.Error:
-            pass
+            return 0
+        return len(pending)
+
+    def close(self) -> None:
+        """Stop the usage flusher and write any queued usage."""
+        self._usage_stop.set()
+        thread = self._usage_thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._usage_thread = None
+        self.flush_usage()
 
 
 class UserManager:
@@ -314,6 +460,8 @@ class UserManager:
         self.db_path = db_path or self._get_default_db_path()
         self.lock = threading.RLock()
         self.token_manager = TokenManager(db_path=db_path)
+        # user_id -> (is_active, monotonic deadline); shares the token cache TTL
+        self._active_cache: Dict[str, Tuple[bool, float]] = {}
 
     def _get_default_db_path(self) -> str:
         """Get default database path."""
@@ -337,6 +485,7 @@ class UserManager:
             password_hash = self._hash_password(password)
             now = datetime.now(timezone.utc)
             roles_json = json.dumps([r.value for r in roles])
+            self._active_cache.pop(user_id, None)
 
             try:
                 conn = sqlite3.connect(self.db_path, timeout=5)
@@ -442,6 +591,25 @@ class UserManager:
 
             return None
 
+    def is_active(self, user_id: str) -> bool:
+        """Whether a user exists and is active (cached like verified tokens).
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the user exists and is active
+        """
+        cached = self._active_cache.get(user_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        user = self.get_user(user_id)
+        active = user is not None and user.is_active
+        ttl = self.token_manager.token_cache.ttl_seconds
+        if ttl > 0:
+            self._active_cache[user_id] = (active, time.monotonic() + ttl)
+        return active
+
     def _hash_password(self, password: str) -> str:
         """Hash a password using PBKDF2."""
         import hashlib
@@ -587,6 +755,10 @@ def get_authorization_manager() -> AuthorizationManager:
 def reset_auth_managers() -> None:
     """Reset all auth managers (for testing)."""
     global _token_manager, _user_manager, _auth_manager
+    if _token_manager is not None:
+        _token_manager.close()
+    if _user_manager is not None:
+        _user_manager.token_manager.close()
     _token_manager = None
     _user_manager = None
     _auth_manager = None
@@ -4,24 +4,40 @@
 """
 Rate Limiter - Prevent abuse of external AI provider APIs.
 
-Implements token bucket rate limiting with:
+Implements sliding-window rate limiting with:
 - Per-provider limits (API calls per time window)
 - Configurable time windows (minute, hour, day)
-- Thread-safe enforcement
-- Persistent state tracking
+- O(1) checks over fixed-width bucket counters
+- Thread-safe enforcement, optionally shared across processes
+  through a memory-mapped state file
+- Asynchronous, batched persistence of call records
 - Detailed logging of violations
 
-Version: 1.0.0
+Version: 2.0.0
 """
 
-import json
+import mmap
+import os
 import sqlite3
 import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+# (window label, window seconds, bucket count)
+_WINDOWS: Tuple[Tuple[str, int, int], ...] = (
+    ("minute", 60, 60),
+    ("hour", 3600, 60),
+    ("day", 86400, 96),
+)
+# Recent APICall records kept per provider for inspection only
+_HISTORY_LIMIT = 1000
+# Minimum interval between deletes of expired api_calls rows
+_CLEANUP_INTERVAL_SECONDS = 600.0
 
 
 class RateLimitError(Exception):
@@ -52,12 +68,218 @@ class APICall:
     error: Optional[str] = None
 
 
+def _window_cells(buckets: int) -> int:
+    """Integers needed to store one window (see _SlidingWindow)."""
+    return 3 + 2 * (buckets + 1)
+
+
+class _SlidingWindow:
+    """Call and failure counts for one window, in a ring of buckets.
+
+    ``cells`` is any mutable int sequence laid out as
+    ``[head, total, failed, counts..., failures...]``: a list for the
+    in-process backend or a view into the shared state file. ``head`` is
+    the absolute index of the newest bucket (0 means empty), so expired
+    buckets are found by arithmetic and every operation is O(1)
+    amortised.
+
+    One bucket more than the window needs is kept, so counts cover
+    between ``seconds`` and ``seconds`` plus one bucket width. Limits are
+    therefore never exceeded; capacity is at worst released one bucket
+    late (1s, 1min and 15min for the minute, hour and day windows).
+    """
+
+    __slots__ = ("cells", "width", "size")
+
+    def __init__(self, cells, seconds: int, buckets: int):
+        self.cells = cells
+        self.width = seconds / buckets
+        self.size = buckets + 1
+
+    def _advance(self, now: float) -> int:
+        """Expire buckets older than the window; return the current slot."""
+        cells, size = self.cells, self.size
+        index = int(now // self.width)
+        head = cells[0]
+        if head <= 0 or index - head >= size:
+            for i in range(1, 3 + 2 * size):
+                cells[i] = 0
+            cells[0] = index
+            return index % size
+        while head < index:
+            head += 1
+            slot = head % size
+            cells[1] -= cells[3 + slot]
+            cells[2] -= cells[3 + size + slot]
+            cells[3 + slot] = 0
+            cells[3 + size + slot] = 0
+        # A clock stepping backwards keeps counting into the newest bucket
+        cells[0] = head
+        return head % size
+
+    def add(self, now: float, failed: bool) -> None:
+        slot = self._advance(now)
+        self.cells[3 + slot] += 1
+        self.cells[1] += 1
+        if failed:
+            self.cells[3 + self.size + slot] += 1
+            self.cells[2] += 1
+
+    def counts(self, now: float) -> Tuple[int, int]:
+        """Return (calls, failed calls) within the window."""
+        self._advance(now)
+        return self.cells[1], self.cells[2]
+
+
+class _LocalRateLimitState:
+    """Per-process window counters (the default backend)."""
+
+    shared = False
+
+    def __init__(self):
+        self._windows: Dict[str, Tuple[_SlidingWindow, ...]] = {}
+
+    def windows(self, provider: str) -> Tuple[_SlidingWindow, ...]:
+        windows = self._windows.get(provider)
+        if windows is None:
+            windows = tuple(
+                _SlidingWindow([0] * _window_cells(buckets), seconds, buckets)
+                for _label, seconds, buckets in _WINDOWS
+            )
+            self._windows[provider] = windows
+        return windows
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        yield
+
+    def close(self) -> None:
+        self._windows.clear()
+
+
+class SharedRateLimitState:
+    """Window counters in a memory-mapped file shared between processes.
+
+    Every process (API workers, agents) that opens the same file enforces
+    one global limit per provider. Updates are serialised with an
+    advisory file lock (fcntl, or msvcrt on Windows) held only for the
+    few integer updates of a check or record. Provider slots are
+    allocated on first use; once all MAX_PROVIDERS slots are taken,
+    further providers are counted per process.
+    """
+
+    MAGIC = b"AFRL0001"
+    HEADER_BYTES = 64
+    NAME_BYTES = 64
+    MAX_PROVIDERS = 64
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._slot_bytes = self.NAME_BYTES + 8 * sum(_window_cells(b) for _l, _s, b in _WINDOWS)
+        self._size = self.HEADER_BYTES + self.MAX_PROVIDERS * self._slot_bytes
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o600)
+        self._slots: Dict[str, Tuple[_SlidingWindow, ...]] = {}
+        self._views: List[memoryview] = []
+        self._overflow = _LocalRateLimitState()
+        try:
+            with self._file_lock():
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                magic = os.read(self._fd, len(self.MAGIC))
+                if os.fstat(self._fd).st_size != self._size or magic != self.MAGIC:
+                    # New file or another layout: start from zeroed counters
+                    os.ftruncate(self._fd, 0)
+                    os.ftruncate(self._fd, self._size)
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    os.write(self._fd, self.MAGIC)
+            self._mm = mmap.mmap(self._fd, self._size)
+            self._view = memoryview(self._mm)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            return
+        try:
+            import msvcrt
+        except ImportError:
+            # No advisory locking available: callers' thread lock only
+            yield
+            return
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def locked(self):
+        return self._file_lock()
+
+    def _encode_name(self, provider: str) -> bytes:
+        name = provider.encode("utf-8")
+        if len(name) > self.NAME_BYTES:
+            import hashlib
+            name = hashlib.sha256(name).hexdigest().encode("ascii")
+        return name.ljust(self.NAME_BYTES, b"\0")
+
+    def windows(self, provider: str) -> Tuple[_SlidingWindow, ...]:
+        """Windows for ``provider`` (call with ``locked()`` held)."""
+        windows = self._slots.get(provider)
+        if windows is not None:
+            return windows
+        name = self._encode_name(provider)
+        for slot in range(self.MAX_PROVIDERS):
+            offset = self.HEADER_BYTES + slot * self._slot_bytes
+            current = bytes(self._view[offset:offset + self.NAME_BYTES])
+            if current == name or not current.strip(b"\0"):
+                if current != name:
+                    self._view[offset:offset + self.NAME_BYTES] = name
+                break
+        else:
+            return self._overflow.windows(provider)
+
+        cursor = offset + self.NAME_BYTES
+        windows = []
+        for _label, seconds, buckets in _WINDOWS:
+            length = 8 * _window_cells(buckets)
+            view = self._view[cursor:cursor + length].cast("q")
+            self._views.append(view)
+            windows.append(_SlidingWindow(view, seconds, buckets))
+            cursor += length
+        self._slots[provider] = windows = tuple(windows)
+        return windows
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._slots.clear()
+        self._view.release()
+        self._mm.close()
+        os.close(self._fd)
+
+
 class RateLimiter:
     """
     Thread-safe rate limiter for AI provider API calls.
 
-    Uses token bucket algorithm to enforce rate limits.
-    Tracks calls in memory and persists to database.
+    Counts calls in bucketed sliding windows (O(1) per check) held in
+    process memory or, with the shared backend, in a memory-mapped file
+    used by every process. Call records are persisted to the database in
+    background batches.
     """
 
     # Default rate limits (conservative to avoid abuse)
@@ -90,16 +312,39 @@ class RateLimiter:
         ),
     }
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        shared_state_path: Optional[str] = None,
+        flush_seconds: Optional[float] = None,
+    ):
         """Initialize the rate limiter.
 
         Args:
             db_path: Path to SQLite database for tracking calls
+            shared_state_path: Memory-mapped counter file shared with other
+                processes (config ``rate_limit_backend`` default)
+            flush_seconds: Interval for writing batched call records
         """
         self.db_path = db_path or self._get_default_db_path()
         self.lock = threading.RLock()
-        self.call_history: Dict[str, list] = {}  # In-memory cache
+        self.call_history: Dict[str, Deque[APICall]] = {}  # Recent calls, inspection only
         self.limits = self.DEFAULT_LIMITS.copy()
+
+        from ..config import get_config
+        config = get_config()
+        if flush_seconds is None:
+            flush_seconds = getattr(config, "rate_limit_flush_seconds", 2.0)
+        if shared_state_path is None and getattr(config, "rate_limit_backend", "memory") == "shared":
+            shared_state_path = str(Path(self.db_path).with_name('rate_limits.state'))
+        self.state = self._open_state(shared_state_path)
+
+        self.flush_seconds = flush_seconds
+        self._pending_calls: List[APICall] = []
+        self._persist_lock = threading.Lock()
+        self._persist_stop = threading.Event()
+        self._persist_thread: Optional[threading.Thread] = None
+        self._last_cleanup = float("-inf")
         self._init_database()
 
     def _get_default_db_path(self) -> str:
@@ -108,6 +353,23 @@ class RateLimiter:
         paths = get_actifix_paths()
         return str(Path(paths.state_dir) / 'rate_limits.db')
 
+    def _open_state(self, shared_state_path: Optional[str]):
+        """Open the counter backend, falling back to per-process counters."""
+        if not shared_state_path:
+            return _LocalRateLimitState()
+        try:
+            return SharedRateLimitState(Path(shared_state_path))
+        except (OSError, ValueError) as e:
+            from ..log_utils import log_event
+            log_event(
+                "RATE_LIMIT_SHARED_STATE_UNAVAILABLE",
+                f"Shared rate limit state unavailable, using per-process limits: {e}",
+                extra={"path": str(shared_state_path)},
+                source="security.rate_limiter",
+                level="WARNING",
+            )
+            return _LocalRateLimitState()
+
     def _init_database(self) -> None:
         """Initialize database for rate limit tracking."""
         try:
@@ -150,6 +412,12 @@ class RateLimiter:
         with self.lock:
             self.limits[provider] = config
 
+    def _window_counts(self, provider: str) -> List[Tuple[int, int]]:
+        """(calls, failures) per window in _WINDOWS order."""
+        now = time.time()
+        with self.lock, self.state.locked():
+            return [window.counts(now) for window in self.state.windows(provider)]
+
     def check_rate_limit(self, provider: str) -> None:
         """Check if a call to a provider would exceed rate limits.
 
@@ -159,42 +427,32 @@ class RateLimiter:
         Raises:
             RateLimitError: If rate limit would be exceeded
         """
-        with self.lock:
-            # Get the provider's configuration
-            config = self.limits.get(provider)
-
-            if not config or not config.enabled:
-                return  # No limit or limit disabled
-
-            now = datetime.now(timezone.utc)
+        # Get the provider's configuration
+        config = self.limits.get(provider)
 
-            # Count calls in each time window
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            day_ago = now - timedelta(days=1)
+        if not config or not config.enabled:
+            return  # No limit or limit disabled
 
-            calls_in_minute = self._count_calls_since(provider, minute_ago)
-            calls_in_hour = self._count_calls_since(provider, hour_ago)
-            calls_in_day = self._count_calls_since(provider, day_ago)
+        (calls_in_minute, _), (calls_in_hour, _), (calls_in_day, _) = self._window_counts(provider)
 
-            # Check limits
-            if calls_in_minute >= config.calls_per_minute:
-                raise RateLimitError(
-                    f"Rate limit exceeded for {provider}: "
-                    f"{calls_in_minute}/{config.calls_per_minute} calls in last minute"
-                )
+        # Check limits
+        if calls_in_minute >= config.calls_per_minute:
+            raise RateLimitError(
+                f"Rate limit exceeded for {provider}: "
+                f"{calls_in_minute}/{config.calls_per_minute} calls in last minute"
+            )
 
-            if calls_in_hour >= config.calls_per_hour:
-                raise RateLimitError(
-                    f"Rate limit exceeded for {provider}: "
-                    f"{calls_in_hour}/{config.calls_per_hour} calls in last hour"
-                )
+        if calls_in_hour >= config.calls_per_hour:
+            raise RateLimitError(
+                f"Rate limit exceeded for {provider}: "
+                f"{calls_in_hour}/{config.calls_per_hour} calls in last hour"
+            )
 
-            if calls_in_day >= config.calls_per_day:
-                raise RateLimitError(
-                    f"Rate limit exceeded for {provider}: "
-                    f"{calls_in_day}/{config.calls_per_day} calls in last 24 hours"
-                )
+        if calls_in_day >= config.calls_per_day:
+            raise RateLimitError(
+                f"Rate limit exceeded for {provider}: "
+                f"{calls_in_day}/{config.calls_per_day} calls in last 24 hours"
+            )
 
     def record_call(
         self,
@@ -206,6 +464,9 @@ class RateLimiter:
     ) -> None:
         """Record an API call for rate limiting tracking.
 
+        Counters are updated immediately; the call record is queued and
+        written to the database by the background flush.
+
         Args:
             provider: Provider name
             success: Whether the call succeeded
@@ -213,28 +474,27 @@ class RateLimiter:
             cost_usd: Cost in USD (if applicable)
             error: Error message if failed
         """
-        with self.lock:
-            now = datetime.now(timezone.utc)
-
-            call = APICall(
-                provider=provider,
-                timestamp=now,
-                success=success,
-                tokens_used=tokens_used,
-                cost_usd=cost_usd,
-                error=error,
-            )
+        now = time.time()
+        call = APICall(
+            provider=provider,
+            timestamp=datetime.fromtimestamp(now, timezone.utc),
+            success=success,
+            tokens_used=tokens_used,
+            cost_usd=cost_usd,
+            error=error,
+        )
 
-            # Update in-memory cache
-            if provider not in self.call_history:
-                self.call_history[provider] = []
-            self.call_history[provider].append(call)
+        with self.lock:
+            with self.state.locked():
+                for window in self.state.windows(provider):
+                    window.add(now, failed=not success)
 
-            # Persist to database
-            self._persist_call(call)
+            history = self.call_history.get(provider)
+            if history is None:
+                history = self.call_history[provider] = deque(maxlen=_HISTORY_LIMIT)
+            history.append(call)
 
-            # Clean up old records (older than 24 hours)
-            self._cleanup_old_records()
+        self._queue_call(call)
 
     def get_usage_stats(self, provider: str) -> Dict[str, int]:
         """Get usage statistics for a provider.
@@ -245,83 +505,86 @@ class RateLimiter:
         Returns:
             Dictionary with usage stats
         """
-        with self.lock:
-            now = datetime.now(timezone.utc)
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            day_ago = now - timedelta(days=1)
-
-            stats = {
-                'provider': provider,
-                'calls_last_minute': self._count_calls_since(provider, minute_ago),
-                'calls_last_hour': self._count_calls_since(provider, hour_ago),
-                'calls_last_day': self._count_calls_since(provider, day_ago),
-                'successful_calls': self._count_successful_calls(provider),
-                'failed_calls': self._count_failed_calls(provider),
-            }
-
-            # Add limit information if available
-            config = self.limits.get(provider)
-            if config:
-                stats['limit_minute'] = config.calls_per_minute
-                stats['limit_hour'] = config.calls_per_hour
-                stats['limit_day'] = config.calls_per_day
-
-            return stats
-
-    def _count_calls_since(self, provider: str, since: datetime) -> int:
-        """Count calls since a specific time."""
-        if provider not in self.call_history:
-            return 0
-
-        count = 0
-        for call in self.call_history[provider]:
-            if call.timestamp >= since:
-                count += 1
-
-        return count
-
-    def _count_successful_calls(self, provider: str) -> int:
-        """Count successful calls for a provider."""
-        if provider not in self.call_history:
-            return 0
-
-        return sum(1 for call in self.call_history[provider] if call.success)
-
-    def _count_failed_calls(self, provider: str) -> int:
-        """Count failed calls for a provider."""
-        if provider not in self.call_history:
-            return 0
-
-        return sum(1 for call in self.call_history[provider] if not call.success)
-
-    def _persist_call(self, call: APICall) -> None:
-        """Persist a call record to database."""
-        try:
-            conn = sqlite3.connect(self.db_path, timeout=5)
-            cursor = conn.cursor()
+        (minute, _), (hour, _), (day, failed) = self._window_counts(provider)
+        stats = {
+            'provider': provider,
+            'calls_last_minute': minute,
+            'calls_last_hour': hour,
+            'calls_last_day': day,
+            'successful_calls': day - failed,
+            'failed_calls': failed,
+        }
+
+        # Add limit information if available
+        config = self.limits.get(provider)
+        if config:
+            stats['limit_minute'] = config.calls_per_minute
+            stats['limit_hour'] = config.calls_per_hour
+            stats['limit_day'] = config.calls_per_day
+
+        return stats
+
+    def _queue_call(self, call: APICall) -> None:
+        """Queue a call record for the next batched write."""
+        with self._persist_lock:
+            self._pending_calls.append(call)
+        if self._persist_thread is None:
+            self._start_persist_thread()
+
+    def _start_persist_thread(self) -> None:
+        with self._persist_lock:
+            if self._persist_thread is not None:
+                return
+            self._persist_stop.clear()
+            self._persist_thread = threading.Thread(
+                target=self._run_persist_thread, name="actifix-rate-limit-persist", daemon=True
+            )
+            self._persist_thread.start()
 
-            cursor.execute('''
-                INSERT INTO api_calls
-                (provider, timestamp, success, tokens_used, cost_usd, error)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                call.provider,
-                call.timestamp.isoformat(),
-                call.success,
-                call.tokens_used,
-                call.cost_usd,
-                call.error,
-            ))
+    def _run_persist_thread(self) -> None:
+        while not self._persist_stop.wait(self.flush_seconds):
+            self.flush()
 
-            conn.commit()
-            conn.close()
-        except sqlite3.Error:
-            # Database persistence failure shouldn't block operation
-            pass
+    def flush(self) -> int:
+        """Write queued call records in one transaction.
+
+        Returns:
+            Number of call records written
+        """
+        with self._persist_lock:
+            pending, self._pending_calls = self._pending_calls, []
+        if pending:
+            try:
+                conn = sqlite3.connect(self.db_path, timeout=5)
+                # OR IGNORE skips providers outside the table's CHECK list
+                conn.executemany('''
+                    INSERT OR IGNORE INTO api_calls
+                    (provider, timestamp, success, tokens_used, cost_usd, error)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (
+                        call.provider,
+                        call.timestamp.isoformat(),
+                        call.success,
+                        call.tokens_used,
+                        call.cost_usd,
+                        call.error,
+                    )
+                    for call in pending
+                ])
+                conn.commit()
+                conn.close()
+            except sqlite3.Error:
+                # Database persistence failure shouldn't block operation
+                return 0
+
+        if time.monotonic() - self._last_cleanup >= _CLEANUP_INTERVAL_SECONDS:
+            self._cleanup_old_records()
+        return len(pending)
 
     def _cleanup_old_records(self) -> None:
         """Remove API call records older than 24 hours."""
+        self._last_cleanup = time.monotonic()
         try:
             cutoff = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
 
@@ -334,19 +597,21 @@ class RateLimiter:
 
             conn.commit()
             conn.close()
-
-            # Also clean up in-memory cache
-            with self.lock:
-                for provider in self.call_history:
-                    cutoff_dt = datetime.now(timezone.utc) - timedelta(days=1)
-                    self.call_history[provider] = [
-                        call for call in self.call_history[provider]
-                        if call.timestamp >= cutoff_dt
-                    ]
-
         except sqlite3.Error:
             pass
 
+    def close(self) -> None:
+        """Stop the persist thread, write queued records and release state."""
+        self._persist_stop.set()
+        thread = self._persist_thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._persist_thread = None
+        self.flush()
+        with self.lock:
+            self.state.close()
+            self.state = _LocalRateLimitState()
+
 
 # Global rate limiter instance
 _rate_limiter: Optional[RateLimiter] = None
@@ -369,4 +634,6 @@ def reset_rate_limiter() -> None:
     """Reset the global rate limiter (for testing)."""
     global _rate_limiter
     with _limiter_lock:
+        if _rate_limiter is not None:
+            _rate_limiter.close()
         _rate_limiter = None
@@ -9,25 +9,33 @@ Implements ticket-specific rate limiting with:
 - Time-window enforcement (per hour, per 4 hours, per day)
 - Emergency brake for ticket floods (>200 tickets in 1 minute)
 - Thread-safe enforcement
-- Persistent state tracking
+- O(1) checks against in-memory sliding windows, seeded from and
+  periodically reconciled with the tickets table
 
 This prevents:
 1. Accidental ticket floods from loops or recursive errors
 2. System overload from too many tickets
 3. Database bloat from excessive ticket creation
 
-Version: 1.0.0
+Version: 2.0.0
 """
 
-import sqlite3
+import heapq
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
-from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from ..raise_af import TicketPriority
 
+# Window each throttled priority is limited over, in seconds
+_PRIORITY_WINDOW_SECONDS: Dict[str, int] = {
+    "P2": 3600,
+    "P3": 4 * 3600,
+    "P4": 86400,
+}
+
 
 class TicketThrottleError(Exception):
     """Raised when ticket creation would exceed throttling limits."""
@@ -50,68 +58,138 @@ class ThrottleConfig:
     # P0 and P1 are never throttled - they're critical
     enabled: bool = True
 
+    # How often in-memory windows are rebuilt from the tickets table
+    reconcile_seconds: float = 30.0
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
 
 class TicketThrottler:
     """
     Thread-safe ticket throttler to prevent excessive ticket creation.
 
     Enforces per-priority rate limits and emergency brake for ticket floods.
+
+    Each priority keeps a creation log (created_at_ms, ticket_id) trimmed
+    to the window it is checked against, plus one log of P2-P4 creations
+    for the emergency brake. Logs are appended in time order and trimmed
+    from the front, so a check is O(1) amortised and decisions match
+    counting the tickets table directly.
+
+    The logs are seeded from the tickets table on first use and merged
+    with it every ``reconcile_seconds``, which picks up tickets created by
+    other processes. Each priority is read over its own window only, and
+    the read happens outside the lock so checks on other threads never
+    wait on the database. ``record_ticket`` ignores ticket ids the logs
+    already hold, so a ticket is never counted twice.
     """
 
-    def __init__(self, config: Optional[ThrottleConfig] = None, db_path: Optional[str] = None):
+    def __init__(self, config: Optional[ThrottleConfig] = None, repository: Optional[Any] = None):
         """Initialize the ticket throttler.
 
         Args:
             config: Throttle configuration (uses defaults if None)
-            db_path: Path to SQLite database for tracking tickets
+            repository: Ticket repository to seed from (global repository if None)
         """
         self.config = config or ThrottleConfig()
-        self.db_path = db_path or self._get_default_db_path()
+        self.repository = repository
         self.lock = threading.RLock()
-        self.ticket_history: Dict[str, List[datetime]] = {}  # In-memory cache
-        self._init_database()
+        self.ticket_history: Dict[str, Deque[Tuple[int, str]]] = {
+            priority.value: deque() for priority in TicketPriority
+        }
+        self._emergency: Deque[Tuple[int, str]] = deque()
+        self._known_ids: Set[str] = set()
+        self._reconciled_at = float("-inf")
+
+    def _emergency_window_ms(self) -> int:
+        return self.config.emergency_window_minutes * 60_000
+
+    def _retention_ms(self, priority: str) -> int:
+        """How long creations of ``priority`` stay in its log."""
+        window = _PRIORITY_WINDOW_SECONDS.get(priority)
+        if window is None:
+            # P0/P1 are only counted for stats over the emergency window
+            return self._emergency_window_ms()
+        return window * 1000
+
+    def _trim(self, log: Deque[Tuple[int, str]], cutoff_ms: int, forget: bool = True) -> None:
+        while log and log[0][0] < cutoff_ms:
+            _, ticket_id = log.popleft()
+            if forget:
+                self._known_ids.discard(ticket_id)
+
+    def _append(self, priority: str, created_ms: int, ticket_id: str) -> None:
+        log = self.ticket_history.setdefault(priority, deque())
+        self._trim(log, created_ms - self._retention_ms(priority))
+        log.append((created_ms, ticket_id))
+        if priority in _PRIORITY_WINDOW_SECONDS:
+            self._emergency.append((created_ms, ticket_id))
+        self._known_ids.add(ticket_id)
+
+    def _count(self, priority: str, now_ms: int) -> int:
+        log = self.ticket_history.get(priority)
+        if not log:
+            return 0
+        self._trim(log, now_ms - self._retention_ms(priority))
+        return len(log)
+
+    def _count_emergency(self, now_ms: int) -> int:
+        # Ids stay known until the priority log itself drops them
+        self._trim(self._emergency, now_ms - self._emergency_window_ms(), forget=False)
+        return len(self._emergency)
 
-    def _get_default_db_path(self) -> str:
-        """Get default database path for throttle tracking data."""
-        from ..state_paths import get_actifix_paths
-        paths = get_actifix_paths()
-        return str(Path(paths.state_dir) / 'ticket_throttle.db')
+    def reconcile(self) -> bool:
+        """Merge the creation logs with the tickets table.
 
-    def _init_database(self) -> None:
-        """Initialize database for ticket throttle tracking."""
+        Returns:
+            True if the logs were rebuilt, False if the database could not
+            be read (the in-memory logs are kept).
+        """
+        with self.lock:
+            # Claim this round so concurrent checks do not start another
+            self._reconciled_at = time.monotonic()
+            priorities = list(self.ticket_history)
+        now_ms = _now_ms()
+        since = {priority: now_ms - self._retention_ms(priority) for priority in priorities}
         try:
-            conn = sqlite3.connect(self.db_path, timeout=5)
-            cursor = conn.cursor()
-
-            # Create ticket throttle tracking table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS ticket_creations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    priority TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    ticket_id TEXT,
-                    error_type TEXT,
-                    CHECK (priority IN ('P0', 'P1', 'P2', 'P3', 'P4'))
+            repository = self.repository
+            if repository is None:
+                from ..persistence.ticket_repo import get_ticket_repository
+                repository = get_ticket_repository()
+            stored = repository.get_creations_since(since)
+        except Exception:
+            return False
+
+        with self.lock:
+            now_ms = _now_ms()
+            self._known_ids.clear()
+            for priority, log in self.ticket_history.items():
+                rows = stored.get(priority, [])
+                seen = {ticket_id for ticket_id, _ in rows}
+                # Keep local records the table does not hold (yet): stricter wins
+                merged = heapq.merge(
+                    ((created_ms, ticket_id) for ticket_id, created_ms in rows),
+                    [entry for entry in log if entry[1] not in seen],
                 )
-            ''')
-
-            # Create index for efficient queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_ticket_creations_priority_timestamp
-                ON ticket_creations(priority, timestamp)
-            ''')
-
-            # Create index for emergency brake queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_ticket_creations_timestamp
-                ON ticket_creations(timestamp)
-            ''')
-
-            conn.commit()
-            conn.close()
-        except sqlite3.Error:
-            # Database errors shouldn't block operation
-            pass
+                cutoff_ms = now_ms - self._retention_ms(priority)
+                log.clear()
+                log.extend(entry for entry in merged if entry[0] >= cutoff_ms)
+                self._known_ids.update(ticket_id for _, ticket_id in log)
+            emergency_cutoff_ms = now_ms - self._emergency_window_ms()
+            self._emergency = deque(
+                entry
+                for entry in heapq.merge(
+                    *(self.ticket_history.get(p, ()) for p in _PRIORITY_WINDOW_SECONDS)
+                )
+                if entry[0] >= emergency_cutoff_ms
+            )
+            return True
+
+    def _reconcile_if_due(self) -> None:
+        if time.monotonic() - self._reconciled_at >= self.config.reconcile_seconds:
+            self.reconcile()
 
     def check_throttle(self, priority: TicketPriority, error_type: str = "unknown") -> None:
         """Check if creating a ticket would exceed throttle limits.
@@ -126,18 +204,13 @@ class TicketThrottler:
         if not self.config.enabled:
             return
 
+        self._reconcile_if_due()
         with self.lock:
-            now = datetime.now(timezone.utc)
+            now_ms = _now_ms()
 
-            # EMERGENCY BRAKE: Check total ticket count in emergency window
+            # EMERGENCY BRAKE: Check P2-P4 ticket count in emergency window
             # Applies to all priorities
-            emergency_window_start = now - timedelta(minutes=self.config.emergency_window_minutes)
-            total_recent = sum(
-                1
-                for priority_key in ("P2", "P3", "P4")
-                for ts in self.ticket_history.get(priority_key, [])
-                if ts >= emergency_window_start
-            )
+            total_recent = self._count_emergency(now_ms)
 
             if total_recent >= self.config.emergency_ticket_threshold:
                 raise TicketThrottleError(
@@ -152,13 +225,10 @@ class TicketThrottler:
                 return
 
             # Priority-specific throttling
-            priority_str = priority.value
+            count = self._count(priority.value, now_ms)
 
             if priority == TicketPriority.P2:
                 # P2: Max 15 per hour
-                hour_ago = now - timedelta(hours=1)
-                count = self._count_tickets_since(priority_str, hour_ago)
-
                 if count >= self.config.max_p2_tickets_per_hour:
                     raise TicketThrottleError(
                         f"P2 ticket throttle exceeded: {count}/{self.config.max_p2_tickets_per_hour} "
@@ -167,9 +237,6 @@ class TicketThrottler:
 
             elif priority == TicketPriority.P3:
                 # P3: Max 5 per 4 hours
-                four_hours_ago = now - timedelta(hours=4)
-                count = self._count_tickets_since(priority_str, four_hours_ago)
-
                 if count >= self.config.max_p3_tickets_per_4h:
                     raise TicketThrottleError(
                         f"P3 ticket throttle exceeded: {count}/{self.config.max_p3_tickets_per_4h} "
@@ -178,9 +245,6 @@ class TicketThrottler:
 
             elif priority == TicketPriority.P4:
                 # P4: Max 2 per day
-                day_ago = now - timedelta(days=1)
-                count = self._count_tickets_since(priority_str, day_ago)
-
                 if count >= self.config.max_p4_tickets_per_day:
                     raise TicketThrottleError(
                         f"P4 ticket throttle exceeded: {count}/{self.config.max_p4_tickets_per_day} "
@@ -195,123 +259,52 @@ class TicketThrottler:
     ) -> None:
         """Record a ticket creation for throttle tracking.
 
+        The ticket row itself is the durable record; this only updates the
+        in-memory logs (no database access).
+
         Args:
             priority: Priority level of the ticket
             ticket_id: Ticket ID
             error_type: Type of error
         """
         with self.lock:
-            now = datetime.now(timezone.utc)
-            priority_str = priority.value
-
-            # Update in-memory cache
-            if priority_str not in self.ticket_history:
-                self.ticket_history[priority_str] = []
-            self.ticket_history[priority_str].append(now)
-
-            # Persist to database
-            self._persist_ticket(priority_str, now, ticket_id, error_type)
-
-            # Clean up old records
-            self._cleanup_old_records()
+            if ticket_id in self._known_ids:
+                return  # Already picked up by a reconcile
+            self._append(priority.value, _now_ms(), ticket_id)
 
-    def get_throttle_stats(self) -> Dict[str, any]:
+    def get_throttle_stats(self) -> Dict[str, Any]:
         """Get current throttle statistics.
 
         Returns:
             Dictionary with throttle stats for each priority
         """
         with self.lock:
-            now = datetime.now(timezone.utc)
+            now_ms = _now_ms()
+            # P0/P1 logs are kept for exactly the emergency window
+            critical = self._count('P0', now_ms) + self._count('P1', now_ms)
 
             stats = {
                 'emergency_brake': {
                     'window_minutes': self.config.emergency_window_minutes,
                     'threshold': self.config.emergency_ticket_threshold,
-                    'recent_count': self._count_all_tickets_since(
-                        now - timedelta(minutes=self.config.emergency_window_minutes)
-                    ),
+                    'recent_count': self._count_emergency(now_ms) + critical,
                 },
                 'P2': {
                     'limit_per_hour': self.config.max_p2_tickets_per_hour,
-                    'count_last_hour': self._count_tickets_since('P2', now - timedelta(hours=1)),
+                    'count_last_hour': self._count('P2', now_ms),
                 },
                 'P3': {
                     'limit_per_4h': self.config.max_p3_tickets_per_4h,
-                    'count_last_4h': self._count_tickets_since('P3', now - timedelta(hours=4)),
+                    'count_last_4h': self._count('P3', now_ms),
                 },
                 'P4': {
                     'limit_per_day': self.config.max_p4_tickets_per_day,
-                    'count_last_day': self._count_tickets_since('P4', now - timedelta(days=1)),
+                    'count_last_day': self._count('P4', now_ms),
                 },
             }
 
             return stats
 
-    def _count_tickets_since(self, priority: str, since: datetime) -> int:
-        """Count tickets of a specific priority since a specific time."""
-        if priority not in self.ticket_history:
-            return 0
-
-        return sum(1 for ts in self.ticket_history[priority] if ts >= since)
-
-    def _count_all_tickets_since(self, since: datetime) -> int:
-        """Count all tickets regardless of priority since a specific time."""
-        total = 0
-        for priority in self.ticket_history.values():
-            total += sum(1 for ts in priority if ts >= since)
-        return total
-
-    def _persist_ticket(self, priority: str, timestamp: datetime, ticket_id: str, error_type: str) -> None:
-        """Persist a ticket creation record to database."""
-        try:
-            conn = sqlite3.connect(self.db_path, timeout=5)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO ticket_creations
-                (priority, timestamp, ticket_id, error_type)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                priority,
-                timestamp.isoformat(),
-                ticket_id,
-                error_type,
-            ))
-
-            conn.commit()
-            conn.close()
-        except sqlite3.Error:
-            # Database persistence failure shouldn't block operation
-            pass
-
-    def _cleanup_old_records(self) -> None:
-        """Remove ticket creation records older than 24 hours."""
-        try:
-            cutoff = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
-
-            conn = sqlite3.connect(self.db_path, timeout=5)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                DELETE FROM ticket_creations WHERE timestamp < ?
-            ''', (cutoff,))
-
-            conn.commit()
-            conn.close()
-
-            # Also clean up in-memory cache
-            with self.lock:
-                cutoff_dt = datetime.now(timezone.utc) - timedelta(days=1)
-                for priority in self.ticket_history:
-                    self.ticket_history[priority] = [
-                        ts for ts in self.ticket_history[priority]
-                        if ts >= cutoff_dt
-                    ]
-
-        except sqlite3.Error:
-            pass
-
 
 # Global throttler instance
 _throttler: Optional[TicketThrottler] = None
@@ -344,6 +337,7 @@ def get_ticket_throttler(config: Optional[ThrottleConfig] = None) -> TicketThrot
                             emergency_ticket_threshold=actifix_config.emergency_ticket_threshold,
                             emergency_window_minutes=actifix_config.emergency_window_minutes,
                             enabled=actifix_config.ticket_throttling_enabled,
+                            reconcile_seconds=actifix_config.ticket_throttle_reconcile_seconds,
                         )
                     except Exception:
                         # Fall back to defaults
@@ -154,10 +154,22 @@ def isolate_actifix_db(monkeypatch, tmp_path, request):
     from actifix.persistence.database import reset_database_pool
     from actifix.persistence.ticket_repo import reset_ticket_repository
     from actifix.persistence.event_repo import reset_event_repository
+    from actifix.persistence.event_partitions import reset_event_partitions
+    from actifix.persistence.event_tail import reset_event_tail
+    from actifix.response_cache import reset_response_cache
+    from actifix.health_sampler import reset_health_sampler
+    from actifix.health import reset_sla_monitor
+    from actifix.security.admin_session import reset_admin_session_manager
     
     reset_database_pool()
     reset_ticket_repository()
     reset_event_repository()
+    reset_event_partitions()
+    reset_event_tail()
+    reset_response_cache()
+    reset_health_sampler()
+    reset_sla_monitor()
+    reset_admin_session_manager()
     
     yield
     
@@ -165,6 +177,74 @@ def isolate_actifix_db(monkeypatch, tmp_path, request):
     reset_database_pool()
     reset_ticket_repository()
     reset_event_repository()
+    reset_event_partitions()
+    reset_event_tail()
+    reset_response_cache()
+    reset_health_sampler()
+    reset_sla_monitor()
+    reset_admin_session_manager()
+
+
+@pytest.fixture
+def actifix_db_path():
+    """Path of the per-test database set up by isolate_actifix_db."""
+    return Path(os.environ["ACTIFIX_DB_PATH"])
+
+
+@pytest.fixture
+def actifix_project(tmp_path, monkeypatch):
+    """Project root under tmp_path with initialised Actifix data and state dirs."""
+    from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    init_actifix_files(get_actifix_paths(project_root=tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def events():
+    """Event repository on the per-test database."""
+    from actifix.persistence.event_repo import EventRepository
+
+    return EventRepository()
+
+
+@pytest.fixture
+def api_client(actifix_project):
+    """Flask test client for an app rooted at actifix_project."""
+    pytest.importorskip("flask")
+    from actifix.api import create_app
+
+    app = create_app(project_root=actifix_project)
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def make_entry():
+    """Factory for test tickets: make_entry(ticket_id, created_at=None, **fields)."""
+    from datetime import datetime, timezone
+
+    from actifix.raise_af import ActifixEntry, TicketPriority
+
+    def make(ticket_id, created_at=None, **fields):
+        values = dict(
+            message=f"test ticket {ticket_id}",
+            source="test/conftest.py",
+            run_label="test",
+            entry_id=ticket_id,
+            created_at=created_at or datetime.now(timezone.utc),
+            priority=TicketPriority.P2,
+            error_type="TestError",
+            stack_trace="",
+            duplicate_guard=f"{ticket_id}-guard",
+        )
+        values.update(fields)
+        return ActifixEntry(**values)
+
+    return make
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -68,7 +68,37 @@ class TestRaiseAF:
         
         ticket_id = generate_ticket_id()
         assert ticket_id.startswith("ACT-")
-        assert len(ticket_id) == 18  # ACT-YYYYMMDD-XXXXXX
+        assert len(ticket_id) == 27  # ACT-YYYYMMDD-TTTTTTSSSPPPPP
+
+    def test_generated_ids_are_unique_and_time_sortable(self):
+        import threading
+        from datetime import datetime, timezone
+        from actifix.raise_af import entry_id_timestamp, generate_entry_id
+
+        ids = []
+        lock = threading.Lock()
+
+        def worker():
+            batch = [generate_entry_id() for _ in range(2000)]
+            with lock:
+                ids.extend(batch)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == len(ids)
+        sequential = [generate_entry_id() for _ in range(100)]
+        assert sequential == sorted(sequential)
+        assert sorted(ids)[-1] < sequential[0]
+
+        stamp = entry_id_timestamp(sequential[0])
+        assert stamp is not None
+        assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 60
+        assert entry_id_timestamp("ACT-20260114-ABC12").day == 14
+        assert entry_id_timestamp("not-an-id") is None
     
     def test_generate_duplicate_guard(self):
         from actifix.raise_af import generate_duplicate_guard
@@ -7,7 +7,7 @@ import os
 import pytest
 
 from actifix.persistence.database import reset_database_pool
-from actifix.persistence.agent_voice_repo import AgentVoiceRepository
+from actifix.persistence.agent_voice_repo import AgentVoiceRepository, AgentVoiceWriter
 
 
 @pytest.fixture
@@ -32,7 +32,85 @@ def test_agent_voice_prunes_to_max_rows(isolated_db):
     for idx in range(10):
         repo.append(agent_id="test", thought=f"t{idx}", run_label="unit")
 
+    # Pruning is amortized: at most prune_every rows over the cap between passes
+    assert 5 <= repo.count() <= 5 + repo.prune_every
+    repo.prune()
     assert repo.count() == 5
     recent = repo.list_recent(limit=10)
     assert [e.thought for e in recent] == ["t9", "t8", "t7", "t6", "t5"]
 
+
+def test_agent_voice_prune_runs_on_rowid_watermark(isolated_db):
+    repo = AgentVoiceRepository(max_rows=3, prune_every=4)
+    for idx in range(8):
+        repo.append(agent_id="test", thought=f"t{idx}")
+
+    # Passes ran at ids 1 and 5 (keeping ids 3-5); the next is due at id 9
+    assert repo.count() == 6
+    repo.append(agent_id="test", thought="t8")
+    assert repo.count() == 3
+
+
+def test_agent_voice_writer_batches_appends(isolated_db):
+    repo = AgentVoiceRepository(max_rows=100)
+    writer = AgentVoiceWriter(repo=repo, batch_size=3, flush_interval_seconds=60)
+    try:
+        writer.add(agent_id="test", thought="first", level="warning", extra={"n": 1})
+        writer.add(agent_id="test", thought="second")
+        assert repo.count() == 0
+        assert writer.pending() == 2
+
+        writer.add(agent_id="test", thought="third")
+        assert repo.count() == 3
+        assert writer.pending() == 0
+
+        with pytest.raises(ValueError):
+            writer.add(agent_id="test", thought="bad level", level="LOUD")
+        writer.add(agent_id="test", thought="fourth")
+    finally:
+        writer.shutdown()
+
+    assert [e.thought for e in repo.list_recent(limit=10)] == ["fourth", "third", "second", "first"]
+    assert repo.list_recent(limit=10)[-1].level == "WARNING"
+
+
+
+def test_agent_voice_writer_requeues_failed_batch(isolated_db, monkeypatch):
+    import actifix.persistence.agent_voice_repo as agent_voice_repo
+    import actifix.raise_af as raise_af
+
+    events, tickets = [], []
+    monkeypatch.setattr(agent_voice_repo, "log_event", lambda event, *args, **kwargs: events.append(event))
+    monkeypatch.setattr(raise_af, "record_error", lambda **kwargs: tickets.append(kwargs))
+
+    repo = AgentVoiceRepository(max_rows=100)
+    writer = AgentVoiceWriter(repo=repo, batch_size=2, flush_interval_seconds=60, max_pending=3)
+
+    def fail(rows):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(repo, "append_many", fail)
+    try:
+        writer.add(agent_id="test", thought="first")
+        writer.add(agent_id="test", thought="second")
+        assert writer.pending() == 2
+        assert writer.failed_flushes == 1
+
+        # While failing, rows queue up to max_pending and the oldest drop
+        writer.add(agent_id="test", thought="third")
+        writer.add(agent_id="test", thought="fourth")
+        assert writer.flush() == 0
+        assert writer.pending() == 3
+        assert writer.dropped_rows == 1
+        assert writer.failed_flushes == 2
+        assert events == ["AGENT_VOICE_FLUSH_FAILED"] * 2
+        assert len(tickets) == 1
+        assert tickets[0]["error_type"] == "RuntimeError"
+
+        monkeypatch.delattr(repo, "append_many")
+        assert writer.flush() == 3
+    finally:
+        writer.shutdown()
+
+    assert [e.thought for e in repo.list_recent(limit=10)] == ["fourth", "third", "second"]
+    assert writer.dropped_rows == 1
@@ -161,6 +161,37 @@ class TestAPIEndpoints:
         assert response.status_code == 401
         assert response.get_json().get('valid') is False
 
+    def test_admin_session_exchange(self, test_client, monkeypatch):
+        """Admin password is exchanged once for a session token."""
+        from flask import request
+        from actifix import api
+
+        password = _ensure_admin_user()
+        response = test_client.post('/api/auth/admin-session', json={'password': 'bad-pass'})
+        assert response.status_code == 401
+        response = test_client.post('/api/auth/admin-session', json={'password': password})
+        assert response.status_code == 200
+        session = response.get_json()
+        assert session['token'].startswith('afs1.') and session['expires_in'] > 0
+
+        remote = {'REMOTE_ADDR': '10.0.0.5'}
+        app = test_client.application
+        with app.test_request_context(headers={'X-Admin-Password': password}, environ_base=remote):
+            assert api._require_auth(request)
+
+        # Session checks never fall back to PBKDF2
+        monkeypatch.setattr(api, '_verify_admin_password', lambda password: pytest.fail('PBKDF2 used'))
+        for headers in ({'X-Admin-Session': session['token']},
+                        {'Authorization': f"Bearer {session['token']}"}):
+            with app.test_request_context(headers=headers, environ_base=remote):
+                assert api._require_auth(request)
+        with app.test_request_context(headers={'X-Admin-Session': session['token'] + 'x'}, environ_base=remote):
+            assert not api._require_auth(request)
+
+        response = test_client.post('/api/auth/admin-session', headers={'X-Admin-Session': session['token']})
+        assert response.status_code == 200
+        assert response.get_json()['token'] != session['token']
+
     def test_ideas_endpoint_requires_auth(self, test_client):
         """Ideas endpoint should reject missing admin auth."""
         response = test_client.post('/api/ideas', json={'idea': 'Add export'})
@@ -32,6 +32,7 @@ from actifix.security.auth import (
     get_authorization_manager,
     reset_auth_managers,
 )
+from actifix.security.admin_session import AdminSessionError, AdminSessionManager
 
 
 class TestTokenManager:
@@ -119,6 +120,204 @@ class TestTokenManager:
             assert manager.verify_token(token2) == "user2"
 
 
+class TestVerifiedTokenCache:
+    """Test cached token verification and batched usage accounting."""
+
+    def _sqlite_connects(self, monkeypatch):
+        import sqlite3
+        from actifix.security import auth
+
+        calls = []
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(
+            auth.sqlite3, "connect", lambda *a, **k: calls.append(a) or real_connect(*a, **k)
+        )
+        return calls
+
+    def test_cached_verification_skips_database(self, monkeypatch):
+        """Repeat verifications are served from memory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = TokenManager(db_path=f"{tmpdir}/auth.db", cache_ttl_seconds=60, usage_flush_seconds=60)
+            _, token_value = manager.create_token("user123")
+            assert manager.verify_token(token_value) == "user123"
+
+            connects = self._sqlite_connects(monkeypatch)
+            for _ in range(5):
+                assert manager.verify_token(token_value) == "user123"
+            assert connects == []
+            manager.close()
+
+    def test_revocation_invalidates_cache(self):
+        """Revoked tokens stop verifying immediately."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = TokenManager(db_path=f"{tmpdir}/auth.db", cache_ttl_seconds=60)
+            _, token1 = manager.create_token("user1")
+            _, token2 = manager.create_token("user2")
+            assert manager.verify_token(token1) == "user1"
+            assert manager.verify_token(token2) == "user2"
+
+            manager.revoke_token(token1)
+            manager.revoke_all_user_tokens("user2")
+            assert manager.verify_token(token1) is None
+            assert manager.verify_token(token2) is None
+            manager.close()
+
+    def test_cache_respects_token_expiry_and_ttl(self, monkeypatch):
+        """Entries are never served past token expiry or cache TTL."""
+        from actifix.security.auth import VerifiedTokenCache
+
+        clock = [100.0]
+        monkeypatch.setattr("actifix.security.auth.time.monotonic", lambda: clock[0])
+        cache = VerifiedTokenCache(ttl_seconds=30, max_entries=2)
+        now = datetime.now(timezone.utc)
+
+        cache.put("a", "user-a", now + timedelta(hours=1))
+        cache.put("b", "user-b", now + timedelta(seconds=5))
+        assert cache.get("a", now) == "user-a"
+        assert cache.get("b", now + timedelta(seconds=6)) is None
+
+        clock[0] += 31
+        assert cache.get("a", now) is None
+
+        cache.put("c", "user-c", now + timedelta(hours=1))
+        cache.put("d", "user-d", now + timedelta(hours=1))
+        cache.put("e", "user-e", now + timedelta(hours=1))
+        assert len(cache) == 2 and cache.get("c", now) is None
+
+    def test_usage_is_flushed_in_batches(self):
+        """last_used is written by flush_usage, not on the request path."""
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = f"{tmpdir}/auth.db"
+            manager = TokenManager(db_path=db_path, cache_ttl_seconds=60, usage_flush_seconds=60)
+            _, token1 = manager.create_token("user1")
+            _, token2 = manager.create_token("user2")
+            manager.verify_token(token1)
+            manager.verify_token(token2)
+
+            def last_used():
+                conn = sqlite3.connect(db_path)
+                rows = conn.execute("SELECT last_used FROM auth_tokens").fetchall()
+                conn.close()
+                return [row[0] for row in rows]
+
+            assert last_used() == [None, None]
+            assert manager.flush_usage() == 2
+            assert all(last_used())
+            assert manager.flush_usage() == 0
+            manager.close()
+
+    def test_user_active_status_is_cached(self, monkeypatch):
+        """UserManager.is_active answers repeat lookups from memory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            user_mgr = UserManager(db_path=f"{tmpdir}/auth.db")
+            user_mgr.create_user("u1", "alice", "pw", {AuthRole.VIEWER})
+            assert user_mgr.is_active("u1") is True
+            assert user_mgr.is_active("missing") is False
+
+            connects = self._sqlite_connects(monkeypatch)
+            assert user_mgr.is_active("u1") is True
+            assert connects == []
+            user_mgr.token_manager.close()
+
+
+class _FakeClock:
+    """Stands in for the time module inside admin_session."""
+
+    def __init__(self):
+        self.now = time.time()
+        self.mono = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.mono
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.mono += seconds
+
+
+class TestAdminSessionManager:
+    """Test HMAC admin session tokens and signing key rotation."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from actifix.security import admin_session
+
+        clock = _FakeClock()
+        monkeypatch.setattr(admin_session, "time", clock)
+        return clock
+
+    def test_issue_and_verify(self, tmp_path):
+        manager = AdminSessionManager(key_file=tmp_path / "keys.json", ttl_seconds=60)
+        session = manager.issue()
+        assert session.expires_at - session.issued_at == 60
+        assert manager.verify(session.token) == "admin"
+
+        prefix, signature = session.token.rsplit(".", 1)
+        flipped = "A" if signature[0] != "A" else "B"
+        assert manager.verify(f"{prefix}.{flipped}{signature[1:]}") is None
+        assert manager.verify(session.token.replace(".admin.", ".other.")) is None
+        assert manager.verify("not-a-token") is None
+        assert manager.verify("") is None
+        assert (tmp_path / "keys.json").stat().st_mode & 0o777 == 0o600
+
+    def test_tokens_expire(self, tmp_path, clock):
+        manager = AdminSessionManager(key_file=tmp_path / "keys.json", ttl_seconds=30)
+        token = manager.issue().token
+        clock.advance(29)
+        assert manager.verify(token) == "admin"
+        clock.advance(2)
+        assert manager.verify(token) is None
+
+    def test_rotation_keeps_old_tokens_valid(self, tmp_path, clock):
+        key_file = tmp_path / "keys.json"
+        manager = AdminSessionManager(key_file=key_file, ttl_seconds=60, rotation_seconds=300)
+        old = manager.issue()
+        clock.advance(301)
+        new = manager.issue()
+        assert old.token.split(".")[1] != new.token.split(".")[1]
+        assert manager.verify(old.token) is None  # expired, not rejected for its key
+        clock.advance(-300)
+        assert manager.verify(old.token) == "admin"
+
+        # Keys older than rotation + ttl are pruned at the next rotation
+        clock.advance(1000)
+        manager.issue()
+        assert len(manager.known_key_ids()) == 1
+
+    def test_workers_share_keys_through_key_file(self, tmp_path, clock):
+        key_file = tmp_path / "keys.json"
+        first = AdminSessionManager(key_file=key_file)
+        second = AdminSessionManager(key_file=key_file)
+        token = first.issue().token
+        assert second.verify(token) == "admin"
+
+        first.rotate_keys()
+        clock.advance(1)
+        rotated = first.issue().token
+        assert second.verify(rotated) == "admin"
+        assert second.verify(token) == "admin"
+
+        first.rotate_keys(revoke_existing=True)
+        assert first.verify(rotated) is None
+        clock.advance(60)
+        assert second.verify(rotated) is None
+
+    def test_pinned_secret(self, tmp_path):
+        a = AdminSessionManager(key_file=tmp_path / "a.json", secret="s3cret")
+        b = AdminSessionManager(key_file=tmp_path / "b.json", secret="s3cret")
+        assert b.verify(a.issue().token) == "admin"
+        assert not (tmp_path / "a.json").exists()
+        with pytest.raises(AdminSessionError):
+            a.rotate_keys()
+        with pytest.raises(AdminSessionError):
+            a.issue("bad.subject")
+
+
 class TestUserManager:
     """Test user management."""
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the prefork API server (worker supervision, graceful reload and
+cross-worker event fan-out).
+"""
+
+import json
+import threading
+import time
+import urllib.request
+from multiprocessing import Pipe
+from pathlib import Path
+
+import pytest
+
+from actifix import api
+from actifix.api_server import PreforkServer, _EventChannel, _Worker
+from actifix.config import ActifixConfig, validate_config
+
+pytestmark = [pytest.mark.integration]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    # The master exports these for its workers
+    monkeypatch.setenv("ACTIFIX_RATE_LIMIT_BACKEND", "memory")
+    monkeypatch.setenv("ACTIFIX_API_WORKERS", "1")
+    return tmp_path
+
+
+def _fake_worker(index, channel):
+    return _Worker(index, 0, process=None, channel=channel, ready=threading.Event())
+
+
+def test_hub_relays_events_to_other_workers():
+    server = PreforkServer(workers=3)
+    pipes = [Pipe(duplex=True) for _ in range(3)]
+    server._workers = [_fake_worker(i, master) for i, (master, _) in enumerate(pipes)]
+    hub = threading.Thread(target=server._run_hub, daemon=True)
+    hub.start()
+    try:
+        _EventChannel(pipes[0][1]).publish("ticket_created", {"ticket_id": "ACT-1"})
+        for _, worker_end in pipes[1:]:
+            assert worker_end.poll(5)
+            assert json.loads(worker_end.recv_bytes()) == {
+                "event": "ticket_created", "data": {"ticket_id": "ACT-1"},
+            }
+        assert not pipes[0][1].poll(0.2)
+    finally:
+        server._stop.set()
+        hub.join(timeout=5)
+
+
+def test_hub_drops_channel_of_dead_worker():
+    server = PreforkServer(workers=2)
+    pipes = [Pipe(duplex=True) for _ in range(2)]
+    server._workers = [_fake_worker(i, master) for i, (master, _) in enumerate(pipes)]
+    hub = threading.Thread(target=server._run_hub, daemon=True)
+    hub.start()
+    try:
+        # A killed worker leaves the master's end at EOF
+        pipes[0][1].close()
+        deadline = time.monotonic() + 5
+        while not pipes[0][0].closed and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pipes[0][0].closed
+
+        # The hub keeps waiting (not spinning) on the live channel
+        cpu_before = time.process_time()
+        time.sleep(1.0)
+        assert time.process_time() - cpu_before < 0.5
+        assert not pipes[1][0].closed
+    finally:
+        server._stop.set()
+        hub.join(timeout=5)
+
+
+def test_emit_ticket_event_publishes_to_other_workers(monkeypatch):
+    published, emitted = [], []
+    monkeypatch.setattr(api, "emit_local_ticket_event", lambda *args: emitted.append(args))
+    api.set_event_publisher(lambda *args: published.append(args))
+    try:
+        api.emit_ticket_event("ticket_completed", {"ticket_id": "ACT-2"})
+    finally:
+        api.set_event_publisher(None)
+    assert emitted == published == [("ticket_completed", {"ticket_id": "ACT-2"})]
+
+
+def test_config_validates_worker_settings():
+    errors = validate_config(ActifixConfig(
+        project_root=Path("/tmp"), paths=None, api_workers=0, api_graceful_timeout_seconds=0
+    ))
+    assert "API workers must be at least 1" in errors
+    assert "API graceful timeout must be positive" in errors
+
+
+@pytest.mark.slow
+def test_workers_serve_and_reload_without_refusing_connections(project):
+    server = PreforkServer(port=0, workers=2, project_root=project, graceful_timeout=10)
+    server.start()
+    try:
+        assert server.wait_until_ready(60)
+        url = f"http://127.0.0.1:{server.port}/api/ping"
+        assert urllib.request.urlopen(url, timeout=10).status == 200
+
+        failures, stop = [], threading.Event()
+
+        def hammer():
+            while not stop.is_set():
+                try:
+                    urllib.request.urlopen(url, timeout=10).read()
+                except Exception as exc:
+                    failures.append(exc)
+
+        clients = [threading.Thread(target=hammer) for _ in range(3)]
+        for client in clients:
+            client.start()
+        old_pids = set(server.worker_pids)
+        assert server.reload()
+        stop.set()
+        for client in clients:
+            client.join()
+
+        assert failures == []
+        assert len(server.worker_pids) == 2
+        assert not old_pids & set(server.worker_pids)
+
+        # A killed worker is replaced
+        victim = server._workers[0]
+        victim.process.kill()
+        victim.process.join()
+        deadline = time.monotonic() + 30
+        while victim in server._workers and time.monotonic() < deadline:
+            time.sleep(0.2)
+            server._replace_dead_workers()
+        assert victim not in server._workers
+        assert server.wait_until_ready(60)
+        assert urllib.request.urlopen(url, timeout=10).status == 200
+    finally:
+        server.stop()
+    assert server.worker_pids == []
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for ETag / If-None-Match support on dashboard read endpoints."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+
+from actifix.persistence.event_repo import get_event_repository
+from actifix.persistence.ticket_repo import TicketRepository, get_ticket_repository
+from actifix.state_paths import get_actifix_paths
+
+
+def _revalidate(client, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control'] == 'no-cache'
+    return etag, client.get(url, headers={'If-None-Match': etag})
+
+
+def test_ticket_list_304_skips_queries_until_a_write(api_client, make_entry, monkeypatch):
+    get_ticket_repository().create_ticket(make_entry("ACT-20260101-ETAG1"))
+    etag, second = _revalidate(api_client, '/api/tickets?limit=5')
+    assert second.status_code == 304
+    assert second.get_data() == b''
+    assert second.headers['ETag'] == etag
+
+    calls = []
+    real_recent = TicketRepository.get_recent_tickets
+    monkeypatch.setattr(
+        TicketRepository, "get_recent_tickets",
+        lambda self, *args, **kwargs: calls.append(1) or real_recent(self, *args, **kwargs),
+    )
+    assert api_client.get('/api/tickets?limit=5', headers={'If-None-Match': etag}).status_code == 304
+    assert calls == []
+
+    # A different query is a different representation
+    assert api_client.get('/api/tickets?limit=6', headers={'If-None-Match': etag}).status_code == 200
+
+    get_ticket_repository().create_ticket(make_entry("ACT-20260101-ETAG2"))
+    changed = api_client.get('/api/tickets?limit=5', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+    assert len(changed.get_json()['tickets']) == 2
+
+
+def test_ticket_detail_and_stats_validators(api_client, make_entry):
+    repo = get_ticket_repository()
+    repo.create_ticket(make_entry("ACT-20260101-ETAG3"))
+
+    etag, second = _revalidate(api_client, '/api/ticket/ACT-20260101-ETAG3')
+    assert second.status_code == 304
+
+    repo.update_ticket("ACT-20260101-ETAG3", {"owner": "someone"})
+    updated = api_client.get('/api/ticket/ACT-20260101-ETAG3', headers={'If-None-Match': etag})
+    assert updated.status_code == 200
+    assert updated.get_json()['owner'] == 'someone'
+
+    missing = api_client.get('/api/ticket/ACT-20260101-NOPE0')
+    assert missing.status_code == 404
+    assert 'ETag' not in missing.headers
+
+    _, stats = _revalidate(api_client, '/api/stats')
+    assert stats.status_code == 304
+
+
+def test_logs_validator_tracks_newest_event(api_client):
+    events = get_event_repository()
+    events.log_event("ETAG_TEST", "first")
+
+    etag, second = _revalidate(api_client, '/api/logs?lines=10')
+    assert second.status_code == 304
+
+    events.log_event("ETAG_TEST", "second")
+    changed = api_client.get('/api/logs?lines=10', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.get_json()['content'][-1]['text'] == 'second'
+
+
+def test_logs_validator_changes_when_partitions_are_dropped(api_client):
+    from actifix.persistence.event_partitions import get_event_partitions
+
+    events = get_event_repository()
+    now = datetime.now(timezone.utc)
+    events.log_event("ETAG_TEST", "expired", timestamp=now - timedelta(days=40))
+    events.log_event("ETAG_TEST", "kept", timestamp=now)
+
+    etag, second = _revalidate(api_client, '/api/logs?lines=10')
+    assert second.status_code == 304
+
+    cutoff_ms = int((now - timedelta(days=30)).timestamp() * 1000)
+    assert get_event_partitions(events.pool).drop_before(cutoff_ms) == 1
+    changed = api_client.get('/api/logs?lines=10', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert [line['text'] for line in changed.get_json()['content']] == ['kept']
+
+
+def test_logs_read_failure_is_not_given_a_validator(api_client, monkeypatch):
+    from actifix.persistence.event_repo import EventRepository
+
+    def fail(self, *args, **kwargs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(EventRepository, "get_events", fail)
+    failed = api_client.get('/api/logs?lines=10')
+    assert failed.status_code == 500
+    assert 'ETag' not in failed.headers
+    assert failed.get_json()['error'] == "database is locked"
+
+
+def test_modules_validator_tracks_status_file(api_client, tmp_path):
+    etag, second = _revalidate(api_client, '/api/modules')
+    assert second.status_code == 304
+
+    status_file = get_actifix_paths(project_root=tmp_path).state_dir / "module_statuses.json"
+    status_file.parent.mkdir(parents=True, exist_ok=True)
+    status_file.write_text('{"schema_version": "module-statuses.v1", "statuses": {"active": [], '
+                           '"disabled": ["runtime.api"], "error": []}}', encoding="utf-8")
+    stat = status_file.stat()
+    os.utime(status_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert api_client.get('/api/modules', headers={'If-None-Match': etag}).status_code == 200
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for busy retries with jittered backoff and contention metrics.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from actifix.persistence.database import (
+    DatabaseConfig,
+    DatabasePool,
+    RetryPolicy,
+    get_contention_metrics,
+    reset_contention_metrics,
+)
+
+pytestmark = [pytest.mark.db]
+
+FAST_RETRY = RetryPolicy(max_attempts=40, base_delay=0.005, max_delay=0.02, attempt_busy_timeout=0.01)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    reset_contention_metrics()
+    pool = DatabasePool(DatabaseConfig(db_path=tmp_path / "data" / "actifix.db", retry_policy=FAST_RETRY))
+    with pool.connection():
+        pass
+    yield pool
+    pool.close()
+    reset_contention_metrics()
+
+
+def _hold_write_lock(db_path, seconds):
+    """Hold the write lock from another connection for a while."""
+    blocker = sqlite3.connect(str(db_path), timeout=0, check_same_thread=False)
+    blocker.execute("BEGIN IMMEDIATE")
+
+    def release():
+        time.sleep(seconds)
+        blocker.rollback()
+        blocker.close()
+
+    thread = threading.Thread(target=release)
+    thread.start()
+    return thread
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, multiplier=2.0)
+    delays = [policy.backoff(attempt) for attempt in (1, 2, 3, 4, 5) for _ in range(50)]
+
+    assert all(0 <= d <= 0.3 for d in delays)
+    assert all(policy.backoff(1) <= 0.1 for _ in range(50))
+    assert len({round(d, 6) for d in delays}) > 1
+
+
+def test_begin_immediate_retries_until_lock_is_released(pool):
+    releaser = _hold_write_lock(pool.config.db_path, 0.2)
+
+    with pool.transaction(immediate=True) as conn:
+        conn.execute("INSERT INTO event_log (event_type, message) VALUES ('T', 'after wait')")
+    releaser.join()
+
+    stats = get_contention_metrics()["test_db_contention_retry.test_begin_immediate_retries_until_lock_is_released"]
+    assert stats["transactions"] == 1
+    assert stats["busy_events"] > 0
+    assert stats["retries"] == stats["busy_events"]
+    assert stats["failures"] == 0
+    assert stats["lock_wait_seconds"] >= 0.1
+
+
+def test_exhausted_retries_raise_and_restore_busy_timeout(pool):
+    releaser = _hold_write_lock(pool.config.db_path, 0.15)
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002, attempt_busy_timeout=0.01)
+
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.transaction(immediate=True, retry=policy, site="exhausted"):
+            pass
+    releaser.join()
+
+    stats = get_contention_metrics()["exhausted"]
+    assert stats["busy_events"] == 3
+    assert stats["retries"] == 2
+    assert stats["failures"] == 1
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == int(pool.config.timeout * 1000)
+
+
+def test_default_policy_keeps_connection_busy_timeout(tmp_path):
+    # A shorter per-attempt wait would make writers give up well before
+    # DatabaseConfig.timeout under long lock contention
+    pool = DatabasePool(DatabaseConfig(db_path=tmp_path / "data" / "actifix.db"))
+    with pool.connection() as conn:
+        statements = []
+        conn.set_trace_callback(statements.append)
+        with pool.transaction(immediate=True, site="default-policy"):
+            pass
+        conn.set_trace_callback(None)
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == int(pool.config.timeout * 1000)
+    pool.close()
+
+    assert RetryPolicy().attempt_busy_timeout is None
+    assert not [sql for sql in statements if "busy_timeout" in sql.lower()]
+
+
+def test_run_in_transaction_reruns_work_after_busy_body(pool):
+    calls = []
+
+    def work(conn):
+        calls.append(1)
+        conn.execute("INSERT INTO event_log (event_type, message) VALUES ('T', ?)", (f"try {len(calls)}",))
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return len(calls)
+
+    assert pool.run_in_transaction(work, site="rerun") == 2
+
+    with pool.connection() as conn:
+        messages = [r[0] for r in conn.execute("SELECT message FROM event_log WHERE event_type = 'T'")]
+    assert messages == ["try 2"]
+    stats = get_contention_metrics()["rerun"]
+    assert stats["busy_events"] == 1
+    assert stats["retries"] == 1
+
+
+def test_run_in_transaction_does_not_retry_other_errors(pool):
+    calls = []
+
+    def work(conn):
+        calls.append(1)
+        raise sqlite3.OperationalError("no such table: missing")
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.run_in_transaction(work, site="other")
+    assert len(calls) == 1
+    assert get_contention_metrics()["other"]["busy_events"] == 0
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the integer epoch-millisecond timestamp shadow columns.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import (
+    DatabasePool,
+    EPOCH_MS_COLUMNS,
+    SCHEMA_VERSION,
+    backfill_epoch_ms_columns,
+    get_database_pool,
+    reset_database_pool,
+    serialize_timestamp,
+    timestamp_to_epoch_ms,
+)
+from actifix.persistence.event_repo import EventFilter
+from actifix.persistence.ticket_repo import TicketFilter, get_ticket_repository
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+
+def _downgrade_to_v7(db_path):
+    """Strip the v8 shadow columns, triggers and indexes from a database."""
+    conn = sqlite3.connect(str(db_path))
+    # v10 event partition objects reference event_log.timestamp_ms
+    conn.execute("DROP VIEW IF EXISTS event_log_all")
+    conn.execute("DROP TABLE IF EXISTS event_log_partitions")
+    conn.execute("DROP TABLE IF EXISTS event_log_sequence")
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE '%\\_ms' ESCAPE '\\'"
+    ).fetchall():
+        conn.execute(f"DROP INDEX {name}")
+    for table, column in EPOCH_MS_COLUMNS:
+        conn.execute(f"ALTER TABLE {table} DROP COLUMN {column}_ms")
+    conn.execute("DELETE FROM schema_version")
+    conn.execute("INSERT INTO schema_version (version) VALUES (7)")
+    conn.commit()
+    conn.close()
+
+
+def test_timestamp_to_epoch_ms_matches_sql_conversion():
+    pool = get_database_pool()
+    samples = [
+        datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime(2026, 3, 1, 12, 30, 15, 999700, tzinfo=timezone(timedelta(hours=2))),
+        datetime(2026, 3, 1, 12, 30, 15),
+    ]
+    with pool.connection() as conn:
+        for value in samples:
+            sql_ms = conn.execute(
+                "SELECT CAST(ROUND((julianday(?) - 2440587.5) * 86400000.0) AS INTEGER)",
+                (serialize_timestamp(value),),
+            ).fetchone()[0]
+            assert sql_ms == timestamp_to_epoch_ms(value)
+
+
+def test_writes_keep_shadow_columns_in_sync(make_entry):
+    repo = get_ticket_repository()
+    created = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert repo.create_ticket(make_entry("ACT-MS-1", created))
+
+    lock = repo.acquire_lock("ACT-MS-1", "agent-1")
+    with repo.pool.transaction() as conn:
+        # Writers that do not know about the shadow columns go through triggers
+        conn.execute(
+            "INSERT INTO tickets (id, priority, error_type, message, source, created_at) "
+            "VALUES ('ACT-MS-2', 'P3', 'TestError', 'raw insert', 'tests', '2026-01-05 10:00:00')"
+        )
+        conn.execute("UPDATE tickets SET created_at = '2026-01-06T00:00:00+00:00' WHERE id = 'ACT-MS-2'")
+
+    with repo.pool.connection() as conn:
+        rows = {
+            row["id"]: row
+            for row in conn.execute("SELECT id, created_at_ms, locked_at_ms, lease_expires_ms FROM tickets")
+        }
+    assert rows["ACT-MS-1"]["created_at_ms"] == timestamp_to_epoch_ms(created)
+    assert rows["ACT-MS-1"]["lease_expires_ms"] == timestamp_to_epoch_ms(lock.lease_expires)
+    assert rows["ACT-MS-1"]["locked_at_ms"] == timestamp_to_epoch_ms(lock.locked_at)
+    assert rows["ACT-MS-2"]["created_at_ms"] == timestamp_to_epoch_ms(
+        datetime(2026, 1, 6, tzinfo=timezone.utc)
+    )
+
+    assert repo.release_lock("ACT-MS-1", "agent-1")
+    with repo.pool.connection() as conn:
+        row = conn.execute("SELECT lease_expires_ms FROM tickets WHERE id = 'ACT-MS-1'").fetchone()
+    assert row["lease_expires_ms"] is None
+
+
+def test_expired_lease_detected_by_integer_predicate(make_entry):
+    repo = get_ticket_repository()
+    assert repo.create_ticket(make_entry("ACT-MS-3", datetime.now(timezone.utc)))
+    assert repo.acquire_lock("ACT-MS-3", "agent-1", lease_duration=timedelta(seconds=-5))
+
+    assert [t["id"] for t in repo.get_expired_locks()] == ["ACT-MS-3"]
+    assert repo.acquire_lock("ACT-MS-3", "agent-2") is not None
+    assert repo.get_expired_locks() == []
+
+
+def test_migration_adds_columns_and_backfills(actifix_db_path, monkeypatch):
+    with get_database_pool().connection():
+        pass
+    reset_database_pool()
+    _downgrade_to_v7(actifix_db_path)
+
+    base = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    conn = sqlite3.connect(str(actifix_db_path))
+    for i in range(5):
+        conn.execute(
+            "INSERT INTO tickets (id, priority, error_type, message, source, created_at, duplicate_guard) "
+            "VALUES (?, 'P2', 'TestError', 'legacy', 'tests', ?, ?)",
+            (f"ACT-LEGACY-{i}", serialize_timestamp(base + timedelta(days=i)), f"legacy-{i}"),
+        )
+    conn.execute(
+        "INSERT INTO event_log (timestamp, event_type, message) VALUES ('2026-02-03 08:00:00', 'LEGACY', 'old')"
+    )
+    conn.execute(
+        "INSERT INTO event_log (timestamp, event_type, message) VALUES ('not a timestamp', 'LEGACY', 'bad')"
+    )
+    conn.commit()
+    conn.close()
+
+    started = []
+    monkeypatch.setattr(DatabasePool, "_start_epoch_backfill", lambda self: started.append(self))
+    pool = get_database_pool()
+    repo = get_ticket_repository()
+
+    with pool.connection() as conn:
+        version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+        assert version == SCHEMA_VERSION
+        assert conn.execute("SELECT COUNT(*) FROM tickets WHERE created_at_ms IS NULL").fetchone()[0] == 5
+    assert len(started) == 1
+
+    # Range predicates fall back to the text column until rows are backfilled
+    window = TicketFilter(created_after=base + timedelta(days=1), created_before=base + timedelta(days=3))
+    expected = {"ACT-LEGACY-1", "ACT-LEGACY-2", "ACT-LEGACY-3"}
+    assert {t["id"] for t in repo.get_tickets(window)} == expected
+
+    filled = backfill_epoch_ms_columns(pool, chunk_size=2)
+
+    assert filled["tickets.created_at_ms"] == 5
+    assert filled["event_log.timestamp_ms"] == 1
+    assert {t["id"] for t in repo.get_tickets(window)} == expected
+    with pool.connection() as conn:
+        bad = conn.execute("SELECT timestamp_ms FROM event_log WHERE message = 'bad'").fetchone()
+        assert bad[0] is None
+    assert backfill_epoch_ms_columns(pool)["tickets.created_at_ms"] == 0
+
+
+def test_event_time_window_and_prune(events):
+    now = datetime.now(timezone.utc)
+    events.log_event("OLD", "old event", timestamp=now - timedelta(days=120))
+    events.log_event("MID", "mid event", timestamp=now - timedelta(days=10))
+    events.log_event("NEW", "new event", timestamp=now)
+
+    window = EventFilter(start_time=now - timedelta(days=30), end_time=now - timedelta(days=1))
+    assert [e["event_type"] for e in events.get_events(window)] == ["MID"]
+
+    assert events.prune_old_events(days_to_keep=90) >= 1
+    remaining = {e["event_type"] for e in events.get_events(EventFilter(limit=1000))}
+    assert "OLD" not in remaining
+    assert {"MID", "NEW"} <= remaining
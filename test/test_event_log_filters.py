@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for SQL-side event filters (levels, event-type prefix, source, time).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.event_repo import EventFilter, get_event_repository
+
+pytestmark = [pytest.mark.db]
+
+
+def _seed(repo):
+    """One sparse error among many info events, spread over two days."""
+    now = datetime.now(timezone.utc)
+    repo.log_event("DISPATCH_FAILED", "old error", level="error", source="do_af", timestamp=now - timedelta(days=1))
+    for i in range(30):
+        repo.log_event("TICKET_CREATED", f"info {i}", source="raise_af", timestamp=now - timedelta(minutes=30 - i))
+    repo.log_event("TICKET_FAILED", "critical", level="CRITICAL", source="do_af", timestamp=now)
+    return now
+
+
+def test_level_filter_returns_exactly_limit_matches(events):
+    _seed(events)
+
+    errors = events.get_events(EventFilter(levels=["ERROR", "critical"], limit=2))
+    assert [e["message"] for e in errors] == ["critical", "old error"]
+    assert errors[1]["level"] == "ERROR"
+
+    assert [e["message"] for e in events.get_events(EventFilter(level="Error"))] == ["old error"]
+
+
+def test_prefix_source_and_window_filters(events):
+    now = _seed(events)
+
+    ticket_events = events.get_events(EventFilter(event_type_prefix="TICKET_", limit=100))
+    assert len(ticket_events) == 31
+    assert all(e["event_type"].startswith("TICKET_") for e in ticket_events)
+
+    assert [e["message"] for e in events.get_events(EventFilter(source="do_af"))] == ["critical", "old error"]
+
+    window = EventFilter(
+        event_type_prefix="TICKET_C",
+        start_time=now - timedelta(minutes=5),
+        end_time=now,
+    )
+    assert [e["message"] for e in events.get_events(window)] == [f"info {i}" for i in range(29, 24, -1)]
+
+
+def test_api_logs_errors_use_sql_filter(api_client):
+    _seed(get_event_repository())
+
+    body = api_client.get('/api/logs?type=errors&lines=2').get_json()
+    assert [line["text"] for line in body["content"]] == ["old error", "critical"]
+
+    body = api_client.get('/api/logs?event_prefix=TICKET_&source=raise_af&lines=3').get_json()
+    assert [line["text"] for line in body["content"]] == ["info 27", "info 28", "info 29"]
+
+    assert api_client.get('/api/logs?start_time=yesterday').status_code == 400
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the time-partitioned event log behind EventRepository.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import (
+    EVENT_LOG_VIEW,
+    SCHEMA_VERSION,
+    get_database_pool,
+    timestamp_to_epoch_ms,
+)
+from actifix.persistence.event_partitions import (
+    EventPartitions,
+    get_event_partitions,
+    partition_for,
+)
+from actifix.persistence.event_repo import BatchedEventWriter, EventFilter
+
+pytestmark = [pytest.mark.db]
+
+
+def _partition_names(pool):
+    return [p.name for p in get_event_partitions(pool).list_partitions()]
+
+
+def test_partition_bounds_for_day_and_week():
+    ts = timestamp_to_epoch_ms(datetime(2026, 10, 15, 13, 45, tzinfo=timezone.utc))
+
+    day = partition_for(ts, "day")
+    assert day.name == "event_log_d20261015"
+    assert day.end_ms - day.start_ms == 86_400_000
+    assert day.start_ms <= ts < day.end_ms
+
+    week = partition_for(ts, "week")
+    assert week.name == "event_log_w20261012"
+    assert week.end_ms - week.start_ms == 7 * 86_400_000
+
+    with pytest.raises(ValueError):
+        partition_for(ts, "month")
+
+
+def test_events_land_in_per_day_partitions_with_global_ids(events):
+    now = datetime.now(timezone.utc)
+    ids = [
+        events.log_event("OLD", "two days ago", timestamp=now - timedelta(days=2)),
+        events.log_event("NEW", "now", timestamp=now),
+        events.log_event("MID", "yesterday", timestamp=now - timedelta(days=1)),
+    ]
+
+    assert ids == sorted(ids) and len(set(ids)) == 3
+    assert len(_partition_names(events.pool)) == 3
+    assert [e["event_type"] for e in events.get_recent_events()] == ["NEW", "MID", "OLD"]
+    assert [e["event_type"] for e in events.get_events(EventFilter(limit=1, offset=1))] == ["MID"]
+    window = EventFilter(start_time=now - timedelta(days=1, hours=1), end_time=now)
+    assert [e["event_type"] for e in events.get_events(window)] == ["MID"]
+    assert events.get_event_count() == 3
+
+
+def test_view_and_reads_include_legacy_rows(events):
+    pool = events.pool
+    with pool.transaction() as conn:
+        conn.execute(
+            "INSERT INTO event_log (timestamp, event_type, message) VALUES ('2026-01-02 08:00:00', 'LEGACY', 'old')"
+        )
+    events.log_event("NEW", "partitioned")
+
+    with pool.connection() as conn:
+        types = {row[0] for row in conn.execute(f"SELECT event_type FROM {EVENT_LOG_VIEW}")}
+    assert types == {"LEGACY", "NEW"}
+    assert [e["event_type"] for e in events.get_recent_events()] == ["NEW", "LEGACY"]
+    assert events.get_stats()["by_type"] == {"LEGACY": 1, "NEW": 1}
+
+
+def test_batched_writer_groups_rows_by_partition(events):
+    writer = BatchedEventWriter(batch_size=1000, flush_interval_seconds=60)
+    now = datetime.now(timezone.utc)
+    for days in (0, 0, 3):
+        writer.add_event("BATCH", f"{days} days ago", timestamp=now - timedelta(days=days))
+    assert writer.flush() == 3
+    writer.shutdown()
+
+    assert len(_partition_names(events.pool)) == 2
+    assert events.get_event_count() == 3
+
+
+def test_prune_drops_whole_partitions(events):
+    now = datetime.now(timezone.utc)
+    events.log_event("OLD", "expired", timestamp=now - timedelta(days=40))
+    events.log_event("OLD", "expired too", timestamp=now - timedelta(days=40))
+    events.log_event("NEW", "kept", timestamp=now)
+    expired = partition_for(timestamp_to_epoch_ms(now - timedelta(days=40))).name
+
+    assert get_event_partitions(events.pool).drop_before(
+        timestamp_to_epoch_ms(now - timedelta(days=30)), dry_run=True
+    ) == 2
+    assert expired in _partition_names(events.pool)
+
+    assert events.prune_old_events(days_to_keep=30) == 2
+    assert expired not in _partition_names(events.pool)
+    with events.pool.connection() as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (expired,)
+        ).fetchone()[0] == 0
+    assert [e["message"] for e in events.get_recent_events()] == ["kept"]
+
+    # A stale in-memory cache recreates a partition dropped elsewhere
+    events.log_event("OLD", "late arrival", timestamp=now - timedelta(days=40))
+    assert expired in _partition_names(events.pool)
+
+
+def test_partition_with_old_ticket_foreign_key_is_rebuilt(events):
+    now = datetime.now(timezone.utc)
+    partition = partition_for(timestamp_to_epoch_ms(now))
+    columns = ", ".join(f"{c} TEXT" for c in ("timestamp", "event_type", "message", "ticket_id"))
+    with events.pool.transaction() as conn:
+        conn.execute(
+            f"CREATE TABLE {partition.name} (id INTEGER PRIMARY KEY, {columns}, "
+            "correlation_id TEXT, extra_json TEXT, source TEXT, level TEXT, timestamp_ms INTEGER, "
+            "FOREIGN KEY (ticket_id) REFERENCES tickets(id) ON DELETE SET NULL)"
+        )
+        conn.execute(
+            f"INSERT INTO {partition.name} (id, timestamp, event_type, message, timestamp_ms) "
+            "VALUES (1, '2026-10-18T10:00:00+00:00', 'OLD', 'before upgrade', ?)",
+            (partition.start_ms,),
+        )
+        conn.execute("UPDATE event_log_sequence SET seq = 1 WHERE id = 0")
+        conn.execute(
+            "INSERT INTO event_log_partitions (name, period_start_ms, period_end_ms) VALUES (?, ?, ?)",
+            (partition.name, partition.start_ms, partition.end_ms),
+        )
+        get_event_partitions(events.pool).rebuild_view(conn)
+
+    assert events.log_event("NEW", "unknown ticket", ticket_id="ACT-ELSEWHERE", timestamp=now)
+
+    with events.pool.connection() as conn:
+        assert conn.execute(f"PRAGMA foreign_key_list({partition.name})").fetchall() == []
+    assert [e["message"] for e in events.get_recent_events()] == ["unknown ticket", "before upgrade"]
+    assert [e["event_type"] for e in events.get_events_for_ticket("ACT-ELSEWHERE")] == ["NEW"]
+
+
+def test_sequence_continues_after_legacy_ids(events):
+    pool = events.pool
+    with pool.transaction() as conn:
+        for i in range(3):
+            conn.execute("INSERT INTO event_log (event_type, message) VALUES ('LEGACY', ?)", (f"row {i}",))
+        conn.execute("DELETE FROM event_log_sequence")
+        conn.execute(
+            "INSERT INTO event_log_sequence (id, seq) SELECT 0, MAX(id) FROM event_log"
+        )
+    manager = EventPartitions(pool, "week")
+    with pool.transaction() as conn:
+        ids = manager.insert(conn, [
+            ("2026-10-18T10:00:00+00:00", "W", "week row", None, None, None, None, "INFO",
+             timestamp_to_epoch_ms(datetime(2026, 10, 18, 10, tzinfo=timezone.utc))),
+        ])
+    assert ids == [4]
+    assert "event_log_w20261012" in [p.name for p in manager.list_partitions()]
+    assert get_database_pool() is pool
+    with pool.connection() as conn:
+        version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+    assert version == SCHEMA_VERSION
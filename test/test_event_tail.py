@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the cursor-based event tail (long-poll and SSE).
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from actifix.persistence.database import DatabaseConfig, DatabasePool
+from actifix.persistence.event_repo import (
+    EventFilter,
+    EventRepository,
+    get_event_repository,
+)
+from actifix.persistence.event_tail import get_event_tail
+
+pytestmark = [pytest.mark.db]
+
+
+def _log_later(repo, delay, *args, **kwargs):
+    thread = threading.Thread(target=lambda: (time.sleep(delay), repo.log_event(*args, **kwargs)))
+    thread.start()
+    return thread
+
+
+def test_tail_starts_at_latest_and_follows_cursor(events):
+    for i in range(3):
+        events.log_event("BACKLOG", f"old {i}")
+
+    backlog, cursor = events.tail_events(limit=2)
+    assert [e["message"] for e in backlog] == ["old 1", "old 2"]
+    assert cursor == backlog[-1]["id"]
+
+    assert events.tail_events(cursor) == ([], cursor)
+
+    new_id = events.log_event("LIVE", "new")
+    fresh, cursor = events.tail_events(cursor)
+    assert [e["id"] for e in fresh] == [new_id]
+    assert cursor == new_id
+
+
+def test_filtered_tail_advances_cursor_past_other_events(events):
+    _, cursor = events.tail_events()
+    events.log_event("NOISE", "skip me")
+    skipped_to = events.log_event("NOISE", "skip me too")
+
+    matched, next_cursor = events.tail_events(cursor, filter=EventFilter(event_type="WANTED"))
+    assert matched == []
+    assert next_cursor == skipped_to
+
+    wanted = events.log_event("WANTED", "match", level="ERROR")
+    matched, _ = events.tail_events(next_cursor, filter=EventFilter(event_type="WANTED", level="ERROR"))
+    assert [e["id"] for e in matched] == [wanted]
+
+
+def test_long_poll_wakes_on_commit_instead_of_timing_out(events):
+    _, cursor = events.tail_events()
+    writer = _log_later(events, 0.1, "LIVE", "woken")
+
+    started = time.monotonic()
+    fresh, _ = events.tail_events(cursor, wait_seconds=10)
+    writer.join()
+
+    assert [e["message"] for e in fresh] == ["woken"]
+    assert time.monotonic() - started < 5
+
+
+def test_long_poll_times_out_when_idle(events):
+    _, cursor = events.tail_events()
+    started = time.monotonic()
+    assert events.tail_events(cursor, wait_seconds=0.2) == ([], cursor)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_wait_sees_commits_from_other_connections(events):
+    tail = get_event_tail(events.pool)
+    tail.poll_interval = 0.05
+    cursor = tail.latest_id()
+
+    # A separate pool stands in for another process: no in-process notify
+    other_pool = DatabasePool(DatabaseConfig(db_path=events.pool.config.db_path))
+    other = EventRepository()
+    other.pool = other_pool
+
+    writer = _log_later(other, 0.1, "REMOTE", "from elsewhere")
+    assert tail.wait(cursor, timeout=5)
+    writer.join()
+    other_pool.close_all()
+
+    fresh, _ = events.tail_events(cursor)
+    assert [e["event_type"] for e in fresh] == ["REMOTE"]
+
+
+def test_tail_endpoint_returns_cursor(api_client):
+    repo = get_event_repository()
+    repo.log_event("API_TAIL", "first", level="WARNING")
+
+    body = api_client.get('/api/events/tail?limit=5').get_json()
+    assert body["content"][-1]["text"] == "first"
+    assert body["content"][-1]["level"] == "WARNING"
+
+    second = repo.log_event("API_TAIL", "second")
+    body = api_client.get(f'/api/events/tail?after_id={body["cursor"]}&wait=1').get_json()
+    assert [line["text"] for line in body["content"]] == ["second"]
+    assert body["cursor"] == second
+
+
+def test_stream_endpoint_emits_sse_events(api_client):
+    repo = get_event_repository()
+    first = repo.log_event("API_STREAM", "one")
+    repo.log_event("API_STREAM", "two")
+
+    response = api_client.get(
+        '/api/events/stream?event_type=API_STREAM&duration=0.3',
+        headers={'Last-Event-ID': str(first)},
+    )
+    assert response.mimetype == 'text/event-stream'
+    body = response.get_data(as_text=True)
+    frames = [frame for frame in body.split("\n\n") if frame.startswith("id:")]
+    assert len(frames) == 1
+    data = json.loads(frames[0].split("data: ", 1)[1])
+    assert data["text"] == "two"
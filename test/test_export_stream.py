@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the streaming NDJSON export pipeline.
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import get_database_pool, reset_database_pool, serialize_timestamp
+from actifix.persistence.export_stream import (
+    StreamingExporter,
+    event_export_table,
+    iter_export_records,
+    resolve_export_path,
+    ticket_export_table,
+)
+
+pytestmark = [pytest.mark.db]
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    pool = get_database_pool()
+    now = datetime.now(timezone.utc)
+    with pool.transaction() as conn:
+        for i in range(25):
+            conn.execute(
+                """
+                INSERT INTO tickets (id, priority, error_type, message, source, created_at,
+                                     duplicate_guard, status)
+                VALUES (?, 'P2', 'TestError', ?, 'tests', ?, ?, ?)
+                """,
+                (
+                    f"ACT-EXP-{i:03d}",
+                    f"failure {i} api_key=sk-abcdefghijklmnopqrstuvwxyz123456",
+                    serialize_timestamp(now - timedelta(days=100 if i % 2 else 1)),
+                    f"guard-{i}",
+                    "Completed" if i % 2 else "Open",
+                ),
+            )
+        for i in range(10):
+            conn.execute(
+                "INSERT INTO event_log (event_type, message, source) VALUES (?, ?, ?)",
+                ("TEST_EVENT", f"event {i}", "tests"),
+            )
+    yield pool
+    reset_database_pool()
+
+
+def _sha256_of_stream(path, compression):
+    opener = {None: open, "gzip": __import__("gzip").open, "lzma": __import__("lzma").open}[compression]
+    with opener(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lzma"])
+def test_export_writes_redacted_ndjson_with_checksum(pool, tmp_path, compression):
+    output = resolve_export_path(tmp_path / "export.ndjson", compression)
+    exporter = StreamingExporter(output, pool, compression=compression, chunk_size=7, workers=1)
+
+    result = exporter.export([ticket_export_table(), event_export_table()])
+
+    records = list(iter_export_records(output, compression))
+    assert records[0]["type"] == "header"
+    assert result.records == {"ticket": 25, "event": 10}
+    tickets = [r for r in records if r["type"] == "ticket"]
+    assert len(tickets) == 25
+    assert all("sk-abcdefghijklmnop" not in r["message"] for r in tickets)
+    assert result.sha256 == _sha256_of_stream(output, compression)
+    assert exporter.checksum_path.read_text().startswith(result.sha256)
+    assert not exporter.checkpoint_path.exists()
+
+
+def test_export_filters_rows(pool, tmp_path):
+    output = tmp_path / "archive.ndjson"
+    exporter = StreamingExporter(output, pool, chunk_size=4, workers=1)
+
+    result = exporter.export([ticket_export_table("status = ?", ("Completed",))])
+
+    assert result.records["ticket"] == 12
+    assert all(r["status"] == "Completed" for r in iter_export_records(output) if r["type"] == "ticket")
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_interrupted_export_resumes_from_checkpoint(pool, tmp_path, compression):
+    output = resolve_export_path(tmp_path / "export.ndjson", compression)
+    calls = {"chunks": 0}
+
+    def crash_after_two_chunks(record_type, count):
+        calls["chunks"] += 1
+        if calls["chunks"] == 2:
+            raise KeyboardInterrupt
+
+    exporter = StreamingExporter(output, pool, compression=compression, chunk_size=5, workers=1)
+    with pytest.raises(KeyboardInterrupt):
+        exporter.export([ticket_export_table()], progress=crash_after_two_chunks)
+    assert exporter.checkpoint_path.exists()
+
+    # Simulate a torn write after the last checkpoint
+    with open(output, "ab") as handle:
+        handle.write(b"garbage-from-a-torn-write")
+
+    result = StreamingExporter(output, pool, compression=compression, chunk_size=5, workers=1).export(
+        [ticket_export_table()]
+    )
+
+    ids = [r["id"] for r in iter_export_records(output, compression) if r["type"] == "ticket"]
+    assert result.resumed is True
+    assert ids == [f"ACT-EXP-{i:03d}" for i in range(25)]
+    assert result.sha256 == _sha256_of_stream(output, compression)
+
+
+def test_export_with_worker_pool_matches_serial(pool, tmp_path):
+    serial = StreamingExporter(tmp_path / "serial.ndjson", pool, chunk_size=10, workers=1)
+    parallel = StreamingExporter(tmp_path / "parallel.ndjson", pool, chunk_size=10, workers=2)
+    serial.export([ticket_export_table()])
+    parallel.export([ticket_export_table()])
+
+    def body(path):
+        return [r for r in iter_export_records(path) if r["type"] != "header"]
+
+    assert body(serial.output_path) == body(parallel.output_path)
+
+
+def test_export_rejects_unknown_compression(pool, tmp_path):
+    with pytest.raises(ValueError):
+        StreamingExporter(tmp_path / "x.ndjson", pool, compression="zip")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the background health sampler."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from actifix import health_sampler
+from actifix.health import get_health
+from actifix.health_sampler import HealthSampler, get_health_snapshot, reset_health_sampler
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("ACTIFIX_CHANGE_ORIGIN", "raise_af")
+    paths = get_actifix_paths(project_root=tmp_path)
+    init_actifix_files(paths)
+    reset_health_sampler()
+    yield paths
+    reset_health_sampler()
+
+
+@pytest.fixture
+def health_calls(monkeypatch):
+    calls = []
+
+    def counting_get_health(paths=None):
+        calls.append(paths)
+        return get_health(paths)
+
+    monkeypatch.setattr(health_sampler, "get_health", counting_get_health)
+    return calls
+
+
+def test_readers_share_one_published_snapshot(paths, health_calls):
+    first = get_health_snapshot(paths)
+    assert get_health_snapshot(paths) is first
+    assert len(health_calls) == 1
+
+    assert first.health.status in {"OK", "WARNING", "ERROR", "SLA_BREACH"}
+    assert first.pool_metrics.get("connection_healthy") is True
+    assert first.age_seconds >= 0
+    with pytest.raises(AttributeError):
+        first.health = None
+
+
+def test_background_thread_republishes_and_survives_failures(paths, health_calls, monkeypatch):
+    sampler = HealthSampler(paths, interval_seconds=0.05)
+    first = sampler.snapshot()
+
+    deadline = time.monotonic() + 5
+    while sampler.snapshot() is first and time.monotonic() < deadline:
+        time.sleep(0.02)
+    second = sampler.snapshot()
+    assert second is not first and second.sampled_at >= first.sampled_at
+
+    def failing_get_health(paths=None):
+        raise RuntimeError("disk gone")
+
+    monkeypatch.setattr(health_sampler, "get_health", failing_get_health)
+    time.sleep(0.2)
+    assert sampler.snapshot().health is not None
+    sampler.stop()
+
+
+def test_endpoints_and_prometheus_read_the_snapshot(paths, health_calls, tmp_path):
+    pytest.importorskip("flask")
+    from actifix.api import create_app
+    from actifix.metrics import export_prometheus_metrics
+
+    app = create_app(project_root=tmp_path)
+    app.config['TESTING'] = True
+
+    with app.test_client() as client:
+        for _ in range(3):
+            body = client.get('/api/health?probe=1').get_json()
+            client.get('/api/health')
+            assert body['sample']['duration_ms'] >= 0
+            assert body['database']['connection_healthy'] is True
+        assert 'actifix_health_status' in export_prometheus_metrics(paths)
+        client.get('/api/metrics/json')
+
+    assert len(health_calls) == 1
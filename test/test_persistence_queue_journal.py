@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the append-only journal behind PersistenceQueue.
+"""
+
+import json
+
+from actifix.persistence.queue import PersistenceQueue
+
+
+def test_enqueue_appends_to_journal_without_rewriting_snapshot(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file)
+
+    queue.enqueue("write", "a", "1")
+    snapshot_before = queue_file.read_text()
+    for i in range(20):
+        queue.enqueue("write", f"key-{i}", "payload")
+
+    assert queue_file.read_text() == snapshot_before
+    assert len(queue.journal_file.read_text().splitlines()) == 21
+
+
+def test_reload_replays_journal_over_snapshot(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file)
+    first = queue.enqueue("write", "a", "1")
+    queue.enqueue("append", "b", "2")
+    queue.enqueue("write", "a", "updated")
+    queue.dequeue(first)
+    queue.enqueue("delete", "c", "")
+    queue.close()
+
+    reloaded = PersistenceQueue(queue_file)
+
+    assert [(e.operation, e.key) for e in reloaded.peek(10)] == [("append", "b"), ("delete", "c")]
+
+
+def test_dedup_updates_existing_entry_via_index(tmp_path):
+    queue = PersistenceQueue(tmp_path / "queue.json")
+    entry_id = queue.enqueue("write", "doc", "v1")
+
+    assert queue.enqueue("write", "doc", "v2") == entry_id
+    assert queue.size() == 1
+
+    reloaded = PersistenceQueue(tmp_path / "queue.json")
+    assert reloaded.peek()[0].content == "v2"
+
+
+def test_torn_journal_tail_is_ignored(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file)
+    queue.enqueue("write", "a", "1")
+    queue.enqueue("write", "b", "2")
+    queue.close()
+
+    with open(queue.journal_file, "a", encoding="utf-8") as handle:
+        handle.write('{"op":"put","entry":{"entry_id":"QE-TORN"')
+
+    reloaded = PersistenceQueue(queue_file)
+    assert [e.key for e in reloaded.peek(10)] == ["a", "b"]
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file, compact_threshold=10)
+
+    for i in range(25):
+        queue.enqueue("write", f"key-{i % 5}", i)
+
+    journal_lines = queue.journal_file.read_text().splitlines()
+    assert len(journal_lines) < 10
+    snapshot = json.loads(queue_file.read_text())
+    assert len(snapshot) == 5
+
+    reloaded = PersistenceQueue(queue_file)
+    assert {e.key: e.content for e in reloaded.peek(10)} == {f"key-{i}": 20 + i for i in range(5)}
+
+
+def test_max_entries_evicts_oldest_and_survives_reload(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file, max_entries=3)
+    for i in range(5):
+        queue.enqueue("write", f"key-{i}", i)
+
+    reloaded = PersistenceQueue(queue_file, max_entries=3)
+    assert [e.key for e in reloaded.peek(10)] == ["key-2", "key-3", "key-4"]
+
+
+def test_replay_compacts_to_failed_entries(tmp_path):
+    queue_file = tmp_path / "queue.json"
+    queue = PersistenceQueue(queue_file)
+    queue.enqueue("write", "ok", "1")
+    queue.enqueue("write", "fail", "2")
+
+    stats = queue.replay(lambda entry: entry.key == "ok")
+
+    assert stats == {"succeeded": 1, "failed": 1, "skipped": 0}
+    assert queue.journal_file.read_text() == ""
+    reloaded = PersistenceQueue(queue_file)
+    assert [(e.key, e.retry_count) for e in reloaded.peek(10)] == [("fail", 1)]
@@ -13,12 +13,14 @@ from actifix.quarantine import (
     quarantine_content,
     quarantine_file,
     list_quarantine,
+    export_quarantine,
     remove_quarantine,
     get_quarantine_count,
     QuarantineEntry,
 )
 from actifix.state_paths import get_actifix_paths, init_actifix_files
 from actifix.persistence.event_repo import get_event_repository, EventFilter
+from actifix.persistence.quarantine_repo import QuarantineRepository
 
 
 class TestQuarantineIdGeneration:
@@ -45,6 +47,28 @@ class TestQuarantineIdGeneration:
         assert any(c.isdigit() for c in qid)
 
 
+    def test_generate_quarantine_id_unique_within_same_microsecond(self, tmp_path):
+        """Test that IDs and quarantines do not collide when the clock does not move."""
+        frozen = datetime(2026, 10, 18, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen
+
+        paths = get_actifix_paths(project_root=tmp_path)
+        init_actifix_files(paths)
+        with patch("actifix.quarantine.datetime", FrozenDatetime):
+            ids = {generate_quarantine_id() for _ in range(50)}
+            first = quarantine_content("payload one", "a.json", "reason", paths)
+            second = quarantine_content("payload two", "b.json", "reason", paths)
+
+        assert len(ids) == 50
+        assert all(qid.startswith("quarantine_20261018_120000_123456_") for qid in ids)
+        assert first.entry_id != second.entry_id
+        assert get_quarantine_count(paths) == 2
+
+
 class TestQuarantineContent:
     """Test content quarantine functionality."""
     
@@ -62,17 +86,19 @@ class TestQuarantineContent:
         assert entry.original_source == source
         assert entry.reason == reason
         assert entry.content == content
-        assert entry.file_path.exists()
+        assert entry.file_path is None
+        assert get_quarantine_count(paths) == 1
     
-    def test_quarantine_content_writes_file(self, tmp_path):
-        """Test that quarantine writes a file."""
+    def test_quarantine_export_writes_file(self, tmp_path):
+        """Test that export writes the markdown form."""
         paths = get_actifix_paths(project_root=tmp_path)
         init_actifix_files(paths)
         
         entry = quarantine_content("Test", "source", "reason", paths)
         
-        assert entry.file_path.exists()
-        content = entry.file_path.read_text()
+        (file_path,) = export_quarantine(entry.entry_id, paths)
+        assert file_path.exists()
+        content = file_path.read_text()
         assert "Test" in content
         assert "source" in content
         assert "reason" in content
@@ -84,7 +110,7 @@ class TestQuarantineContent:
         
         entry = quarantine_content("Content", "src.py", "Bad format", paths)
         
-        content = entry.file_path.read_text()
+        content = export_quarantine(entry.entry_id, paths)[0].read_text()
         assert "Entry ID" in content
         assert "Source" in content
         assert "Reason" in content
@@ -100,7 +126,7 @@ class TestQuarantineContent:
         entry = quarantine_content("Test", "source", "reason")
         
         assert entry is not None
-        assert entry.file_path.exists()
+        assert list_quarantine()[0].entry_id == entry.entry_id
     
     def test_quarantine_content_logs_event(self, tmp_path):
         """Test that quarantine logs an event."""
@@ -141,8 +167,8 @@ class TestQuarantineFile:
         
         assert entry is None
     
-    def test_quarantine_file_creates_backup(self, tmp_path):
-        """Test that file quarantine creates backup."""
+    def test_quarantine_file_stores_content_in_database(self, tmp_path):
+        """Test that file quarantine keeps the original content without file copies."""
         paths = get_actifix_paths(project_root=tmp_path)
         init_actifix_files(paths)
         
@@ -151,9 +177,8 @@ class TestQuarantineFile:
         
         entry = quarantine_file(test_file, "reason", paths)
         
-        # Check backup file exists
-        backup_files = list(paths.quarantine_dir.glob(f"{entry.entry_id}_original*"))
-        assert len(backup_files) > 0
+        assert list_quarantine(paths)[0].content == "Original content"
+        assert list(paths.quarantine_dir.glob(f"{entry.entry_id}*")) == []
 
 
 class TestListQuarantine:
@@ -237,7 +262,7 @@ class TestRemoveQuarantine:
         result = remove_quarantine(entry.entry_id, paths)
         
         assert result is True
-        assert not entry.file_path.exists()
+        assert get_quarantine_count(paths) == 0
     
     def test_remove_quarantine_nonexistent(self, tmp_path):
         """Test removing non-existent quarantine entry."""
@@ -248,8 +273,8 @@ class TestRemoveQuarantine:
         
         assert result is False
     
-    def test_remove_quarantine_removes_backup(self, tmp_path):
-        """Test that removal also removes backup files."""
+    def test_remove_quarantine_removes_exported_files(self, tmp_path):
+        """Test that removal also removes exported and legacy backup files."""
         paths = get_actifix_paths(project_root=tmp_path)
         init_actifix_files(paths)
         
@@ -257,12 +282,12 @@ class TestRemoveQuarantine:
         test_file.write_text("Content")
         
         entry = quarantine_file(test_file, "reason", paths)
+        export_quarantine(entry.entry_id, paths)
+        (paths.quarantine_dir / f"{entry.entry_id}_original.txt").write_text("Content")
         
         remove_quarantine(entry.entry_id, paths)
         
-        # Check no backup files remain
-        backup_files = list(paths.quarantine_dir.glob(f"{entry.entry_id}_original*"))
-        assert len(backup_files) == 0
+        assert list(paths.quarantine_dir.glob(f"{entry.entry_id}*")) == []
     
     def test_remove_quarantine_logs_event(self, tmp_path):
         """Test that remove logs an event."""
@@ -325,7 +350,7 @@ class TestQuarantineEdgeCases:
         entry = quarantine_content("", "source", "Empty content", paths)
         
         assert entry.content == ""
-        assert entry.file_path.exists()
+        assert get_quarantine_count(paths) == 1
     
     def test_quarantine_large_content(self, tmp_path):
         """Test quarantining large content."""
@@ -336,7 +361,7 @@ class TestQuarantineEdgeCases:
         entry = quarantine_content(large_content, "source", "Large", paths)
         
         assert entry.content == large_content
-        assert entry.file_path.exists()
+        assert list_quarantine(paths)[0].content == large_content
     
     def test_quarantine_special_characters(self, tmp_path):
         """Test quarantining content with special characters."""
@@ -348,3 +373,130 @@ class TestQuarantineEdgeCases:
         
         entries = list_quarantine(paths)
         assert len(entries) == 1
+
+
+class TestQuarantineDedup:
+    """Test content-hash dedup and paging of database-backed quarantine."""
+
+    def test_repeated_content_bumps_occurrences(self, tmp_path):
+        """Test that the same content is stored once with a counter."""
+        paths = get_actifix_paths(project_root=tmp_path)
+        init_actifix_files(paths)
+
+        first = quarantine_content("corrupt payload", "a.json", "Bad JSON", paths)
+        for _ in range(4):
+            again = quarantine_content("corrupt payload", "a.json", "Still bad", paths)
+
+        assert again.entry_id == first.entry_id
+        assert again.occurrences == 5
+        assert again.reason == "Still bad"
+        assert get_quarantine_count(paths) == 1
+
+    def test_removed_content_can_be_quarantined_again(self, tmp_path):
+        """Test that dedup only applies to active entries."""
+        paths = get_actifix_paths(project_root=tmp_path)
+        init_actifix_files(paths)
+
+        first = quarantine_content("payload", "a.json", "reason", paths)
+        assert remove_quarantine(first.entry_id, paths)
+        second = quarantine_content("payload", "a.json", "reason", paths)
+
+        assert second.entry_id != first.entry_id
+        assert second.occurrences == 1
+        assert get_quarantine_count(paths) == 1
+
+    def test_list_quarantine_pages_with_cursor(self, tmp_path):
+        """Test keyset paging over quarantine entries."""
+        paths = get_actifix_paths(project_root=tmp_path)
+        init_actifix_files(paths)
+        for i in range(5):
+            quarantine_content(f"Content {i}", f"source{i}", "reason", paths)
+
+        repo = QuarantineRepository()
+        page, cursor = repo.list_paginated(limit=2)
+        assert [r.content for r in page] == ["Content 4", "Content 3"]
+        page, cursor = repo.list_paginated(limit=2, cursor=cursor)
+        assert [r.content for r in page] == ["Content 2", "Content 1"]
+        page, cursor = repo.list_paginated(limit=2, cursor=cursor)
+        assert [r.content for r in page] == ["Content 0"]
+        assert cursor is None
+        assert [e.content for e in list_quarantine(paths, limit=1)] == ["Content 4"]
+
+    def test_legacy_quarantine_files_are_imported_once(self, tmp_path):
+        """Test that quarantine_*.md files from the file-based store are listed and counted."""
+        paths = get_actifix_paths(project_root=tmp_path)
+        init_actifix_files(paths)
+        paths.quarantine_dir.mkdir(parents=True, exist_ok=True)
+        for i, stamp in enumerate(("20260101_080000_000001", "20260102_080000_000002")):
+            entry_id = f"quarantine_{stamp}"
+            (paths.quarantine_dir / f"{entry_id}.md").write_text(
+                "# Quarantined Content\n\n"
+                f"- **Entry ID**: {entry_id}\n"
+                f"- **Source**: legacy{i}.json\n"
+                "- **Reason**: Bad: JSON\n"
+                f"- **Quarantined At**: 2026-01-0{i + 1}T08:00:00+00:00\n\n"
+                "## Original Content\n\n"
+                f"```\nlegacy payload {i}\n```\n\n"
+                "## Recovery Notes\n"
+            )
+
+        assert get_quarantine_count(paths) == 2
+        entries = list_quarantine(paths)
+        assert [e.content for e in entries] == ["legacy payload 1", "legacy payload 0"]
+        assert entries[1].entry_id == "quarantine_20260101_080000_000001"
+        assert entries[1].original_source == "legacy0.json"
+        assert entries[1].reason == "Bad: JSON"
+        assert entries[1].quarantined_at == datetime(2026, 1, 1, 8, tzinfo=timezone.utc)
+
+        # Removed entries stay removed, and importing again adds nothing
+        legacy_file = paths.quarantine_dir / "quarantine_20260101_080000_000001.md"
+        legacy_text = legacy_file.read_text()
+        assert remove_quarantine("quarantine_20260101_080000_000001", paths)
+        legacy_file.write_text(legacy_text)
+        from actifix import quarantine
+        quarantine._legacy_imported.clear()
+        assert quarantine.import_legacy_quarantine(paths) == 0
+        assert [e.content for e in list_quarantine(paths)] == ["legacy payload 1"]
+
+    def test_v8_database_migrates_quarantine_columns(self, tmp_path):
+        """Test the v8->v9 migration adds the counter and dedup index."""
+        import sqlite3
+        from actifix.persistence.database import SCHEMA_VERSION, get_database_pool, reset_database_pool
+
+        pool = get_database_pool()
+        with pool.connection():
+            pass
+        db_path = pool.config.db_path
+        reset_database_pool()
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP TABLE quarantine")
+        conn.execute(
+            """
+            CREATE TABLE quarantine (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entry_id TEXT UNIQUE NOT NULL,
+                original_source TEXT NOT NULL,
+                reason TEXT NOT NULL,
+                content TEXT NOT NULL,
+                original_content_hash TEXT,
+                quarantined_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                recovered_at TIMESTAMP,
+                recovery_notes TEXT,
+                status TEXT DEFAULT 'quarantined'
+            )
+            """
+        )
+        conn.execute("INSERT INTO schema_version (version) VALUES (8)")
+        conn.execute("DELETE FROM schema_version WHERE version > 8")
+        conn.commit()
+        conn.close()
+
+        with get_database_pool().connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(quarantine)")}
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(quarantine)")}
+            version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+        assert {"occurrences", "last_seen_at"} <= columns
+        assert "idx_quarantine_active_hash" in indexes
+        assert version == SCHEMA_VERSION
+        assert quarantine_content("x", "s", "r").occurrences == 1
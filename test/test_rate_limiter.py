@@ -12,19 +12,26 @@ Verifies that:
 7. Old records are cleaned up
 """
 
+import os
 import sqlite3
+import subprocess
+import sys
 import tempfile
 import time
 import threading
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 
 import pytest
 
+import actifix
+
 from actifix.security.rate_limiter import (
     RateLimiter,
     RateLimitError,
     RateLimitConfig,
     APICall,
+    SharedRateLimitState,
     get_rate_limiter,
     reset_rate_limiter,
 )
@@ -285,6 +292,7 @@ class TestThreadSafety:
         limiter = RateLimiter()
         errors = []
         successes = []
+        limited = []
 
         def check_and_record():
             try:
@@ -292,7 +300,7 @@ class TestThreadSafety:
                 limiter.record_call('openai', success=True)
                 successes.append(1)
             except RateLimitError:
-                errors.append("rate_limit")
+                limited.append(1)
             except Exception as e:
                 errors.append(str(e))
 
@@ -310,7 +318,7 @@ class TestThreadSafety:
         # All calls should complete without exception (thread safety is maintained)
         assert len(errors) == 0  # No exceptions from threading
         # Some calls may hit rate limit or succeed (both are valid outcomes)
-        assert len(successes) + len(errors) <= 5
+        assert len(successes) + len(limited) == 5
 
     def test_concurrent_recording(self):
         """Verify concurrent recording works correctly."""
@@ -369,6 +377,7 @@ class TestDatabasePersistence:
             # Create limiter and record call
             limiter1 = RateLimiter(db_path=db_path)
             limiter1.record_call('openai', success=True, tokens_used=100)
+            limiter1.flush()
 
             # Create new limiter with same database
             limiter2 = RateLimiter(db_path=db_path)
@@ -404,6 +413,175 @@ class TestDatabasePersistence:
             assert len(limiter.call_history['openai']) == 2
 
 
+class _FakeClock:
+    """Stands in for the time module inside rate_limiter."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+def _limit(minute=100, hour=1000, day=10000):
+    return RateLimitConfig(
+        provider_name='openai', calls_per_minute=minute, calls_per_hour=hour, calls_per_day=day,
+    )
+
+
+class TestBucketedWindows:
+    """Test window expiry of the bucketed counters."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from actifix.security import rate_limiter
+
+        clock = _FakeClock(1_700_000_000.0)
+        monkeypatch.setattr(rate_limiter, "time", clock)
+        return clock
+
+    def test_windows_release_capacity_after_expiry(self, tmp_path, clock):
+        limiter = RateLimiter(db_path=str(tmp_path / "rl.db"))
+        limiter.set_limit('openai', _limit(minute=3, hour=5))
+        for _ in range(3):
+            limiter.record_call('openai', success=True)
+        with pytest.raises(RateLimitError, match="minute"):
+            limiter.check_rate_limit('openai')
+
+        # Counts never drop before the full window has passed
+        clock.now += 59
+        with pytest.raises(RateLimitError, match="minute"):
+            limiter.check_rate_limit('openai')
+        clock.now += 2
+        limiter.check_rate_limit('openai')
+
+        limiter.record_call('openai', success=False)
+        limiter.record_call('openai', success=True)
+        with pytest.raises(RateLimitError, match="hour"):
+            limiter.check_rate_limit('openai')
+        clock.now += 3600 + 60
+        limiter.check_rate_limit('openai')
+
+        stats = limiter.get_usage_stats('openai')
+        assert (stats['calls_last_minute'], stats['calls_last_hour'], stats['calls_last_day']) == (0, 0, 5)
+        assert (stats['successful_calls'], stats['failed_calls']) == (4, 1)
+
+        clock.now += 86400 + 900
+        assert limiter.get_usage_stats('openai')['calls_last_day'] == 0
+        limiter.close()
+
+    def test_checks_do_not_scan_history(self, tmp_path, clock):
+        limiter = RateLimiter(db_path=str(tmp_path / "rl.db"))
+        limiter.set_limit('openai', _limit(minute=100000, hour=100000, day=5000))
+        for _ in range(5000):
+            limiter.record_call('openai', success=True)
+        limiter.call_history.clear()
+        with pytest.raises(RateLimitError, match="24 hours"):
+            limiter.check_rate_limit('openai')
+        limiter.close()
+
+
+class TestBatchedPersistence:
+    """Test asynchronous, batched persistence of call records."""
+
+    def _rows(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute('SELECT provider, success, error FROM api_calls ORDER BY id').fetchall()
+        finally:
+            conn.close()
+
+    def test_records_are_written_in_batches(self, tmp_path, monkeypatch):
+        from actifix.security import rate_limiter
+
+        db_path = str(tmp_path / "rl.db")
+        limiter = RateLimiter(db_path=db_path, flush_seconds=3600)
+        connects = []
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(
+            rate_limiter.sqlite3, "connect", lambda *a, **k: connects.append(a) or real_connect(*a, **k)
+        )
+
+        for i in range(50):
+            limiter.record_call('openai', success=i % 10 != 0, error=None if i % 10 else "boom")
+        limiter.record_call('module:yahtzee', success=True)
+        assert connects == []
+        assert self._rows(db_path) == []
+
+        assert limiter.flush() == 51
+        rows = self._rows(db_path)
+        assert len(rows) == 50  # module providers are outside the table's CHECK list
+        assert rows[0] == ('openai', 0, 'boom')
+        assert limiter.flush() == 0
+        limiter.close()
+
+    def test_background_thread_flushes(self, tmp_path):
+        db_path = str(tmp_path / "rl.db")
+        limiter = RateLimiter(db_path=db_path, flush_seconds=0.05)
+        limiter.record_call('claude_api', success=True)
+        deadline = time.monotonic() + 5
+        while not self._rows(db_path) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert self._rows(db_path) == [('claude_api', 1, None)]
+        limiter.close()
+
+
+class TestSharedRateLimitState:
+    """Test the memory-mapped backend shared between processes."""
+
+    def test_instances_share_one_limit(self, tmp_path):
+        state = str(tmp_path / "rl.state")
+        first = RateLimiter(db_path=str(tmp_path / "a.db"), shared_state_path=state)
+        second = RateLimiter(db_path=str(tmp_path / "b.db"), shared_state_path=state)
+        assert isinstance(first.state, SharedRateLimitState)
+        for limiter in (first, second):
+            limiter.set_limit('openai', _limit(minute=3))
+
+        first.record_call('openai', success=True)
+        second.record_call('openai', success=True)
+        first.record_call('openai', success=False)
+        with pytest.raises(RateLimitError, match="3/3"):
+            second.check_rate_limit('openai')
+        assert second.get_usage_stats('openai')['failed_calls'] == 1
+        first.close()
+        second.close()
+
+    def test_limit_enforced_across_processes(self, tmp_path):
+        state = tmp_path / "rl.state"
+        script = (
+            "import sys\n"
+            "from actifix.security.rate_limiter import RateLimiter\n"
+            "limiter = RateLimiter(db_path=sys.argv[1], shared_state_path=sys.argv[2])\n"
+            "for _ in range(3):\n"
+            "    limiter.record_call('openai', success=True)\n"
+            "limiter.close()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(actifix.__file__).resolve().parents[1]))
+        for name in ("a", "b"):
+            subprocess.run(
+                [sys.executable, "-c", script, str(tmp_path / f"{name}.db"), str(state)],
+                check=True, timeout=60, env=env,
+            )
+
+        limiter = RateLimiter(db_path=str(tmp_path / "parent.db"), shared_state_path=str(state))
+        limiter.set_limit('openai', _limit(minute=100, hour=6))
+        assert limiter.get_usage_stats('openai')['calls_last_minute'] == 6
+        with pytest.raises(RateLimitError, match="hour"):
+            limiter.check_rate_limit('openai')
+        limiter.close()
+
+    def test_slot_overflow_falls_back_to_process_counters(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(SharedRateLimitState, "MAX_PROVIDERS", 1)
+        limiter = RateLimiter(db_path=str(tmp_path / "rl.db"), shared_state_path=str(tmp_path / "rl.state"))
+        limiter.record_call('openai', success=True)
+        limiter.record_call('claude_api', success=True)
+        assert limiter.get_usage_stats('claude_api')['calls_last_minute'] == 1
+        limiter.close()
+
+
 class TestGlobalLimiterInstance:
     """Test global rate limiter instance."""
 
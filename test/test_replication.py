@@ -0,0 +1,246 @@
+"""Tests for WAL shipping to a local standby replica."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from actifix.persistence.replication import (
+    ReplicationError,
+    WalShipper,
+    parse_wal_header,
+)
+
+
+def _open_primary(path):
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    return conn
+
+
+def _rows(path, sql="SELECT id, body FROM items ORDER BY id", replica=True):
+    if replica:
+        conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True)
+    else:
+        conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def primary(tmp_path):
+    db_path = tmp_path / "actifix.db"
+    conn = _open_primary(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, body TEXT)")
+    yield db_path, conn
+    conn.close()
+
+
+def test_initial_sync_copies_database(primary, tmp_path):
+    db_path, conn = primary
+    conn.executemany("INSERT INTO items (body) VALUES (?)", [(f"row-{i}",) for i in range(50)])
+
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    result = shipper.sync_once()
+
+    assert result["resynced"] is True
+    assert _rows(shipper.replica_path) == _rows(db_path, replica=False)
+    assert shipper.verify_replica()
+
+
+def test_incremental_frames_are_shipped_without_resync(primary, tmp_path):
+    db_path, conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+
+    conn.execute("INSERT INTO items (body) VALUES ('late')")
+    result = shipper.sync_once()
+
+    assert result["resynced"] is False
+    assert result["frames"] > 0
+    assert _rows(shipper.replica_path)[-1][1] == "late"
+    metrics = shipper.get_metrics()
+    assert metrics["bytes_shipped"] > 0
+    assert metrics["segments_shipped"] >= 1
+    assert metrics["replication_lag_seconds"] is not None
+
+
+def test_lag_compares_commit_and_shipped_positions(primary, tmp_path):
+    db_path, conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+    shipper._state.last_sync_at -= 10
+
+    caught_up = shipper.get_metrics()
+    assert caught_up["replication_lag_seconds"] == 0.0
+    assert caught_up["unshipped_frames"] == 0
+
+    conn.execute("INSERT INTO items (body) VALUES ('unshipped')")
+    behind = shipper.get_metrics()
+    assert behind["unshipped_frames"] > 0
+    assert behind["replication_lag_seconds"] >= 10
+
+
+def test_missing_wal_header_resyncs_once(primary, tmp_path):
+    db_path, conn = primary
+    conn.execute("INSERT INTO items (body) VALUES ('before-truncate')")
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+
+    # TRUNCATE leaves an empty WAL file: no header until the next write
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    assert shipper.sync_once()["resynced"] is True
+    assert shipper.sync_once()["resynced"] is False
+    assert shipper.sync_once()["resynced"] is False
+    assert shipper.get_metrics()["resyncs"] == 2
+
+    conn.execute("INSERT INTO items (body) VALUES ('after-truncate')")
+    shipper.sync_once()
+    assert _rows(shipper.replica_path) == _rows(db_path, replica=False)
+
+
+def test_uncommitted_frames_are_not_shipped(primary, tmp_path):
+    db_path, conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO items (body) VALUES (?)", [("x" * 2000,) for _ in range(200)])
+    shipper.sync_once()
+    conn.execute("ROLLBACK")
+
+    assert _rows(shipper.replica_path) == []
+
+
+def test_checkpoint_and_wal_restart_keep_replica_consistent(primary, tmp_path):
+    db_path, conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+
+    conn.execute("INSERT INTO items (body) VALUES ('before-restart')")
+    conn.execute("PRAGMA wal_checkpoint(RESTART)")
+    conn.execute("INSERT INTO items (body) VALUES ('after-restart')")
+    shipper.sync_once()
+
+    assert _rows(shipper.replica_path) == _rows(db_path, replica=False)
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("INSERT INTO items (body) VALUES ('after-truncate')")
+    shipper.sync_once()
+
+    assert _rows(shipper.replica_path) == _rows(db_path, replica=False)
+
+
+def test_state_survives_restart_and_replays_pending_segment(primary, tmp_path):
+    db_path, conn = primary
+    standby = tmp_path / "standby"
+    shipper = WalShipper(db_path, standby)
+    shipper.sync_once()
+
+    conn.execute("INSERT INTO items (body) VALUES ('crash')")
+    original_apply = WalShipper._apply_frames
+    calls = {"count": 0}
+
+    def failing_apply(self, page_size, frames):
+        calls["count"] += 1
+        raise OSError("simulated crash during apply")
+
+    WalShipper._apply_frames = failing_apply
+    try:
+        with pytest.raises(OSError):
+            shipper.sync_once()
+    finally:
+        WalShipper._apply_frames = original_apply
+
+    restarted = WalShipper(db_path, standby)
+    result = restarted.sync_once()
+
+    assert calls["count"] == 1
+    assert result["resynced"] is False
+    assert _rows(restarted.replica_path) == _rows(db_path, replica=False)
+
+
+def test_sync_during_concurrent_writes(primary, tmp_path):
+    db_path, _conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    stop = threading.Event()
+
+    def writer():
+        conn = _open_primary(db_path)
+        try:
+            for i in range(300):
+                conn.execute("INSERT INTO items (body) VALUES (?)", (f"w-{i}",))
+                if i % 100 == 99:
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        finally:
+            conn.close()
+            stop.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not stop.is_set():
+        shipper.sync_once()
+    thread.join()
+    shipper.sync_once()
+
+    assert _rows(shipper.replica_path) == _rows(db_path, replica=False)
+    assert shipper.verify_replica()
+
+
+def test_promote_replaces_primary_and_moves_old_files_aside(primary, tmp_path):
+    db_path, conn = primary
+    conn.execute("INSERT INTO items (body) VALUES ('keep')")
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+    conn.close()
+
+    target = shipper.promote(sync_first=False)
+
+    assert target == db_path
+    assert _rows(db_path, replica=False) == [(1, "keep")]
+    assert list(tmp_path.glob("actifix.db.pre_promote_*"))
+
+
+def test_promote_rejects_corrupt_replica(primary, tmp_path):
+    db_path, _conn = primary
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    shipper.sync_once()
+    shipper.replica_path.write_bytes(b"not a database" * 100)
+
+    with pytest.raises(ReplicationError):
+        shipper.promote(sync_first=False)
+
+
+def test_promote_never_copies_a_corrupted_primary(primary, tmp_path):
+    db_path, conn = primary
+    conn.executemany("INSERT INTO items (body) VALUES (?)", [("x" * 500,) for _ in range(200)])
+    WalShipper(db_path, tmp_path / "standby").sync_once()
+    expected = _rows(db_path, replica=False)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+
+    # Corrupt every page after the header page and lose the WAL
+    data = bytearray(db_path.read_bytes())
+    page_size = int.from_bytes(data[16:18], "big") or 65536
+    for offset in range(page_size, len(data), page_size):
+        data[offset:offset + 64] = b"\xde\xad\xbe\xef" * 16
+    db_path.write_bytes(bytes(data))
+    for suffix in ("-wal", "-shm"):
+        (tmp_path / f"actifix.db{suffix}").unlink(missing_ok=True)
+
+    shipper = WalShipper(db_path, tmp_path / "standby")
+    assert shipper.sync_once(allow_resync=False)["resync_skipped"] is True
+    assert shipper.verify_replica()
+
+    target = shipper.promote()
+
+    assert shipper.verify_replica()
+    assert _rows(target, replica=False) == expected
+
+
+def test_parse_wal_header_rejects_garbage():
+    assert parse_wal_header(b"") is None
+    assert parse_wal_header(b"\x00" * 32) is None
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the write-generation response cache."""
+
+from __future__ import annotations
+
+from actifix.persistence.ticket_repo import get_ticket_repository
+from actifix.response_cache import ResponseCache, render_response_cache_metrics
+
+
+def test_cache_hits_until_generation_changes():
+    cache = ResponseCache(max_staleness_seconds=60)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute(("stats", ()), 1, build) == (1, False)
+    assert cache.get_or_compute(("stats", ()), 1, build) == (1, True)
+    assert cache.get_or_compute(("stats", (("a", "b"),)), 1, build) == (2, False)
+    assert cache.get_or_compute(("stats", ()), 2, build) == (3, False)
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 3
+    assert stats["endpoints"]["stats"] == {"hits": 1, "misses": 3}
+    assert 'actifix_response_cache_hits_total{endpoint="stats"} 1' in render_response_cache_metrics(cache)
+
+
+def test_max_staleness_and_uncacheable_values(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("actifix.response_cache.time.monotonic", lambda: clock[0])
+    cache = ResponseCache(max_staleness_seconds=5)
+
+    assert cache.get_or_compute("health", 0, lambda: "a") == ("a", False)
+    clock[0] += 4
+    assert cache.get_or_compute("health", 0, lambda: "b") == ("a", True)
+    clock[0] += 2
+    assert cache.get_or_compute("health", 0, lambda: "c") == ("c", False)
+
+    assert cache.get_or_compute("err", 0, lambda: 500, cacheable=lambda v: v < 400) == (500, False)
+    assert cache.get_or_compute("err", 0, lambda: 200, cacheable=lambda v: v < 400) == (200, False)
+
+    disabled = ResponseCache(max_staleness_seconds=0)
+    disabled.get_or_compute("x", 0, lambda: 1)
+    assert disabled.get_or_compute("x", 0, lambda: 2) == (2, False)
+
+
+def test_ticket_writes_bump_write_generation(make_entry):
+    repo = get_ticket_repository()
+    start = repo.get_write_generation()
+
+    repo.create_ticket(make_entry("ACT-20260101-GEN01"))
+    created = repo.get_write_generation()
+    assert created > start
+
+    assert repo.get_write_generation() == created
+    repo.update_ticket("ACT-20260101-GEN01", {"owner": "someone"})
+    assert repo.get_write_generation() > created
+
+
+def test_stats_served_from_cache_until_ticket_write(api_client, make_entry, monkeypatch):
+    from actifix import api
+
+    calls = []
+    real_stats = api.get_ticket_stats
+
+    def counting_stats(paths):
+        calls.append(1)
+        return real_stats(paths)
+
+    monkeypatch.setattr(api, "get_ticket_stats", counting_stats)
+
+    first = api_client.get('/api/stats')
+    second = api_client.get('/api/stats')
+    assert first.headers['X-Actifix-Cache'] == 'MISS'
+    assert second.headers['X-Actifix-Cache'] == 'HIT'
+    assert second.get_json() == first.get_json()
+    assert len(calls) == 1
+
+    get_ticket_repository().create_ticket(make_entry("ACT-20260101-GEN02"))
+    third = api_client.get('/api/stats')
+    assert third.headers['X-Actifix-Cache'] == 'MISS'
+    assert third.get_json()['total'] == first.get_json()['total'] + 1
+    assert len(calls) == 2
+
+
+def test_metrics_endpoint_exposes_cache_counters(api_client):
+    api_client.get('/api/tickets/summary')
+    api_client.get('/api/tickets/summary')
+
+    body = api_client.get('/api/metrics').get_data(as_text=True)
+    assert 'actifix_response_cache_hits_total{endpoint="tickets_summary"} 1' in body
+    assert 'actifix_response_cache_misses_total{endpoint="tickets_summary"} 1' in body
+
+    cache = api_client.get('/api/metrics/json').get_json()['response_cache']
+    assert cache['endpoints']['metrics']['misses'] == 1
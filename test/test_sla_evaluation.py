@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for SQL-side and incremental SLA breach evaluation.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix import health
+from actifix.health import SlaMonitor, check_sla_breaches, get_health, get_sla_summary
+from actifix.persistence.database import get_database_pool, reset_database_pool
+from actifix.persistence.ticket_repo import (
+    TicketRepository,
+    get_ticket_repository,
+    reset_ticket_repository,
+)
+from actifix.raise_af import ActifixEntry, TicketPriority
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    paths = get_actifix_paths(project_root=tmp_path)
+    init_actifix_files(paths)
+
+    yield paths
+
+    reset_database_pool()
+    reset_ticket_repository()
+
+
+def _entry(ticket_id, priority, age_hours):
+    return ActifixEntry(
+        message=f"sla test {ticket_id}",
+        source="tests/test_sla_evaluation.py",
+        run_label="sla-test",
+        entry_id=ticket_id,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=age_hours),
+        priority=priority,
+        error_type="TestError",
+        stack_trace="",
+        duplicate_guard=f"{ticket_id}-guard",
+    )
+
+
+def _seed(repo):
+    repo.create_ticket(_entry("ACT-SLA-P0-OLD", TicketPriority.P0, 5))
+    repo.create_ticket(_entry("ACT-SLA-P0-MID", TicketPriority.P0, 2))
+    repo.create_ticket(_entry("ACT-SLA-P0-NEW", TicketPriority.P0, 0.5))
+    repo.create_ticket(_entry("ACT-SLA-P2-OK", TicketPriority.P2, 3))
+    repo.create_ticket(_entry("ACT-SLA-P3-OLD", TicketPriority.P3, 100))
+
+
+def test_sql_evaluation_matches_python_fallback(paths):
+    repo = get_ticket_repository()
+    _seed(repo)
+
+    breaches = check_sla_breaches(paths)
+    assert [(b["priority"], b["ticket_id"], b["count"]) for b in breaches] == [
+        ("P0", "ACT-SLA-P0-OLD", 2),
+        ("P3", "ACT-SLA-P3-OLD", 1),
+    ]
+    assert breaches[0]["sla_hours"] == 1 and breaches[0]["breach_hours"] == pytest.approx(4.0, abs=0.1)
+
+    summary = get_sla_summary(paths)
+    assert summary.total == 3
+    expected_next = repo.get_ticket("ACT-SLA-P0-NEW")["created_at"] + timedelta(hours=1)
+    assert abs(summary.next_breach_at - expected_next) < timedelta(milliseconds=2)
+
+    now_ms = int(summary.evaluated_at.timestamp() * 1000)
+    fallback = health._evaluate_sla_in_python(paths, summary.thresholds_ms, now_ms)
+    assert fallback == summary.priorities
+
+    # Open tickets without created_at_ms (backfill running) use the fallback
+    with get_database_pool().connection() as conn:
+        conn.execute("UPDATE tickets SET created_at_ms = NULL WHERE id = 'ACT-SLA-P3-OLD'")
+        conn.commit()
+    assert repo.evaluate_sla(summary.thresholds_ms, now_ms) is None
+    assert get_sla_summary(paths).total == 3
+
+
+def test_sla_queries_are_index_seeks(paths):
+    get_ticket_repository().create_ticket(_entry("ACT-SLA-PLAN", TicketPriority.P1, 1))
+    with get_database_pool().connection() as conn:
+        plan = " | ".join(
+            row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM tickets "
+                "WHERE deleted = 0 AND status = 'Open' AND priority = ? AND created_at_ms <= ?",
+                ("P1", 0),
+            )
+        )
+    assert "idx_tickets_sla_created_ms" in plan
+    assert "SCAN tickets" not in plan
+
+
+def test_incremental_monitor_reuses_until_write_or_breach(paths, monkeypatch):
+    repo = get_ticket_repository()
+    _seed(repo)
+    calls = []
+    real_evaluate = TicketRepository.evaluate_sla
+    monkeypatch.setattr(
+        TicketRepository, "evaluate_sla",
+        lambda self, *args: calls.append(1) or real_evaluate(self, *args),
+    )
+
+    monitor = SlaMonitor()
+    first = monitor.summary(paths)
+    assert monitor.summary(paths) is first
+    assert len(calls) == 1
+
+    # Crossing the next-breach instant re-evaluates without any write
+    later = first.next_breach_at + timedelta(seconds=1)
+    crossed = monitor.summary(paths, now=later)
+    assert crossed is not first and crossed.total == first.total + 1
+    assert len(calls) == 2
+
+    repo.update_ticket("ACT-SLA-P3-OLD", {"owner": "someone"})
+    monitor.summary(paths, now=later)
+    assert len(calls) == 3
+
+
+def test_health_reports_ticket_breach_count(paths):
+    _seed(get_ticket_repository())
+    result = get_health(paths)
+    assert result.sla_breaches == 3
+    assert result.status in {"SLA_BREACH", "ERROR"}
+    assert result.oldest_ticket_age_hours == pytest.approx(100, abs=0.1)
+    assert any("ACT-SLA-P0-OLD" in w and "2 tickets" in w for w in result.warnings)
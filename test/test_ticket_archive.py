@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the hot/cold ticket archive tier.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import reset_database_pool, serialize_timestamp
+from actifix.persistence.ticket_repo import (
+    TicketFilter,
+    get_ticket_repository,
+    reset_ticket_repository,
+)
+from actifix.raise_af import ActifixEntry, TicketPriority
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+
+    init_actifix_files(get_actifix_paths(project_root=tmp_path))
+
+    yield get_ticket_repository()
+
+    reset_database_pool()
+    reset_ticket_repository()
+
+
+def _create(repo, ticket_id, age_days=0, status="Completed", guard=None):
+    created = datetime.now(timezone.utc) - timedelta(days=age_days)
+    entry = ActifixEntry(
+        message=f"archive test {ticket_id}",
+        source="tests/test_ticket_archive.py",
+        run_label="archive-test",
+        entry_id=ticket_id,
+        created_at=created,
+        priority=TicketPriority.P2,
+        error_type="TestError",
+        stack_trace="",
+        duplicate_guard=guard or f"{ticket_id}-guard",
+    )
+    assert repo.create_ticket(entry) is True
+    with repo.pool.transaction() as conn:
+        conn.execute("UPDATE tickets SET status = ? WHERE id = ?", (status, ticket_id))
+
+
+def test_archive_moves_old_completed_tickets_in_chunks(repo):
+    for i in range(7):
+        _create(repo, f"ACT-OLD-{i}", age_days=120)
+    _create(repo, "ACT-NEW-0", age_days=1)
+    _create(repo, "ACT-OPEN-0", age_days=120, status="Open")
+
+    result = repo.archive.archive_completed(min_age_days=90, chunk_size=3)
+
+    assert result["moved"] == 7
+    assert result["chunks"] == 3
+    assert repo.archive.count() == 7
+    hot_ids = {t["id"] for t in repo.get_tickets()}
+    assert hot_ids == {"ACT-NEW-0", "ACT-OPEN-0"}
+
+
+def test_reads_include_archived_tier_on_request(repo):
+    _create(repo, "ACT-OLD-1", age_days=120)
+    _create(repo, "ACT-NEW-1", age_days=1)
+    repo.archive.archive_completed(min_age_days=90)
+
+    assert repo.get_ticket("ACT-OLD-1") is None
+    archived = repo.get_ticket("ACT-OLD-1", include_archived=True)
+    assert archived["status"] == "Completed"
+
+    all_ids = {t["id"] for t in repo.get_tickets(TicketFilter(include_archived=True))}
+    assert all_ids == {"ACT-OLD-1", "ACT-NEW-1"}
+
+    assert repo.get_stats()["completed"] == 1
+    assert repo.get_stats(include_archived=True)["completed"] == 2
+
+
+def test_duplicate_guard_consults_archive(repo):
+    _create(repo, "ACT-OLD-2", age_days=120, guard="shared-guard")
+    repo.archive.archive_completed(min_age_days=90)
+
+    assert repo.check_duplicate_guard("shared-guard")["id"] == "ACT-OLD-2"
+    assert repo.check_duplicate_guard("shared-guard", include_archived=False) is None
+
+    duplicate = ActifixEntry(
+        message="recurring",
+        source="tests/test_ticket_archive.py",
+        run_label="archive-test",
+        entry_id="ACT-DUP-2",
+        created_at=datetime.now(timezone.utc),
+        priority=TicketPriority.P2,
+        error_type="TestError",
+        stack_trace="",
+        duplicate_guard="shared-guard",
+    )
+    assert repo.create_ticket(duplicate) is False
+
+
+def test_union_prefers_hot_copy_after_interrupted_move(repo):
+    _create(repo, "ACT-OLD-3", age_days=120)
+    with repo.pool.connection() as conn:
+        repo.archive.attach(conn, create=True)
+        cols = ", ".join(r[1] for r in conn.execute("PRAGMA main.table_info(tickets)"))
+        conn.execute(
+            f"INSERT INTO archive.tickets ({cols}, archived_at) "
+            f"SELECT {cols}, ? FROM main.tickets",
+            (serialize_timestamp(datetime.now(timezone.utc)),),
+        )
+        conn.commit()
+
+    tickets = repo.get_tickets(TicketFilter(include_archived=True))
+    assert [t["id"] for t in tickets] == ["ACT-OLD-3"]
+
+    # Re-running the move is idempotent
+    assert repo.archive.archive_completed(min_age_days=90)["moved"] == 1
+    assert repo.archive.count() == 1
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for set-based retention / duplicate cleanup and the bulk ticket APIs.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import reset_database_pool
+from actifix.persistence.ticket_cleanup import (
+    apply_retention_policy,
+    cleanup_duplicate_tickets,
+    get_ticket_age_days,
+)
+from actifix.persistence.ticket_repo import (
+    get_ticket_repository,
+    reset_ticket_repository,
+)
+from actifix.raise_af import ActifixEntry, TicketPriority
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+NOTES = (
+    "Implementation: Closed by bulk cleanup test.\n"
+    "Files:\n"
+    "- src/actifix/persistence/ticket_cleanup.py"
+)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    init_actifix_files(get_actifix_paths(project_root=tmp_path))
+
+    yield get_ticket_repository()
+
+    reset_ticket_repository()
+    reset_database_pool()
+
+
+def _create(repo, ticket_id, age, message=None, priority=TicketPriority.P2,
+            source="module.py:1", error_type="RuntimeError", completed=False):
+    entry = ActifixEntry(
+        message=message or f"cleanup test {ticket_id}",
+        source=source,
+        run_label="cleanup-test",
+        entry_id=ticket_id,
+        created_at=datetime.now(timezone.utc) - age,
+        priority=priority,
+        error_type=error_type,
+        stack_trace="",
+        duplicate_guard=f"{ticket_id}-guard",
+    )
+    assert repo.create_ticket(entry)
+    if completed:
+        with repo.pool.transaction() as conn:
+            conn.execute("UPDATE tickets SET status = 'Completed', completed = 1 WHERE id = ?", (ticket_id,))
+
+
+def _bulk_audit_records(repo, description_prefix):
+    with repo.pool.connection() as conn:
+        return conn.execute(
+            "SELECT record_id, new_values FROM database_audit_log WHERE change_description LIKE ?",
+            (f"{description_prefix}%",),
+        ).fetchall()
+
+
+def test_ticket_age_is_measured_from_created_at(repo):
+    _create(repo, "ACT-AGE-OLD", timedelta(days=40), priority=TicketPriority.P4, completed=True)
+
+    ticket = repo.get_ticket("ACT-AGE-OLD")
+    assert 'created' not in ticket
+    assert 39.9 < get_ticket_age_days(ticket) < 40.1
+
+    executed = apply_retention_policy(repo, dry_run=False)
+    assert executed['by_priority'] == {'P4': 1}
+    assert repo.get_ticket("ACT-AGE-OLD")["deleted"] is True
+
+
+def test_retention_policy_buckets_and_soft_deletes_in_sql(repo):
+    _create(repo, "ACT-RET-P0-OLD", timedelta(days=200), priority=TicketPriority.P0, completed=True)
+    _create(repo, "ACT-RET-P4-OLD", timedelta(days=40), priority=TicketPriority.P4, completed=True)
+    _create(repo, "ACT-RET-P4-NEW", timedelta(days=10), priority=TicketPriority.P4, completed=True)
+    _create(repo, "ACT-RET-TEST", timedelta(days=8), source="test/test_x.py", completed=True)
+    _create(repo, "ACT-RET-OPEN", timedelta(days=400), priority=TicketPriority.P4)
+
+    dry = apply_retention_policy(repo, dry_run=True)
+    assert dry == {
+        'completed_expired': 0,
+        'test_tickets_expired': 1,
+        'total_deleted': 2,
+        'by_priority': {'P4': 1},
+    }
+    assert repo.get_ticket("ACT-RET-P4-OLD")["deleted"] is False
+
+    fallback = apply_retention_policy(repo, retention_days=30, use_priority_policies=False, dry_run=True)
+    assert fallback['completed_expired'] == 2
+    assert fallback['total_deleted'] == 3
+
+    executed = apply_retention_policy(repo, dry_run=False)
+    assert executed['total_deleted'] == 2
+    deleted = {t["id"] for t in repo.get_deleted_tickets()}
+    assert deleted == {"ACT-RET-P4-OLD", "ACT-RET-TEST"}
+
+    records = _bulk_audit_records(repo, "Bulk deleted")
+    assert len(records) == 1
+    assert records[0]["record_id"] is None
+    assert "ACT-RET-TEST" in records[0]["new_values"]
+
+
+def test_duplicate_cleanup_ranks_groups_with_window_functions(repo):
+    for i, hours in enumerate([50, 40, 30, 1]):
+        _create(repo, f"ACT-DUPSQL-A{i}", timedelta(hours=hours), message="same failure")
+    _create(repo, "ACT-DUPSQL-B0", timedelta(hours=30), message="other failure")
+    _create(repo, "ACT-DUPSQL-B1", timedelta(hours=5), message="other failure")
+    _create(repo, "ACT-DUPSQL-SOLO", timedelta(hours=90), message="unique failure")
+    with repo.pool.transaction() as conn:
+        conn.execute("UPDATE tickets SET locked_by = 'agent-1' WHERE id = 'ACT-DUPSQL-A1'")
+
+    dry = cleanup_duplicate_tickets(repo, min_age_hours=24.0, dry_run=True)
+    assert dry == {
+        'duplicate_groups': 2,
+        'duplicates_found': 4,
+        'duplicates_closed': 3,
+        'duplicates_skipped_locked': 1,
+        'duplicates_skipped_recent': 0,
+    }
+
+    executed = cleanup_duplicate_tickets(repo, min_age_hours=35.0, dry_run=False)
+    assert executed['duplicates_closed'] == 1
+    assert executed['duplicates_skipped_recent'] == 2
+
+    status = {t["id"]: t["status"] for t in repo.get_tickets()}
+    assert status["ACT-DUPSQL-A0"] == "Completed"
+    assert status["ACT-DUPSQL-A1"] == "Open"
+    assert status["ACT-DUPSQL-A2"] == "Open"
+    assert status["ACT-DUPSQL-A3"] == "Open"
+    assert status["ACT-DUPSQL-SOLO"] == "Open"
+    assert len(_bulk_audit_records(repo, "Bulk completed")) == 1
+
+
+def test_duplicate_cleanup_notes_name_each_groups_kept_ticket(repo):
+    _create(repo, "ACT-DUPNOTE-A0", timedelta(hours=50), message="first failure")
+    _create(repo, "ACT-DUPNOTE-A1", timedelta(hours=1), message="first failure")
+    _create(repo, "ACT-DUPNOTE-B0", timedelta(hours=50), message="second failure")
+    _create(repo, "ACT-DUPNOTE-B1", timedelta(hours=2), message="second failure")
+
+    executed = cleanup_duplicate_tickets(repo, min_age_hours=24.0, dry_run=False)
+    assert executed['duplicates_closed'] == 2
+
+    notes = {
+        ticket_id: repo.get_ticket(ticket_id)["completion_notes"]
+        for ticket_id in ("ACT-DUPNOTE-A0", "ACT-DUPNOTE-B0")
+    }
+    assert notes["ACT-DUPNOTE-A0"].endswith("Duplicate of ACT-DUPNOTE-A1")
+    assert notes["ACT-DUPNOTE-B0"].endswith("Duplicate of ACT-DUPNOTE-B1")
+    assert notes["ACT-DUPNOTE-A0"].startswith("Implementation: Auto-completed stale duplicate ticket")
+
+
+def test_mark_complete_many_chunks_and_skips_completed(repo):
+    for i in range(5):
+        _create(repo, f"ACT-BULK-{i}", timedelta(hours=1))
+    repo.delete_ticket("ACT-BULK-4")
+
+    first = repo.mark_complete_many(
+        ["ACT-BULK-0", "ACT-BULK-1", "ACT-BULK-2", "ACT-BULK-4", "ACT-MISSING"],
+        NOTES, "Bulk test steps.", "Bulk test results.", chunk_size=2,
+    )
+    assert first == ["ACT-BULK-0", "ACT-BULK-1", "ACT-BULK-2"]
+    assert len(_bulk_audit_records(repo, "Bulk completed")) == 2
+
+    again = repo.mark_complete_many(
+        ["ACT-BULK-0", "ACT-BULK-3"], NOTES, "Bulk test steps.", "Bulk test results.",
+    )
+    assert again == ["ACT-BULK-3"]
+    ticket = repo.get_ticket("ACT-BULK-3")
+    assert ticket["completed"] and ticket["completion_notes"] == NOTES
+
+    with pytest.raises(ValueError):
+        repo.mark_complete_many(["ACT-BULK-3"], "too short", "steps", "results")
+
+
+def test_delete_tickets_where_walks_rowid_chunks(repo):
+    for i in range(7):
+        _create(repo, f"ACT-PURGE-{i}", timedelta(hours=1), error_type="Purge" if i % 2 == 0 else "Keep")
+
+    deleted = repo.delete_tickets_where("error_type = ?", ["Purge"], soft_delete=False, chunk_size=2)
+
+    assert deleted == ["ACT-PURGE-0", "ACT-PURGE-2", "ACT-PURGE-4", "ACT-PURGE-6"]
+    assert sorted(t["id"] for t in repo.get_tickets()) == ["ACT-PURGE-1", "ACT-PURGE-3", "ACT-PURGE-5"]
+    assert len(_bulk_audit_records(repo, "Bulk deleted")) == 2
+    assert repo.delete_tickets_where("error_type = ?", ["Purge"]) == []
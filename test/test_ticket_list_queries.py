@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the SQL-side ticket list queries (newest-N, created bounds and
+trigger-maintained counts).
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.persistence.database import get_database_pool, reset_database_pool
+from actifix.persistence.ticket_repo import get_ticket_repository, reset_ticket_repository
+from actifix.persistence.ticket_shards import ShardedTicketRepository
+from actifix.raise_af import ActifixEntry, TicketPriority
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+
+@pytest.fixture
+def db_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    init_actifix_files(get_actifix_paths(project_root=tmp_path))
+
+    yield tmp_path / "data" / "actifix.db"
+
+    reset_database_pool()
+    reset_ticket_repository()
+
+
+def _entry(ticket_id, age_minutes=0, priority=TicketPriority.P2):
+    return ActifixEntry(
+        message=f"list query test {ticket_id}",
+        source="tests/test_ticket_list_queries.py",
+        run_label="list-test",
+        entry_id=ticket_id,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=age_minutes),
+        priority=priority,
+        error_type="TestError",
+        stack_trace="",
+        duplicate_guard=f"{ticket_id}-guard",
+    )
+
+
+def _set_status(ticket_id, status):
+    with get_database_pool().connection() as conn:
+        conn.execute("UPDATE tickets SET status = ? WHERE id = ?", (status, ticket_id))
+        conn.commit()
+
+
+def _counted_stats(conn):
+    """get_stats() computed the slow way, for comparison."""
+    def count(where):
+        return conn.execute(f"SELECT COUNT(*) FROM tickets WHERE {where}").fetchone()[0]
+
+    return {
+        'total': count("deleted = 0"),
+        'open': count("deleted = 0 AND status = 'Open'"),
+        'in_progress': count("deleted = 0 AND status = 'In Progress'"),
+        'completed': count("deleted = 0 AND status = 'Completed'"),
+        'by_priority': {p: count(f"deleted = 0 AND priority = '{p}'") for p in ("P0", "P1", "P2", "P3", "P4")},
+        'locked': count("deleted = 0 AND locked_by IS NOT NULL"),
+        'deleted': count("deleted = 1"),
+    }
+
+
+def test_recent_tickets_merge_statuses_newest_first(db_env):
+    repo = get_ticket_repository()
+    for i, age in enumerate([50, 10, 40, 20, 30, 5]):
+        repo.create_ticket(_entry(f"ACT-LIST-{i}", age_minutes=age))
+    _set_status("ACT-LIST-1", "Completed")
+    _set_status("ACT-LIST-4", "Completed")
+    _set_status("ACT-LIST-5", "In Progress")
+
+    # Rows the epoch backfill has not reached yet still sort correctly
+    with get_database_pool().connection() as conn:
+        conn.execute("UPDATE tickets SET created_at_ms = NULL WHERE id = 'ACT-LIST-3'")
+        conn.commit()
+
+    ids = [t["id"] for t in repo.get_recent_tickets(4)]
+    assert ids == ["ACT-LIST-1", "ACT-LIST-3", "ACT-LIST-4", "ACT-LIST-2"]
+    assert [t["id"] for t in repo.get_recent_tickets(10, statuses=("In Progress",))] == ["ACT-LIST-5"]
+    assert repo.get_recent_tickets(0) == []
+
+    bounds = repo.get_created_bounds("Open")
+    assert abs(bounds["oldest"] - repo.get_ticket("ACT-LIST-0")["created_at"]) < timedelta(milliseconds=1)
+    assert bounds["newest"] > bounds["oldest"]
+    assert repo.get_created_bounds("Missing") == {"oldest": None, "newest": None}
+
+
+def test_counts_table_tracks_every_write(db_env):
+    repo = get_ticket_repository()
+    for i in range(6):
+        repo.create_ticket(_entry(f"ACT-COUNT-{i}", priority=list(TicketPriority)[i % 5]))
+    _set_status("ACT-COUNT-0", "Completed")
+    _set_status("ACT-COUNT-1", "In Progress")
+    repo.update_ticket("ACT-COUNT-2", {"priority": "P0"})
+    repo.acquire_lock("ACT-COUNT-3", "tester")
+    repo.delete_ticket("ACT-COUNT-4")
+    repo.delete_ticket("ACT-COUNT-5", soft_delete=False)
+    repo.recover_ticket("ACT-COUNT-4")
+    repo.delete_ticket("ACT-COUNT-1")
+
+    with get_database_pool().connection() as conn:
+        expected = _counted_stats(conn)
+    assert repo.get_stats() == expected
+    assert expected["total"] == 4 and expected["deleted"] == 1 and expected["locked"] == 1
+
+
+def test_list_queries_use_indexes(db_env):
+    repo = get_ticket_repository()
+    repo.create_ticket(_entry("ACT-PLAN-1"))
+    pool = get_database_pool()
+    queries = [
+        ("SELECT * FROM tickets WHERE deleted = 0 AND status = ? AND created_at_ms IS NOT NULL "
+         "ORDER BY created_at_ms DESC LIMIT ?", ("Open", 20)),
+        ("SELECT MIN(created_at_ms) FROM tickets WHERE deleted = 0 AND status = ?", ("Open",)),
+        ("SELECT COUNT(*) FROM tickets WHERE locked_by >= '' AND +deleted = 0", ()),
+    ]
+    with pool.connection() as conn:
+        for sql, params in queries:
+            plan = " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+            assert "SCAN tickets" not in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
+
+
+def test_migration_seeds_counts_from_existing_rows(db_env):
+    repo = get_ticket_repository()
+    for i in range(3):
+        repo.create_ticket(_entry(f"ACT-MIG-{i}"))
+    _set_status("ACT-MIG-0", "Completed")
+    reset_ticket_repository()
+    reset_database_pool()
+
+    conn = sqlite3.connect(str(db_env))
+    for name in ("trg_tickets_counts_insert", "trg_tickets_counts_delete", "trg_tickets_counts_update"):
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute("DROP TABLE ticket_counts")
+    conn.execute("DROP INDEX idx_tickets_status_created_ms")
+    conn.execute("DELETE FROM schema_version")
+    conn.execute("INSERT INTO schema_version (version) VALUES (11)")
+    conn.commit()
+    conn.close()
+
+    repo = get_ticket_repository()
+    stats = repo.get_stats()
+    assert stats["open"] == 2 and stats["completed"] == 1
+    repo.create_ticket(_entry("ACT-MIG-3"))
+    assert repo.get_stats()["open"] == 3
+
+
+def test_sharded_recent_tickets_and_bounds(tmp_path, db_env):
+    repo = ShardedTicketRepository(tmp_path / "shards", default_shard="alpha")
+    repo.create_ticket(_entry("ACT-SH-A-OLD", age_minutes=30))
+    repo.create_ticket(_entry("ACT-SH-A-NEW", age_minutes=1))
+    repo.create_ticket(_entry("ACT-SH-B-MID", age_minutes=10), shard_key="beta")
+
+    assert [t["id"] for t in repo.get_recent_tickets(2)] == ["ACT-SH-A-NEW", "ACT-SH-B-MID"]
+    bounds = repo.get_created_bounds("Open")
+    assert bounds["oldest"] < bounds["newest"]
+    assert abs(repo.get_ticket("ACT-SH-A-OLD")["created_at"] - bounds["oldest"]) < timedelta(milliseconds=1)
+    repo.close()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for per-project ticket shards behind the repository facade.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from actifix.config import reset_config
+from actifix.persistence.database import reset_database_pool
+from actifix.persistence.event_repo import EventRepository
+from actifix.persistence.ticket_repo import (
+    TicketFilter,
+    get_ticket_repository,
+    reset_ticket_repository,
+)
+from actifix.persistence.ticket_shards import (
+    ShardedTicketRepository,
+    normalize_shard_key,
+    project_shard_key,
+)
+from actifix.raise_af import ActifixEntry, TicketPriority
+from actifix.state_paths import get_actifix_paths, init_actifix_files
+
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+
+@pytest.fixture
+def shard_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_DATA_DIR", str(tmp_path / "actifix"))
+    monkeypatch.setenv("ACTIFIX_STATE_DIR", str(tmp_path / ".actifix"))
+    monkeypatch.setenv("ACTIFIX_DB_PATH", str(tmp_path / "data" / "actifix.db"))
+    init_actifix_files(get_actifix_paths(project_root=tmp_path))
+    reset_config()
+
+    yield tmp_path / "data" / "shards"
+
+    reset_ticket_repository()
+    reset_database_pool()
+    reset_config()
+
+
+def _entry(ticket_id, priority=TicketPriority.P2, age_minutes=0):
+    return ActifixEntry(
+        message=f"shard test {ticket_id}",
+        source="tests/test_ticket_shards.py",
+        run_label="shard-test",
+        entry_id=ticket_id,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=age_minutes),
+        priority=priority,
+        error_type="TestError",
+        stack_trace="",
+        duplicate_guard=f"{ticket_id}-guard",
+    )
+
+
+def test_shard_keys_are_normalized():
+    assert normalize_shard_key("My Project/../x") == "my-project-x"
+    key = project_shard_key("/srv/Projects/Web App")
+    assert key.startswith("web-app-") and len(key) == len("web-app-") + 8
+    with pytest.raises(ValueError):
+        normalize_shard_key("///")
+
+
+def test_tickets_are_written_to_separate_databases(shard_dir):
+    repo = ShardedTicketRepository(shard_dir, default_shard="alpha")
+    assert repo.create_ticket(_entry("ACT-SHARD-A1"))
+    assert repo.create_ticket(_entry("ACT-SHARD-B1"), shard_key="beta")
+
+    shard_map = json.loads((shard_dir / "shard_map.json").read_text())
+    assert shard_map["shards"] == {"alpha": "alpha.db", "beta": "beta.db"}
+    assert [t["id"] for t in repo.shard("alpha").get_tickets()] == ["ACT-SHARD-A1"]
+    assert [t["id"] for t in repo.shard("beta").get_tickets()] == ["ACT-SHARD-B1"]
+
+    # A fresh facade finds tickets by probing the shards
+    other = ShardedTicketRepository(shard_dir, default_shard="alpha")
+    assert other.get_ticket("ACT-SHARD-B1")["id"] == "ACT-SHARD-B1"
+    assert other.update_ticket("ACT-SHARD-B1", {"owner": "agent-9"})
+    assert repo.shard("beta").get_ticket("ACT-SHARD-B1")["owner"] == "agent-9"
+    repo.close()
+    other.close()
+
+
+def test_fan_out_listing_is_merge_sorted_and_paginated(shard_dir):
+    repo = ShardedTicketRepository(shard_dir, default_shard="alpha")
+    repo.create_ticket(_entry("ACT-A-P2-OLD", TicketPriority.P2, age_minutes=30))
+    repo.create_ticket(_entry("ACT-A-P0", TicketPriority.P0, age_minutes=5))
+    repo.create_ticket(_entry("ACT-B-P2-NEW", TicketPriority.P2, age_minutes=1), shard_key="beta")
+    repo.create_ticket(_entry("ACT-B-P1", TicketPriority.P1, age_minutes=10), shard_key="beta")
+
+    ids = [t["id"] for t in repo.get_tickets()]
+    assert ids == ["ACT-A-P0", "ACT-B-P1", "ACT-B-P2-NEW", "ACT-A-P2-OLD"]
+
+    page = repo.get_tickets(TicketFilter(limit=2, offset=1))
+    assert [t["id"] for t in page] == ["ACT-B-P1", "ACT-B-P2-NEW"]
+
+    stats = repo.get_stats()
+    assert stats["total"] == 4
+    assert stats["open"] == 4
+    assert stats["by_priority"]["P2"] == 2
+    assert set(repo.get_shard_stats()) == {"alpha", "beta"}
+    repo.close()
+
+
+def test_claims_rotate_round_robin_across_shards(shard_dir):
+    repo = ShardedTicketRepository(shard_dir, default_shard="alpha")
+    for i in range(2):
+        repo.create_ticket(_entry(f"ACT-A-{i}"))
+        repo.create_ticket(_entry(f"ACT-B-{i}"), shard_key="beta")
+
+    claimed = [repo.get_and_lock_next_ticket(f"agent-{i}")["id"] for i in range(4)]
+
+    assert [ticket_id[:5] for ticket_id in claimed] == ["ACT-A", "ACT-B", "ACT-A", "ACT-B"]
+    assert repo.get_and_lock_next_ticket("agent-x") is None
+    assert repo.release_lock(claimed[1], "agent-1")
+    assert repo.shard("beta").get_ticket(claimed[1])["locked_by"] is None
+    repo.close()
+
+
+def test_global_repository_uses_shards_when_configured(shard_dir, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_SHARD_DIR", str(shard_dir))
+    monkeypatch.setenv("ACTIFIX_SHARD_KEY", "gamma")
+    reset_config()
+    reset_ticket_repository()
+
+    repo = get_ticket_repository()
+
+    assert isinstance(repo, ShardedTicketRepository)
+    assert repo.default_shard == "gamma"
+    assert repo.create_ticket(_entry("ACT-GLOBAL-1"))
+    assert (shard_dir / "gamma.db").exists()
+    assert get_ticket_repository() is repo
+
+
+def test_ticket_events_keep_their_ticket_id_with_shards(shard_dir, monkeypatch):
+    monkeypatch.setenv("ACTIFIX_SHARD_DIR", str(shard_dir))
+    reset_config()
+    reset_ticket_repository()
+    repo = get_ticket_repository()
+    assert isinstance(repo, ShardedTicketRepository)
+    assert repo.create_ticket(_entry("ACT-SHARD-EVT"))
+
+    # The ticket lives in a shard; its events go to the main database
+    events = EventRepository()
+    assert events.log_event("TICKET_CREATED", "created", ticket_id="ACT-SHARD-EVT")
+
+    found = events.get_events_for_ticket("ACT-SHARD-EVT")
+    assert [(e["event_type"], e["ticket_id"]) for e in found] == [("TICKET_CREATED", "ACT-SHARD-EVT")]
+
+
+def test_cli_archive_and_prune_cover_every_shard(shard_dir, monkeypatch, tmp_path):
+    from actifix.main import main
+    from actifix.persistence.export_stream import iter_export_records
+
+    monkeypatch.setenv("ACTIFIX_SHARD_DIR", str(shard_dir))
+    monkeypatch.setenv("ACTIFIX_SHARD_KEY", "alpha")
+    reset_config()
+    reset_ticket_repository()
+    repo = get_ticket_repository()
+    old = (datetime.now(timezone.utc) - timedelta(days=200)).isoformat()
+    for ticket_id, key in (("ACT-OLD-A", "alpha"), ("ACT-OLD-B", "beta"), ("ACT-GONE-B", "beta")):
+        repo.create_ticket(_entry(ticket_id, age_minutes=200 * 24 * 60), shard_key=key)
+        with repo.shard(key).pool.transaction() as conn:
+            conn.execute(
+                "UPDATE tickets SET status = 'Completed', completed = 1, updated_at = ? WHERE id = ?",
+                (old, ticket_id),
+            )
+    repo.create_ticket(_entry("ACT-NEW-B"), shard_key="beta")
+
+    output = tmp_path / "archive.ndjson"
+    assert main([
+        "--project-root", str(tmp_path), "archive", "--output", str(output),
+        "--min-age-days", "30", "--delete-after-archive", "--workers", "1",
+    ]) == 0
+    archived = {(r["shard"], r["id"]) for r in iter_export_records(output) if r["type"] == "ticket"}
+    assert archived == {("alpha", "ACT-OLD-A"), ("beta", "ACT-OLD-B"), ("beta", "ACT-GONE-B")}
+    assert [t["id"] for t in repo.get_tickets()] == ["ACT-NEW-B"]
+
+    repo.create_ticket(_entry("ACT-STALE-A", age_minutes=200 * 24 * 60))
+    with repo.shard("alpha").pool.transaction() as conn:
+        conn.execute(
+            "UPDATE tickets SET status = 'Completed', completed = 1, updated_at = ? WHERE id = ?",
+            (old, "ACT-STALE-A"),
+        )
+    assert main(["--project-root", str(tmp_path), "prune", "--max-age-days", "30", "--execute"]) == 0
+    assert repo.shard("alpha").get_ticket("ACT-STALE-A") is None
+    assert [t["id"] for t in repo.get_tickets()] == ["ACT-NEW-B"]
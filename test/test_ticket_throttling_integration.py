@@ -311,3 +311,169 @@ class TestThrottlingDisabled:
                 paths=config.paths,
             )
             assert entry is not None, f"Should create ticket {i} when throttling disabled"
+
+
+class _FakeClock:
+    """Stands in for the time module inside ticket_throttler."""
+
+    def __init__(self):
+        self.now = time.time()
+        self.mono = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.mono
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.mono += seconds
+
+
+def _entry(ticket_id, priority, age_minutes=0.0):
+    from actifix.raise_af import ActifixEntry
+
+    return ActifixEntry(
+        message=f"throttle window test {ticket_id}",
+        source="test/test_ticket_throttling_integration.py",
+        run_label="throttle-test",
+        entry_id=ticket_id,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=age_minutes),
+        priority=priority,
+        error_type="ThrottleWindowTest",
+        stack_trace="",
+        duplicate_guard=f"{ticket_id}-guard",
+    )
+
+
+class TestInMemoryWindows:
+    """Tests for the in-memory windows seeded from the tickets table."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from actifix.security import ticket_throttler
+
+        clock = _FakeClock()
+        monkeypatch.setattr(ticket_throttler, "time", clock)
+        return clock
+
+    @pytest.fixture
+    def repo(self):
+        return get_ticket_repository()
+
+    def _config(self, **overrides):
+        values = dict(
+            max_p2_tickets_per_hour=3, max_p3_tickets_per_4h=2, max_p4_tickets_per_day=1,
+            emergency_ticket_threshold=50, emergency_window_minutes=1,
+        )
+        values.update(overrides)
+        return ThrottleConfig(**values)
+
+    def test_seeded_from_tickets_table(self, repo):
+        repo.create_ticket(_entry("ACT-THR-P2-A", TicketPriority.P2, age_minutes=50))
+        repo.create_ticket(_entry("ACT-THR-P2-B", TicketPriority.P2, age_minutes=10))
+        repo.create_ticket(_entry("ACT-THR-P2-C", TicketPriority.P2))
+        repo.create_ticket(_entry("ACT-THR-P2-OLD", TicketPriority.P2, age_minutes=90))
+        repo.create_ticket(_entry("ACT-THR-P4-A", TicketPriority.P4, age_minutes=600))
+        repo.delete_ticket("ACT-THR-P2-B")  # creations still count once deleted
+
+        throttler = TicketThrottler(config=self._config())
+        with pytest.raises(TicketThrottleError, match="P2 ticket throttle exceeded: 3/3"):
+            throttler.check_throttle(TicketPriority.P2)
+        with pytest.raises(TicketThrottleError, match="P4"):
+            throttler.check_throttle(TicketPriority.P4)
+        throttler.check_throttle(TicketPriority.P3)
+
+        # A seeded ticket reported again is not counted twice
+        throttler.record_ticket(TicketPriority.P2, "ACT-THR-P2-C")
+        stats = throttler.get_throttle_stats()
+        assert stats['P2']['count_last_hour'] == 3
+        assert stats['emergency_brake']['recent_count'] == 1
+
+    def test_checks_stay_in_memory_between_reconciles(self, repo, clock, monkeypatch):
+        calls = []
+        real = type(repo).get_creations_since
+        monkeypatch.setattr(
+            type(repo), "get_creations_since", lambda self, since: calls.append(since) or real(self, since)
+        )
+        throttler = TicketThrottler(config=self._config(reconcile_seconds=30))
+        for i in range(3):
+            throttler.check_throttle(TicketPriority.P2)
+            repo.create_ticket(_entry(f"ACT-THR-MEM-{i}", TicketPriority.P2))
+            throttler.record_ticket(TicketPriority.P2, f"ACT-THR-MEM-{i}")
+        with pytest.raises(TicketThrottleError):
+            throttler.check_throttle(TicketPriority.P2)
+        assert len(calls) == 1
+
+        # Another process's ticket shows up at the next reconcile
+        repo.create_ticket(_entry("ACT-THR-OTHER", TicketPriority.P3))
+        throttler.check_throttle(TicketPriority.P3)
+        clock.advance(31)
+        throttler.check_throttle(TicketPriority.P3)
+        assert len(calls) == 2
+        assert throttler.get_throttle_stats()['P3']['count_last_4h'] == 1
+
+    def test_reconcile_reads_each_priority_over_its_own_window(self, repo, clock, monkeypatch):
+        calls = []
+        real = type(repo).get_creations_since
+        monkeypatch.setattr(
+            type(repo), "get_creations_since", lambda self, since: calls.append(since) or real(self, since)
+        )
+        repo.create_ticket(_entry("ACT-THR-WIN-P0", TicketPriority.P0, age_minutes=120))
+        repo.create_ticket(_entry("ACT-THR-WIN-P4", TicketPriority.P4, age_minutes=120))
+
+        throttler = TicketThrottler(config=self._config())
+        throttler.reconcile()
+
+        now_ms = int(clock.now * 1000)
+        assert {p: now_ms - since for p, since in calls[0].items()} == {
+            'P0': 60_000, 'P1': 60_000, 'P2': 3_600_000, 'P3': 4 * 3_600_000, 'P4': 86_400_000,
+        }
+        assert [ticket_id for _, ticket_id in throttler.ticket_history['P0']] == []
+        assert [ticket_id for _, ticket_id in throttler.ticket_history['P4']] == ["ACT-THR-WIN-P4"]
+
+    def test_reconcile_reads_without_holding_the_lock(self, clock):
+        import threading
+
+        free = []
+
+        def try_lock():
+            # What a check on another thread would do while the read runs
+            if throttler.lock.acquire(blocking=False):
+                throttler.lock.release()
+                free.append(True)
+            else:
+                free.append(False)
+
+        class _Repo:
+            def get_creations_since(self, since_ms):
+                worker = threading.Thread(target=try_lock)
+                worker.start()
+                worker.join()
+                return {}
+
+        throttler = TicketThrottler(config=self._config(), repository=_Repo())
+        assert throttler.reconcile()
+        assert free == [True]
+
+    def test_windows_expire(self, clock):
+        throttler = TicketThrottler(config=self._config(emergency_ticket_threshold=4), repository=_EmptyRepo())
+        for i in range(3):
+            throttler.record_ticket(TicketPriority.P2, f"ACT-THR-EXP-{i}")
+        throttler.record_ticket(TicketPriority.P3, "ACT-THR-EXP-P3")
+        with pytest.raises(TicketThrottleError, match="EMERGENCY BRAKE"):
+            throttler.check_throttle(TicketPriority.P1)
+
+        clock.now += 61
+        throttler.check_throttle(TicketPriority.P1)
+        with pytest.raises(TicketThrottleError, match="P2"):
+            throttler.check_throttle(TicketPriority.P2)
+        clock.now += 3600
+        throttler.check_throttle(TicketPriority.P2)
+        assert throttler.get_throttle_stats()['P3']['count_last_4h'] == 1
+
+
+class _EmptyRepo:
+    def get_creations_since(self, since_ms):
+        return {}
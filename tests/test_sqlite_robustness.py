@@ -323,6 +323,91 @@ class TestSQLiteRobustness:
         assert hasattr(report, 'severity')
         assert hasattr(report, 'message')
 
+    def test_backup_reports_progress_in_steps(self, test_db):
+        """Test that online backup copies in page steps and reports progress."""
+        conn = sqlite3.connect(str(test_db))
+        conn.executemany(
+            "INSERT INTO test_table (value) VALUES (?)",
+            [("x" * 500,) for _ in range(200)],
+        )
+        conn.commit()
+        conn.close()
+
+        manager = SQLiteRobustness(test_db, config={"backup_step_sleep_s": 0})
+        manager.enforce_pragmas()
+
+        calls = []
+        backup_path = manager.backup(pages_per_step=5, progress=lambda r, t: calls.append((r, t)))
+
+        assert len(calls) > 1
+        assert calls[-1][0] == 0
+        conn = sqlite3.connect(str(backup_path))
+        assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone()[0] == 201
+        conn.close()
+
+    def test_backup_with_concurrent_writes_is_consistent(self, test_db):
+        """Test that commits during the backup neither block nor tear the copy."""
+        manager = SQLiteRobustness(test_db, config={"backup_step_sleep_s": 0})
+        manager.enforce_pragmas()
+
+        writer = sqlite3.connect(str(test_db), isolation_level=None)
+        writer.executemany(
+            "INSERT INTO test_table (value) VALUES (?)",
+            [("y" * 500,) for _ in range(200)],
+        )
+
+        def write_during_step(remaining, total):
+            writer.execute("INSERT INTO test_table (value) VALUES ('during')")
+
+        backup_path = manager.backup(pages_per_step=2, progress=write_during_step)
+        writer.close()
+
+        conn = sqlite3.connect(str(backup_path))
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone()[0] == 201
+        conn.close()
+
+    @pytest.mark.parametrize("codec,suffix", [("gzip", ".gz"), ("lzma", ".xz")])
+    def test_compressed_backup_restores(self, test_db, codec, suffix):
+        """Test that compressed backups are written and can be restored."""
+        manager = SQLiteRobustness(test_db)
+        manager.enforce_pragmas()
+
+        backup_path = manager.backup(compression=codec)
+        assert backup_path.name.endswith(".db" + suffix)
+
+        conn = sqlite3.connect(str(test_db))
+        conn.execute("DELETE FROM test_table")
+        conn.commit()
+        conn.close()
+
+        manager.restore(backup_path, verify=False)
+
+        conn = sqlite3.connect(str(test_db))
+        assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone()[0] == 1
+        conn.close()
+
+    def test_backup_rejects_unknown_compression(self, test_db):
+        """Test that unsupported codecs fail before any copy is made."""
+        manager = SQLiteRobustness(test_db)
+
+        with pytest.raises(ValueError):
+            manager.backup(compression="zip")
+
+    def test_backup_rotation_keeps_newest(self, test_db):
+        """Test that backup_keep rotates older backups away."""
+        manager = SQLiteRobustness(test_db, config={"backup_keep": 2})
+        manager.enforce_pragmas()
+
+        paths = []
+        for index in range(4):
+            paths.append(manager.backup(backup_name=f"backup_{test_db.stem}_{index}.db"))
+            time.sleep(0.01)
+
+        remaining = manager.list_backups()
+        assert remaining == [paths[3], paths[2]]
+        assert not paths[0].exists()
+
 
 class TestCorruptionReport:
     """Test CorruptionReport dataclass."""